@@ -0,0 +1,103 @@
+"""
+Round-trip throughput and payload size of each registered serializer.
+
+    python benchmarks/bench_serializers.py [--repeat 20]
+
+Models: a generated `Workflow` (20 jobs x 20 actions, nested models and dicts) and a
+`PQCKeyPair` (enums, datetimes and raw key bytes). Formats whose optional dependency is
+missing are skipped; formats that cannot represent a model (e.g. JSON and arbitrary bytes)
+are reported as n/a.
+"""
+import argparse
+import os
+import time
+from datetime import datetime, timedelta
+
+from dslmodel.pqc.core import PQCAlgorithmType, PQCKeyPair, PQCSecurityLevel
+from dslmodel.utils.serializers import available_serializers, get_serializer
+from dslmodel.workflow.workflow_models import Action, Condition, CronSchedule, Job, Workflow
+
+
+def sample_workflow(jobs: int = 20, actions: int = 20) -> Workflow:
+    return Workflow(
+        name="benchmark",
+        description="Generated workflow for serializer benchmarks",
+        schedules=[CronSchedule(cron="*/5 * * * *")],
+        jobs=[
+            Job(
+                name=f"job-{j}",
+                depends_on=[f"job-{j - 1}"] if j else None,
+                runner="python",
+                steps=[
+                    Action(
+                        name=f"action-{j}-{a}",
+                        code=f"result_{a} = sum(range({a}))",
+                        args={"index": a, "values": list(range(5)), "label": f"step {a}"},
+                        env={"STAGE": "bench"},
+                        cond=Condition(expr=f"index > {a % 3}"),
+                    )
+                    for a in range(actions)
+                ],
+            )
+            for j in range(jobs)
+        ],
+        context={"owner": "bench", "limits": {"cpu": 4, "memory": "8Gi"}},
+    )
+
+
+def sample_key_pair() -> PQCKeyPair:
+    created = datetime(2025, 1, 1)
+    return PQCKeyPair(
+        algorithm=PQCAlgorithmType.KYBER,
+        security_level=PQCSecurityLevel.LEVEL_3,
+        public_key=os.urandom(1184),
+        private_key=os.urandom(2400),
+        key_id="kyber-768-bench",
+        created_at=created,
+        expires_at=created + timedelta(days=365),
+        metadata={"purpose": "benchmark", "rotation": 3},
+    )
+
+
+def bench(model, file_format: str, repeat: int) -> tuple[float, float, int] | None:
+    """Return (dumps per second, loads per second, payload bytes), or None if unsupported."""
+    serializer = get_serializer(file_format)
+    try:
+        payload = serializer.dump_model(model)
+        if serializer.load_model(type(model), payload) != model:
+            return None
+    except (TypeError, ValueError, UnicodeError):
+        return None
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        serializer.dump_model(model)
+    dumps = repeat / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        serializer.load_model(type(model), payload)
+    loads = repeat / (time.perf_counter() - start)
+    return dumps, loads, len(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'model':<12} {'format':<8} {'dump/s':>10} {'load/s':>10} {'bytes':>9}")
+    for model in (sample_workflow(), sample_key_pair()):
+        # Key pairs are tiny; scale repeats so timings are comparable
+        repeat = args.repeat if isinstance(model, Workflow) else args.repeat * 100
+        for file_format in available_serializers():
+            result = bench(model, file_format, repeat)
+            if result is None:
+                print(f"{type(model).__name__:<12} {file_format:<8} {'n/a':>10} {'n/a':>10} {'n/a':>9}")
+                continue
+            dumps, loads, size = result
+            print(f"{type(model).__name__:<12} {file_format:<8} {dumps:>10.1f} {loads:>10.1f} {size:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Per-action and per-job overhead of workflow execution as the context grows.
+
+    python benchmarks/bench_workflow_context.py [--actions 200] [--jobs 200] [--sizes 100 10000 100000]
+
+Each run executes one job of small actions (a conditional counter increment and a templated
+value) against a context holding a DataFrame-like list of ``size`` row dicts that no action
+touches, plus one action that appends to a small list. Wrapping the context (one scan for
+templated values per run) is reported separately; with a copy-on-write context the time per
+action should stay flat as ``size`` grows.
+
+A second run schedules ``--jobs`` one-action jobs, each depending on the previous one, through
+`DAGScheduler` against the same context. Every job gets its ancestors' changes layered over the
+shared context, so the time per job should stay flat as ``size`` grows too.
+"""
+import argparse
+import time
+
+from loguru import logger
+
+from dslmodel.workflow.context import WorkflowContext
+from dslmodel.workflow.dag_scheduler import DAGScheduler
+from dslmodel.workflow.workflow_executor import execute_job
+from dslmodel.workflow.workflow_models import Action, Condition, Job, Workflow
+
+
+def sample_context(size: int) -> dict:
+    return {
+        "rows": [{"id": i, "name": f"row-{i}", "score": i * 0.5} for i in range(size)],
+        "counter": 0,
+        "log": [],
+    }
+
+
+def sample_job(actions: int) -> Job:
+    steps = []
+    for index in range(actions):
+        if index % 10 == 0:
+            steps.append(Action(name=f"log-{index}", code=f"log.append({index})"))
+        else:
+            steps.append(
+                Action(name=f"step-{index}", code="counter += 1", cond=Condition(expr="counter >= 0"))
+            )
+    steps.append(Action(name="summary", code="summary = '{{ counter }} steps'"))
+    return Job(name="bench", steps=steps)
+
+
+def bench(size: int, actions: int) -> tuple[float, float]:
+    """Return (milliseconds to wrap the context, microseconds per action)."""
+    context = sample_context(size)
+    job = sample_job(actions)
+    start = time.perf_counter()
+    wrapped = WorkflowContext.wrap(context)
+    setup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = execute_job(job, wrapped)
+    elapsed = time.perf_counter() - start
+    assert result["counter"] == actions - len(range(0, actions, 10))
+    assert context["log"] == []
+    return setup * 1e3, elapsed / len(job.steps) * 1e6
+
+
+def sample_workflow(jobs: int) -> Workflow:
+    return Workflow(
+        name="bench",
+        jobs=[
+            Job(
+                name=f"job-{index}",
+                depends_on=[f"job-{index - 1}"] if index else None,
+                steps=[Action(name="count", code="counter += 1")],
+            )
+            for index in range(jobs)
+        ],
+    )
+
+
+def bench_jobs(size: int, jobs: int) -> float:
+    """Return microseconds per scheduled job, excluding the one-time wrap of the context."""
+    context = WorkflowContext.wrap(sample_context(size))
+    scheduler = DAGScheduler(sample_workflow(jobs), max_workers=1)
+
+    start = time.perf_counter()
+    result = scheduler.run(context)
+    elapsed = time.perf_counter() - start
+    assert result["counter"] == jobs
+    return elapsed / jobs * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--actions", type=int, default=200)
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    args = parser.parse_args()
+
+    # Measure context handling, not log formatting
+    logger.remove()
+
+    print(f"{'rows':>10} {'wrap ms':>10} {'us/action':>12} {'us/job':>10}")
+    for size in args.sizes:
+        setup, per_action = bench(size, args.actions)
+        per_job = bench_jobs(size, args.jobs)
+        print(f"{size:>10} {setup:>10.1f} {per_action:>12.1f} {per_job:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
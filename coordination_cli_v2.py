@@ -7,13 +7,12 @@ Core Features:
 - Atomic work claiming with nanosecond IDs
 - Work progress tracking
 - Work completion with velocity tracking
-- Fast-path optimizations
+- Transactional SQLite work store (dslmodel.utils.work_store)
 - Basic dashboard view
 """
 
 import json
 import time
-import fcntl
 import os
 from pathlib import Path
 from datetime import datetime
@@ -25,6 +24,8 @@ from rich.console import Console
 from rich.table import Table
 from rich import print as rprint
 
+from dslmodel.utils.work_store import WorkStore, open_work_store
+
 app = typer.Typer(help="Agent Coordination CLI - 80/20 Implementation")
 console = Console()
 
@@ -34,6 +35,9 @@ WORK_CLAIMS_FILE = COORDINATION_DIR / "work_claims.json"
 AGENT_STATUS_FILE = COORDINATION_DIR / "agent_status.json"
 COORDINATION_LOG_FILE = COORDINATION_DIR / "coordination_log.json"
 FAST_CLAIMS_FILE = COORDINATION_DIR / "work_claims_fast.jsonl"
+# Claims, progress and completions live in one SQLite store; the JSON files above are
+# imported into it the first time it is created
+COORDINATION_DB = COORDINATION_DIR / "coordination.db"
 
 # Enums
 class Priority(str, Enum):
@@ -60,41 +64,10 @@ def ensure_coordination_dir():
     """Ensure coordination directory exists"""
     COORDINATION_DIR.mkdir(parents=True, exist_ok=True)
 
-def atomic_json_update(filepath: Path, update_func):
-    """Atomically update a JSON file with locking"""
-    lock_file = filepath.with_suffix('.json.lock')
-    
-    # Try to acquire lock
-    try:
-        lock_fd = os.open(str(lock_file), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-    except FileExistsError:
-        console.print("⚠️  Another process is updating, please retry", style="yellow")
-        return False
-    
-    try:
-        # Initialize file if doesn't exist
-        if not filepath.exists():
-            filepath.write_text("[]")
-        
-        # Read current data
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        
-        # Apply update
-        new_data = update_func(data)
-        
-        # Write atomically
-        temp_file = filepath.with_suffix('.json.tmp')
-        with open(temp_file, 'w') as f:
-            json.dump(new_data, f, indent=2)
-        
-        # Atomic move
-        temp_file.replace(filepath)
-        return True
-        
-    finally:
-        os.close(lock_fd)
-        lock_file.unlink()
+def get_store() -> WorkStore:
+    """Open the coordination store (importing legacy JSON files on first use)"""
+    ensure_coordination_dir()
+    return open_work_store(COORDINATION_DB, legacy_dir=COORDINATION_DIR)
 
 # Core Commands
 @app.command()
@@ -103,7 +76,7 @@ def claim(
     description: str = typer.Argument(..., help="Work description"),
     priority: Priority = typer.Option(Priority.medium, help="Work priority"),
     team: str = typer.Option("autonomous_team", help="Team assignment"),
-    fast: bool = typer.Option(True, help="Use fast-path optimization")
+    fast: bool = typer.Option(True, help="Ignored; kept for compatibility")
 ):
     """Claim work atomically with nanosecond-precision ID"""
     ensure_coordination_dir()
@@ -113,52 +86,18 @@ def claim(
     
     console.print(f"🤖 Agent {agent_id} claiming work: {work_id}")
     
-    if fast:
-        # Fast-path: Append to JSONL file
-        claim_entry = {
-            "work_item_id": work_id,
-            "agent_id": agent_id,
-            "claimed_at": datetime.now().isoformat() + "Z",
-            "work_type": work_type,
-            "description": description,
-            "priority": priority.value,
-            "status": WorkStatus.active.value,
-            "team": team
-        }
-        
-        # Simple append operation
-        with open(FAST_CLAIMS_FILE, 'a') as f:
-            f.write(json.dumps(claim_entry) + '\n')
-        
-        console.print(f"✅ [green]SUCCESS[/green]: Fast-path claimed {work_id}")
-        console.print(f"   Type: {work_type}, Priority: {priority.value}, Team: {team}")
-        
-        # Set environment for subsequent commands
-        os.environ["CURRENT_WORK_ITEM"] = work_id
-        os.environ["AGENT_ID"] = agent_id
-        
-    else:
-        # Regular path with full JSON
-        claim_data = {
-            "work_item_id": work_id,
-            "agent_id": agent_id,
-            "claimed_at": datetime.now().isoformat() + "Z",
-            "work_type": work_type,
-            "description": description,
-            "priority": priority.value,
-            "status": WorkStatus.active.value,
-            "team": team,
-            "progress": 0
-        }
-        
-        def add_claim(data):
-            data.append(claim_data)
-            return data
-        
-        if atomic_json_update(WORK_CLAIMS_FILE, add_claim):
-            console.print(f"✅ [green]SUCCESS[/green]: Claimed {work_id}")
-            os.environ["CURRENT_WORK_ITEM"] = work_id
-            os.environ["AGENT_ID"] = agent_id
+    # Every claim is a single indexed insert, so there is no separate fast path any more
+    store = get_store()
+    with store.transaction():
+        store.add_work(description, type=work_type, priority=priority.value, team=team, work_id=work_id, progress=0)
+        store.claim(work_id, agent_id, status=WorkStatus.active.value)
+    
+    console.print(f"✅ [green]SUCCESS[/green]: Claimed {work_id}")
+    console.print(f"   Type: {work_type}, Priority: {priority.value}, Team: {team}")
+    
+    # Set environment for subsequent commands
+    os.environ["CURRENT_WORK_ITEM"] = work_id
+    os.environ["AGENT_ID"] = agent_id
 
 @app.command()
 def progress(
@@ -172,18 +111,11 @@ def progress(
         console.print("❌ No work item ID specified", style="red")
         raise typer.Exit(1)
     
-    def update_progress(data):
-        updated = False
-        for item in data:
-            if item.get("work_item_id") == work_id:
-                item["progress"] = percent
-                item["status"] = status.value
-                item["last_update"] = datetime.now().isoformat() + "Z"
-                updated = True
-        return data
-    
-    if atomic_json_update(WORK_CLAIMS_FILE, update_progress):
+    if get_store().update_work(work_id, progress=percent, status=status.value,
+                               last_update=datetime.now().isoformat() + "Z"):
         console.print(f"📈 Updated {work_id} to {percent}% ({status.value})")
+    else:
+        console.print(f"❌ Work item {work_id} not found", style="red")
 
 @app.command()
 def complete(
@@ -197,86 +129,56 @@ def complete(
         console.print("❌ No work item ID specified", style="red")
         raise typer.Exit(1)
     
-    completion_time = datetime.now().isoformat() + "Z"
-    
-    # Update work claims
-    def mark_complete(data):
-        for item in data:
-            if item.get("work_item_id") == work_id:
-                item["status"] = WorkStatus.completed.value
-                item["completed_at"] = completion_time
-                item["result"] = result
-                item["velocity_points"] = velocity
-        return data
-    
-    # Log completion
-    def log_completion(data):
-        data.append({
-            "work_item_id": work_id,
-            "completed_at": completion_time,
-            "agent_id": os.environ.get("AGENT_ID", "unknown"),
-            "result": result,
-            "velocity_points": velocity
-        })
-        return data
-    
-    if atomic_json_update(WORK_CLAIMS_FILE, mark_complete):
-        atomic_json_update(COORDINATION_LOG_FILE, log_completion)
+    store = get_store()
+    with store.transaction():
+        completed = store.complete(work_id, status=WorkStatus.completed.value, result=result, velocity_points=velocity)
+        if completed:
+            store.log_event("work_completed", {
+                "work_item_id": work_id,
+                "agent_id": os.environ.get("AGENT_ID", "unknown"),
+                "result": result,
+                "velocity_points": velocity
+            })
+    
+    if completed:
         console.print(f"✅ Completed {work_id} ({result}) - {velocity} points")
         if "CURRENT_WORK_ITEM" in os.environ:
             del os.environ["CURRENT_WORK_ITEM"]
+    else:
+        console.print(f"❌ Work item {work_id} not found", style="red")
 
 @app.command()
-def dashboard(fast: bool = typer.Option(True, help="Use fast-path dashboard")):
+def dashboard(fast: bool = typer.Option(True, help="Ignored; kept for compatibility")):
     """Show coordination dashboard"""
     console.print("🚀 [bold]COORDINATION DASHBOARD[/bold]")
     console.print("=" * 50)
     
-    if fast and FAST_CLAIMS_FILE.exists():
-        # Fast-path: Count lines in JSONL
-        with open(FAST_CLAIMS_FILE, 'r') as f:
-            fast_items = [json.loads(line) for line in f if line.strip()]
-        
-        active_fast = [item for item in fast_items if item.get("status") == "active"]
-        
-        console.print(f"\n⚡ Fast-path active items: {len(active_fast)}")
-        
-        # Show recent items
-        if active_fast:
-            table = Table(title="Recent Active Work (Fast-Path)")
-            table.add_column("Work ID", style="cyan")
-            table.add_column("Type", style="green")
-            table.add_column("Priority", style="yellow")
-            table.add_column("Team", style="blue")
-            
-            for item in active_fast[-5:]:  # Last 5 items
-                table.add_row(
-                    item["work_item_id"],
-                    item["work_type"],
-                    item["priority"],
-                    item["team"]
-                )
-            
-            console.print(table)
+    store = get_store()
+    counts = store.work_counts()
+    active_items = store.list_work(status=WorkStatus.active.value, limit=5)
     
-    # Regular dashboard
-    if WORK_CLAIMS_FILE.exists():
-        with open(WORK_CLAIMS_FILE, 'r') as f:
-            claims = json.load(f)
-        
-        active_items = [c for c in claims if c.get("status") != "completed"]
-        completed_items = [c for c in claims if c.get("status") == "completed"]
+    console.print(f"\n⚡ Active items: {counts.get(WorkStatus.active.value, 0)}")
+    
+    # Show recent items
+    if active_items:
+        table = Table(title="Recent Active Work")
+        table.add_column("Work ID", style="cyan")
+        table.add_column("Type", style="green")
+        table.add_column("Priority", style="yellow")
+        table.add_column("Team", style="blue")
         
-        console.print(f"\n📊 Work Summary:")
-        console.print(f"   Active: {len(active_items)}")
-        console.print(f"   Completed: {len(completed_items)}")
+        for item in active_items:
+            table.add_row(item["id"], item["type"], item["priority"], item["team"])
         
-        # Calculate velocity
-        if COORDINATION_LOG_FILE.exists():
-            with open(COORDINATION_LOG_FILE, 'r') as f:
-                log_data = json.load(f)
-            total_velocity = sum(item.get("velocity_points", 0) for item in log_data)
-            console.print(f"   Total Velocity: {total_velocity} points")
+        console.print(table)
+    
+    completed = counts.get(WorkStatus.completed.value, 0)
+    console.print(f"\n📊 Work Summary:")
+    console.print(f"   Active: {sum(counts.values()) - completed}")
+    console.print(f"   Completed: {completed}")
+    
+    # Calculate velocity
+    console.print(f"   Total Velocity: {store.total('velocity_points', status=WorkStatus.completed.value):.0f} points")
 
 @app.command()
 def list_work(
@@ -284,19 +186,7 @@ def list_work(
     status: Optional[WorkStatus] = typer.Option(None, help="Filter by status")
 ):
     """List work items with filters"""
-    if not WORK_CLAIMS_FILE.exists():
-        console.print("No work items found")
-        return
-    
-    with open(WORK_CLAIMS_FILE, 'r') as f:
-        claims = json.load(f)
-    
-    # Apply filters
-    filtered = claims
-    if team:
-        filtered = [c for c in filtered if c.get("team") == team]
-    if status:
-        filtered = [c for c in filtered if c.get("status") == status.value]
+    filtered = get_store().list_work(team=team, status=status.value if status else None)
     
     if not filtered:
         console.print("No matching work items")
@@ -313,48 +203,40 @@ def list_work(
     
     for item in filtered:
         table.add_row(
-            item["work_item_id"][:20] + "...",
-            item["work_type"],
+            item["id"][:20] + "...",
+            item["type"],
             item["priority"],
             item["status"],
             f"{item.get('progress', 0)}%",
-            item["agent_id"][:15] + "..."
+            (item["agent_id"] or "")[:15] + "..."
         )
     
     console.print(table)
 
 @app.command()
 def optimize():
-    """Archive completed work for performance (80/20 optimization)"""
-    if not WORK_CLAIMS_FILE.exists():
-        console.print("No work claims to optimize")
-        return
-    
-    with open(WORK_CLAIMS_FILE, 'r') as f:
-        claims = json.load(f)
-    
-    completed = [c for c in claims if c.get("status") == "completed"]
-    active = [c for c in claims if c.get("status") != "completed"]
-    
-    if not completed:
-        console.print("No completed items to archive")
-        return
-    
-    # Archive completed items
-    archive_dir = COORDINATION_DIR / "archived_claims"
-    archive_dir.mkdir(exist_ok=True)
-    
-    archive_file = archive_dir / f"completed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(archive_file, 'w') as f:
-        json.dump(completed, f, indent=2)
-    
-    # Keep only active items
-    with open(WORK_CLAIMS_FILE, 'w') as f:
-        json.dump(active, f, indent=2)
+    """Archive completed work to JSON and remove it from the store"""
+    store = get_store()
+    with store.transaction():
+        completed = store.list_work(status=WorkStatus.completed.value)
+        
+        if not completed:
+            console.print("No completed items to archive")
+            return
+        
+        # Archive completed items before removing them, so a failed write loses nothing
+        archive_dir = COORDINATION_DIR / "archived_claims"
+        archive_dir.mkdir(exist_ok=True)
+        
+        archive_file = archive_dir / f"completed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        with open(archive_file, 'w') as f:
+            json.dump(completed, f, indent=2)
+        
+        store.purge(WorkStatus.completed.value)
     
     console.print(f"✅ Archived {len(completed)} completed items")
     console.print(f"   Archive: {archive_file}")
-    console.print(f"   Active items: {len(active)}")
+    console.print(f"   Active items: {sum(store.work_counts().values())}")
 
 if __name__ == "__main__":
     app()
\ No newline at end of file
@@ -1,17 +1,67 @@
 # """dslmodel."""
+import importlib
 import warnings
+from typing import TYPE_CHECKING
+
+# Public names are resolved on first access (PEP 562) so that ``import dslmodel`` does not pull in
+# dspy, pandas or the template stack, and no LM is configured until a prompt-driven method needs one.
+_LAZY_ATTRS = {
+    "DSLModel": ".dsl_models",
+    "render": ".template",
+    "init_log": ".utils.log_tools",
+    "log_warning": ".utils.log_tools",
+    "log_info": ".utils.log_tools",
+    "log_debug": ".utils.log_tools",
+    "log_error": ".utils.log_tools",
+    "log_critical": ".utils.log_tools",
+    "log_exception": ".utils.log_tools",
+    "logger": ".utils.log_tools",
+    "DataReader": ".readers.data_reader",
+    "init_instant": ".utils.dspy_tools",
+    "init_lm": ".utils.dspy_tools",
+    "init_text": ".utils.dspy_tools",
+    "ensure_lm": ".utils.dspy_tools",
+    "DataWriter": ".writers.data_writer",
+    "Field": "pydantic",
+    "run_dsls": ".utils.model_tools",
+    "from_prompt_chain": ".utils.model_tools",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+if TYPE_CHECKING:
+    from pydantic import Field
+
+    from .dsl_models import DSLModel
+    from .readers.data_reader import DataReader
+    from .template import render
+    from .utils.dspy_tools import ensure_lm, init_instant, init_lm, init_text
+    from .utils.log_tools import (
+        init_log,
+        log_critical,
+        log_debug,
+        log_error,
+        log_exception,
+        log_info,
+        log_warning,
+        logger,
+    )
+    from .utils.model_tools import from_prompt_chain, run_dsls
+    from .writers.data_writer import DataWriter
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# from .generators.dsl_class_generator import DSLClassGenerator
-from .dsl_models import DSLModel
-from .template import render
-from .utils.log_tools import init_log, log_warning, log_info, log_debug, log_error, log_critical, log_exception, logger
-from .readers.data_reader import DataReader
-from .utils.dspy_tools import init_instant, init_lm, init_text
-from .writers.data_writer import DataWriter
-from pydantic import Field
-from .utils.model_tools import run_dsls, from_prompt_chain
-
-init_text()
 
 #
 # # Ignore all DeprecationWarnings
@@ -14,6 +14,7 @@ from dslmodel.agents.examples.ping_agent import PingAgent
 from dslmodel.agents.examples.roberts_agent import RobertsAgent
 from dslmodel.agents.examples.scrum_agent import ScrumAgent
 from dslmodel.agents.examples.lean_agent import LeanAgent
+from dslmodel.utils.span_writer import span_writer
 
 
 class SwarmDemo:
@@ -54,9 +55,7 @@ class SwarmDemo:
             "attributes": attributes or {}
         }
         
-        with self.span_file.open("a") as f:
-            json.dump(span, f)
-            f.write("\n")
+        span_writer(self.span_file).write(span)
         
         print(f"📤 Emitted: {name}")
         if attributes:
@@ -1,6 +1,10 @@
 """Swarm agent implementation for coordinated multi-agent systems."""
 
+from .command_executor import CommandExecutor, CommandResult, command_executor
+from .span_bus import SpanBus
+from .span_router import SpanRouter
+from .span_tail import SpanTail
 from .swarm_agent import SwarmAgent, NextCommand
 from .swarm_models import SwarmAgentModel, SwarmState
 
-__all__ = ["SwarmAgent", "NextCommand", "SwarmAgentModel", "SwarmState"]
\ No newline at end of file
+__all__ = ["SwarmAgent", "NextCommand", "CommandExecutor", "CommandResult", "command_executor", "SpanBus", "SpanRouter", "SpanTail", "SwarmAgentModel", "SwarmState"]
\ No newline at end of file
@@ -0,0 +1,371 @@
+"""Run swarm agent `NextCommand`s in-process, on warm worker processes, or as subprocesses."""
+
+from __future__ import annotations
+import asyncio
+import concurrent.futures
+import json
+import pathlib
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Collection, Dict, List, Optional, Sequence
+
+from loguru import logger
+
+from .command_worker import invoke
+from .swarm_models import NextCommand
+
+WORKER_SCRIPT = pathlib.Path(__file__).with_name("command_worker.py")
+
+
+@dataclass
+class CommandResult:
+    """Outcome of one command; ``mode`` is ``inprocess``, ``pool`` or ``subprocess``."""
+
+    argv: List[str]
+    returncode: int
+    stdout: str = ""
+    stderr: str = ""
+    duration_s: float = 0.0
+    mode: str = "subprocess"
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+
+@dataclass
+class CommandStats:
+    """Latency and outcome counters of one command path."""
+
+    count: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    modes: Counter = field(default_factory=Counter)
+
+    def add(self, result: CommandResult) -> None:
+        self.count += 1
+        self.failures += not result.ok
+        self.timeouts += result.timed_out
+        self.total_s += result.duration_s
+        self.max_s = max(self.max_s, result.duration_s)
+        self.modes[result.mode] += 1
+
+
+def command_argv(cmd: NextCommand) -> List[str]:
+    """The CLI arguments of ``cmd``: its ``path`` (or dotted ``fq_name``) followed by its ``args``."""
+    path = cmd.path if cmd.path is not None else (cmd.fq_name.split(".") if cmd.fq_name else [])
+    return [*path, *cmd.args]
+
+
+def worker_command(cli_command: Sequence[str]) -> Optional[List[str]]:
+    """
+    The command line of a warm worker for ``cli_command``, if it runs a Python CLI.
+
+    ``python script.py ...`` and ``python -m module ...`` can be served by a worker that imports
+    the script's or module's ``app`` once; anything else cannot.
+    """
+    if len(cli_command) < 2 or not pathlib.Path(cli_command[0]).name.startswith("python"):
+        return None
+    if cli_command[1] == "-m" and len(cli_command) == 3:
+        return [cli_command[0], str(WORKER_SCRIPT), "-m", cli_command[2]]
+    if cli_command[1].endswith(".py") and len(cli_command) == 2:
+        return [cli_command[0], str(WORKER_SCRIPT), cli_command[1]]
+    return None
+
+
+class _Worker:
+    """Parent-side handle of one long-lived `command_worker` process."""
+
+    def __init__(self, command: List[str], startup_timeout: float):
+        self.command = command
+        self.startup_timeout = startup_timeout
+        self.proc: Optional[asyncio.subprocess.Process] = None
+
+    async def start(self) -> None:
+        self.proc = await asyncio.create_subprocess_exec(
+            *self.command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE, limit=2**24
+        )
+        try:
+            line = await asyncio.wait_for(self.proc.stdout.readline(), self.startup_timeout)
+            ready = json.loads(line) if line else {"error": "worker exited during startup"}
+        except (asyncio.TimeoutError, ValueError) as e:
+            ready = {"error": f"no ready message: {e!r}"}
+        if not ready.get("ready"):
+            self.kill()
+            raise RuntimeError(ready.get("error"))
+
+    async def call(self, argv: List[str], timeout: Optional[float]) -> Dict[str, Any]:
+        if self.proc is None or self.proc.returncode is not None:
+            await self.start()
+        self.proc.stdin.write(json.dumps({"argv": argv}).encode() + b"\n")
+        await self.proc.stdin.drain()
+        line = await asyncio.wait_for(self.proc.stdout.readline(), timeout)
+        if not line:
+            self.proc = None
+            raise EOFError("worker exited")
+        return json.loads(line)
+
+    def kill(self) -> None:
+        if self.proc is not None and self.proc.returncode is None:
+            self.proc.kill()
+        self.proc = None
+
+
+class CommandExecutor:
+    """
+    Execute `NextCommand`s with bounded concurrency, timeouts and per-command latency stats.
+
+    Each command runs in the cheapest way available:
+
+    - **in-process** when ``app`` (a Typer app or click command) is given and the command path
+      is in ``inprocess_commands`` (all of ``app``'s commands if None). Commands run one at a time
+      on a dedicated thread, since capturing output swaps ``sys.stdout``; a command that times out
+      keeps that thread busy until it returns.
+    - **pool**: a warm worker process that imported the CLI once, when ``cli_command`` is
+      ``python script.py`` or ``python -m module`` and the target has a Typer ``app``. Up to
+      ``pool_size`` workers are started on first use; a worker that times out is killed and
+      replaced.
+    - **subprocess**: ``cli_command`` + arguments in a new process, as before.
+
+    The executor runs its own event loop thread, so `run` (blocking), `arun` (from any event loop)
+    and `run_many` share one pool.
+
+    Args:
+        cli_command: Command prefix, e.g. ``["python", "coordination_cli.py"]``
+        app: CLI to run commands of in-process
+        inprocess_commands: Command paths (e.g. ``"work list"``) safe to run in-process
+        pool_size: Warm worker processes (0 disables the pool)
+        max_concurrency: Commands running at once, across all modes
+        timeout: Seconds before a command is abandoned (None waits forever)
+    """
+
+    def __init__(self,
+                 cli_command: Sequence[str],
+                 app: Any = None,
+                 inprocess_commands: Optional[Collection[str]] = None,
+                 pool_size: int = 2,
+                 max_concurrency: int = 8,
+                 timeout: Optional[float] = 60.0,
+                 startup_timeout: float = 30.0):
+        self.cli_command = list(cli_command)
+        self.inprocess_commands = None if inprocess_commands is None else {
+            tuple(command.split()) for command in inprocess_commands
+        }
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.stats: Dict[str, CommandStats] = {}
+        self._app = app
+        self._command = None
+        self._inprocess_thread = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="cli-inprocess")
+        self._worker_command = worker_command(self.cli_command) if pool_size else None
+        self._pool_size = pool_size
+        self._startup_timeout = startup_timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        # Created on the executor's loop
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._idle: Optional[asyncio.Queue] = None
+        self._pool_started: Optional[asyncio.Future] = None
+        self._workers: List[_Worker] = []
+
+    # Public API
+
+    def submit(self, cmd: NextCommand) -> concurrent.futures.Future:
+        """Start ``cmd`` and return a future of its `CommandResult`."""
+        name = " ".join(cmd.path) if cmd.path is not None else cmd.fq_name or ""
+        return asyncio.run_coroutine_threadsafe(self._execute(name, command_argv(cmd)), self._ensure_loop())
+
+    def run(self, cmd: NextCommand) -> CommandResult:
+        return self.submit(cmd).result()
+
+    async def arun(self, cmd: NextCommand) -> CommandResult:
+        return await asyncio.wrap_future(self.submit(cmd))
+
+    def run_many(self, cmds: Sequence[NextCommand]) -> List[CommandResult]:
+        """Run ``cmds`` concurrently (up to ``max_concurrency``); results in command order."""
+        return [future.result() for future in [self.submit(cmd) for cmd in cmds]]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Count, failures, timeouts, mean/max latency and mode counts per command path."""
+        with self._stats_lock:
+            return {
+                name: {
+                    "count": stats.count,
+                    "failures": stats.failures,
+                    "timeouts": stats.timeouts,
+                    "mean_s": stats.total_s / stats.count,
+                    "max_s": stats.max_s,
+                    "modes": dict(stats.modes),
+                }
+                for name, stats in self.stats.items()
+            }
+
+    def close(self) -> None:
+        """Stop the worker processes and the executor's loop; the executor cannot be used afterwards."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(self._stop_workers(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+        self._inprocess_thread.shutdown(wait=False)
+
+    def __enter__(self) -> CommandExecutor:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # Dispatch
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="cli-executor", daemon=True).start()
+                self._slots = asyncio.Semaphore(self.max_concurrency)
+                self._loop = loop
+            return self._loop
+
+    async def _execute(self, name: str, argv: List[str]) -> CommandResult:
+        async with self._slots:
+            start = time.perf_counter()
+            if self._runs_inprocess(argv):
+                result = await self._run_inprocess(argv)
+            elif self._worker_command is not None and await self._pool_ready():
+                result = await self._run_pooled(argv)
+            else:
+                result = await self._run_subprocess(argv)
+            result.duration_s = time.perf_counter() - start
+        self._record(name, result)
+        return result
+
+    def _runs_inprocess(self, argv: List[str]) -> bool:
+        if self._app is None:
+            return False
+        if self.inprocess_commands is None:
+            return True
+        return any(tuple(argv[:len(path)]) == path for path in self.inprocess_commands)
+
+    async def _run_inprocess(self, argv: List[str]) -> CommandResult:
+        if self._command is None:
+            self._command = self._app if hasattr(self._app, "main") else _typer_command(self._app)
+        future = asyncio.get_running_loop().run_in_executor(self._inprocess_thread, invoke, self._command, argv)
+        try:
+            return CommandResult(argv, mode="inprocess", **await asyncio.wait_for(future, self.timeout))
+        except asyncio.TimeoutError:
+            return CommandResult(argv, -1, mode="inprocess", timed_out=True)
+
+    async def _pool_ready(self) -> bool:
+        # The first caller starts one worker; concurrent callers wait for the same outcome
+        if self._pool_started is None:
+            self._pool_started = asyncio.ensure_future(self._start_pool())
+        return await asyncio.shield(self._pool_started)
+
+    async def _start_pool(self) -> bool:
+        worker = _Worker(self._worker_command, self._startup_timeout)
+        try:
+            await worker.start()
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Cannot start a command worker for {self.cli_command}, spawning per command: {e}")
+            self._worker_command = None
+            return False
+        self._workers = [worker] + [
+            _Worker(self._worker_command, self._startup_timeout) for _ in range(self._pool_size - 1)
+        ]
+        self._idle = asyncio.Queue()
+        for worker in self._workers:  # the others start on first use
+            self._idle.put_nowait(worker)
+        return True
+
+    async def _run_pooled(self, argv: List[str]) -> CommandResult:
+        worker = await self._idle.get()
+        try:
+            return CommandResult(argv, mode="pool", **await worker.call(argv, self.timeout))
+        except asyncio.TimeoutError:
+            worker.kill()
+            return CommandResult(argv, -1, mode="pool", timed_out=True)
+        except (OSError, EOFError, RuntimeError, ValueError) as e:
+            worker.kill()
+            return CommandResult(argv, -1, stderr=f"Command worker failed: {e}\n", mode="pool")
+        except BaseException:
+            # Cancelled mid-call: the worker still owes a reply to this request, so it cannot be reused
+            worker.kill()
+            raise
+        finally:
+            self._idle.put_nowait(worker)
+
+    async def _run_subprocess(self, argv: List[str]) -> CommandResult:
+        proc = await asyncio.create_subprocess_exec(
+            *self.cli_command, *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), self.timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return CommandResult(argv, -1, timed_out=True)
+        return CommandResult(argv, proc.returncode, stdout.decode(), stderr.decode())
+
+    def _record(self, name: str, result: CommandResult) -> None:
+        with self._stats_lock:
+            self.stats.setdefault(name, CommandStats()).add(result)
+        logger.debug(
+            "{} {} in {:.1f}ms ({}){}", name, "ok" if result.ok else f"failed ({result.returncode})",
+            result.duration_s * 1000, result.mode, " timed out" if result.timed_out else "",
+        )
+
+    async def _stop_workers(self) -> None:
+        for worker in self._workers:
+            if worker.proc is not None and worker.proc.returncode is None:
+                worker.proc.stdin.close()
+                try:
+                    await asyncio.wait_for(worker.proc.wait(), 1.0)
+                except asyncio.TimeoutError:
+                    worker.kill()
+
+
+def _typer_command(app):
+    import typer.main
+
+    return typer.main.get_command(app)
+
+
+_shared: Dict[tuple, CommandExecutor] = {}
+_shared_users: Counter = Counter()
+_shared_lock = threading.Lock()
+
+
+def command_executor(cli_command: Sequence[str], **options: Any) -> CommandExecutor:
+    """
+    The process-wide `CommandExecutor` of ``cli_command``, created with ``options`` on first use.
+
+    Agents running the same CLI share one event loop thread and one worker pool; ``options``
+    given after the executor exists are ignored. Each call takes a reference that must be
+    returned with `release_command_executor`.
+    """
+    key = tuple(cli_command)
+    with _shared_lock:
+        executor = _shared.get(key)
+        if executor is None:
+            executor = _shared[key] = CommandExecutor(cli_command, **options)
+        _shared_users[key] += 1
+        return executor
+
+
+def release_command_executor(executor: CommandExecutor) -> None:
+    """Drop a reference taken by `command_executor`; the last one closes the executor."""
+    key = tuple(executor.cli_command)
+    with _shared_lock:
+        if _shared.get(key) is not executor:
+            return
+        _shared_users[key] -= 1
+        if _shared_users[key] > 0:
+            return
+        del _shared[key], _shared_users[key]
+    executor.close()
@@ -0,0 +1,78 @@
+"""
+Long-lived worker running CLI commands of one Typer/Click app for `CommandExecutor`.
+
+    python command_worker.py path/to/cli.py [ATTRIBUTE]
+    python command_worker.py -m package.module [ATTRIBUTE]
+
+The app (``ATTRIBUTE`` of the script or module, default ``app``) is imported once. The worker then
+reads one JSON request per line from stdin, ``{"argv": [...]}``, runs the command and answers with
+one JSON line, ``{"returncode": n, "stdout": "...", "stderr": "..."}``. The first line written
+is ``{"ready": true}``, or ``{"ready": false, "error": "..."}`` if the app could not be loaded.
+
+This file is run by path, not as part of the dslmodel package, so starting a worker only imports
+the target app.
+"""
+
+import json
+import os
+import runpy
+import sys
+from typing import Any, Dict, List
+
+
+def load_command(target: str, module: bool = False, attribute: str = "app"):
+    """Import ``target`` (a script path, or a module name with ``module``) and return its click command."""
+    namespace = runpy.run_module(target, run_name="__command_worker__") if module else \
+        runpy.run_path(target, run_name="__command_worker__")
+    app = namespace.get(attribute)
+    if app is None:
+        raise LookupError(f"{target} has no attribute '{attribute}'")
+    if not hasattr(app, "main"):  # a Typer app rather than a click command
+        import typer.main
+
+        app = typer.main.get_command(app)
+    return app
+
+
+def invoke(command, argv: List[str]) -> Dict[str, Any]:
+    """Run ``command`` with ``argv``, capturing its output; exceptions become return code 1."""
+    from click.testing import CliRunner
+
+    try:
+        runner = CliRunner(mix_stderr=False)
+    except TypeError:  # click >= 8.2 always captures stderr separately
+        runner = CliRunner()
+    result = runner.invoke(command, argv, catch_exceptions=True)
+    stderr = result.stderr
+    if result.exception is not None and not isinstance(result.exception, SystemExit):
+        stderr += f"{type(result.exception).__name__}: {result.exception}\n"
+    return {"returncode": result.exit_code, "stdout": result.stdout, "stderr": stderr}
+
+
+def main(args: List[str]) -> None:
+    # Answers go to a private copy of stdout; anything else printing to fd 1 lands on stderr
+    protocol = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+
+    module = args[:1] == ["-m"]
+    if module:
+        args = args[1:]
+    # Import paths as if the target had been run directly, not this file
+    sys.path[0] = os.getcwd() if module else os.path.dirname(os.path.abspath(args[0]))
+    try:
+        command = load_command(args[0], module, *args[1:2])
+    except BaseException as e:
+        protocol.write(json.dumps({"ready": False, "error": f"{type(e).__name__}: {e}"}) + "\n")
+        protocol.flush()
+        sys.exit(1)
+    protocol.write(json.dumps({"ready": True}) + "\n")
+    protocol.flush()
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        protocol.write(json.dumps(invoke(command, request["argv"])) + "\n")
+        protocol.flush()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -15,6 +15,8 @@ from typing import Dict, Any, List
 from dataclasses import dataclass, field
 from queue import Queue
 
+from dslmodel.utils.span_writer import span_writer
+
 
 @dataclass
 class MockSpan:
@@ -64,8 +66,7 @@ class SimpleTelemetry:
         )
         
         # Write to JSONL file
-        with self.span_file.open("a") as f:
-            f.write(span.to_jsonl() + "\n")
+        span_writer(self.span_file).write(span.to_jsonl())
         
         return span
 
@@ -40,6 +40,7 @@ from opentelemetry.sdk.metrics.export import (
 
 # Local imports
 from dslmodel.agents.swarm import SwarmAgent, NextCommand, SpanData
+from dslmodel.utils.span_writer import span_writer
 
 
 class JSONLSpanExporter(SpanExporter):
@@ -53,32 +54,34 @@ class JSONLSpanExporter(SpanExporter):
         self.output_file = output_file
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
         self.output_file.touch()
+        self.writer = span_writer(self.output_file)
     
     def export(self, spans) -> SpanExportResult:
         """Export spans to JSONL file."""
         try:
-            with self.output_file.open("a") as f:
-                for span in spans:
-                    # Convert OTEL span to SwarmAgent format
-                    span_data = {
-                        "name": span.name,
-                        "trace_id": format(span.context.trace_id, "032x"),
-                        "span_id": format(span.context.span_id, "016x"),
-                        "parent_span_id": format(span.parent.span_id, "016x") if span.parent else None,
-                        "timestamp": span.start_time / 1e9,  # Convert to seconds
-                        "duration_ms": (span.end_time - span.start_time) / 1e6 if span.end_time else None,
-                        "attributes": dict(span.attributes) if span.attributes else {},
-                        "status": span.status.status_code.name if span.status else "UNSET",
-                        "events": [
-                            {
-                                "name": event.name,
-                                "timestamp": event.timestamp / 1e9,
-                                "attributes": dict(event.attributes) if event.attributes else {}
-                            }
-                            for event in span.events
-                        ] if span.events else []
-                    }
-                    f.write(json.dumps(span_data) + "\n")
+            records = []
+            for span in spans:
+                # Convert OTEL span to SwarmAgent format
+                span_data = {
+                    "name": span.name,
+                    "trace_id": format(span.context.trace_id, "032x"),
+                    "span_id": format(span.context.span_id, "016x"),
+                    "parent_span_id": format(span.parent.span_id, "016x") if span.parent else None,
+                    "timestamp": span.start_time / 1e9,  # Convert to seconds
+                    "duration_ms": (span.end_time - span.start_time) / 1e6 if span.end_time else None,
+                    "attributes": dict(span.attributes) if span.attributes else {},
+                    "status": span.status.status_code.name if span.status else "UNSET",
+                    "events": [
+                        {
+                            "name": event.name,
+                            "timestamp": event.timestamp / 1e9,
+                            "attributes": dict(event.attributes) if event.attributes else {}
+                        }
+                        for event in span.events
+                    ] if span.events else []
+                }
+                records.append(span_data)
+            self.writer.write_many(records)
             return SpanExportResult.SUCCESS
         except Exception as e:
             print(f"Failed to export spans: {e}")
@@ -86,7 +89,11 @@ class JSONLSpanExporter(SpanExporter):
     
     def shutdown(self):
         """Shutdown the exporter."""
-        pass
+        self.writer.flush()
+    
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        self.writer.flush()
+        return True
 
 
 class SwarmTelemetry:
@@ -0,0 +1,179 @@
+"""One span stream reader fanning spans out to many swarm agents in one asyncio loop."""
+
+from __future__ import annotations
+import asyncio
+import pathlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from .span_router import SpanRouter
+from .span_tail import SpanTail
+from .swarm_agent import SwarmAgent
+from .swarm_models import NextCommand, SpanData
+
+
+@dataclass
+class AgentStats:
+    """Delivery counters of one agent on a `SpanBus`."""
+
+    name: str
+    received: int = 0
+    handled: int = 0
+    commands: int = 0
+    errors: int = 0
+    max_queued: int = 0
+
+
+@dataclass
+class _Batch:
+    """A batch read from the stream: the position after it and its spans not yet handled."""
+
+    position: Tuple[int, int]
+    outstanding: int = 1  # held at 1 while the batch is still being published
+
+
+class SpanBus:
+    """
+    Host many agents on one span stream: one reader, one decode per span, one routing pass.
+
+    Every span is matched against all agents' ``TRIGGER_MAP`` keywords and ``LISTEN_FILTER``
+    prefixes at once (see `SpanRouter`) and put on the queue of each agent it triggers, together
+    with the handler to call. Agents that override ``forward`` get every span. Each agent drains
+    its own bounded queue in its own task, so a slow agent does not delay the others until its
+    queue is full; then reading pauses until it catches up (backpressure rather than drops).
+    Commands returned by handlers run through the agent's ``arun_cli``.
+
+    The stream offset is committed after the newest batch that, together with every batch
+    before it, all agents have handled, so a restarted bus resumes after it even if the bus
+    was never idle.
+
+    Args:
+        span_stream: JSONL span file to follow
+        agents: Agents to host (more can be added with `add` before `run`)
+        queue_size: Spans an agent may have waiting before reading pauses
+        offset_file: Where to persist the stream position (None starts at the end every time)
+    """
+
+    def __init__(self,
+                 span_stream: pathlib.Path,
+                 agents: Sequence = (),
+                 queue_size: int = 1000,
+                 offset_file: Optional[pathlib.Path] = None):
+        self.span_stream = pathlib.Path(span_stream)
+        self.offset_file = offset_file
+        self.queue_size = queue_size
+        self.agents: List = []
+        self.stats: List[AgentStats] = []
+        self.router: Optional[SpanRouter] = None
+        self._tail: Optional[SpanTail] = None
+        self._batches: Deque[_Batch] = deque()  # published batches not yet committed, oldest first
+        for agent in agents:
+            self.add(agent)
+
+    def add(self, agent) -> None:
+        """Host ``agent``; must be called before `run`."""
+        if self.router is not None:
+            raise RuntimeError("Agents cannot be added to a running SpanBus")
+        self.agents.append(agent)
+        self.stats.append(AgentStats(agent.__class__.__name__))
+
+    def build_router(self) -> SpanRouter:
+        opaque = [
+            position for position, agent in enumerate(self.agents)
+            if getattr(type(agent), "forward", SwarmAgent.forward) is not SwarmAgent.forward
+        ]
+        return SpanRouter(self.agents, opaque=opaque)
+
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        """Follow the stream and dispatch spans until ``stop`` is set, then drain the queues."""
+        self.router = self.build_router()
+        queues: List[asyncio.Queue] = [asyncio.Queue(self.queue_size) for _ in self.agents]
+        workers = [
+            asyncio.create_task(self._drain(agent, queue, stats))
+            for agent, queue, stats in zip(self.agents, queues, self.stats)
+        ]
+        logger.info(f"Span bus hosting {len(self.agents)} agent(s) on {self.span_stream}")
+        try:
+            with SpanTail(self.span_stream, offset_file=self.offset_file) as tail:
+                self._tail = tail
+                async for spans in tail.afollow(stop):
+                    batch = _Batch(tail.position)
+                    self._batches.append(batch)
+                    await self.publish(spans, queues, batch)
+                    self._done(batch)
+                await asyncio.gather(*(queue.join() for queue in queues))
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.router = self._tail = None
+            self._batches.clear()
+
+    async def publish(self, spans: List[SpanData], queues: List[asyncio.Queue], batch: _Batch) -> None:
+        """Put each span on the queue of every agent it routes to, waiting while a queue is full."""
+        for span in spans:
+            for position, method_name in self.router.route(span.name):
+                queue, stats = queues[position], self.stats[position]
+                batch.outstanding += 1
+                await queue.put((span, method_name, batch))
+                stats.received += 1
+                stats.max_queued = max(stats.max_queued, queue.qsize())
+
+    def _done(self, batch: _Batch) -> None:
+        """Count one delivery of ``batch`` as handled and commit past every finished leading batch."""
+        batch.outstanding -= 1
+        position = None
+        while self._batches and not self._batches[0].outstanding:
+            position = self._batches.popleft().position
+        if position is not None:
+            self._tail.commit(position)
+
+    async def _drain(self, agent, queue: asyncio.Queue, stats: AgentStats) -> None:
+        while True:
+            span, method_name, batch = await queue.get()
+            try:
+                cmd = self.dispatch(agent, span, method_name)
+                stats.handled += 1
+                if cmd:
+                    stats.commands += 1
+                    stdout, stderr = await agent.arun_cli(cmd)
+                    if stderr:
+                        logger.warning(f"{stats.name} command {cmd.path} failed: {stderr}")
+            except Exception as e:
+                stats.errors += 1
+                logger.error(f"{stats.name} failed to handle span {span.name}: {e}")
+            finally:
+                queue.task_done()
+                self._done(batch)
+
+    @staticmethod
+    def dispatch(agent, span: SpanData, method_name: Optional[str]) -> Optional[NextCommand]:
+        if method_name is None:
+            return agent.forward(span)
+        return getattr(agent, method_name)(span)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Counters per hosted agent, keyed ``name`` or ``name#n`` for repeated classes."""
+        result = {}
+        for stats in self.stats:
+            key, n = stats.name, 1
+            while key in result:
+                n += 1
+                key = f"{stats.name}#{n}"
+            result[key] = {
+                "received": stats.received,
+                "handled": stats.handled,
+                "commands": stats.commands,
+                "errors": stats.errors,
+                "max_queued": stats.max_queued,
+            }
+        return result
+
+    def run_forever(self) -> None:
+        try:
+            asyncio.run(self.run())
+        except KeyboardInterrupt:
+            logger.info("Span bus stopped")
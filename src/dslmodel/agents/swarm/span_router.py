@@ -0,0 +1,128 @@
+"""Precompiled routing of span names to swarm agent trigger handlers."""
+
+from __future__ import annotations
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton finding which of a fixed set of keywords occur in a text.
+
+    One pass over the text finds every keyword, however many there are, instead of one
+    substring scan per keyword.
+
+    Args:
+        keywords: Keywords to find; their positions are the ids `find` returns
+    """
+
+    def __init__(self, keywords: Sequence[str]):
+        self.keywords = list(keywords)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        self._always = tuple(i for i, keyword in enumerate(self.keywords) if not keyword)
+
+        for i, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                if char not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                    self._goto[state][char] = len(self._goto) - 1
+                state = self._goto[state][char]
+            if keyword:
+                self._out[state] += (i,)
+
+        # Breadth-first, so a state's failure link is final before its children need it
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] += self._out[self._fail[child]]
+
+    def find(self, text: str) -> List[int]:
+        """Ids of the keywords occurring in ``text``, in keyword order."""
+        found = set(self._always)
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return sorted(found)
+
+
+def trigger_keys(agent) -> List[Tuple[str, str]]:
+    """An agent's ``(keyword, method name)`` pairs whose handler exists, in ``TRIGGER_MAP`` order."""
+    return [
+        (keyword, method_name)
+        for keyword, method_name in getattr(agent, "TRIGGER_MAP", {}).items()
+        if getattr(agent, method_name, None)
+    ]
+
+
+class SpanRouter:
+    """
+    Route span names to the handler each agent would pick in `SwarmAgent.forward`.
+
+    For every agent the handler is that of the first ``TRIGGER_MAP`` keyword (in map order)
+    contained in the lower-cased span name, among spans starting with the agent's
+    ``LISTEN_FILTER``. All agents' keywords are matched in one `KeywordMatcher` pass and the
+    result is cached per span name, since span streams repeat a small set of names. Agents in
+    ``opaque`` override ``forward`` themselves and receive every span.
+
+    Args:
+        agents: Agents to route to; `route` refers to them by position
+        opaque: Positions of agents whose own ``forward`` must see every span
+        cache_size: Number of distinct span names whose routes are cached
+    """
+
+    def __init__(self, agents: Sequence, opaque: Iterable[int] = (), cache_size: int = 4096):
+        self.opaque = frozenset(opaque)
+        self._filters = [getattr(agent, "LISTEN_FILTER", None) for agent in agents]
+        keywords: Dict[str, int] = {}
+        # keyword id -> (agent position, rank in its TRIGGER_MAP, method name)
+        self._targets: List[List[Tuple[int, int, str]]] = []
+        for position, agent in enumerate(agents):
+            if position in self.opaque:
+                continue
+            for rank, (keyword, method_name) in enumerate(trigger_keys(agent)):
+                if keyword not in keywords:
+                    keywords[keyword] = len(keywords)
+                    self._targets.append([])
+                self._targets[keywords[keyword]].append((position, rank, method_name))
+        self.matcher = KeywordMatcher(list(keywords))
+        self._agent_count = len(agents)
+        self.route = lru_cache(maxsize=cache_size)(self._route)
+
+    def _route(self, span_name: str) -> Tuple[Tuple[int, Optional[str]], ...]:
+        """``(agent position, method name)`` for every agent the span goes to; None means ``forward``."""
+        best: Dict[int, Tuple[int, str]] = {}
+        for keyword_id in self.matcher.find(span_name.lower()):
+            for position, rank, method_name in self._targets[keyword_id]:
+                if position not in best or rank < best[position][0]:
+                    best[position] = (rank, method_name)
+        routes = []
+        for position in range(self._agent_count):
+            if position in self.opaque:
+                routes.append((position, None))
+            elif position in best:
+                prefix = self._filters[position]
+                if not prefix or span_name.startswith(prefix):
+                    routes.append((position, best[position][1]))
+        return tuple(routes)
+
+    def handler_for(self, span_name: str) -> Optional[str]:
+        """For a single-agent router: the method name the span goes to, if any."""
+        routes = self.route(span_name)
+        return routes[0][1] if routes else None
@@ -0,0 +1,272 @@
+"""Tail a JSONL span stream in batches, waking on file system events instead of polling."""
+
+from __future__ import annotations
+import asyncio
+import json
+import os
+import pathlib
+import threading
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Tuple
+
+from loguru import logger
+from pydantic import TypeAdapter, ValidationError
+
+from .swarm_models import SpanData
+
+# watchdog (inotify on Linux) is optional; without it tails fall back to polling
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+SPAN_BATCH = TypeAdapter(List[SpanData])
+
+_observer = None
+_observer_lock = threading.Lock()
+
+
+def _shared_observer():
+    """One watchdog observer (and inotify instance) shared by every tail in the process."""
+    global _observer
+    with _observer_lock:
+        if _observer is None:
+            _observer = Observer()
+            _observer.daemon = True
+            _observer.start()
+        return _observer
+
+
+if WATCHDOG_AVAILABLE:
+    class _PathHandler(FileSystemEventHandler):
+        """Call ``callback`` for any event on ``path`` (including it being created or moved)."""
+
+        def __init__(self, path: pathlib.Path, callback: Callable[[], None]):
+            self.path = os.fsdecode(path)
+            self.callback = callback
+
+        def on_any_event(self, event):
+            if self.path in (os.fsdecode(event.src_path), os.fsdecode(getattr(event, "dest_path", "") or "")):
+                self.callback()
+
+
+def decode_spans(lines: List[bytes]) -> List[SpanData]:
+    """
+    Decode JSONL lines into spans with one validation call, skipping lines that are not valid spans.
+
+    Args:
+        lines: Complete lines without their trailing newline
+
+    Returns:
+        The spans, in line order
+    """
+    lines = [line for line in lines if line.strip()]
+    if not lines:
+        return []
+    try:
+        return SPAN_BATCH.validate_json(b"[" + b",".join(lines) + b"]")
+    except ValidationError:
+        pass
+    # A bad line fails the whole batch; fall back to one line at a time
+    spans = []
+    for line in lines:
+        try:
+            spans.append(SpanData(**json.loads(line)))
+        except (json.JSONDecodeError, UnicodeDecodeError, TypeError, ValueError):
+            continue
+    return spans
+
+
+class SpanTail:
+    """
+    Follow a JSONL span file, yielding the spans appended to it in batches.
+
+    Reads what is available in ``chunk_size`` blocks, so a burst of spans is decoded and
+    dispatched together; a batch stops at the first line ending past ``max_batch_bytes``, so a
+    large backlog (a resumed offset far behind, or ``from_start`` on a big file) is handled and
+    committed in bounded steps. The tail wakes on watchdog events for the file and otherwise re-checks
+    every ``poll_interval`` seconds (the only wakeup when watchdog is not installed). Rotation
+    (the path now names a different file) continues at the start of the new file once the old
+    one is drained; truncation restarts at offset 0.
+
+    With ``offset_file`` the position after the last batch passed to `commit` is saved, and a
+    new tail of the same file resumes there instead of at the end, so spans written while the
+    reader was down are not lost.
+
+    Args:
+        path: JSONL file to follow (created if missing)
+        offset_file: Where to persist the read position (None disables resuming)
+        chunk_size: Bytes read per system call
+        max_batch_bytes: Bytes of complete lines after which a batch is cut
+        poll_interval: Seconds between checks when no file event arrives
+        from_start: Start at the beginning instead of the end when there is no saved offset
+    """
+
+    def __init__(self,
+                 path: pathlib.Path,
+                 offset_file: Optional[pathlib.Path] = None,
+                 chunk_size: int = 64 * 1024,
+                 max_batch_bytes: int = 4 * 1024 * 1024,
+                 poll_interval: float = 1.0,
+                 from_start: bool = False):
+        self.path = pathlib.Path(path)
+        self.offset_file = pathlib.Path(offset_file) if offset_file else None
+        self.chunk_size = chunk_size
+        self.max_batch_bytes = max_batch_bytes
+        self.poll_interval = poll_interval
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch()
+
+        self._file = self.path.open("rb")
+        self._inode = os.fstat(self._file.fileno()).st_ino
+        self._partial = b""
+        self.offset = self._start_offset(from_start)
+        self._file.seek(self.offset)
+
+        self._changed = threading.Event()
+        self._waiters: set = set()  # (loop, asyncio.Event) of afollow() calls
+        self._handler = None
+        self._watch = None
+        if WATCHDOG_AVAILABLE:
+            try:
+                self._handler = _PathHandler(self.path.resolve(), self._notify)
+                self._watch = _shared_observer().schedule(self._handler, str(self.path.resolve().parent))
+            except OSError as e:  # e.g. out of inotify watches
+                logger.warning(f"Cannot watch {self.path}, polling every {poll_interval}s: {e}")
+                self._handler = None
+
+    def _start_offset(self, from_start: bool) -> int:
+        size = os.fstat(self._file.fileno()).st_size
+        if self.offset_file and self.offset_file.exists():
+            try:
+                saved = json.loads(self.offset_file.read_text())
+                if saved["inode"] == self._inode and saved["offset"] <= size:
+                    return saved["offset"]
+                # The file was rotated or truncated while we were down: its content is all new
+                return 0
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable offset file {self.offset_file}: {e}")
+        return 0 if from_start else size
+
+    def _notify(self) -> None:
+        self._changed.set()
+        for loop, event in list(self._waiters):
+            loop.call_soon_threadsafe(event.set)
+
+    # Reading
+
+    def read_batch(self) -> List[SpanData]:
+        """
+        Read and decode the complete lines appended since the last call (possibly none).
+
+        Stops once about ``max_batch_bytes`` have been read; the rest comes with the next call.
+        """
+        lines, budget = [], self.max_batch_bytes
+        while True:
+            start = self.offset
+            lines.extend(self._read_lines(budget))
+            budget -= self.offset - start
+            if budget <= 0 or not self._reopen_if_replaced():
+                return decode_spans(lines)
+
+    def _read_lines(self, limit: int) -> List[bytes]:
+        chunks, size, newline = [self._partial], len(self._partial), False
+        # Past the limit, keep reading only until the first complete line
+        while size < limit or not newline:
+            chunk = self._file.read(self.chunk_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+            newline = newline or b"\n" in chunk
+        data = b"".join(chunks)
+        complete, newline, self._partial = data.rpartition(b"\n")
+        if not newline:
+            return []
+        self.offset += len(complete) + 1
+        return complete.split(b"\n")
+
+    def _reopen_if_replaced(self) -> bool:
+        """Follow rotation and truncation; True if there is a new file to read from the start."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False  # rotated away and not recreated yet
+        if stat.st_ino != self._inode:
+            logger.debug(f"{self.path} was rotated; following the new file")
+            self._file.close()
+            self._file = self.path.open("rb")
+            self._inode = os.fstat(self._file.fileno()).st_ino
+        elif stat.st_size < self.offset + len(self._partial):
+            logger.debug(f"{self.path} was truncated; reading from the start")
+            self._file.seek(0)
+        else:
+            return False
+        if self._partial:
+            logger.warning(f"Dropping incomplete line at the end of the previous {self.path}")
+        self._partial = b""
+        self.offset = 0
+        return True
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        """``(inode, offset)`` after the last batch read, for a later `commit`."""
+        return self._inode, self.offset
+
+    def commit(self, position: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Persist the read position; call once the spans before it have been handled.
+
+        Args:
+            position: A `position` taken earlier (default: the current one)
+        """
+        if not self.offset_file:
+            return
+        inode, offset = position or self.position
+        temp_file = self.offset_file.with_suffix(".tmp")
+        temp_file.write_text(json.dumps({"inode": inode, "offset": offset}))
+        temp_file.replace(self.offset_file)
+
+    # Following
+
+    def follow(self, stop: Optional[threading.Event] = None) -> Iterator[List[SpanData]]:
+        """Yield non-empty batches of new spans until ``stop`` is set; waits only when caught up."""
+        while stop is None or not stop.is_set():
+            self._changed.clear()
+            batch = self.read_batch()
+            if batch:
+                yield batch
+                continue
+            self._changed.wait(self.poll_interval)
+
+    async def afollow(self, stop: Optional[asyncio.Event] = None) -> AsyncIterator[List[SpanData]]:
+        """Async `follow`: waits on the event loop and reads in a worker thread."""
+        changed = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), changed)
+        self._waiters.add(waiter)
+        try:
+            while stop is None or not stop.is_set():
+                changed.clear()
+                batch = await asyncio.to_thread(self.read_batch)
+                if batch:
+                    yield batch
+                    continue
+                try:
+                    await asyncio.wait_for(changed.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._waiters.discard(waiter)
+
+    def close(self) -> None:
+        if self._handler is not None:
+            _shared_observer().remove_handler_for_watch(self._handler, self._watch)
+            self._handler = None
+        self._file.close()
+
+    def __enter__(self) -> SpanTail:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
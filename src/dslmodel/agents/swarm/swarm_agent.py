@@ -6,11 +6,16 @@ import time
 import pathlib
 import subprocess
 import asyncio
+import threading
 from enum import Enum
-from typing import Dict, Type, Optional, Any
+from typing import Dict, List, Type, Optional, Any
 from abc import ABC, abstractmethod
 
 from dslmodel.mixins import FSMMixin, trigger
+from dslmodel.utils.span_writer import span_writer
+from .command_executor import CommandExecutor, command_executor, release_command_executor
+from .span_router import SpanRouter
+from .span_tail import SpanTail
 from .swarm_models import NextCommand, SpanData, SwarmAgentModel
 
 # Import generated Weaver models if available
@@ -40,7 +45,8 @@ class SwarmAgent(FSMMixin, ABC):
     def __init__(self, 
                  root_dir: Optional[pathlib.Path] = None,
                  span_file: str = "telemetry_spans.jsonl",
-                 cli_command: Optional[list] = None):
+                 cli_command: Optional[list] = None,
+                 executor: Optional[CommandExecutor] = None):
         """
         Initialize swarm agent.
         
@@ -48,6 +54,9 @@ class SwarmAgent(FSMMixin, ABC):
             root_dir: Root directory for agent coordination (default: ~/s2s/agent_coordination)
             span_file: Name of the JSONL file containing spans
             cli_command: CLI command to execute (default: ["python", "coordination_cli.py"])
+            executor: Runs the agent's commands (default: the `CommandExecutor` shared by all
+                agents of cli_command, which keeps warm worker processes instead of starting
+                Python per command)
         """
         super().__init__()
         
@@ -55,6 +64,8 @@ class SwarmAgent(FSMMixin, ABC):
         self.root_dir = root_dir or pathlib.Path("~/s2s/agent_coordination").expanduser()
         self.span_stream = self.root_dir / span_file
         self.cli_command = cli_command or ["python", str(self.root_dir / "coordination_cli.py")]
+        self._shared_executor = executor is None
+        self.executor = executor or command_executor(self.cli_command)
         
         # Initialize FSM
         self.setup_fsm(state_enum=self.StateEnum, initial=list(self.StateEnum)[0])
@@ -68,19 +79,13 @@ class SwarmAgent(FSMMixin, ABC):
     
     def run_cli(self, cmd: NextCommand) -> subprocess.CompletedProcess:
         """Execute a CLI command."""
-        full_command = self.cli_command + cmd.path + cmd.args
-        return subprocess.run(full_command, capture_output=True, text=True)
+        result = self.executor.run(cmd)
+        return subprocess.CompletedProcess(self.cli_command + result.argv, result.returncode, result.stdout, result.stderr)
     
     async def arun_cli(self, cmd: NextCommand) -> tuple[str, str]:
         """Asynchronously execute a CLI command."""
-        full_command = self.cli_command + cmd.path + cmd.args
-        proc = await asyncio.create_subprocess_exec(
-            *full_command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await proc.communicate()
-        return stdout.decode(), stderr.decode()
+        result = await self.executor.arun(cmd)
+        return result.stdout, result.stderr
     
     def forward(self, span: SpanData) -> Optional[NextCommand]:
         """
@@ -92,19 +97,15 @@ class SwarmAgent(FSMMixin, ABC):
         Returns:
             NextCommand to execute, or None if no matching trigger
         """
-        # Apply LISTEN_FILTER if configured
-        if self.LISTEN_FILTER and not span.name.startswith(self.LISTEN_FILTER):
-            return None
-            
-        span_name_lower = span.name.lower()
-        
-        for trigger_key, method_name in self.TRIGGER_MAP.items():
-            if trigger_key in span_name_lower:
-                handler = getattr(self, method_name, None)
-                if handler:
-                    return handler(span)
-        
-        return None
+        method_name = self.span_router().handler_for(span.name)
+        return getattr(self, method_name)(span) if method_name else None
+    
+    def span_router(self) -> SpanRouter:
+        """The precompiled `TRIGGER_MAP` / `LISTEN_FILTER` index used by `forward`."""
+        router = self.__dict__.get("_span_router")
+        if router is None:
+            router = self._span_router = SpanRouter([self])
+        return router
     
     def _transition(self, prompt: str, dest_state: Enum) -> None:
         """
@@ -144,8 +145,7 @@ class SwarmAgent(FSMMixin, ABC):
                 print(f"⚠️ Weaver validation failed: {e}")
         
         # Write to span stream
-        with self.span_stream.open("a") as f:
-            f.write(json.dumps(transition_span) + "\n")
+        span_writer(self.span_stream).write(transition_span)
         
         # Update model state
         self.model.state = dest_state.name
@@ -158,79 +158,70 @@ class SwarmAgent(FSMMixin, ABC):
         except (json.JSONDecodeError, ValueError):
             return None
     
-    def run(self):
+    def forward_batch(self, spans: List[SpanData]) -> List[NextCommand]:
         """
-        Watch span stream file and react to new spans.
+        Route a batch of spans, in order, through `forward`.
+        
+        Args:
+            spans: Spans read together from the stream
+            
+        Returns:
+            The commands produced, in span order
+        """
+        self.model.state = self.current_state.name
+        return [cmd for cmd in map(self.forward, spans) if cmd]
+    
+    def span_tail(self, from_start: bool = False) -> SpanTail:
+        """
+        Open the span stream for following.
         
-        This is the main event loop for the agent.
+        The read position is saved per agent class next to the stream, so a restarted agent
+        resumes after the last span it handled instead of skipping to the end of the file.
+        """
+        offset_file = self.root_dir / f".{self.span_stream.name}.{self.__class__.__name__}.offset"
+        return SpanTail(self.span_stream, offset_file=offset_file, from_start=from_start)
+    
+    def run(self, stop: Optional[threading.Event] = None):
         """
-        # Ensure span file exists
-        self.root_dir.mkdir(parents=True, exist_ok=True)
-        self.span_stream.touch()
+        Watch span stream file and react to new spans.
+        
+        This is the main event loop for the agent. It sleeps until the span file changes,
+        then handles everything appended since in one batch.
         
+        Args:
+            stop: Return once this event is set (default: run forever)
+        """
         print(f"🔄 {self.__class__.__name__} starting - watching {self.span_stream}")
         
-        with self.span_stream.open() as f:
-            # Seek to end of file
-            f.seek(0, 2)
-            
-            while True:
-                line = f.readline()
-                if not line:
-                    time.sleep(0.2)
-                    continue
-                
-                span = self.parse_span(line.strip())
-                if not span:
-                    continue
-                
-                # Update model state
-                self.model.state = self.current_state.name
-                
-                # Forward to handler
-                cmd = self.forward(span)
-                if cmd:
-                    print(f"📌 Executing: {' '.join(cmd.path + cmd.args)}")
-                    result = self.run_cli(cmd)
-                    if result.returncode != 0:
-                        print(f"❌ Command failed: {result.stderr}")
+        with self.span_tail() as tail:
+            for batch in tail.follow(stop):
+                # In span order: a batch can hold dependent transitions, e.g. claim then complete
+                for result in map(self.executor.run, self.forward_batch(batch)):
+                    print(f"📌 Executed: {' '.join(result.argv)} ({result.duration_s * 1000:.0f}ms, {result.mode})")
+                    if not result.ok:
+                        print(f"❌ Command failed: {'timed out' if result.timed_out else result.stderr}")
+                tail.commit()
     
-    async def arun(self):
+    async def arun(self, stop: Optional[asyncio.Event] = None):
         """
         Async version of run() for better integration with async codebases.
         """
-        # Ensure span file exists
-        self.root_dir.mkdir(parents=True, exist_ok=True)
-        self.span_stream.touch()
-        
         print(f"🔄 {self.__class__.__name__} starting (async) - watching {self.span_stream}")
         
-        # Use aiofiles if available, otherwise fall back to sync with executor
-        try:
-            import aiofiles
-            async with aiofiles.open(self.span_stream, mode='r') as f:
-                await f.seek(0, 2)
-                while True:
-                    line = await f.readline()
-                    if not line:
-                        await asyncio.sleep(0.2)
-                        continue
-                    
-                    span = self.parse_span(line.strip())
-                    if not span:
-                        continue
-                    
-                    self.model.state = self.current_state.name
-                    cmd = self.forward(span)
-                    if cmd:
-                        print(f"📌 Executing: {' '.join(cmd.path + cmd.args)}")
-                        stdout, stderr = await self.arun_cli(cmd)
-                        if stderr:
-                            print(f"❌ Command error: {stderr}")
-        except ImportError:
-            # Fallback to sync version in executor
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.run)
+        with self.span_tail() as tail:
+            async for batch in tail.afollow(stop):
+                for cmd in self.forward_batch(batch):
+                    result = await self.executor.arun(cmd)
+                    print(f"📌 Executed: {' '.join(result.argv)} ({result.duration_s * 1000:.0f}ms, {result.mode})")
+                    if result.stderr or result.timed_out:
+                        print(f"❌ Command error: {'timed out' if result.timed_out else result.stderr}")
+                tail.commit()
+    
+    def close(self) -> None:
+        """Release the agent's command executor (closing it if no other agent shares it)."""
+        if self._shared_executor and self.executor is not None:
+            release_command_executor(self.executor)
+        self.executor = None
     
     @abstractmethod
     def setup_triggers(self):
@@ -23,6 +23,8 @@ import tempfile
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from dslmodel.utils.span_writer import span_writer
+
 # Import OpenTelemetry components
 try:
     from opentelemetry import trace
@@ -902,9 +904,7 @@ Work completed successfully by {agent.agent_type.value} agent.
             }
             
             # Write to coordination file
-            spans_file = self.coordination_dir / "telemetry_spans.jsonl"
-            with open(spans_file, 'a') as f:
-                f.write(json.dumps(span_data) + '\n')
+            span_writer(self.coordination_dir / "telemetry_spans.jsonl").write(span_data)
             
             logger.debug(f"📡 Emitted span: {span_name}")
             
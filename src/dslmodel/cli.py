@@ -2,28 +2,71 @@
 
 from pathlib import Path
 
-from dslmodel.utils.dspy_tools import init_lm
+from dslmodel.utils.cli_tools import LazySubApp, LazyTyperGroup
 from dslmodel.utils.json_output import set_json_mode, json_command
 import typer
 from rich import print
 from typing_extensions import Annotated
 
-from dslmodel import init_instant
-from dslmodel.generators.gen_dslmodel_class import generate_and_save_dslmodel
-from dslmodel.template import render
-from dslmodel.commands import slidev, forge, autonomous, swarm, thesis_cli, demo, capability_map, validate_otel, ollama_validate, weaver, validate_weaver, worktree, telemetry_cli, weaver_health_check, redteam, validation_loop, swarm_worktree, agent_coordination_cli, evolution, auto_evolution, evolution_worktree, complete_8020_validation, unified_evolution_cli, unified_8020_evolution, consolidated_cli, ollama_autonomous, system_introspection, disc_autonomous, weaver_diagrams, disc_integrated_auto, weaver_autonomous_loop, multilayer_weaver_feedback, otel_learning_engine, health_8020_improvement, claude_code_otel_monitoring, gap_analysis_8020, swarm_sh_5one
-try:
-    from dslmodel.commands import pqc
-    PQC_AVAILABLE = True
-except ImportError:
-    PQC_AVAILABLE = False
-try:
-    from dslmodel.commands import otel_coordination_cli
-    OTEL_AVAILABLE = True
-except ImportError:
-    OTEL_AVAILABLE = False
-
-app = typer.Typer()
+# Sub-apps are imported only when invoked; `dsl --help` lists them from this registry.
+SUBAPPS: tuple[LazySubApp, ...] = (
+    # LazySubApp("asyncapi", "dslmodel.commands.asyncapi"),
+    LazySubApp("slidev", "dslmodel.commands.slidev", "Slidev CLI commands. https://sli.dev/builtin/cli"),
+    # LazySubApp("coord", "dslmodel.commands.coordination_cli", "Agent coordination system"),
+    LazySubApp("pqc", "dslmodel.commands.pqc", "Post-Quantum Cryptography commands"),
+    LazySubApp("otel", "dslmodel.commands.otel_coordination_cli", "OTEL-enhanced coordination system"),
+    LazySubApp("forge", "dslmodel.commands.forge", "Weaver Forge workflow commands"),
+    LazySubApp("auto", "dslmodel.commands.autonomous", "Autonomous Decision Engine"),
+    LazySubApp("swarm", "dslmodel.commands.swarm", "SwarmAgent coordination and management"),
+    LazySubApp("thesis", "dslmodel.commands.thesis_cli", "SwarmSH thesis implementation and demo"),
+    LazySubApp("demo", "dslmodel.commands.demo", "Automated full cycle demonstrations"),
+    LazySubApp("capability", "dslmodel.commands.capability_map", "SwarmAgent capability mapping and visualization"),
+    LazySubApp("bench", "dslmodel.commands.bench", "Performance benchmarks of the workflow executor"),
+    LazySubApp("validate", "dslmodel.commands.validate_otel", "Concurrent OpenTelemetry validation and testing"),
+    LazySubApp("validate-weaver", "dslmodel.commands.validate_weaver", "Weaver-first OpenTelemetry validation using semantic conventions"),
+    LazySubApp("validation-loop", "dslmodel.commands.validation_loop", "Continuous SwarmAgent validation loop with auto-remediation"),
+    LazySubApp("ollama", "dslmodel.commands.ollama_validate", "Ollama configuration validation and management"),
+    LazySubApp("ollama-auto", "dslmodel.commands.ollama_autonomous", "🤖 Autonomous Ollama system - gap detection and self-healing"),
+    LazySubApp("disc-auto", "dslmodel.commands.disc_autonomous", "🧠 DISC autonomous compensation - behavioral gap detection and compensation"),
+    LazySubApp("disc-integrated", "dslmodel.commands.disc_integrated_auto", "🤝 DISC-integrated autonomous system - decisions with behavioral compensation"),
+    LazySubApp("weaver", "dslmodel.commands.weaver", "Weaver-first auto-generation from semantic conventions"),
+    LazySubApp("weaver-health", "dslmodel.commands.weaver_health_check", "Weaver global health checks with Ollama validation"),
+    LazySubApp("worktree", "dslmodel.commands.worktree", "Git worktree management for exclusive worktree development"),
+    LazySubApp("swarm-worktree", "dslmodel.commands.swarm_worktree", "SwarmAgent worktree coordination with OTEL telemetry"),
+    LazySubApp("telemetry", "dslmodel.commands.telemetry_cli", "Real-time telemetry, auto-remediation, and security monitoring"),
+    LazySubApp("redteam", "dslmodel.commands.redteam", "Automated red team security testing and vulnerability assessment"),
+    LazySubApp("agents", "dslmodel.commands.agent_coordination_cli", "Agent coordination with exclusive worktrees and OTEL communication"),
+    # ============================================================================
+    # NEW: Consolidated 8020 CLI Structure (5 commands replace 20+)
+    # ============================================================================
+    # Simple consolidated commands - use the main app from consolidated_cli
+    LazySubApp("dsl", "dslmodel.commands.consolidated_cli", "🎯 Consolidated CLI - Core and Advanced commands"),
+    # ============================================================================
+    # LEGACY: Keep for backward compatibility (will be deprecated)
+    # ============================================================================
+    LazySubApp("evolve", "dslmodel.commands.unified_8020_evolution", "Ultimate 8020 Evolution System - Evolution + Validation + Learning"),
+    LazySubApp("evolve-unified", "dslmodel.commands.unified_evolution_cli", "Unified Evolution System - All capabilities in one interface"),
+    LazySubApp("evolve-legacy", "dslmodel.commands.evolution", "Legacy autonomous evolution system"),
+    LazySubApp("auto-evolve", "dslmodel.commands.auto_evolution", "Automatic evolution with SwarmAgent integration"),
+    LazySubApp("evolve-worktree", "dslmodel.commands.evolution_worktree", "Worktree-based evolution with OTEL telemetry"),
+    LazySubApp("8020", "dslmodel.commands.complete_8020_validation", "Complete 8020 SwarmAgent feature validation and demonstration"),
+    LazySubApp("introspect", "dslmodel.commands.system_introspection", "🔍 System introspection - echo internal structure and architecture"),
+    LazySubApp("weaver-diagrams", "dslmodel.commands.weaver_diagrams", "🧵 Weaver architecture diagrams - visualize all Weaver aspects"),
+    LazySubApp("weaver-loop", "dslmodel.commands.weaver_autonomous_loop", "🔄 Weaver autonomous loop - 10-minute feature completion cycles"),
+    LazySubApp("weaver-multilayer", "dslmodel.commands.multilayer_weaver_feedback", "🧵 Multi-layer Weaver validation with feedback loops and self-improvement"),
+    LazySubApp("otel-learn", "dslmodel.commands.otel_learning_engine", "🧠 OTEL Learning Engine - Feed telemetry data to language models"),
+    LazySubApp("health-8020", "dslmodel.commands.health_8020_improvement", "🎯 80/20 Health Improvement - Optimize system health using Pareto Principle"),
+    LazySubApp("otel-monitor", "dslmodel.commands.claude_code_otel_monitoring", "🔍 Claude Code OTEL monitoring and gap detection"),
+    LazySubApp("gap-8020", "dslmodel.commands.gap_analysis_8020", "🔍 80/20 Gap Analysis - Identify and close system gaps using OTEL monitoring"),
+    LazySubApp("5one", "dslmodel.commands.swarm_sh_5one", "🚀 Swarm SH 5-ONE: Git-Native Hyper-Intelligence Platform"),
+    LazySubApp("forge-dx", "dslmodel.commands.weaver_forge_dx_loop", "🔄 Weaver Forge Git Agent Auto DX Loop"),
+)
+
+class DSLGroup(LazyTyperGroup):
+    lazy_subapps = SUBAPPS
+
+
+app = typer.Typer(cls=DSLGroup)
 
 # Global JSON flag callback
 def json_callback(value: bool):
@@ -44,63 +87,6 @@ def main(
     """DSLModel CLI - Telemetry-driven development platform."""
     pass
 
-# app.add_typer(name="asyncapi", typer_instance=asyncapi.app)
-app.add_typer(name="slidev", typer_instance=slidev.app)
-# app.add_typer(name="coord", typer_instance=coordination_cli.app, help="Agent coordination system")
-if PQC_AVAILABLE:
-    app.add_typer(name="pqc", typer_instance=pqc.app, help="Post-Quantum Cryptography commands")
-if OTEL_AVAILABLE:
-    app.add_typer(name="otel", typer_instance=otel_coordination_cli.app, help="OTEL-enhanced coordination system")
-app.add_typer(name="forge", typer_instance=forge.app, help="Weaver Forge workflow commands")
-app.add_typer(name="auto", typer_instance=autonomous.app, help="Autonomous Decision Engine")
-app.add_typer(name="swarm", typer_instance=swarm.app, help="SwarmAgent coordination and management")
-app.add_typer(name="thesis", typer_instance=thesis_cli.app, help="SwarmSH thesis implementation and demo")
-app.add_typer(name="demo", typer_instance=demo.app, help="Automated full cycle demonstrations")
-app.add_typer(name="capability", typer_instance=capability_map.app, help="SwarmAgent capability mapping and visualization")
-app.add_typer(name="validate", typer_instance=validate_otel.app, help="Concurrent OpenTelemetry validation and testing")
-app.add_typer(name="validate-weaver", typer_instance=validate_weaver.app, help="Weaver-first OpenTelemetry validation using semantic conventions")
-app.add_typer(name="validation-loop", typer_instance=validation_loop.app, help="Continuous SwarmAgent validation loop with auto-remediation")
-app.add_typer(name="ollama", typer_instance=ollama_validate.app, help="Ollama configuration validation and management")
-app.add_typer(name="ollama-auto", typer_instance=ollama_autonomous.app, help="🤖 Autonomous Ollama system - gap detection and self-healing")
-app.add_typer(name="disc-auto", typer_instance=disc_autonomous.app, help="🧠 DISC autonomous compensation - behavioral gap detection and compensation")
-app.add_typer(name="disc-integrated", typer_instance=disc_integrated_auto.app, help="🤝 DISC-integrated autonomous system - decisions with behavioral compensation")
-app.add_typer(name="weaver", typer_instance=weaver.app, help="Weaver-first auto-generation from semantic conventions")
-app.add_typer(name="weaver-health", typer_instance=weaver_health_check.app, help="Weaver global health checks with Ollama validation")
-app.add_typer(name="worktree", typer_instance=worktree.app, help="Git worktree management for exclusive worktree development")
-app.add_typer(name="swarm-worktree", typer_instance=swarm_worktree.app, help="SwarmAgent worktree coordination with OTEL telemetry")
-app.add_typer(name="telemetry", typer_instance=telemetry_cli.app, help="Real-time telemetry, auto-remediation, and security monitoring")
-app.add_typer(name="redteam", typer_instance=redteam.app, help="Automated red team security testing and vulnerability assessment")
-app.add_typer(name="agents", typer_instance=agent_coordination_cli.app, help="Agent coordination with exclusive worktrees and OTEL communication")
-# ============================================================================
-# NEW: Consolidated 8020 CLI Structure (5 commands replace 20+)
-# ============================================================================
-# Simple consolidated commands - use the main app from consolidated_cli
-app.add_typer(name="dsl", typer_instance=consolidated_cli.app, help="🎯 Consolidated CLI - Core and Advanced commands")
-
-# ============================================================================
-# LEGACY: Keep for backward compatibility (will be deprecated)
-# ============================================================================
-app.add_typer(name="evolve", typer_instance=unified_8020_evolution.app, help="Ultimate 8020 Evolution System - Evolution + Validation + Learning")
-app.add_typer(name="evolve-unified", typer_instance=unified_evolution_cli.app, help="Unified Evolution System - All capabilities in one interface") 
-app.add_typer(name="evolve-legacy", typer_instance=evolution.app, help="Legacy autonomous evolution system")
-app.add_typer(name="auto-evolve", typer_instance=auto_evolution.app, help="Automatic evolution with SwarmAgent integration")
-app.add_typer(name="evolve-worktree", typer_instance=evolution_worktree.app, help="Worktree-based evolution with OTEL telemetry")
-app.add_typer(name="8020", typer_instance=complete_8020_validation.app, help="Complete 8020 SwarmAgent feature validation and demonstration")
-app.add_typer(name="introspect", typer_instance=system_introspection.app, help="🔍 System introspection - echo internal structure and architecture")
-app.add_typer(name="weaver-diagrams", typer_instance=weaver_diagrams.app, help="🧵 Weaver architecture diagrams - visualize all Weaver aspects")
-app.add_typer(name="weaver-loop", typer_instance=weaver_autonomous_loop.app, help="🔄 Weaver autonomous loop - 10-minute feature completion cycles")
-app.add_typer(name="weaver-multilayer", typer_instance=multilayer_weaver_feedback.app, help="🧵 Multi-layer Weaver validation with feedback loops and self-improvement")
-app.add_typer(name="otel-learn", typer_instance=otel_learning_engine.app, help="🧠 OTEL Learning Engine - Feed telemetry data to language models")
-app.add_typer(name="health-8020", typer_instance=health_8020_improvement.app, help="🎯 80/20 Health Improvement - Optimize system health using Pareto Principle")
-app.add_typer(name="otel-monitor", typer_instance=claude_code_otel_monitoring.app, help="🔍 Claude Code OTEL monitoring and gap detection")
-app.add_typer(name="gap-8020", typer_instance=gap_analysis_8020.app, help="🔍 80/20 Gap Analysis - Identify and close system gaps using OTEL monitoring")
-app.add_typer(name="5one", typer_instance=swarm_sh_5one.app, help="🚀 Swarm SH 5-ONE: Git-Native Hyper-Intelligence Platform")
-try:
-    from dslmodel.commands import weaver_forge_dx_loop
-    app.add_typer(name="forge-dx", typer_instance=weaver_forge_dx_loop.app, help="🔄 Weaver Forge Git Agent Auto DX Loop")
-except ImportError:
-    pass  # forge-dx not available due to missing dependencies
-
 
 # ============================================================================  
 # CONSOLIDATION HELPER COMMANDS
@@ -209,7 +195,8 @@ def generate_class(
         formatter.add_data("model", model)
         
         formatter.print(f"Generating class from prompt: '{prompt}'")
-        from dslmodel.utils.dspy_tools import init_instant
+        from dslmodel.generators.gen_dslmodel_class import generate_and_save_dslmodel
+        from dslmodel.utils.dspy_tools import init_lm
 
         init_lm(model=model)
         # init_instant()
@@ -254,6 +241,9 @@ def generate_models(openapi_file: Path = Path("openapi.yaml"), output_dir: Path
         typer.echo("No schemas found in the OpenAPI file.")
         raise typer.Exit()
 
+    from dslmodel.template import render
+    from dslmodel.utils.dspy_tools import init_instant
+
     init_instant()
 
     for schema_name, schema in schemas.items():
@@ -0,0 +1,85 @@
+"""Benchmark commands for measuring executor overhead and holding it against a baseline."""
+
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from loguru import logger
+from rich.console import Console
+from rich.table import Table
+
+from dslmodel.workflow.benchmark import PROFILERS, SCENARIOS, Scenario, bench, profile, regressions
+
+app = typer.Typer(help="Performance benchmarks")
+console = Console()
+
+
+@app.command("workflow")
+def bench_workflow(
+    scenario: Optional[List[str]] = typer.Option(
+        None, "--scenario", "-s", help=f"Scenario to run, repeatable (default: all of {', '.join(SCENARIOS)})"
+    ),
+    jobs: Optional[int] = typer.Option(None, "--jobs", help="Run one custom scenario with this many jobs"),
+    width: int = typer.Option(1, "--width", help="Jobs per DAG layer of the custom scenario"),
+    actions: int = typer.Option(20, "--actions", help="Code actions per job of the custom scenario"),
+    conditions: float = typer.Option(0.0, "--conditions", help="Fraction of conditional actions of the custom scenario"),
+    context_size: int = typer.Option(100, "--context-size", help="Context rows of the custom scenario"),
+    repeat: int = typer.Option(3, "--repeat", "-r", help="Runs per scenario; the best is reported"),
+    save: Optional[Path] = typer.Option(None, "--save", help="Write results to this file, e.g. as a baseline"),
+    baseline: Optional[Path] = typer.Option(None, "--baseline", help="Compare against results written with --save"),
+    tolerance: float = typer.Option(0.2, "--tolerance", help="Allowed slowdown per action before failing"),
+    profiler: Optional[str] = typer.Option(None, "--profile", help=f"Also profile each scenario: {' or '.join(PROFILERS)}"),
+    profile_dir: Path = typer.Option(Path("profiles"), "--profile-dir", help="Directory for profiles"),
+):
+    """
+    Run synthetic workflows through execute_workflow and report per-action overhead.
+
+    Exits with status 1 if ``--baseline`` is given and any scenario regressed by more than ``--tolerance``.
+    """
+    if profiler is not None and profiler not in PROFILERS:
+        raise typer.BadParameter(f"must be one of {', '.join(PROFILERS)}", param_hint="--profile")
+    unknown = [name for name in scenario or [] if name not in SCENARIOS]
+    if unknown:
+        raise typer.BadParameter(f"unknown scenario(s) {', '.join(unknown)}", param_hint="--scenario")
+    if jobs:
+        scenarios = [Scenario("custom", jobs, width, actions, conditions, context_size)]
+    else:
+        scenarios = [SCENARIOS[name] for name in scenario or SCENARIOS]
+
+    # Measure the executor, not log formatting
+    logger.remove()
+
+    table = Table(title="Workflow executor overhead")
+    for column in ("scenario", "jobs", "actions", "rows", "ms", "us/action", "actions/s", "peak MiB"):
+        table.add_column(column, justify="left" if column == "scenario" else "right")
+
+    results = {}
+    for current in scenarios:
+        result = results[current.name] = bench(current, repeat)
+        table.add_row(
+            current.name,
+            str(current.jobs),
+            str(current.jobs * current.actions),
+            str(current.context_size),
+            f"{result['ms']:.1f}",
+            f"{result['us_per_action']:.1f}",
+            f"{result['actions_per_s']:.0f}",
+            f"{result['peak_mib']:.2f}",
+        )
+        if profiler:
+            try:
+                console.print(f"Profile of {current.name} written to {profile(current, profiler, profile_dir)}")
+            except ImportError:
+                console.print("[yellow]pyinstrument is not installed; skipping profile[/yellow]")
+    console.print(table)
+
+    if save:
+        save.write_text(json.dumps(results, indent=2))
+
+    if baseline:
+        slower = regressions(results, json.loads(baseline.read_text()), tolerance)
+        for message in slower:
+            console.print(f"[red]REGRESSION[/red] {message}")
+        if slower:
+            raise typer.Exit(1)
@@ -12,6 +12,8 @@ from datetime import datetime
 from enum import Enum
 
 from dslmodel.agents.swarm import SwarmAgent
+from dslmodel.utils.span_writer import span_writer
+from dslmodel.utils.work_store import WorkStore, open_work_store
 
 
 # Initialize CLI apps
@@ -25,7 +27,8 @@ app.add_typer(agent_app, name="agent")
 
 # Configuration
 ROOT = Path("~/s2s/agent_coordination").expanduser()
-WORK_ITEMS = ROOT / "work_items.json"
+WORK_ITEMS = ROOT / "work_items.json"  # pre-SQLite store, imported into WORK_DB on first use
+WORK_DB = ROOT / "coordination.db"
 SPAN_STREAM = ROOT / "telemetry_spans.jsonl"
 AGENT_PACKAGE = "dslmodel.agents.examples"
 
@@ -56,24 +59,37 @@ def log_span(name: str, attributes: Optional[Dict] = None):
         "attributes": attributes or {}
     }
     
-    with SPAN_STREAM.open("a") as f:
-        f.write(json.dumps(span) + "\n")
+    span_writer(SPAN_STREAM).write(span)
+
+
+_store: Optional[WorkStore] = None
+
+
+def get_store() -> WorkStore:
+    """The coordination work store, opened once per process."""
+    global _store
+    if _store is None or _store.path != WORK_DB:
+        _store = open_work_store(WORK_DB, legacy_dir=ROOT)
+    return _store
 
 
 def load_work_items() -> Dict:
-    """Load work items from JSON file."""
-    if not WORK_ITEMS.exists():
-        return {"items": {}, "next_id": 1}
-    
-    with WORK_ITEMS.open() as f:
-        return json.load(f)
+    """
+    Snapshot of all work items in the old ``{"items": ..., "next_id": ...}`` layout.
+
+    Kept for callers that edit the whole document; prefer the per-item `WorkStore` methods.
+    """
+    store = get_store()
+    return {"items": {item["id"]: item for item in store.list_work()}, "next_id": store.peek_id()}
 
 
 def save_work_items(data: Dict):
-    """Save work items to JSON file."""
-    ROOT.mkdir(parents=True, exist_ok=True)
-    with WORK_ITEMS.open("w") as f:
-        json.dump(data, f, indent=2)
+    """Write back a document from `load_work_items` (upserts every item)."""
+    store = get_store()
+    with store.transaction():
+        for item in data.get("items", {}).values():
+            store.put_work(item)
+        store.set_counter("work", data.get("next_id", 1) - 1)
 
 
 # Work Commands
@@ -85,9 +101,8 @@ def claim_work(
     team: str = "default"
 ):
     """Claim a new work item."""
-    data = load_work_items()
-    work_id = f"WORK-{data['next_id']}"
-    data["next_id"] += 1
+    store = get_store()
+    work_id = f"WORK-{store.next_id()}"
     
     work_item = {
         "id": work_id,
@@ -101,8 +116,7 @@ def claim_work(
         "updated_at": datetime.now().isoformat()
     }
     
-    data["items"][work_id] = work_item
-    save_work_items(data)
+    store.put_work(work_item)
     
     # Log span
     log_span("work.claim", {
@@ -123,17 +137,10 @@ def list_work(
     format: str = "table"
 ):
     """List work items with optional filters."""
-    data = load_work_items()
-    items = data.get("items", {}).values()
-    
-    # Filter items
-    if team:
-        items = [i for i in items if i.get("team") == team]
-    if status:
-        items = [i for i in items if i.get("status") == status]
+    items = get_store().list_work(team=team, status=status)
     
     if format == "json":
-        typer.echo(json.dumps(list(items), indent=2))
+        typer.echo(json.dumps(items, indent=2))
     else:
         if not items:
             typer.echo("No work items found.")
@@ -154,18 +161,10 @@ def list_work(
 @work_app.command("progress")
 def update_progress(work_id: str, progress: int):
     """Update work item progress."""
-    data = load_work_items()
-    
-    if work_id not in data["items"]:
+    if not get_store().update_work(work_id, progress=min(100, max(0, progress)), status="in_progress"):
         typer.echo(f"❌ Work item {work_id} not found.")
         raise typer.Exit(1)
     
-    data["items"][work_id]["progress"] = min(100, max(0, progress))
-    data["items"][work_id]["status"] = "in_progress"
-    data["items"][work_id]["updated_at"] = datetime.now().isoformat()
-    
-    save_work_items(data)
-    
     # Log span
     log_span("work.progress", {
         "work_id": work_id,
@@ -178,21 +177,10 @@ def update_progress(work_id: str, progress: int):
 @work_app.command("complete")
 def complete_work(work_id: str, status: str = "success", score: int = 5):
     """Mark work item as complete."""
-    data = load_work_items()
-    
-    if work_id not in data["items"]:
+    if not get_store().complete(work_id, completion_status=status, score=score):
         typer.echo(f"❌ Work item {work_id} not found.")
         raise typer.Exit(1)
     
-    data["items"][work_id]["status"] = "completed"
-    data["items"][work_id]["progress"] = 100
-    data["items"][work_id]["completion_status"] = status
-    data["items"][work_id]["score"] = score
-    data["items"][work_id]["completed_at"] = datetime.now().isoformat()
-    data["items"][work_id]["updated_at"] = datetime.now().isoformat()
-    
-    save_work_items(data)
-    
     # Log span
     log_span("work.complete", {
         "work_id": work_id,
@@ -203,24 +191,34 @@ def complete_work(work_id: str, status: str = "success", score: int = 5):
     typer.echo(f"✅ Completed {work_id} with status: {status} (score: {score}/10)")
 
 
+@work_app.command("next")
+def claim_next_work(agent_id: str, team: Optional[str] = None):
+    """Atomically claim the highest-priority pending work item."""
+    item = get_store().claim_next(agent_id, team=team)
+    if item is None:
+        typer.echo("No pending work items.")
+        raise typer.Exit(1)
+    
+    log_span("work.claim_next", {"work_id": item["id"], "agent_id": agent_id, "team": team})
+    
+    typer.echo(f"✅ {agent_id} claimed {item['id']}: {item['title']}")
+    return item["id"]
+
+
 @work_app.command("stats")
 def work_stats(team: Optional[str] = None):
     """Show work statistics."""
-    data = load_work_items()
-    items = list(data.get("items", {}).values())
-    
-    if team:
-        items = [i for i in items if i.get("team") == team]
+    store = get_store()
+    counts = store.work_counts(team=team)
     
-    total = len(items)
-    completed = len([i for i in items if i.get("status") == "completed"])
-    in_progress = len([i for i in items if i.get("status") == "in_progress"])
-    claimed = len([i for i in items if i.get("status") == "claimed"])
+    total = sum(counts.values())
+    completed = counts.get("completed", 0)
+    in_progress = counts.get("in_progress", 0)
+    claimed = counts.get("claimed", 0)
     
     avg_score = 0
     if completed > 0:
-        scores = [i.get("score", 5) for i in items if i.get("status") == "completed"]
-        avg_score = sum(scores) / len(scores)
+        avg_score = store.average("score", status="completed", team=team, default=5)
     
     typer.echo(f"\n📊 Work Statistics{f' for team {team}' if team else ''}:")
     typer.echo(f"   Total items: {total}")
@@ -319,8 +317,7 @@ def init_coordination():
     """Initialize the coordination environment."""
     ROOT.mkdir(parents=True, exist_ok=True)
     
-    if not WORK_ITEMS.exists():
-        save_work_items({"items": {}, "next_id": 1})
+    get_store()
     
     if not SPAN_STREAM.exists():
         SPAN_STREAM.touch()
@@ -338,8 +335,12 @@ def reset_coordination(
         typer.echo("Use --confirm to proceed.")
         raise typer.Exit(1)
     
-    if WORK_ITEMS.exists():
-        WORK_ITEMS.unlink()
+    global _store
+    if _store is not None:
+        _store.close()
+        _store = None
+    for path in (WORK_ITEMS, WORK_DB, WORK_DB.with_name(WORK_DB.name + "-wal"), WORK_DB.with_name(WORK_DB.name + "-shm")):
+        path.unlink(missing_ok=True)
     
     if SPAN_STREAM.exists():
         SPAN_STREAM.unlink()
@@ -15,6 +15,8 @@ from rich.progress import track, Progress, SpinnerColumn, TextColumn, BarColumn,
 from rich.panel import Panel
 from rich import print as rprint
 
+from dslmodel.utils.work_store import import_json, open_work_store, WorkStore
+
 # Initialize console and CLI app
 console = Console()
 app = typer.Typer(help="SwarmSH-inspired agent coordination")
@@ -24,159 +26,77 @@ DATA_DIR = Path("./swarm_data")
 
 
 class SwarmCoordinator:
-    """Core swarm coordination functionality"""
+    """Core swarm coordination functionality, backed by a `WorkStore` in ``data_dir``"""
     
     def __init__(self, data_dir: Path = DATA_DIR):
         self.data_dir = data_dir
         self.data_dir.mkdir(exist_ok=True)
         
-        # Core JSON files
-        self.agents_file = self.data_dir / "agents.json"
-        self.work_file = self.data_dir / "work_queue.json"
-        self.teams_file = self.data_dir / "teams.json"
-        self.telemetry_file = self.data_dir / "telemetry.json"
-        
-        # Initialize files if not exist
-        self._init_files()
-    
-    def _init_files(self):
-        """Initialize JSON files with empty structures"""
-        for file, default in [
-            (self.agents_file, {}),
-            (self.work_file, []),
-            (self.teams_file, {}),
-            (self.telemetry_file, [])
-        ]:
-            if not file.exists():
-                self._write_json(file, default)
-    
-    def _read_json(self, file: Path) -> Any:
-        """Atomic read with error handling"""
-        try:
-            return json.loads(file.read_text())
-        except:
-            return {} if file == self.agents_file or file == self.teams_file else []
-    
-    def _write_json(self, file: Path, data: Any):
-        """Atomic write with backup"""
-        backup = file.with_suffix('.bak')
-        if file.exists():
-            file.rename(backup)
-        file.write_text(json.dumps(data, indent=2))
-        if backup.exists():
-            backup.unlink()  # Remove backup after successful write
+        # Agents, work queue and telemetry live in one SQLite database; JSON files left by
+        # earlier versions in data_dir are imported the first time it is created
+        self.db_file = self.data_dir / "swarm.db"
+        self.store = open_work_store(self.db_file, legacy_dir=self.data_dir)
     
     def create_agent(self, name: str, team: Optional[str] = None) -> str:
         """Create a new agent with nanosecond-precision ID"""
-        agent_id = f"agent_{int(time.time_ns())}"
-        agents = self._read_json(self.agents_file)
-        
-        agents[agent_id] = {
-            "name": name,
-            "team": team or "default",
-            "status": "idle",
-            "created": datetime.now().isoformat(),
-            "work_completed": 0
-        }
-        
-        self._write_json(self.agents_file, agents)
+        agent_id = self.store.add_agent(name, team, agent_id=f"agent_{int(time.time_ns())}")
         self._log_telemetry("agent_created", {"agent_id": agent_id, "name": name})
         return agent_id
     
     def assign_work(self, description: str, priority: str = "medium", team: Optional[str] = None) -> str:
         """Add work to the queue"""
-        work_id = f"work_{uuid.uuid4().hex[:8]}"
-        work_queue = self._read_json(self.work_file)
-        
-        work_item = {
-            "id": work_id,
-            "description": description,
-            "priority": priority,
-            "team": team,
-            "status": "pending",
-            "created": datetime.now().isoformat(),
-            "assigned_to": None
-        }
-        
-        work_queue.append(work_item)
-        self._write_json(self.work_file, work_queue)
+        work_id = self.store.add_work(description, priority=priority, team=team, work_id=f"work_{uuid.uuid4().hex[:8]}")
         self._log_telemetry("work_created", {"work_id": work_id})
         return work_id
     
     def process_work(self) -> Dict[str, int]:
-        """Simple work processing - assign pending work to idle agents"""
-        agents = self._read_json(self.agents_file)
-        work_queue = self._read_json(self.work_file)
-        
-        idle_agents = [aid for aid, agent in agents.items() if agent["status"] == "idle"]
-        pending_work = [w for w in work_queue if w["status"] == "pending"]
-        
+        """Simple work processing - assign pending work to idle agents, highest priority first"""
         assigned = 0
-        for work in pending_work[:len(idle_agents)]:
-            agent_id = idle_agents[assigned]
-            work["status"] = "in_progress"
-            work["assigned_to"] = agent_id
-            agents[agent_id]["status"] = "working"
-            assigned += 1
+        with self.store.transaction():
+            for agent in self.store.list_agents(status="idle"):
+                if self.store.claim_next(agent["id"]) is None:
+                    break
+                assigned += 1
+            pending = self.store.work_counts().get("pending", 0)
         
-        self._write_json(self.agents_file, agents)
-        self._write_json(self.work_file, work_queue)
-        
-        return {"assigned": assigned, "pending": len(pending_work) - assigned}
+        return {"assigned": assigned, "pending": pending}
     
     def get_status(self) -> Dict[str, Any]:
         """Get swarm status overview"""
-        agents = self._read_json(self.agents_file)
-        work_queue = self._read_json(self.work_file)
+        agents = self.store.agent_counts()
+        work = self.store.work_counts()
         
         return {
             "agents": {
-                "total": len(agents),
-                "idle": sum(1 for a in agents.values() if a["status"] == "idle"),
-                "working": sum(1 for a in agents.values() if a["status"] == "working")
+                "total": sum(agents.values()),
+                "idle": agents.get("idle", 0),
+                "working": agents.get("working", 0)
             },
             "work": {
-                "total": len(work_queue),
-                "pending": sum(1 for w in work_queue if w["status"] == "pending"),
-                "in_progress": sum(1 for w in work_queue if w["status"] == "in_progress"),
-                "completed": sum(1 for w in work_queue if w["status"] == "completed")
+                "total": sum(work.values()),
+                "pending": work.get("pending", 0),
+                "in_progress": work.get("in_progress", 0),
+                "completed": work.get("completed", 0)
             }
         }
     
+    def work_items(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Work items in creation order (``title`` holds the description)"""
+        return self.store.list_work(status=status)
+    
     def complete_work(self, work_id: str) -> bool:
-        """Mark work as completed"""
-        work_queue = self._read_json(self.work_file)
-        agents = self._read_json(self.agents_file)
-        
-        for work in work_queue:
-            if work["id"] == work_id:
-                work["status"] = "completed"
-                work["completed"] = datetime.now().isoformat()
-                
-                # Free up agent
-                if work.get("assigned_to"):
-                    if work["assigned_to"] in agents:
-                        agents[work["assigned_to"]]["status"] = "idle"
-                        agents[work["assigned_to"]]["work_completed"] += 1
-                
-                self._write_json(self.work_file, work_queue)
-                self._write_json(self.agents_file, agents)
-                self._log_telemetry("work_completed", {"work_id": work_id})
-                return True
-        return False
+        """Mark work as completed and free its agent"""
+        if not self.store.complete(work_id):
+            return False
+        self._log_telemetry("work_completed", {"work_id": work_id})
+        return True
+    
+    def telemetry(self, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        return self.store.events(last)
     
     def _log_telemetry(self, event: str, data: Dict[str, Any]):
-        """Log telemetry events"""
-        telemetry = self._read_json(self.telemetry_file)
-        telemetry.append({
-            "timestamp": datetime.now().isoformat(),
-            "event": event,
-            "data": data
-        })
-        # Keep last 1000 events
-        if len(telemetry) > 1000:
-            telemetry = telemetry[-1000:]
-        self._write_json(self.telemetry_file, telemetry)
+        """Log telemetry events, keeping the last 1000"""
+        self.store.log_event(event, data, keep=1000)
 
 
 class FullCycleDemo:
@@ -318,11 +238,10 @@ class FullCycleDemo:
                 rprint(f"  Cycle {cycle + 1}: Assigned {result['assigned']} items, {result['pending']} pending")
                 
                 # Simulate work completion
-                work_queue = self.coordinator._read_json(self.coordinator.work_file)
                 completed_this_cycle = 0
                 
-                for work in work_queue:
-                    if work["status"] == "in_progress" and random.random() > 0.3:
+                for work in self.coordinator.work_items(status="in_progress"):
+                    if random.random() > 0.3:
                         success = self.coordinator.complete_work(work["id"])
                         if success:
                             completed_this_cycle += 1
@@ -362,7 +281,7 @@ class FullCycleDemo:
         
         analysis_table.add_row("Efficiency Rate", f"{efficiency:.1%}", "✓ Good" if efficiency > 0.6 else "⚠ Needs Improvement")
         analysis_table.add_row("Throughput", f"{throughput:.1f} items/min", "✓ Optimal" if throughput > 2 else "⚠ Could Optimize")
-        analysis_table.add_row("Agent Utilization", f"{len(self.coordinator._read_json(self.coordinator.agents_file))}", "✓ Adequate")
+        analysis_table.add_row("Agent Utilization", f"{self.coordinator.get_status()['agents']['total']}", "✓ Adequate")
         analysis_table.add_row("Cycle Time", f"{total_time:.1f}s", "✓ Fast")
         
         console.print(analysis_table)
@@ -394,7 +313,7 @@ class FullCycleDemo:
             "execution_time": (datetime.now() - self.start_time).total_seconds(),
             "metrics": self.cycle_metrics,
             "system_state": self.coordinator.get_status(),
-            "telemetry_events": len(self.coordinator._read_json(self.coordinator.telemetry_file)),
+            "telemetry_events": len(self.coordinator.telemetry()),
             "timestamp": datetime.now().isoformat()
         }
         
@@ -430,7 +349,8 @@ class FullCycleDemo:
         
         if self.coordinator.data_dir.exists():
             # Keep reports but clean working data
-            for file in ["agents.json", "work_queue.json", "telemetry.json"]:
+            self.coordinator.store.close()
+            for file in ["swarm.db", "swarm.db-wal", "swarm.db-shm"]:
                 file_path = self.coordinator.data_dir / file
                 if file_path.exists():
                     file_path.unlink()
@@ -532,14 +452,14 @@ def show_telemetry(
 ):
     """Show telemetry events"""
     coordinator = SwarmCoordinator()
-    telemetry_data = coordinator._read_json(coordinator.telemetry_file)
+    telemetry_data = coordinator.telemetry(last)
     
     table = Table(title=f"Last {last} Telemetry Events")
     table.add_column("Timestamp", style="cyan")
     table.add_column("Event", style="magenta") 
     table.add_column("Data", style="green")
     
-    for event in telemetry_data[-last:]:
+    for event in telemetry_data:
         table.add_row(
             event["timestamp"][:19],  # Trim microseconds
             event["event"],
@@ -588,11 +508,9 @@ def run_demo():
     
     # Complete some work
     rprint("\n[yellow]Completing work...[/yellow]")
-    work_queue = coordinator._read_json(coordinator.work_file)
-    for work in work_queue[:2]:
-        if work["status"] == "in_progress":
-            coordinator.complete_work(work["id"])
-            rprint(f"  → Completed: {work['description']}")
+    for work in coordinator.work_items(status="in_progress")[:2]:
+        coordinator.complete_work(work["id"])
+        rprint(f"  → Completed: {work['title']}")
     
     # Final status
     rprint("\n[yellow]Final status:[/yellow]")
@@ -610,6 +528,23 @@ def clean_data():
         rprint(f"[yellow]⚠[/yellow] Data directory does not exist: {DATA_DIR}")
 
 
+@app.command("migrate")
+def migrate_json(
+    source: Path = typer.Argument(..., help="Directory with JSON coordination files (agents.json, work_queue.json, work_claims.json, ...)"),
+    db: Path = typer.Option(DATA_DIR / "swarm.db", "--db", help="SQLite work store to import into")
+):
+    """Import JSON coordination files into the SQLite work store"""
+    store = WorkStore(db)
+    imported = import_json(store, source)
+    store.close()
+    if not imported:
+        rprint(f"[yellow]⚠[/yellow] No coordination files found in {source}")
+        return
+    for name, count in imported.items():
+        rprint(f"[green]✓[/green] {name}: {count} records")
+    rprint(f"Imported into {db}")
+
+
 @app.command("init")
 def initialize_swarm():
     """Initialize swarm with sample agents and work"""
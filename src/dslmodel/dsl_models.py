@@ -1,6 +1,6 @@
-from typing import TypeVar
+from typing import Any, Iterable, TypeVar
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter, model_validator
 
 from dslmodel.mixins import DSPyDSLMixin, FileHandlerDSLMixin, JinjaDSLMixin, ToFromDSLMixin
 
@@ -13,10 +13,59 @@ class DSLModel(BaseModel, FileHandlerDSLMixin, JinjaDSLMixin, DSPyDSLMixin, ToFr
     file handling to the FileHandlerDSLMixin.
     """
 
-    def __init__(self, **data):
-        # Render any default template values using Jinja2 before instantiation
-        data = self.render_defaults(data)
-        super().__init__(**data)
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        # Record which fields have Jinja2 defaults once, so models without any skip rendering entirely
+        cls.templated_default_fields()
+
+    @model_validator(mode="before")
+    @classmethod
+    def _render_templated_defaults(cls, data: Any) -> Any:
+        # Render any default template values using Jinja2 before validation. Runs inside
+        # pydantic-core, so direct construction, model_validate and bulk_validate all share it.
+        if isinstance(data, dict) and cls.templated_default_fields():
+            data = cls.render_defaults(dict(data))
+        return data
+
+    @classmethod
+    def list_adapter(cls: type[T]) -> TypeAdapter[list[T]]:
+        """
+        Returns the cached ``TypeAdapter(list[cls])`` used for bulk validation.
+        """
+        adapter = cls.__dict__.get("__list_adapter__")
+        if adapter is None:
+            adapter = TypeAdapter(list[cls])
+            cls.__list_adapter__ = adapter
+        return adapter
+
+    @classmethod
+    def bulk_validate(cls: type[T], records: Iterable[dict]) -> list[T]:
+        """
+        Validates many records in a single pydantic-core call.
+
+        Parameters
+        ----------
+        - records: An iterable of dictionaries, one per instance.
+
+        Returns
+        -------
+        - A list of instances in record order. Invalid records raise one ValidationError
+          whose locations start with the record index.
+        """
+        if not isinstance(records, list):
+            records = list(records)
+        return cls.list_adapter().validate_python(records)
+
+    @classmethod
+    def from_records(cls: type[T], records: Iterable[dict] | str | bytes) -> list[T]:
+        """
+        Creates instances from an iterable of dictionaries or a JSON array string/bytes.
+        JSON is parsed and validated by pydantic-core without building intermediate dicts.
+        """
+        if isinstance(records, (str, bytes, bytearray)):
+            return cls.list_adapter().validate_json(records)
+        return cls.bulk_validate(records)
 
     @classmethod
     def field_names(cls) -> list[str]:
@@ -3,6 +3,8 @@ import typing
 import dspy
 from pydantic import BaseModel, Field
 
+from dslmodel.utils.dspy_tools import ensure_lm
+
 if typing.TYPE_CHECKING:
     from dspygen.mixin.fsm.fsm_mixin import FSMMixin
 
@@ -42,6 +44,7 @@ class FSMTriggerModule(dspy.Module):
 
 
 def fsm_trigger_call(prompt, fsm: "FSMMixin", **kwargs):
+    ensure_lm()
     fsm_trigger = FSMTriggerModule()
     chosen_trigger = fsm_trigger.forward(prompt=prompt, fsm=fsm)
     if chosen_trigger and hasattr(fsm, chosen_trigger):
@@ -1,5 +1,10 @@
 import ast
+import json
 import logging
+import threading
+import weakref
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TypeVar
 
 import yaml
@@ -7,7 +12,16 @@ import dspy
 from dspy import Predict, ChainOfThought, InputField, OutputField, Signature
 from pydantic import BaseModel, ValidationError, Field
 
+from dslmodel.dspy_modules.output_repair import (
+    RepairMetrics,
+    apply_patch,
+    error_deltas,
+    parse_output,
+    repair_locally,
+    repair_metrics,
+)
 from dslmodel.template import render
+from dslmodel.utils.dspy_tools import ensure_lm
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.ERROR)
@@ -59,6 +73,24 @@ class PromptToPydanticInstanceErrorSignature(Signature):
     )
 
 
+class FieldPatchSignature(Signature):
+    """Fix only the listed fields of the generated kwargs so that each value validates against its JSON schema.
+    Leave every other field alone.
+    """
+
+    root_pydantic_model_class_name = InputField(
+        desc="The class name of the pydantic model to receive the kwargs"
+    )
+    prompt = InputField(desc="The prompt the kwargs were synthesized from")
+    field_errors = InputField(
+        desc="The failing field paths with their validation errors, current values and JSON schemas"
+    )
+    field_patch_dict = OutputField(
+        prefix="```python\nfield_patch: dict = ",
+        desc="A Python dictionary mapping each failing field path (exactly as given) to its corrected value",
+    )
+
+
 class DiagnosisSignature(Signature):
     """Diagnose why the LLM couldn't create the dictionary and suggest potential changes to the source."""
 
@@ -121,8 +153,89 @@ class GenYAMLInstance(dspy.Module):
         self.validation_error = None
 
 
+@dataclass(eq=False)
+class GenerationContext:
+    """
+    Everything about a model class that generation needs and that does not depend on the prompt:
+    the collected class sources, the JSON schema and the DSPy predictors.
+
+    Built once per model class (see `get_generation_context`) and shared by every
+    `GenPydanticInstance` for that class, including across the threads used by `run_dsls`.
+    """
+
+    model_ref: "weakref.ref[type[BaseModel]]"
+    model_sources: str
+    generate: Predict
+    correct_generate: ChainOfThought
+    diagnosis_generate: ChainOfThought
+    patch_generate: Predict
+    _schema_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def model(self) -> type[BaseModel]:
+        # Held weakly: the context is the value of a WeakKeyDictionary keyed by this class.
+        return self.model_ref()
+
+    @cached_property
+    def json_schema(self) -> dict:
+        with self._schema_lock:
+            return self.model.model_json_schema()
+
+
+_generation_contexts: "weakref.WeakKeyDictionary[type, dict[tuple, GenerationContext]]" = weakref.WeakKeyDictionary()
+_generation_contexts_lock = threading.Lock()
+
+
+def get_generation_context(
+        model: type[T],
+        generate_sig=PromptToPydanticInstanceSignature,
+        correct_generate_sig=PromptToPydanticInstanceErrorSignature,
+        diagnosis_sig=DiagnosisSignature,
+        patch_sig=FieldPatchSignature,
+) -> GenerationContext:
+    """
+    Return the memoised generation context for ``model`` and the given signatures.
+
+    Contexts are keyed by the class object itself (weakly), so redefining a model class
+    produces a fresh context and discarded classes do not keep theirs alive.
+    """
+    key = (generate_sig, correct_generate_sig, diagnosis_sig, patch_sig)
+    with _generation_contexts_lock:
+        per_model = _generation_contexts.get(model)
+        if per_model is not None and key in per_model:
+            return per_model[key]
+
+    context = GenerationContext(
+        model_ref=weakref.ref(model),
+        model_sources=collect_all_sources_as_string(model),
+        generate=Predict(generate_sig),
+        correct_generate=ChainOfThought(correct_generate_sig),
+        diagnosis_generate=ChainOfThought(diagnosis_sig),
+        patch_generate=Predict(patch_sig),
+    )
+
+    with _generation_contexts_lock:
+        # Another thread may have built the same context meanwhile; keep the first one.
+        return _generation_contexts.setdefault(model, {}).setdefault(key, context)
+
+
+def clear_generation_contexts(model: type | None = None) -> None:
+    """Drop memoised generation contexts, for one model class or all of them."""
+    with _generation_contexts_lock:
+        if model is None:
+            _generation_contexts.clear()
+        else:
+            _generation_contexts.pop(model, None)
+
+
 class GenPydanticInstance(dspy.Module):
-    """A module for generating and validating Pydantic model instances based on prompts."""
+    """
+    A module for generating and validating Pydantic model instances based on prompts.
+
+    Output that fails validation goes through a bounded repair pipeline: local repairs first
+    (see `dslmodel.dspy_modules.output_repair`), then up to ``max_patch_attempts`` LLM patches
+    of only the failing fields, then up to ``max_corrections`` full corrections, then diagnosis.
+    """
 
     def __init__(
             self,
@@ -131,28 +244,50 @@ class GenPydanticInstance(dspy.Module):
             correct_generate_sig=PromptToPydanticInstanceErrorSignature,
             diagnosis_sig=DiagnosisSignature,
             verbose=False,
+            patch_sig=FieldPatchSignature,
+            max_patch_attempts: int = 2,
+            max_corrections: int = 1,
     ):
         super().__init__()
         self.output_key = "root_model_kwargs_dict"
         self.model = model
         self.verbose = verbose
+        self.max_patch_attempts = max_patch_attempts
+        self.max_corrections = max_corrections
+
+        # Source collection and predictor construction are shared per model class
+        self.context = get_generation_context(model, generate_sig, correct_generate_sig, diagnosis_sig, patch_sig)
+        self.model_sources = self.context.model_sources
+
+        # DSPy Predict/ChainOfThought dspy_modules for generation, patching, correction, and diagnosis
+        self.generate = self.context.generate
+        self.patch_generate = self.context.patch_generate
+        self.correct_generate = self.context.correct_generate
+        self.diagnosis_generate = self.context.diagnosis_generate
+        self.validation_error = None
+        self.metrics = RepairMetrics()
 
-        # Collect source code for model validation and correction logic
-        self.model_sources = collect_all_sources_as_string(model)
+    def _predict(self, predictor, **kwargs) -> tuple[dspy.Prediction, int]:
+        """Call ``predictor`` and return its prediction with the LM tokens it used."""
+        with dspy.context(track_usage=True):
+            prediction = predictor(**kwargs)
+        usage = prediction.get_lm_usage() or {}
+        tokens = sum((model_usage or {}).get("total_tokens") or 0 for model_usage in usage.values())
+        return prediction, tokens
 
-        # Initialize DSPy ChainOfThought dspy_modules for generation, correction, and diagnosis
-        self.generate = Predict(generate_sig)
-        self.correct_generate = ChainOfThought(correct_generate_sig)
-        self.diagnosis_generate = ChainOfThought(diagnosis_sig)
-        self.validation_error = None
+    def _record(self, stage: str, ok: bool, tokens: int = 0) -> None:
+        self.metrics.record(stage, ok, tokens)
+        repair_metrics.record(stage, ok, tokens)
 
     def generate_output(self, prompt: str) -> str:
         """Generates output from the prompt."""
-        output = self.generate(
+        output, tokens = self._predict(
+            self.generate,
             prompt=prompt,
             root_pydantic_model_class_name=self.model.__name__,
             pydantic_model_definitions=self.model_sources,
         )
+        self._record("generate", True, tokens)
         return output[self.output_key]
 
     def validate_root_model(self, output: str) -> bool:
@@ -165,69 +300,132 @@ class GenPydanticInstance(dspy.Module):
             logger.debug(f"Validation error: {error}")
             return False
 
-    def validate_output(self, output: str) -> T:
-        """Validates the generated output and returns the model instance if successful."""
+    def _validate(self, output: str | dict) -> tuple[T | None, dict | None]:
+        """
+        Parse and validate ``output``, falling back to local repairs.
+
+        Returns ``(instance, data)``; on failure the instance is None, ``self.validation_error``
+        holds the remaining error and ``data`` is the locally repaired dict (None if unparseable).
+        """
         try:
-            return self.model.model_validate(eval_dict_str(output))
-        except (ValidationError, ValueError, TypeError, SyntaxError) as error:
+            data = parse_output(output)
+        except ValueError as error:
             self.validation_error = error
+            logger.debug(f"Parse error: {error}")
+            return None, None
+        try:
+            return self.model.model_validate(data), data
+        except ValidationError:
+            pass
+        instance, data, error = repair_locally(self.model, data, self.context.json_schema)
+        self._record("local", instance is not None)
+        self.validation_error = error
+        if error is not None:
             logger.debug(f"Validation error: {error}")
-            return self.handle_correction(prompt, output)
+        return instance, data
 
-    def handle_correction(self, prompt: str, output: str) -> T:
-        """Attempts to correct the generated output based on errors."""
+    def validate_output(self, output: str | dict) -> T:
+        """Validates the generated output, applying local repairs, and returns the model instance."""
+        instance, _ = self._validate(output)
+        if instance is None:
+            raise self.validation_error
+        return instance
+
+    def request_patch(self, prompt: str, data: dict) -> tuple[T | None, dict | None]:
+        """
+        Ask the LM to fix only the fields named in ``self.validation_error`` and merge its
+        answer into ``data``. Returns ``(instance, data)``, with data None when the errors
+        cannot be expressed as field patches.
+        """
+        deltas = error_deltas(self.context.json_schema, data, self.validation_error)
+        paths = [delta["path"] for delta in deltas]
+        if not all(paths):
+            return None, None
+
+        prediction, tokens = self._predict(
+            self.patch_generate,
+            prompt=prompt,
+            root_pydantic_model_class_name=self.model.__name__,
+            field_errors=json.dumps(deltas, indent=1, default=str),
+        )
         try:
-            corrected_output = self.correct_generate(
-                prompt=prompt,
-                root_pydantic_model_class_name=self.model.__name__,
-                pydantic_model_definitions=self.model_sources,
-                generated_kwargs=output,
-                error=f"Error: {self.validation_error}",
-            )[self.output_key]
-            return self.validate_output(corrected_output)
-        except (AssertionError, ValueError, TypeError) as error:
-            logger.error(f"Correction failed: {error}")
-            raise
+            patch = parse_output(prediction["field_patch_dict"])
+        except ValueError as error:
+            logger.debug(f"Unusable field patch: {error}")
+            self._record("patch", False, tokens)
+            return None, data
+
+        merged, applied = apply_patch(data, patch, paths)
+        logger.debug(f"Applied field patch to {applied}")
+        instance, merged = self._validate(merged)
+        self._record("patch", instance is not None, tokens)
+        return instance, data if merged is None else merged
+
+    def handle_correction(self, prompt: str, output: str) -> T:
+        """Regenerates the whole output once from the validation error. Does not retry."""
+        corrected_output, tokens = self._predict(
+            self.correct_generate,
+            prompt=prompt,
+            root_pydantic_model_class_name=self.model.__name__,
+            pydantic_model_definitions=self.model_sources,
+            generated_kwargs=output,
+            error=f"Error: {self.validation_error}",
+        )
+        instance, _ = self._validate(corrected_output[self.output_key])
+        self._record("correct", instance is not None, tokens)
+        if instance is None:
+            logger.error(f"Correction failed: {self.validation_error}")
+            raise self.validation_error
+        return instance
 
     def diagnose_issue(self, prompt: str) -> None:
         """Diagnoses the error when both generation and correction steps fail."""
-        diagnosis_output = self.diagnosis_generate(
+        diagnosis_output, tokens = self._predict(
+            self.diagnosis_generate,
             error_message=str(self.validation_error),
             root_pydantic_model_class_name=self.model.__name__,
             prompt=prompt,
         )
+        self._record("diagnose", True, tokens)
         suggested_changes = diagnosis_output["suggested_changes"]
         logger.error(f"Diagnosis suggestions: {suggested_changes}")
-        raise ValueError(f"Model generation failed. Suggested changes: {suggested_changes}")
+        raise ValueError(f"Model generation failed. Suggested changes: {suggested_changes}") from self.validation_error
 
-    def forward(self, prompt: str) -> T:
-        """The main function that handles generation, validation, correction, and diagnosis."""
-        # Step 1: Generate initial output
-        prompt = render(prompt)
+    def repair(self, prompt: str, output: str) -> T:
+        """Validate ``output``, running the bounded local -> patch -> correction -> diagnosis pipeline."""
+        instance, data = self._validate(output)
 
-        output = self.generate_output(prompt)
-
-        # Step 2: Attempt to validate the generated output
-        try:
-            return self.validate_output(output)
-        except (AssertionError, ValueError, TypeError) as error:
-            logger.error(f"Error during validation: {error}\nOutput:\n{output}")
+        for _ in range(self.max_patch_attempts):
+            if instance is not None or data is None:
+                break
+            instance, data = self.request_patch(prompt, data)
 
-            # Step 3: Try to correct the output
+        for _ in range(self.max_corrections):
+            if instance is not None:
+                break
             try:
-                return self.handle_correction(prompt, output)
-            except (AssertionError, ValueError, TypeError) as error2:
-                # Step 4: If correction fails, perform diagnosis
-                print(self.diagnose_issue(prompt))
-                raise error2
+                instance = self.handle_correction(prompt, output if data is None else repr(data))
+            except (ValueError, TypeError) as error:
+                logger.error(f"Error during correction: {error}")
+
+        if instance is None:
+            self.diagnose_issue(prompt)
+        return instance
+
+    def forward(self, prompt: str) -> T:
+        """The main function that handles generation, validation, repair, and diagnosis."""
+        ensure_lm()
+        prompt = render(prompt)
+        output = self.generate_output(prompt)
+        return self.repair(prompt, output)
 
     def __call__(self, prompt: str):
         return self.forward(prompt)
 
 
-def gen_instance(model, prompt, verbose=False):
+def gen_instance(model, prompt, verbose=False, **kwargs):
     """Helper function to instantiate and use GenPydanticInstance."""
-    model_module = GenPydanticInstance(model, verbose=verbose)
+    model_module = GenPydanticInstance(model, verbose=verbose, **kwargs)
     return model_module(prompt)
 
 
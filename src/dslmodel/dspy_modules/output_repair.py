@@ -0,0 +1,368 @@
+"""
+Local (LLM-free) repair of generated model kwargs and structured validation error deltas.
+
+`GenPydanticInstance` runs generated output through three increasingly expensive stages:
+
+1. ``parse_output`` - Python literal first, then YAML (which also covers JSON), after stripping
+   code fences and echoed prefixes.
+2. ``repair_locally`` - fixes the mechanical failures pydantic reports: unknown keys on models
+   that forbid extras, scalars where lists are expected, numbers where strings are expected,
+   nested objects emitted as strings, case-mismatched enum values and missing fields whose schema
+   provides a default. Only when this leaves errors is an LLM involved.
+3. A targeted LLM patch built from ``error_deltas``: just the failing field paths with their
+   current values and JSON sub-schemas, merged back with ``apply_patch``.
+
+`RepairMetrics` counts attempts, successes and LM tokens per stage.
+"""
+import ast
+import re
+import threading
+from collections import Counter
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any
+
+import yaml
+from pydantic import BaseModel, ValidationError
+
+Loc = tuple[str | int, ...]
+
+_FENCE_RE = re.compile(r"^\s*```[\w-]*\s*\n?|\n?\s*```\s*$")
+_ASSIGNMENT_RE = re.compile(r"^\s*\w+\s*(:\s*[\w\[\], ]+)?\s*=\s*")
+_MISSING = object()
+
+# Pydantic error types repair_locally knows how to fix
+LIST_ERRORS = {"list_type", "tuple_type", "set_type", "frozen_set_type"}
+OBJECT_ERRORS = {"model_type", "dict_type", "model_attributes_type"}
+NUMBER_ERRORS = {"int_parsing", "float_parsing", "decimal_parsing"}
+CHOICE_ERRORS = {"enum", "literal_error"}
+
+MAX_VALUE_CHARS = 500
+
+
+def parse_output(output: str | dict) -> dict:
+    """Parse LM output into a dict, trying a Python literal first and YAML/JSON second."""
+    if isinstance(output, dict):
+        return output
+    text = _FENCE_RE.sub("", str(output)).strip()
+    text = _ASSIGNMENT_RE.sub("", text, count=1)
+    try:
+        data = ast.literal_eval(text)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as error:
+            raise ValueError(f"Output is neither a Python literal nor YAML: {error}") from error
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a dictionary of model kwargs, got {type(data).__name__}")
+    return data
+
+
+def unwrap_root(model: type[BaseModel], data: dict) -> dict:
+    """Unwrap ``{"ModelName": {...}}`` when the model has no field of that name."""
+    if len(data) == 1:
+        (key, value), = data.items()
+        if (
+            isinstance(value, dict)
+            and isinstance(key, str)
+            and key not in model.model_fields
+            and key.lower().replace("_", "") == model.__name__.lower()
+        ):
+            return value
+    return data
+
+
+def format_path(loc: Loc) -> str:
+    return ".".join(str(part) for part in loc)
+
+
+def parse_path(path: str) -> Loc:
+    return tuple(int(part) if part.isdigit() else part for part in path.split(".")) if path else ()
+
+
+def get_path(data: Any, loc: Loc, default: Any = None) -> Any:
+    for part in loc:
+        try:
+            data = data[part]
+        except (KeyError, IndexError, TypeError):
+            return default
+    return data
+
+
+def set_path(data: Any, loc: Loc, value: Any) -> None:
+    """Set ``value`` at ``loc``, creating intermediate dicts for missing keys."""
+    for part in loc[:-1]:
+        if isinstance(data, dict) and not isinstance(data.get(part), (dict, list)):
+            data[part] = {}
+        data = data[part]
+    data[loc[-1]] = value
+
+
+def delete_path(data: Any, loc: Loc) -> None:
+    parent = get_path(data, loc[:-1])
+    if isinstance(parent, dict):
+        parent.pop(loc[-1], None)
+    elif isinstance(parent, list) and isinstance(loc[-1], int) and loc[-1] < len(parent):
+        del parent[loc[-1]]
+
+
+def data_loc(data: Any, loc: Loc, error_type: str = "") -> Loc:
+    """
+    Trim a pydantic error location to the part that addresses ``data``.
+
+    Pydantic appends union member tags (``int``, ``function-after[...]``) to locations; those
+    do not exist in the data and are dropped. A trailing missing key is kept for ``missing`` errors.
+    """
+    node = data
+    for depth, part in enumerate(loc):
+        if isinstance(node, dict) and part in node:
+            node = node[part]
+        elif isinstance(node, list) and isinstance(part, int) and part < len(node):
+            node = node[part]
+        elif isinstance(node, dict) and error_type == "missing" and depth == len(loc) - 1:
+            return loc
+        else:
+            return loc[:depth]
+    return loc
+
+
+def _resolve(schema: dict, node: dict) -> dict:
+    """Follow ``$ref``s and collapse single-branch ``allOf`` wrappers."""
+    for _ in range(32):
+        if "$ref" in node:
+            node = schema.get("$defs", {}).get(node["$ref"].rsplit("/", 1)[-1], {})
+        elif len(node.get("allOf", ())) == 1:
+            node = node["allOf"][0]
+        else:
+            break
+    return node
+
+
+def _branches(schema: dict, node: dict) -> list[dict]:
+    node = _resolve(schema, node)
+    branches = node.get("anyOf") or node.get("oneOf")
+    return [_resolve(schema, branch) for branch in branches] if branches else [node]
+
+
+def is_nullable(schema: dict, node: dict) -> bool:
+    return any(branch.get("type") == "null" for branch in _branches(schema, node))
+
+
+def schema_for_path(schema: dict, loc: Loc) -> dict:
+    """Return the JSON sub-schema describing the value at ``loc`` (``{}`` if unknown)."""
+    node = schema
+    for part in loc:
+        candidates = [branch for branch in _branches(schema, node) if branch.get("type") != "null"]
+        node = {}
+        for branch in candidates:
+            if isinstance(part, int) and "items" in branch:
+                node = branch["items"]
+            elif isinstance(part, int) and part < len(branch.get("prefixItems", ())):
+                node = branch["prefixItems"][part]
+            elif part in branch.get("properties", {}):
+                node = branch["properties"][part]
+            elif isinstance(branch.get("additionalProperties"), dict):
+                node = branch["additionalProperties"]
+            else:
+                continue
+            break
+    return node
+
+
+def inline_refs(schema: dict, node: Any, depth: int = 4) -> Any:
+    """Copy of ``node`` with ``$ref``s replaced by their definitions, to a bounded depth."""
+    if isinstance(node, list):
+        return [inline_refs(schema, item, depth) for item in node]
+    if not isinstance(node, dict):
+        return node
+    if "$ref" in node:
+        if depth <= 0:
+            return {"type": "object"}
+        return inline_refs(schema, _resolve(schema, node), depth - 1)
+    return {key: inline_refs(schema, value, depth) for key, value in node.items() if key != "$defs"}
+
+
+def _fix_error(schema: dict, data: dict, error: dict) -> bool:
+    """Apply one mechanical fix for ``error`` in place. Returns False if there is none."""
+    error_type = error["type"]
+    loc = data_loc(data, tuple(error["loc"]), error_type)
+    if not loc:
+        return False
+    value = get_path(data, loc, _MISSING)
+    node = schema_for_path(schema, loc)
+
+    if error_type == "extra_forbidden":
+        delete_path(data, loc)
+        return True
+
+    if error_type == "missing":
+        options = _branches(schema, node)
+        if "default" in node:
+            set_path(data, loc, deepcopy(node["default"]))
+        elif is_nullable(schema, node):
+            set_path(data, loc, None)
+        elif len(options) == 1 and options[0].get("type") == "array":
+            set_path(data, loc, [])
+        else:
+            return False
+        return True
+
+    if value is _MISSING:
+        return False
+
+    if error_type == "string_type" and isinstance(value, (int, float, bool)):
+        set_path(data, loc, str(value))
+        return True
+
+    if error_type in LIST_ERRORS:
+        if isinstance(value, str):
+            try:
+                parsed = ast.literal_eval(value.strip())
+            except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+                parsed = None
+            if isinstance(parsed, (list, tuple, set)):
+                set_path(data, loc, list(parsed))
+                return True
+        if value is not None and not isinstance(value, (list, tuple, set)):
+            set_path(data, loc, [value])
+            return True
+        return False
+
+    if error_type in OBJECT_ERRORS and isinstance(value, str):
+        try:
+            set_path(data, loc, parse_output(value))
+        except ValueError:
+            return False
+        return True
+
+    if error_type in NUMBER_ERRORS and isinstance(value, str):
+        cleaned = value.strip().replace(",", "").replace("_", "")
+        if cleaned != value:
+            set_path(data, loc, cleaned)
+            return True
+        return False
+
+    if error_type in CHOICE_ERRORS and isinstance(value, str):
+        choices = [
+            choice
+            for branch in _branches(schema, node)
+            for choice in branch.get("enum", [branch["const"]] if "const" in branch else [])
+        ]
+        matches = [choice for choice in choices if str(choice).strip().lower() == value.strip().lower()]
+        if len(matches) == 1 and matches[0] != value:
+            set_path(data, loc, matches[0])
+            return True
+        return False
+
+    return False
+
+
+def repair_locally(
+    model: type[BaseModel], data: dict, schema: dict | None = None, max_rounds: int = 3
+) -> tuple[BaseModel | None, dict, ValidationError | None]:
+    """
+    Validate ``data`` against ``model``, applying mechanical fixes between attempts.
+
+    Returns ``(instance, data, None)`` on success, or ``(None, data, error)`` with the
+    partially repaired data and the remaining validation error. ``data`` is not modified.
+    """
+    schema = model.model_json_schema() if schema is None else schema
+    data = deepcopy(unwrap_root(model, data))
+    for _ in range(max_rounds + 1):
+        try:
+            return model.model_validate(data), data, None
+        except ValidationError as error:
+            last_error = error
+        fixed = [_fix_error(schema, data, error) for error in last_error.errors()]
+        if not any(fixed):
+            break
+    return None, data, last_error
+
+
+def error_deltas(schema: dict, data: dict, error: ValidationError) -> list[dict]:
+    """
+    Describe each failing field for a targeted patch request: its path, the error, the
+    current value and its JSON sub-schema. Several errors on one path are merged.
+    """
+    deltas: dict[Loc, dict] = {}
+    for item in error.errors():
+        loc = data_loc(data, tuple(item["loc"]), item["type"])
+        if loc in deltas:
+            deltas[loc]["errors"].append(item["msg"])
+            continue
+        value = get_path(data, loc, _MISSING)
+        deltas[loc] = {
+            "path": format_path(loc),
+            "errors": [item["msg"]],
+            "current_value": "<missing>" if value is _MISSING else _truncate(value),
+            "schema": inline_refs(schema, schema_for_path(schema, loc)),
+        }
+    return list(deltas.values())
+
+
+def apply_patch(data: dict, patch: dict, allowed_paths: list[str]) -> tuple[dict, list[str]]:
+    """
+    Merge ``{path: value}`` ``patch`` into a copy of ``data``.
+
+    Only the requested paths (or paths beneath them) are applied, so a patch cannot rewrite
+    fields that already validated. Returns the merged data and the applied paths.
+    """
+    allowed = [parse_path(path) for path in allowed_paths]
+    merged = deepcopy(data)
+    applied = []
+    for path, value in patch.items():
+        loc = parse_path(str(path))
+        if not loc or not any(loc[: len(prefix)] == prefix for prefix in allowed):
+            continue
+        try:
+            set_path(merged, loc, value)
+        except (KeyError, IndexError, TypeError):
+            continue
+        applied.append(str(path))
+    return merged, applied
+
+
+def _truncate(value: Any) -> Any:
+    text = repr(value)
+    return value if len(text) <= MAX_VALUE_CHARS else text[:MAX_VALUE_CHARS] + "..."
+
+
+STAGES = ("generate", "local", "patch", "correct", "diagnose")
+
+
+@dataclass
+class RepairMetrics:
+    """Attempts, successes and LM tokens per generation/repair stage."""
+
+    attempts: Counter = field(default_factory=Counter)
+    successes: Counter = field(default_factory=Counter)
+    tokens: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, stage: str, ok: bool, tokens: int = 0) -> None:
+        with self._lock:
+            self.attempts[stage] += 1
+            self.successes[stage] += int(ok)
+            self.tokens[stage] += tokens
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {
+                stage: {
+                    "attempts": self.attempts[stage],
+                    "successes": self.successes[stage],
+                    "tokens": self.tokens[stage],
+                }
+                for stage in STAGES
+                if self.attempts[stage]
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.attempts.clear()
+            self.successes.clear()
+            self.tokens.clear()
+
+
+# Process-wide totals across all GenPydanticInstance runs
+repair_metrics = RepairMetrics()
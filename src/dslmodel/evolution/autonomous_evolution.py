@@ -32,6 +32,8 @@ from loguru import logger
 from pydantic import BaseModel, Field
 import numpy as np
 
+from dslmodel.utils.span_writer import span_writer
+
 # Import OpenTelemetry components
 try:
     from opentelemetry import trace
@@ -920,9 +922,7 @@ class AutonomousEvolutionEngine:
             }
             
             # Write to coordination file
-            spans_file = self.coordination_dir / "telemetry_spans.jsonl"
-            with open(spans_file, 'a') as f:
-                f.write(json.dumps(span_data) + '\n')
+            span_writer(self.coordination_dir / "telemetry_spans.jsonl").write(span_data)
             
         except Exception as e:
             logger.error(f"Failed to emit evolution span: {e}")
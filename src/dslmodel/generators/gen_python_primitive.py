@@ -4,7 +4,7 @@ import logging
 from dspy import ChainOfThought, InputField, OutputField, Signature
 from pydantic import BaseModel, Field
 
-from dslmodel.utils.dspy_tools import init_instant
+from dslmodel.utils.dspy_tools import ensure_lm, init_instant
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -184,6 +184,7 @@ class GenPrimitiveModule:
         """
         Handles generation, validation, correction, and returns the final output.
         """
+        ensure_lm()
         # Generate initial output
         generated_output = self.generate(prompt=prompt)
         output = generated_output.get(self.output_key)
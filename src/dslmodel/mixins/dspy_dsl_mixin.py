@@ -1,7 +1,7 @@
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
-import dspy
-from dslmodel.dspy_modules.gen_pydantic_instance import gen_instance
+if TYPE_CHECKING:
+    import dspy
 
 
 T = TypeVar("T", bound="DSLModel")
@@ -14,40 +14,64 @@ class DSPyDSLMixin:
     """
 
     @classmethod
-    def from_prompt(cls: type[T], prompt: Any, verbose=False, **kwargs) -> T:
+    def from_prompt(cls: type[T], prompt: Any, verbose=False, use_cache=True, **kwargs) -> T:
         """
         Creates an instance of the model from a user prompt.
 
         :param prompt: The user prompt.
         :param verbose: Whether to print verbose output and debug information.
+        :param use_cache: Whether to consult the response cache, if one is enabled.
         :return: An instance of the model.
         """
+        from dslmodel.dspy_modules.gen_pydantic_instance import gen_instance
+        from dslmodel.utils.dspy_tools import ensure_lm
+        from dslmodel.utils.response_cache import get_response_cache
+
         if verbose:
             print(prompt)
 
+        lm = ensure_lm()
+        cache = get_response_cache() if use_cache else None
+        if cache is None:
+            return gen_instance(cls, prompt, verbose)
+
+        # Key on the rendered prompt so templated prompts are cached by what the LM actually sees
+        if isinstance(prompt, str) and ("{{" in prompt or "{%" in prompt):
+            from dslmodel.template import render
+
+            prompt = render(prompt)
+
+        key = cache.make_key(cls, prompt, lm)
+        cached = cache.get(key)
+        if cached is not None:
+            return cls.model_validate(cached)
+
         instance = gen_instance(cls, prompt, verbose)
+        cache.set(key, instance)
         return instance
 
     @classmethod
-    def from_template(cls: type[T], template: str, verbose=False, **kwargs) -> T:
+    def from_template(cls: type[T], template: str, verbose=False, use_cache=True, **kwargs) -> T:
         """
         Creates an instance of the model from a template and a context dictionary.
 
         :param template: The template string to render.
         :param verbose: Whether to print verbose output and debug information.
+        :param use_cache: Whether to consult the response cache, if one is enabled.
         :return: An instance of the model.
         """
         from dslmodel.template import render
 
         rendered_prompt = render(template, **kwargs)
-        return cls.from_prompt(rendered_prompt, verbose=verbose)
+        return cls.from_prompt(rendered_prompt, verbose=verbose, use_cache=use_cache)
 
     @classmethod
     def from_signature(
         cls: type[T],
-        signature: str | type[dspy.Signature],  # Signature can be a string or a dspy.Signature subclass
-        predictor_class: type[dspy.Module] = dspy.Predict,  # Default predictor class is dspy.Predict
+        signature: "str | type[dspy.Signature]",  # Signature can be a string or a dspy.Signature subclass
+        predictor_class: "type[dspy.Module] | None" = None,  # Default predictor class is dspy.Predict
         verbose=False,
+        use_cache=True,
         **kwargs,
     ) -> T:
         """
@@ -59,8 +83,34 @@ class DSPyDSLMixin:
         :param predictor_class: A DSPy module class (dspy.Module) that can interpret the signature and generate a prompt.
                                 Default is dspy.Predict.
         :param verbose: Whether to print verbose output and debug information.
+        :param use_cache: Whether to consult the response cache, if one is enabled.
         :return: An instance of the model.
         """
+        import json
+
+        import dspy
+
+        from dslmodel.utils.dspy_tools import ensure_lm
+        from dslmodel.utils.response_cache import get_response_cache
+
+        lm = ensure_lm()
+        if predictor_class is None:
+            predictor_class = dspy.Predict
+
+        cache = get_response_cache() if use_cache else None
+        if cache is not None:
+            signature_text = signature if isinstance(signature, str) else (
+                f"{signature.__qualname__}: {getattr(signature, 'signature', '')}\n"
+                f"{getattr(signature, 'instructions', '')}"
+            )
+            request = json.dumps(
+                [signature_text, predictor_class.__qualname__, kwargs], sort_keys=True, default=str
+            )
+            key = cache.make_key(cls, request, lm)
+            cached = cache.get(key)
+            if cached is not None:
+                return cls.model_validate(cached)
+
         # Instantiate the predictor with the provided signature (string or Signature subclass)
         predictor = predictor_class(signature)
 
@@ -71,4 +121,7 @@ class DSPyDSLMixin:
             print(f"Prompt: {prompt}")
 
         # Create an instance of the model using from_prompt
-        return cls.from_prompt(str(prompt), verbose=verbose, **kwargs)
+        instance = cls.from_prompt(str(prompt), verbose=verbose, use_cache=False, **kwargs)
+        if cache is not None:
+            cache.set(key, instance)
+        return instance
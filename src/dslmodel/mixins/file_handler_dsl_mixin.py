@@ -1,15 +1,22 @@
-from typing import TypeVar
+from typing import ClassVar, TypeVar
 import os
 
+from pydantic import ValidationError
+
+from dslmodel.utils.serializers import detect_serializer, get_serializer, serializer_for_extension
+
 T = TypeVar("T", bound="DSLModel")
 
 
 class FileHandlerDSLMixin:
     """
     A mixin class that provides file handling functionalities for saving and loading
-    models to and from YAML, JSON, and TOML formats.
+    models to and from YAML, JSON, TOML and any other format in `dslmodel.utils.serializers`.
     """
 
+    # Format used by save() when none is given; override per model class, e.g. "msgpack"
+    default_file_format: ClassVar[str] = "yaml"
+
     def generate_filename(self, ext: str = "yaml", add_timestamp: bool = False) -> str:
         """
         Generates a safe filename based on the model's content.
@@ -25,53 +32,52 @@ class FileHandlerDSLMixin:
         return filename
 
     def save(
-        self, file_path: str | None = None, file_format: str = "yaml", add_timestamp: bool = False
+        self, file_path: str | None = None, file_format: str | None = None, add_timestamp: bool = False
     ) -> str:
         """
         Saves the model to a file in the specified format. Automatically generates a filename if not provided.
 
         :param file_path: The path to the file. If None, generates a filename.
-        :param file_format: The format to save the file in ('yaml', 'json', 'toml').
+        :param file_format: The format to save the file in ('yaml', 'json', 'toml', 'msgpack', 'cbor', ...).
+            Defaults to the class's ``default_file_format``.
         :param add_timestamp: Whether to append a timestamp to the filename.
         :return: The path to the saved file.
         """
+        file_format = file_format or self.default_file_format
+        serializer = get_serializer(file_format)
+
         if file_path is None:
             file_path = self.generate_filename(ext=file_format, add_timestamp=add_timestamp)
 
-        if file_format == "yaml":
-            content = self.to_yaml()
-        elif file_format == "json":
-            content = self.to_json()
-        elif file_format == "toml":
-            content = self.to_toml()
-        else:
-            raise ValueError("Unsupported file format. Use 'yaml', 'json', or 'toml'.")
+        content = serializer.dump_model(self)
 
-        with open(file_path, "w") as file:
+        with open(file_path, "wb") as file:
             file.write(content)
 
         return file_path
 
     @classmethod
-    def load(cls: type[T], file_path: str) -> T:
+    def load(cls: type[T], file_path: str, file_format: str | None = None) -> T:
         """
-        Loads a model from a file, inferring the file format from its ext.
+        Loads a model from a file, inferring the file format from its ext or, for unknown
+        extensions, from the file's leading bytes.
 
         :param file_path: The path to the file.
+        :param file_format: Explicit format, skipping detection.
         :return: An instance of the model populated with data from the file.
-        :raises ValueError: If the file format is unsupported.
+        :raises ValueError: If the file format is unsupported or the content is invalid.
         """
         _, ext = os.path.splitext(file_path)
-        ext = ext.lower()
 
-        with open(file_path) as file:
+        with open(file_path, "rb") as file:
             content = file.read()
 
-        if ext in [".yaml", ".yml"]:
-            return cls.from_yaml(content)
-        elif ext == ".json":
-            return cls.from_json(content)
-        elif ext == ".toml":
-            return cls.from_toml(content)
+        if file_format:
+            serializer = get_serializer(file_format)
         else:
-            raise ValueError(f"Unsupported file format '{ext}'. Supported formats are 'yaml', 'json', 'toml'.")
+            serializer = serializer_for_extension(ext) or detect_serializer(content)
+
+        try:
+            return serializer.load_model(cls, content)
+        except ValidationError as ve:
+            raise ValueError(f"Validation error while creating {cls.__name__} instance: {ve}")
@@ -4,8 +4,6 @@ import inspect
 from transitions import Machine
 from transitions.core import State
 
-from dslmodel.dspy_modules.fsm_trigger_module import fsm_trigger_call
-
 
 def trigger(source, dest, conditions=None, unless=None, before=None, after=None, prepare=None):
     def decorator(func):
@@ -124,6 +122,8 @@ class FSMMixin:
 
     def forward(self, prompt, **kwargs):
         self.prompts.append(prompt)
+        from dslmodel.dspy_modules.fsm_trigger_module import fsm_trigger_call
+
         return fsm_trigger_call(prompt, self, **kwargs)
 
     @property
@@ -6,25 +6,34 @@ from dslmodel.template import render_native
 class JinjaDSLMixin:
     model_fields = None
 
+    @classmethod
+    def templated_default_fields(cls) -> tuple[str, ...]:
+        """
+        Names of fields whose default is a Jinja2 template, computed once per class.
+        """
+        fields = cls.__dict__.get("__templated_defaults__")
+        if fields is None:
+            fields = tuple(
+                field_name
+                for field_name, field_value in cls.model_fields.items()
+                if field_value.default is not PydanticUndefined
+                and isinstance(field_value.default, str)
+                and "{{" in field_value.default
+            )
+            cls.__templated_defaults__ = fields
+        return fields
+
     @classmethod
     def render_defaults(cls, data: dict) -> dict:
         """
         Renders default values that are defined as Jinja2 templates.
         """
-        for field_name, field_value in cls.model_fields.items():
-            if (
-                field_name in data
-                or field_value.default is None
-                or field_value.default is PydanticUndefined
-            ):
+        for field_name in cls.templated_default_fields():
+            # Only set the value if not already provided by user input
+            if field_name in data:
                 continue
             try:
-                if field_value.default and "{{" in field_value.default:
-                    # Render the template if it contains a Jinja2 expression
-                    rendered_value = render_native(field_value.default)
-                    # Only set the value if not already provided by user input
-                    if field_name not in data:
-                        data[field_name] = rendered_value
+                data[field_name] = render_native(cls.model_fields[field_name].default)
             except Exception:
                 pass
 
@@ -1,14 +1,39 @@
+import io
 import json
 from abc import abstractmethod, ABC
+from contextlib import nullcontext
 
 import toml
 import yaml
-from typing import TypeVar, Union, Optional
+from typing import IO, Iterable, Iterator, TypeVar, Union, Optional
 from pathlib import Path
 from pydantic import ValidationError
 
+from dslmodel.utils.serializers import YAML_LOADER, detect_serializer, get_serializer
+
 T = TypeVar("T", bound="DSLModel")
 
+# File suffixes understood by write_many / iter_from_file
+STREAM_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".yaml": "yaml", ".yml": "yaml", ".json": "json"}
+
+
+def stream_format(file_path: Optional[Union[str, Path]], format: Optional[str] = None) -> str:
+    """
+    Returns the streaming format ("jsonl", "yaml" or "json") given explicitly or inferred from the file suffix.
+    """
+    if format:
+        if format not in STREAM_FORMATS.values():
+            raise ValueError(f"Unsupported stream format: {format}")
+        return format
+    suffix = Path(file_path).suffix.lower() if file_path else ""
+    if suffix not in STREAM_FORMATS:
+        raise ValueError(f"Cannot infer stream format from {file_path!r}; pass format='jsonl', 'yaml' or 'json'")
+    return STREAM_FORMATS[suffix]
+
+
+def dump_yaml_document(data: dict) -> str:
+    return yaml.dump(data, default_flow_style=False, width=1000, explicit_start=True)
+
 
 class ToFromDSLMixin(ABC):
     """
@@ -59,7 +84,7 @@ class ToFromDSLMixin(ABC):
         if not content:
             raise ValueError("Either content or file_path must be provided")
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=YAML_LOADER)
             return cls.from_dict(data)
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing YAML content: {e}")
@@ -96,12 +121,126 @@ class ToFromDSLMixin(ABC):
         except Exception as e:
             raise ValueError(f"Error parsing TOML content: {e}")
 
+    @classmethod
+    def iter_from_jsonl(cls: type[T], content: str = "", file_path: Optional[Union[str, Path]] = None) -> Iterator[T]:
+        """
+        Lazily yields one instance per line of JSON Lines content from a string or file path.
+        Blank lines are skipped; only one line is held in memory at a time.
+        """
+        if not (content or file_path):
+            raise ValueError("Either content or file_path must be provided")
+        with (open(file_path, 'r') if file_path else io.StringIO(content)) as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"Error parsing JSON on line {line_number}: {e}")
+                yield cls.from_dict(data)
+
+    @classmethod
+    def iter_from_yaml_documents(
+            cls: type[T], content: str = "", file_path: Optional[Union[str, Path]] = None
+    ) -> Iterator[T]:
+        """
+        Lazily yields one instance per document of multi-document YAML (separated by ``---``)
+        from a string or file path. Empty documents are skipped.
+        """
+        if not (content or file_path):
+            raise ValueError("Either content or file_path must be provided")
+        with (open(file_path, 'r') if file_path else io.StringIO(content)) as f:
+            try:
+                for data in yaml.load_all(f, Loader=YAML_LOADER):
+                    if data is not None:
+                        yield cls.from_dict(data)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Error parsing YAML content: {e}")
+
+    @classmethod
+    def iter_from_json_array(
+            cls: type[T], content: str = "", file_path: Optional[Union[str, Path]] = None, prefix: str = "item"
+    ) -> Iterator[T]:
+        """
+        Lazily yields one instance per element of a (possibly very large) JSON array, parsed
+        incrementally with ijson. ``prefix`` selects a nested array, e.g. ``"spans.item"``.
+        """
+        import ijson
+
+        if not (content or file_path):
+            raise ValueError("Either content or file_path must be provided")
+        with (open(file_path, 'rb') if file_path else io.BytesIO(content.encode())) as f:
+            try:
+                for data in ijson.items(f, prefix, use_float=True):
+                    yield cls.from_dict(data)
+            except ijson.JSONError as e:
+                raise ValueError(f"Error parsing JSON content: {e}")
+
+    @classmethod
+    def iter_from_file(cls: type[T], file_path: Union[str, Path], format: Optional[str] = None) -> Iterator[T]:
+        """
+        Lazily yields instances from a JSONL, multi-document YAML or JSON array file,
+        choosing the reader from ``format`` or the file suffix.
+        """
+        readers = {
+            "jsonl": cls.iter_from_jsonl,
+            "yaml": cls.iter_from_yaml_documents,
+            "json": cls.iter_from_json_array,
+        }
+        return readers[stream_format(file_path, format)](file_path=file_path)
+
+    @classmethod
+    def write_many(
+            cls, instances: Iterable[T], file_path: Union[str, Path, IO[str]], format: Optional[str] = None
+    ) -> int:
+        """
+        Writes instances one at a time as JSON Lines, multi-document YAML or a JSON array
+        to a file path or an open text stream. Returns the number of instances written.
+        """
+        path = None if hasattr(file_path, "write") else file_path
+        format = stream_format(path, format)
+        count = 0
+        with (open(path, 'w') if path else nullcontext(file_path)) as f:
+            if format == "json":
+                f.write("[")
+            for instance in instances:
+                if format == "jsonl":
+                    f.write(instance.model_dump_json() + "\n")
+                elif format == "yaml":
+                    f.write(dump_yaml_document(instance.model_dump()))
+                else:
+                    f.write(("," if count else "") + "\n" + instance.model_dump_json())
+                count += 1
+            if format == "json":
+                f.write("\n]\n")
+        return count
+
+    @classmethod
+    def from_bytes(cls: type[T], payload: bytes, format: Optional[str] = None) -> T:
+        """
+        Creates an instance from a payload in any registered format (see `dslmodel.utils.serializers`).
+        The format is detected from the payload's leading bytes when not given.
+        """
+        serializer = get_serializer(format) if format else detect_serializer(payload)
+        try:
+            return cls.from_dict(serializer.loads(payload))
+        except ValueError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Error parsing {serializer.name} content: {e}")
+
+    def to_bytes(self, format: str = "json") -> bytes:
+        """
+        Serializes the model instance with a registered serializer, e.g. "json", "yaml", "msgpack" or "cbor".
+        """
+        return get_serializer(format).dump_model(self)
+
     def to_yaml(self, file_path: Optional[Union[str, Path]] = None) -> str:
         """
         Serializes the model instance into a YAML string. Optionally, writes to a file if file_path is provided.
         """
         try:
-            yaml_content = yaml.dump(self.model_dump(), default_flow_style=False, width=1000)
+            yaml_content = get_serializer("yaml").dump_model(self).decode()
             if file_path:
                 with open(file_path, 'w') as f:
                     f.write(yaml_content)
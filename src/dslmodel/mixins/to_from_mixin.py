@@ -3,13 +3,54 @@ from abc import abstractmethod, ABC
 
 import toml
 import yaml
-from typing import TypeVar, Union, Optional
+from typing import AsyncIterable, AsyncIterator, Iterable, TypeVar, Union, Optional
 from pathlib import Path
 from pydantic import ValidationError
 import aiofiles
 
+from dslmodel.mixins.to_from_dsl_mixin import dump_yaml_document, stream_format
+from dslmodel.utils.serializers import YAML_LOADER, get_serializer
+
 T = TypeVar("T", bound="DSLModel")
 
+# aiofiles hands every call to a thread, so streams are read and written in large chunks
+CHUNK_SIZE = 1 << 20
+
+
+async def aiter_lines(content: str = "", file_path: Optional[Union[str, Path]] = None) -> AsyncIterator[str]:
+    """
+    Yields lines (with line endings) from a string or file, reading the file in CHUNK_SIZE blocks.
+
+    Lines end only at ``"\n"``: ``str.splitlines`` would also split on characters such as
+    U+2028 that JSON encoders leave unescaped inside strings.
+    """
+    if not file_path:
+        lines, tail = _split_lines(content)
+        for line in lines:
+            yield line
+        if tail:
+            yield tail
+        return
+    async with aiofiles.open(file_path, 'r') as f:
+        tail = ""
+        while chunk := await f.read(CHUNK_SIZE):
+            lines, tail = _split_lines(tail + chunk)
+            for line in lines:
+                yield line
+        if tail:
+            yield tail
+
+
+def _split_lines(text: str) -> tuple[list[str], str]:
+    """Split ``text`` into complete ``"\n"``-terminated lines and the unterminated rest."""
+    lines = text.split("\n")
+    tail = lines.pop()
+    return [line + "\n" for line in lines], tail
+
+
+def is_document_start(line: str) -> bool:
+    return line.startswith("---") and (len(line) == 3 or line[3] in " \t\r\n")
+
 
 class ToFromMixin(ABC):
     """
@@ -63,7 +104,7 @@ class ToFromMixin(ABC):
         if not content:
             raise ValueError("Either content or file_path must be provided")
         try:
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=YAML_LOADER)
             return await cls.from_dict(data)
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing YAML content: {e}")
@@ -104,12 +145,135 @@ class ToFromMixin(ABC):
         except Exception as e:
             raise ValueError(f"Error parsing TOML content: {e}")
 
+    @classmethod
+    async def iter_from_jsonl(
+            cls: type[T], content: str = "", file_path: Optional[Union[str, Path]] = None
+    ) -> AsyncIterator[T]:
+        """
+        Asynchronously yields one instance per line of JSON Lines content from a string or file path.
+        """
+        if not (content or file_path):
+            raise ValueError("Either content or file_path must be provided")
+        line_number = 0
+        async for line in aiter_lines(content, file_path):
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Error parsing JSON on line {line_number}: {e}")
+            yield await cls.from_dict(data)
+
+    @classmethod
+    async def iter_from_yaml_documents(
+            cls: type[T], content: str = "", file_path: Optional[Union[str, Path]] = None
+    ) -> AsyncIterator[T]:
+        """
+        Asynchronously yields one instance per document of multi-document YAML from a string or
+        file path. Documents are split on ``---``/``...`` marker lines and parsed one at a time.
+        """
+        if not (content or file_path):
+            raise ValueError("Either content or file_path must be provided")
+        document: list[str] = []
+        async for line in aiter_lines(content, file_path):
+            if is_document_start(line) or line.rstrip() == "...":
+                async for instance in cls._from_yaml_document(document):
+                    yield instance
+                document = [line] if is_document_start(line) else []
+            else:
+                document.append(line)
+        async for instance in cls._from_yaml_document(document):
+            yield instance
+
+    @classmethod
+    async def _from_yaml_document(cls: type[T], lines: list[str]) -> AsyncIterator[T]:
+        try:
+            data = yaml.load("".join(lines), Loader=YAML_LOADER) if lines else None
+        except yaml.YAMLError as e:
+            raise ValueError(f"Error parsing YAML content: {e}")
+        if data is not None:
+            yield await cls.from_dict(data)
+
+    @classmethod
+    async def iter_from_json_array(
+            cls: type[T], file_path: Union[str, Path], prefix: str = "item"
+    ) -> AsyncIterator[T]:
+        """
+        Asynchronously yields one instance per element of a large JSON array file, parsed
+        incrementally with ijson. ``prefix`` selects a nested array, e.g. ``"spans.item"``.
+        """
+        import ijson
+
+        async with aiofiles.open(file_path, 'rb') as f:
+            try:
+                async for data in ijson.items(f, prefix, use_float=True, buf_size=CHUNK_SIZE):
+                    yield await cls.from_dict(data)
+            except ijson.JSONError as e:
+                raise ValueError(f"Error parsing JSON content: {e}")
+
+    @classmethod
+    def iter_from_file(cls: type[T], file_path: Union[str, Path], format: Optional[str] = None) -> AsyncIterator[T]:
+        """
+        Asynchronously yields instances from a JSONL, multi-document YAML or JSON array file,
+        choosing the reader from ``format`` or the file suffix.
+        """
+        readers = {
+            "jsonl": cls.iter_from_jsonl,
+            "yaml": cls.iter_from_yaml_documents,
+            "json": cls.iter_from_json_array,
+        }
+        return readers[stream_format(file_path, format)](file_path=file_path)
+
+    @classmethod
+    async def write_many(
+            cls,
+            instances: Union[Iterable[T], AsyncIterable[T]],
+            file_path: Union[str, Path],
+            format: Optional[str] = None,
+    ) -> int:
+        """
+        Writes instances as JSON Lines, multi-document YAML or a JSON array, buffering up to
+        CHUNK_SIZE characters between writes. Returns the number of instances written.
+        """
+        format = stream_format(file_path, format)
+        count = 0
+        buffer: list[str] = ["["] if format == "json" else []
+        buffered = 0
+
+        async def items():
+            if hasattr(instances, "__aiter__"):
+                async for instance in instances:
+                    yield instance
+            else:
+                for instance in instances:
+                    yield instance
+
+        async with aiofiles.open(file_path, 'w') as f:
+            async for instance in items():
+                if format == "jsonl":
+                    text = instance.model_dump_json() + "\n"
+                elif format == "yaml":
+                    text = dump_yaml_document(instance.model_dump())
+                else:
+                    text = ("," if count else "") + "\n" + instance.model_dump_json()
+                buffer.append(text)
+                buffered += len(text)
+                count += 1
+                if buffered >= CHUNK_SIZE:
+                    await f.write("".join(buffer))
+                    buffer, buffered = [], 0
+            if format == "json":
+                buffer.append("\n]\n")
+            await f.write("".join(buffer))
+        return count
+
     async def to_yaml(self, file_path: Optional[Union[str, Path]] = None) -> str:
         """
         Serializes the model instance into a YAML string. Optionally, writes to a file if file_path is provided.
         """
         try:
-            yaml_content = yaml.dump(self.model_dump(), default_flow_style=False, width=1000)
+            yaml_content = get_serializer("yaml").dump_model(self).decode()
             if file_path:
                 async with aiofiles.open(file_path, 'w') as f:
                     await f.write(yaml_content)
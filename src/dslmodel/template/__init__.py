@@ -1 +1,2 @@
 from .functional import render, render_native
+from .cache import TemplateCache, clear_template_cache, get_environment, set_template_cache_size, template_cache_info
@@ -0,0 +1,127 @@
+"""
+Process-wide Jinja environment pool and compiled-template cache.
+
+Building a ``CustomEnvironment`` registers every extension (``FakerExtension`` alone
+installs hundreds of globals) and ``from_string`` recompiles the template source each
+time. Environments are therefore pooled per (flavour, loader path) and compiled
+``Template`` objects are kept in an LRU cache keyed by a hash of their source.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from os import PathLike, fspath
+from typing import NamedTuple
+
+from jinja2 import Environment, FileSystemLoader, Template
+
+from dslmodel.template.environments import CustomEnvironment, CustomNativeEnvironment
+
+DEFAULT_TEMPLATE_CACHE_SIZE = 1024
+
+ENVIRONMENT_FLAVOURS: dict[str, type[Environment]] = {
+    "text": CustomEnvironment,
+    "native": CustomNativeEnvironment,
+}
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class TemplateCache:
+    """Thread-safe LRU cache of compiled templates with hit/miss counters."""
+
+    def __init__(self, maxsize: int = DEFAULT_TEMPLATE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates: OrderedDict[tuple[str, str, str], Template] = OrderedDict()
+        self._environments: dict[tuple[str, str], Environment] = {}
+        self._lock = threading.Lock()
+
+    def get_environment(self, flavour: str = "text", fs_loader_path: str | PathLike[str] = ".") -> Environment:
+        """Return the shared environment for ``flavour`` and ``fs_loader_path``, creating it once."""
+        key = (flavour, fspath(fs_loader_path))
+        environment = self._environments.get(key)
+        if environment is None:
+            with self._lock:
+                environment = self._environments.get(key)
+                if environment is None:
+                    environment_cls = ENVIRONMENT_FLAVOURS[flavour]
+                    environment = environment_cls(loader=FileSystemLoader(key[1]))
+                    self._environments[key] = environment
+        return environment
+
+    def get_template(self, source: str, flavour: str = "text", fs_loader_path: str | PathLike[str] = ".") -> Template:
+        """Return the compiled template for ``source``, compiling it on a cache miss."""
+        environment = self.get_environment(flavour, fs_loader_path)
+        if self.maxsize <= 0:
+            self.misses += 1
+            return environment.from_string(source)
+
+        digest = hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+        key = (flavour, fspath(fs_loader_path), digest)
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return template
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent miss on the same source only wastes a compile.
+        template = environment.from_string(source)
+
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+        return template
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum number of cached templates, evicting the oldest entries if needed."""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._templates) > max(maxsize, 0):
+                self._templates.popitem(last=False)
+
+    def clear(self, environments: bool = False) -> None:
+        """Drop all cached templates and reset the counters; optionally drop pooled environments too."""
+        with self._lock:
+            self._templates.clear()
+            self.hits = 0
+            self.misses = 0
+            if environments:
+                self._environments.clear()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._templates))
+
+
+template_cache = TemplateCache()
+
+
+def get_environment(flavour: str = "text", fs_loader_path: str | PathLike[str] = ".") -> Environment:
+    """Return the pooled environment for the given flavour ("text" or "native") and loader path."""
+    return template_cache.get_environment(flavour, fs_loader_path)
+
+
+def template_cache_info() -> CacheInfo:
+    """Return hit/miss statistics for the process-wide template cache."""
+    return template_cache.info()
+
+
+def set_template_cache_size(maxsize: int) -> None:
+    """Set the size of the process-wide template cache. A size of 0 disables caching."""
+    template_cache.resize(maxsize)
+
+
+def clear_template_cache(environments: bool = False) -> None:
+    """Clear the process-wide template cache."""
+    template_cache.clear(environments)
@@ -2,9 +2,7 @@ from os import path, PathLike, makedirs
 from pathlib import Path
 from typing import Any
 
-from jinja2 import FileSystemLoader
-
-from dslmodel.template.environments import CustomEnvironment, CustomNativeEnvironment
+from dslmodel.template.cache import template_cache
 
 
 def render(tmpl_str_or_path: str | PathLike[str],
@@ -12,10 +10,6 @@ def render(tmpl_str_or_path: str | PathLike[str],
            fs_loader_path: str | PathLike[str] = ".",
            **kwargs) -> str:
     """Render a template from a string or a file with the given keyword arguments."""
-    file_loader = FileSystemLoader(fs_loader_path)
-
-    environment = CustomEnvironment(loader=file_loader)
-
     # Check if tmpl_str_or_path is a path to a file
     if path.exists(tmpl_str_or_path) and Path(tmpl_str_or_path).is_file():
         with open(tmpl_str_or_path) as file:
@@ -23,12 +17,12 @@ def render(tmpl_str_or_path: str | PathLike[str],
     else:
         template_content = str(tmpl_str_or_path)
 
-    template = environment.from_string(template_content)
+    template = template_cache.get_template(template_content, "text", fs_loader_path)
 
     rendered = template.render(**kwargs)
 
     if to:
-        to_ = environment.from_string(str(to))
+        to_ = template_cache.get_template(str(to), "text", fs_loader_path)
         rendered_to = to_.render(**kwargs)
 
         # Check if a directory needs to be created. First check if there is a directory in the path
@@ -53,9 +47,6 @@ def render_native(tmpl_str_or_path: str | Path, to: str = "", **kwargs) -> Any:
     :param kwargs: Additional keyword arguments to pass into the template.
     :return: The rendered template as a native Python type (str, int, list, dict, etc.).
     """
-    file_loader = FileSystemLoader(".")
-    environment = CustomNativeEnvironment(loader=file_loader)
-
     # Check if tmpl_str_or_path is a file path
     if path.exists(tmpl_str_or_path) and Path(tmpl_str_or_path).is_file():
         with open(tmpl_str_or_path) as file:
@@ -64,12 +55,12 @@ def render_native(tmpl_str_or_path: str | Path, to: str = "", **kwargs) -> Any:
         template_content = str(tmpl_str_or_path)
 
     # Render the template content as a native Python type
-    template = environment.from_string(template_content)
+    template = template_cache.get_template(template_content, "native")
     rendered = template.render(**kwargs)
 
     # If 'to' is specified, write the rendered output to a file
     if to:
-        to_path = environment.from_string(to).render(**kwargs)
+        to_path = template_cache.get_template(to, "native").render(**kwargs)
 
         # Ensure directories exist for the output path
         output_dir = path.dirname(to_path)
@@ -0,0 +1,320 @@
+"""
+Asyncio batch engine for generating many DSLModel instances from prompts.
+
+Jobs are ``(model_class, prompt)`` pairs pulled lazily from any iterable or async iterable,
+so unbounded job streams are fine. Each job runs ``model_class.from_prompt`` in a worker
+thread under per-provider concurrency and requests/tokens-per-minute limits, transient
+failures are retried with exponential backoff, and results are yielded as they complete
+with their original index and latency::
+
+    engine = BatchEngine(max_concurrency=8, requests_per_minute=300)
+    async for result in engine.stream((Person, f"Person #{i}") for i in range(10_000)):
+        if result.ok:
+            ...
+
+Rate-limit waits and retry backoff happen in the worker thread that holds the job's provider
+slot, so the event loop never blocks. ``run_dsls`` and ``run_dsl_matrix`` in
+`dslmodel.utils.model_tools` are thin wrappers over the synchronous `BatchEngine.run`.
+"""
+import asyncio
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+
+from loguru import logger
+
+# Exception class names (from litellm, httpx, openai, ...) treated as transient without importing them
+TRANSIENT_ERROR_NAMES = (
+    "RateLimitError",
+    "Timeout",
+    "TimeoutError",
+    "APIConnectionError",
+    "ServiceUnavailableError",
+    "InternalServerError",
+    "ConnectError",
+    "ReadTimeout",
+)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Return True for errors worth retrying (rate limits, timeouts, dropped connections)."""
+    if isinstance(error, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+        return True
+    return any(name in cls.__name__ for cls in type(error).__mro__ for name in TRANSIENT_ERROR_NAMES)
+
+
+def estimate_tokens(prompt: Any) -> int:
+    """Rough token estimate (4 characters per token) used for tokens-per-minute limits."""
+    return max(1, len(str(prompt)) // 4)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket refilled continuously at ``per_minute`` units per minute.
+
+    Callers reserve units up front and sleep off any deficit outside the lock, so waiters
+    are served in arrival order.
+    """
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.capacity = float(per_minute)
+        self.available = float(per_minute)
+        self._refill_per_second = per_minute / 60.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Take ``amount`` units, blocking until they are available. Returns the time spent waiting."""
+        with self._lock:
+            now = time.monotonic()
+            self.available = min(self.capacity, self.available + (now - self._updated) * self._refill_per_second)
+            self._updated = now
+            self.available -= min(amount, self.capacity)
+            wait = -self.available / self._refill_per_second if self.available < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+@dataclass
+class ProviderLimits:
+    """Limits applied to all jobs routed to one LM provider."""
+
+    max_concurrency: int = 5
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+
+
+@dataclass
+class BatchJob:
+    index: int
+    model_class: type
+    prompt: Any
+    provider: str = "default"
+
+
+@dataclass
+class BatchResult:
+    index: int
+    model_class: type
+    prompt: Any
+    instance: Any = None
+    error: BaseException | None = None
+    attempts: int = 0
+    latency_s: float = 0.0
+    queued_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def default_provider() -> str:
+    """Provider prefix of the configured DSPy LM (``groq/llama...`` -> ``groq``)."""
+    import dspy
+
+    lm = dspy.settings.lm
+    model = str(getattr(lm, "model", "") or "")
+    return model.split("/", 1)[0] if "/" in model else (model or "default")
+
+
+@dataclass
+class BatchEngine:
+    """
+    Bounded-concurrency batch generation with rate limits, retries and streaming results.
+
+    :param max_concurrency: Default concurrency for providers without explicit limits.
+    :param requests_per_minute: Default requests-per-minute limit (None for unlimited).
+    :param tokens_per_minute: Default prompt-tokens-per-minute limit (None for unlimited).
+    :param provider_limits: Per-provider overrides, keyed by provider name (e.g. ``"groq"``).
+    :param max_retries: Retries per job for transient errors.
+    :param backoff_base: First retry delay in seconds; doubles on each attempt, with jitter.
+    :param backoff_max: Upper bound for a single retry delay.
+    :param retry_on: Predicate deciding whether an error is transient.
+    """
+
+    max_concurrency: int = 5
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+    provider_limits: dict[str, ProviderLimits] = field(default_factory=dict)
+    max_retries: int = 3
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    retry_on: Callable[[BaseException], bool] = is_transient_error
+    _rate_limiters: dict[tuple[str, str], RateLimiter] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def limits_for(self, provider: str) -> ProviderLimits:
+        return self.provider_limits.get(provider) or ProviderLimits(
+            self.max_concurrency, self.requests_per_minute, self.tokens_per_minute
+        )
+
+    def _limiter(self, provider: str, kind: str, per_minute: float | None) -> RateLimiter | None:
+        if per_minute is None:
+            return None
+        key = (provider, kind)
+        with self._lock:
+            if key not in self._rate_limiters:
+                self._rate_limiters[key] = RateLimiter(per_minute)
+            return self._rate_limiters[key]
+
+    @property
+    def max_in_flight(self) -> int:
+        # Enough worker threads for every provider to use its full concurrency at once
+        return self.max_concurrency + sum(limits.max_concurrency for limits in self.provider_limits.values())
+
+    def execute(self, job: BatchJob, **kwargs) -> BatchResult:
+        """
+        Run one job to completion in the calling (worker) thread: rate limiting, ``from_prompt``
+        and retries with exponential backoff. Errors are captured in the result, never raised.
+        """
+        limits = self.limits_for(job.provider)
+        requests = self._limiter(job.provider, "requests", limits.requests_per_minute)
+        tokens = self._limiter(job.provider, "tokens", limits.tokens_per_minute)
+        result = BatchResult(job.index, job.model_class, job.prompt)
+
+        while True:
+            result.attempts += 1
+            if requests is not None:
+                result.queued_s += requests.acquire()
+            if tokens is not None:
+                result.queued_s += tokens.acquire(estimate_tokens(job.prompt))
+            start = time.perf_counter()
+            try:
+                result.instance = job.model_class.from_prompt(job.prompt, **kwargs)
+                result.error = None
+            except Exception as e:
+                result.error = e
+            finally:
+                result.latency_s += time.perf_counter() - start
+
+            if result.error is None or result.attempts > self.max_retries or not self.retry_on(result.error):
+                break
+            delay = min(self.backoff_max, self.backoff_base * 2 ** (result.attempts - 1))
+            delay *= random.uniform(0.5, 1.0)
+            logger.warning(f"Task {job.index} attempt {result.attempts} failed ({result.error}); retrying in {delay:.2f}s")
+            result.queued_s += delay
+            time.sleep(delay)
+
+        if result.error is not None:
+            logger.error(f"Task {job.index} failed after {result.attempts} attempt(s): {result.error}")
+        return result
+
+    async def _execute_async(
+        self, job: BatchJob, semaphore: asyncio.Semaphore, executor: ThreadPoolExecutor, **kwargs
+    ) -> BatchResult:
+        async with semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, lambda: self.execute(job, **kwargs)
+            )
+
+    async def stream(
+        self, jobs: Iterable[tuple[type, Any]] | AsyncIterable[tuple[type, Any]], **kwargs
+    ) -> AsyncIterator[BatchResult]:
+        """
+        Run ``(model_class, prompt)`` jobs and yield a `BatchResult` for each as soon as it completes.
+
+        Jobs are pulled from ``jobs`` only as capacity frees up, so the iterable may be unbounded.
+        Extra keyword arguments are passed to ``from_prompt``.
+        """
+        provider = _prepare_lm()
+        source = _aiter_jobs(jobs, provider) if hasattr(jobs, "__aiter__") else _iter_jobs(jobs, provider)
+        semaphores: dict[str, asyncio.Semaphore] = {}
+        completed: asyncio.Queue[asyncio.Task] = asyncio.Queue()
+        pending: set[asyncio.Task] = set()
+        exhausted = False
+
+        executor = ThreadPoolExecutor(max_workers=self.max_in_flight)
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_in_flight:
+                    try:
+                        job = await anext(source) if hasattr(source, "__anext__") else next(source)
+                    except (StopIteration, StopAsyncIteration):
+                        exhausted = True
+                        break
+                    if job.provider not in semaphores:
+                        semaphores[job.provider] = asyncio.Semaphore(self.limits_for(job.provider).max_concurrency)
+                    task = asyncio.create_task(self._execute_async(job, semaphores[job.provider], executor, **kwargs))
+                    task.add_done_callback(completed.put_nowait)
+                    pending.add(task)
+
+                if not pending:
+                    return
+                task = await completed.get()
+                pending.discard(task)
+                yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            # Never wait on the loop thread for from_prompt calls that are already running
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def gather(self, jobs: Iterable[tuple[type, Any]] | AsyncIterable[tuple[type, Any]], **kwargs) -> list[BatchResult]:
+        """Run all jobs and return their results in input order."""
+        results = [result async for result in self.stream(jobs, **kwargs)]
+        results.sort(key=lambda result: result.index)
+        return results
+
+    def iter_completed(self, jobs: Iterable[tuple[type, Any]], **kwargs) -> Iterator[BatchResult]:
+        """Synchronous `stream` for callers without an event loop."""
+        provider = _prepare_lm()
+        source = _iter_jobs(jobs, provider)
+        semaphores: dict[str, threading.BoundedSemaphore] = {}
+        pending: set[Future] = set()
+
+        def execute(job: BatchJob) -> BatchResult:
+            with semaphores[job.provider]:
+                return self.execute(job, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            try:
+                for job in source:
+                    if job.provider not in semaphores:
+                        semaphores[job.provider] = threading.BoundedSemaphore(self.limits_for(job.provider).max_concurrency)
+                    pending.add(executor.submit(execute, job))
+                    if len(pending) >= self.max_in_flight:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        yield from (future.result() for future in done)
+                for future in as_completed(pending):
+                    yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def run(self, jobs: Iterable[tuple[type, Any]], **kwargs) -> list[BatchResult]:
+        """Run all jobs without an event loop and return their results in input order."""
+        results = list(self.iter_completed(jobs, **kwargs))
+        results.sort(key=lambda result: result.index)
+        return results
+
+
+def _prepare_lm() -> str:
+    from dslmodel.utils.dspy_tools import ensure_lm
+
+    # Configure the LM on the calling thread; DSPy settings may only be changed by the thread that owns them
+    ensure_lm()
+    return default_provider()
+
+
+def _iter_jobs(jobs: Iterable, provider: str) -> Iterator[BatchJob]:
+    for index, job in enumerate(jobs):
+        yield _to_job(index, job, provider)
+
+
+async def _aiter_jobs(jobs: AsyncIterable, provider: str) -> AsyncIterator[BatchJob]:
+    counter = itertools.count()
+    async for job in jobs:
+        yield _to_job(next(counter), job, provider)
+
+
+def _to_job(index: int, job, provider: str) -> BatchJob:
+    if isinstance(job, BatchJob):
+        return job
+    model_class, prompt, *rest = job
+    return BatchJob(index, model_class, prompt, rest[0] if rest else provider)
@@ -1,6 +1,11 @@
 import os
 from importlib import import_module
 from pathlib import Path
+from typing import NamedTuple
+
+import click
+import typer
+from typer.core import TyperGroup
 
 
 def source_dir(path):
@@ -23,3 +28,59 @@ def load_commands(app, cmd_dir):
         module = import_module(module_name)
         if hasattr(module, "app"):
             app.add_typer(module.app, name=filepath.stem[:-4], help=module.__doc__)
+
+
+class LazySubApp(NamedTuple):
+    """Registry entry describing a Typer sub-app that is imported only when invoked."""
+
+    name: str
+    module: str
+    help: str = ""
+    attr: str = "app"
+
+
+class LazySubAppGroup(click.Group):
+    """
+    Placeholder for a lazily imported Typer sub-app.
+
+    Help listings of the parent only read ``name`` and ``help``, which come from the registry
+    entry, so the sub-app module is imported the first time the command is actually resolved.
+    """
+
+    def __init__(self, spec: LazySubApp):
+        super().__init__(name=spec.name, help=spec.help)
+        self.spec = spec
+        self._group: click.Group | None = None
+
+    def load(self) -> click.Group:
+        if self._group is None:
+            try:
+                module = import_module(self.spec.module)
+            except ImportError as e:
+                raise click.UsageError(f"Command '{self.spec.name}' is unavailable: {e}") from e
+            group = typer.main.get_group(getattr(module, self.spec.attr))
+            group.name = self.spec.name
+            group.help = self.spec.help or group.help
+            self._group = group
+        return self._group
+
+    def make_context(self, info_name, args, parent=None, **extra) -> click.Context:
+        return self.load().make_context(info_name, args, parent=parent, **extra)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return self.load().list_commands(ctx)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        return self.load().get_command(ctx, cmd_name)
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that registers ``lazy_subapps`` as placeholders instead of importing them."""
+
+    lazy_subapps: tuple[LazySubApp, ...] = ()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for spec in self.lazy_subapps:
+            self.add_command(LazySubAppGroup(spec), spec.name)
+
@@ -1,7 +1,10 @@
 import dspy
 import os
+import threading
 from typing import Optional
 
+_lm_lock = threading.Lock()
+
 
 def init_lm(
         model: Optional[str] = None,
@@ -141,6 +144,25 @@ def init_text(model_type="chat", max_tokens=8000, **kwargs):
         max_tokens=max_tokens, **kwargs
     )
 
+def ensure_lm(**kwargs) -> dspy.LM:
+    """
+    Return the LM configured in DSPy settings, initialising the default one on first use.
+
+    Importing dslmodel no longer configures an LM; prompt-driven entry points such as
+    ``from_prompt``, ``from_signature`` and ``run_dsls`` call this instead, so an LM
+    configured explicitly beforehand (e.g. via ``init_lm``) is always respected.
+
+    :param kwargs: Keyword arguments passed to `init_text` if no LM is configured yet.
+    :return: The configured LM object.
+    :rtype: dspy.LM
+    """
+    if dspy.settings.lm is None:
+        with _lm_lock:
+            if dspy.settings.lm is None:
+                init_text(**kwargs)
+    return dspy.settings.lm
+
+
 # Presets for different use cases
 
 # def init_o1(**kwargs):
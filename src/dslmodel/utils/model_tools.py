@@ -11,37 +11,24 @@ from dslmodel.utils.dspy_tools import init_instant, init_text
 def run_dsls(tasks: list[tuple[type(DSLModel), str]], max_workers=5) -> list[DSLModel]:
     """
     Execute a list of (DSLModel subclass, prompt) tuples concurrently and return the results in the same order.
+
+    Failed tasks are logged and returned as None. Use `dslmodel.utils.batch_engine.BatchEngine` directly
+    for rate limits, retries, streaming results and per-task errors and latencies.
     """
+    from dslmodel.utils.batch_engine import BatchEngine
+
     logger = logging.getLogger(__name__)
     if not logger.handlers:
         logging.basicConfig(level=logging.INFO)
 
-    def run_task(index: int, model_class: type(DSLModel), prompt: str) -> tuple[int, DSLModel]:
-        """Generate model instance from prompt, return result along with task index."""
-        logger.debug(f"Starting task {index} with prompt: {prompt}")
-        try:
-            model_instance = model_class.from_prompt(prompt)
-            logger.debug(f"Task {index} completed successfully.")
-            return index, model_instance
-        except Exception as e:
-            logger.error(f"Task {index} failed with error: {e}")
-            raise
-
-    # Use a ThreadPoolExecutor to run tasks concurrently
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(run_task, i, model_class, prompt): i
-            for i, (model_class, prompt) in enumerate(tasks)
-        }
-
-        results: list[DSLModel | None] = [None] * len(tasks)
-
-        for future in as_completed(futures):
-            try:
-                index, result = future.result()
-                results[index] = result
-            except Exception as e:
-                logger.error(f"Error in task {futures[future]}: {e}")
+    results: list[DSLModel | None] = []
+    for result in BatchEngine(max_concurrency=max_workers, max_retries=0).run(tasks):
+        if result.ok:
+            logger.debug(f"Task {result.index} completed successfully in {result.latency_s:.3f}s.")
+            results.append(result.instance)
+        else:
+            logger.error(f"Task {result.index} failed with error: {result.error}")
+            results.append(None)
 
     return results
 
@@ -136,35 +123,21 @@ def run_dsl_matrix(
         List[Tuple[str, str, DSLModel]]: A list of tuples containing (x_prompt, y_prompt, model_instance).
     """
 
-    # Prepare a list to collect results
-    results = []
-
-    # Define the task function to generate a model instance
-    def task(x_prompt: str, y_prompt: str) -> Tuple[str, str, DSLModel]:
-        prompt = f"{x_prompt} {y_prompt}"
-        try:
-            # Instantiate the model based on the combined prompt
-            model_instance = model_class.from_prompt(prompt)
-            logger.info(f"Generated model for: {prompt}")
-            return (x_prompt, y_prompt, model_instance)
-        except Exception as e:
-            logger.error(f"Error generating model for prompt '{prompt}': {e}")
-            raise
+    from dslmodel.utils.batch_engine import BatchEngine
 
     # Generate all combinations of x_prompts and y_prompts
     prompt_combinations = [(x, y) for x in x_prompts for y in y_prompts]
+    tasks = [(model_class, f"{x_prompt} {y_prompt}") for x_prompt, y_prompt in prompt_combinations]
 
     # Execute tasks concurrently
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_prompt = {executor.submit(task, x, y): (x, y) for x, y in prompt_combinations}
-
-        for future in as_completed(future_to_prompt):
-            x_prompt, y_prompt = future_to_prompt[future]
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed task for prompts ({x_prompt}, {y_prompt}): {e}")
+    results = []
+    for result in BatchEngine(max_concurrency=max_workers, max_retries=0).run(tasks):
+        x_prompt, y_prompt = prompt_combinations[result.index]
+        if result.ok:
+            logger.info(f"Generated model for: {result.prompt}")
+            results.append((x_prompt, y_prompt, result.instance))
+        else:
+            logger.error(f"Failed task for prompts ({x_prompt}, {y_prompt}): {result.error}")
 
     return results
 
@@ -0,0 +1,177 @@
+"""
+Persistent, content-addressed cache of prompt-to-model generations.
+
+Entries are keyed by (model class fingerprint, rendered prompt, LM identity, temperature) and
+store the validated ``model_dump`` of the generated instance in a local SQLite database, so a
+hit skips the LLM call and the validation/correction loop. The class fingerprint is a hash of
+the collected model sources, which means editing a model (or any model it references)
+invalidates its entries.
+
+The cache is opt-in::
+
+    from dslmodel.utils.response_cache import enable_response_cache
+
+    enable_response_cache(ttl_seconds=7 * 24 * 3600, max_entries=50_000)
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+from dslmodel.utils.file_tools import data_dir
+
+DEFAULT_CACHE_PATH = data_dir("response_cache.sqlite3")
+
+
+class ResponseCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def model_fingerprint(model: type[BaseModel]) -> str:
+    """Hash of the model's qualified name and the sources of every class it references."""
+    from dslmodel.dspy_modules.gen_pydantic_instance import get_generation_context
+
+    sources = get_generation_context(model).model_sources
+    payload = f"{model.__module__}.{model.__qualname__}\n{sources}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def lm_identity(lm: Any) -> tuple[str, Any]:
+    """Return (model name, temperature) for a DSPy LM, tolerating LMs without those attributes."""
+    if lm is None:
+        return "", None
+    kwargs = getattr(lm, "kwargs", None) or {}
+    return str(getattr(lm, "model", type(lm).__name__)), kwargs.get("temperature")
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL and LRU size-based eviction."""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        ttl_seconds: float | None = None,
+        max_entries: int = 10_000,
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " model TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    @staticmethod
+    def make_key(model: type[BaseModel], prompt: Any, lm: Any = None) -> str:
+        """Content address for generating ``model`` from ``prompt`` with ``lm``."""
+        lm_name, temperature = lm_identity(lm)
+        payload = json.dumps(
+            [model_fingerprint(model), str(prompt), lm_name, temperature], default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached model dump for ``key``, or None on a miss or an expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self.ttl_seconds is not None and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, instance: BaseModel) -> None:
+        """Store the dump of a validated ``instance`` under ``key``, evicting old entries if needed."""
+        value = instance.model_dump_json()
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, value, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, type(instance).__qualname__, value, now, now),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        if self.ttl_seconds is not None:
+            self._conn.execute("DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN"
+                " (SELECT key FROM responses ORDER BY accessed_at ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+            return ResponseCacheStats(self.hits, self.misses, count)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_response_cache: ResponseCache | None = None
+
+
+def enable_response_cache(
+    path: str | Path = DEFAULT_CACHE_PATH,
+    ttl_seconds: float | None = None,
+    max_entries: int = 10_000,
+) -> ResponseCache:
+    """Enable the process-wide response cache used by `from_prompt`, `from_template` and `from_signature`."""
+    global _response_cache
+    disable_response_cache()
+    _response_cache = ResponseCache(path, ttl_seconds=ttl_seconds, max_entries=max_entries)
+    return _response_cache
+
+
+def disable_response_cache() -> None:
+    global _response_cache
+    if _response_cache is not None:
+        _response_cache.close()
+    _response_cache = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Return the enabled response cache, or None if caching is off."""
+    return _response_cache
@@ -0,0 +1,267 @@
+"""
+Pluggable serializer registry used by `ToFromDSLMixin` and `FileHandlerDSLMixin`.
+
+Built-in formats:
+
+- ``yaml``: LibYAML C dumper/loader when available (same output as the pure-Python dumper,
+  except that enum members are written as their values).
+- ``json``: orjson when installed, otherwise pydantic's JSON serializer.
+- ``toml``: ``toml`` for writing, the stdlib ``tomllib`` for reading.
+- ``msgpack`` and ``cbor``: compact binary formats, available when ``msgpack`` / ``cbor2``
+  are installed (``pip install dslmodel[fast]``).
+
+Formats are chosen per call (``model.save(file_format="msgpack")``), per model class
+(``default_file_format: ClassVar[str] = "msgpack"``), or detected on load from the file
+extension and, failing that, the payload's leading bytes. Additional formats can be added
+with `register_serializer`.
+"""
+import importlib.util
+import json
+import re
+import threading
+import tomllib
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+from uuid import UUID
+
+import yaml
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+
+class YAMLDumper(getattr(yaml, "CDumper", yaml.Dumper)):
+    """LibYAML-backed dumper that writes enum members as their values so safe loaders can read them back."""
+
+
+YAMLDumper.add_multi_representer(Enum, lambda dumper, value: dumper.represent_data(value.value))
+
+CBOR_MAGIC = b"\xd9\xd9\xf7"  # CBOR self-describe tag 55799
+_TOML_LINE = re.compile(rb"^(\[\[?[^\]\n]+\]\]?|[A-Za-z0-9_.\"'-]+\s*=)")
+
+
+class Serializer(ABC):
+    """
+    Converts pydantic models to bytes and back for one format.
+
+    Subclasses implement ``dumps``/``loads`` for plain data and may override ``dump_model``
+    and ``load_model`` to use a faster model-aware path, and ``sniff`` to recognise payloads.
+    """
+
+    name: str = ""
+    extensions: tuple[str, ...] = ()
+    binary: bool = False
+    requires: str | None = None
+    # model_dump mode fed to dumps: "python" keeps bytes/datetimes native, "json" makes them strings
+    dump_mode: str = "python"
+
+    def available(self) -> bool:
+        return self.requires is None or importlib.util.find_spec(self.requires) is not None
+
+    @abstractmethod
+    def dumps(self, data: Any) -> bytes:
+        ...
+
+    @abstractmethod
+    def loads(self, payload: bytes) -> Any:
+        ...
+
+    def dump_model(self, model) -> bytes:
+        return self.dumps(model.model_dump(mode=self.dump_mode))
+
+    def load_model(self, cls, payload: bytes):
+        return cls.model_validate(self.loads(payload))
+
+    def sniff(self, head: bytes) -> bool:
+        """Return True if ``head`` (the first bytes of a payload) looks like this format."""
+        return False
+
+
+class YAMLSerializer(Serializer):
+    name = "yaml"
+    extensions = (".yaml", ".yml")
+
+    def dumps(self, data: Any) -> bytes:
+        return yaml.dump(data, Dumper=YAMLDumper, default_flow_style=False, width=1000).encode()
+
+    def loads(self, payload: bytes) -> Any:
+        return yaml.load(payload, Loader=YAML_LOADER)
+
+    def sniff(self, head: bytes) -> bool:
+        # Fallback for text payloads
+        return True
+
+
+class JSONSerializer(Serializer):
+    name = "json"
+    extensions = (".json",)
+    dump_mode = "json"
+
+    def __init__(self, pretty: bool = True):
+        self.pretty = pretty
+
+    def dumps(self, data: Any) -> bytes:
+        try:
+            import orjson
+        except ImportError:
+            return json.dumps(data, indent=2 if self.pretty else None, default=str).encode()
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if self.pretty else 0, default=str)
+
+    def loads(self, payload: bytes) -> Any:
+        try:
+            import orjson
+        except ImportError:
+            return json.loads(payload)
+        return orjson.loads(payload)
+
+    def sniff(self, head: bytes) -> bool:
+        return head.lstrip(b"\xef\xbb\xbf \t\r\n")[:1] in (b"{", b"[")
+
+
+class TOMLSerializer(Serializer):
+    name = "toml"
+    extensions = (".toml",)
+
+    def dumps(self, data: Any) -> bytes:
+        import toml
+
+        return toml.dumps(_plain_tree(data, (Enum,))).encode()
+
+    def loads(self, payload: bytes) -> Any:
+        return tomllib.loads(payload.decode())
+
+    def sniff(self, head: bytes) -> bool:
+        for line in head.splitlines():
+            line = line.strip()
+            if line and not line.startswith(b"#"):
+                return bool(_TOML_LINE.match(line))
+        return False
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert values binary formats cannot encode natively (datetimes, enums, ...)."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    if isinstance(value, (Decimal, UUID, PurePath)):
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+class MsgpackSerializer(Serializer):
+    name = "msgpack"
+    extensions = (".msgpack", ".mpk")
+    binary = True
+    requires = "msgpack"
+
+    def dumps(self, data: Any) -> bytes:
+        import msgpack
+
+        return msgpack.packb(data, default=_to_plain, use_bin_type=True)
+
+    def loads(self, payload: bytes) -> Any:
+        import msgpack
+
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+    def sniff(self, head: bytes) -> bool:
+        # A model dumps to a map: fixmap, map16 or map32
+        return bool(head) and (0x80 <= head[0] <= 0x8F or head[0] in (0xDE, 0xDF))
+
+
+class CBORSerializer(Serializer):
+    name = "cbor"
+    extensions = (".cbor",)
+    # cbor2 encodes datetimes itself but rejects naive ones, so those are converted ahead of encoding
+    binary = True
+    requires = "cbor2"
+
+    def dumps(self, data: Any) -> bytes:
+        import cbor2
+
+        return CBOR_MAGIC + cbor2.dumps(_plain_tree(data, PLAIN_TYPES))
+
+    def loads(self, payload: bytes) -> Any:
+        import cbor2
+
+        return cbor2.loads(payload.removeprefix(CBOR_MAGIC))
+
+    def sniff(self, head: bytes) -> bool:
+        return head.startswith(CBOR_MAGIC)
+
+
+PLAIN_TYPES = (Enum, datetime, date, time, Decimal, UUID, PurePath)
+
+
+def _plain_tree(value: Any, types: tuple[type, ...]) -> Any:
+    """Copy of a dumped tree with instances of ``types`` converted by `_to_plain`."""
+    if isinstance(value, dict):
+        return {key: _plain_tree(item, types) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_plain_tree(item, types) for item in value]
+    if isinstance(value, types):
+        return _to_plain(value)
+    return value
+
+
+_serializers: dict[str, Serializer] = {}
+_lock = threading.Lock()
+
+
+def register_serializer(serializer: Serializer, replace: bool = False) -> Serializer:
+    """Add a serializer to the registry under ``serializer.name``."""
+    with _lock:
+        if serializer.name in _serializers and not replace:
+            raise ValueError(f"Serializer '{serializer.name}' is already registered")
+        _serializers[serializer.name] = serializer
+    return serializer
+
+
+def available_serializers() -> list[str]:
+    """Names of registered serializers whose dependencies are installed."""
+    return [name for name, serializer in _serializers.items() if serializer.available()]
+
+
+def get_serializer(name: str) -> Serializer:
+    """
+    Return the serializer registered as ``name``.
+
+    :raises ValueError: If no serializer has that name.
+    :raises ImportError: If the serializer's optional dependency is not installed.
+    """
+    serializer = _serializers.get(name.lower().lstrip("."))
+    if serializer is None:
+        raise ValueError(f"Unsupported file format '{name}'. Supported formats are {', '.join(map(repr, _serializers))}.")
+    if not serializer.available():
+        raise ImportError(f"The '{name}' format requires the '{serializer.requires}' package: pip install {serializer.requires}")
+    return serializer
+
+
+def serializer_for_extension(ext: str) -> Serializer | None:
+    """Return the serializer registered for a file extension such as ``.yml``, if any."""
+    ext = ext.lower()
+    for serializer in _serializers.values():
+        if ext in serializer.extensions:
+            return get_serializer(serializer.name)
+    return None
+
+
+def detect_serializer(payload: bytes) -> Serializer:
+    """Pick a serializer from the leading bytes of ``payload``; binary formats are tried first."""
+    head = payload[:512]
+    candidates = sorted(_serializers.values(), key=lambda serializer: (not serializer.binary, serializer.name == "yaml"))
+    for serializer in candidates:
+        if serializer.sniff(head) and serializer.available():
+            return serializer
+    raise ValueError("Could not detect the serialization format")
+
+
+for _serializer in (YAMLSerializer(), JSONSerializer(), TOMLSerializer(), MsgpackSerializer(), CBORSerializer()):
+    register_serializer(_serializer)
@@ -0,0 +1,314 @@
+"""
+Buffered, rotating JSONL writer shared by everything that appends spans to a span stream.
+
+Spans are encoded into an in-memory buffer and appended to the file when the buffer reaches
+``buffer_bytes``, when it is ``flush_interval`` seconds old (checked on write and by one
+background thread for all writers), on `SpanWriter.flush` and at process exit. Each flush
+is a single ``write`` to a descriptor opened with ``O_APPEND`` and contains only whole lines, so
+any number of processes can append to the same stream without interleaving partial records.
+
+When the file would grow past ``max_bytes`` it is renamed to
+``<stem>.<timestamp><suffix>`` and a new file is started; readers following the path (e.g.
+`dslmodel.agents.swarm.SpanTail`) continue in the new file. Archives are gzipped one rotation
+later, once no process can still be appending to them, and only the newest ``backup_count``
+are kept.
+
+Use `span_writer` to get the process-wide writer of a path::
+
+    from dslmodel.utils.span_writer import span_writer
+
+    span_writer(root / "telemetry_spans.jsonl").write({"name": "s2s.work.claim", ...})
+"""
+import atexit
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+import weakref
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+try:
+    import fcntl
+except ImportError:  # Windows: rotation is not coordinated between processes
+    fcntl = None
+
+FSYNC_POLICIES = ("never", "flush", "always")
+MAX_WRITE_BYTES = 1 << 20  # larger flushes are split at line boundaries
+
+
+class SpanWriter:
+    """
+    Buffered JSONL appender with size/time flushing, fsync policy and size-based rotation.
+
+    :param path: JSONL file to append to (created with its directory if missing).
+    :param buffer_bytes: Buffered bytes that trigger a flush (0 writes every span immediately).
+    :param flush_interval: Maximum seconds a span stays buffered.
+    :param fsync: ``never``, ``flush`` (after every flush) or ``always`` (no buffering, fsync per span).
+    :param max_bytes: Size at which the file is rotated (None disables rotation).
+    :param backup_count: Rotated archives kept.
+    :param compress: Gzip rotated archives.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        buffer_bytes: int = 64 * 1024,
+        flush_interval: float = 0.25,
+        fsync: str = "never",
+        max_bytes: int | None = 64 * 1024 * 1024,
+        backup_count: int = 5,
+        compress: bool = True,
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, not {fsync!r}")
+        self.path = Path(path)
+        self.buffer_bytes = 0 if fsync == "always" else buffer_bytes
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
+        self.written = 0
+        self.rotations = 0
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+        self._first_buffered_at = 0.0
+        self._fd: int | None = None
+        self._lock = threading.RLock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _flusher.add(self)
+
+    # Writing
+
+    def write(self, span: dict[str, Any] | str) -> None:
+        """Append one span (a dict, or an already encoded JSON line without the newline)."""
+        self.write_many((span,))
+
+    def write_many(self, spans: Iterable[dict[str, Any] | str]) -> None:
+        lines = [
+            (span if isinstance(span, str) else json.dumps(span, default=str)).encode() + b"\n" for span in spans
+        ]
+        if not lines:
+            return
+        with self._lock:
+            if not self._buffer:
+                self._first_buffered_at = time.monotonic()
+                _flusher.wake()
+            self._buffer.extend(lines)
+            self._buffered += sum(map(len, lines))
+            if self._buffered >= self.buffer_bytes or self._is_stale(time.monotonic()):
+                self.flush()
+
+    def _is_stale(self, now: float) -> bool:
+        return bool(self._buffer) and now - self._first_buffered_at >= self.flush_interval
+
+    def flush(self) -> None:
+        """Append the buffered spans to the file."""
+        with self._lock:
+            if not self._buffer:
+                return
+            data, self._buffer, self._buffered = b"".join(self._buffer), [], 0
+            if self.max_bytes is not None:
+                self._rotate_if_needed(len(data))
+            fd = self._open()
+            for chunk in _chunks(data):
+                while chunk:
+                    chunk = chunk[os.write(fd, chunk):]
+            if self.fsync != "never":
+                os.fsync(fd)
+            self.written += len(data)
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        _flusher.discard(self)
+
+    def __enter__(self) -> "SpanWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # File handling
+
+    def _open(self) -> int:
+        """The append descriptor of the current file, reopened if another process rotated it."""
+        if self._fd is not None:
+            try:
+                if os.stat(self.path).st_ino == os.fstat(self._fd).st_ino:
+                    return self._fd
+            except FileNotFoundError:
+                pass
+            os.close(self._fd)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._fd
+
+    def _rotate_if_needed(self, incoming: int) -> None:
+        try:
+            if os.stat(self.path).st_size + incoming <= self.max_bytes:
+                return
+        except FileNotFoundError:
+            return
+        with _file_lock(self.path.with_name(self.path.name + ".lock")):
+            # Another process may have rotated while we waited for the lock
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                return
+            if stat.st_size + incoming <= self.max_bytes or stat.st_size == 0:
+                return
+            stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+            archive = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+            os.rename(self.path, archive)
+            self.rotations += 1
+            self._cleanup_archives(keep_plain=archive)
+
+    def archives(self) -> list[Path]:
+        """Rotated archives of this stream, oldest first."""
+        pattern = f"{self.path.stem}.*{self.path.suffix}"
+        return sorted(
+            path for path in self.path.parent.glob(f"{pattern}*")
+            if path.name.endswith((self.path.suffix, self.path.suffix + ".gz")) and path != self.path
+        )
+
+    def _cleanup_archives(self, keep_plain: Path) -> None:
+        for archive in self.archives():
+            # The newest archive may still receive appends from processes that have not reopened yet
+            if self.compress and archive.suffix != ".gz" and archive != keep_plain:
+                with open(archive, "rb") as source, gzip.open(f"{archive}.gz", "wb") as target:
+                    shutil.copyfileobj(source, target)
+                archive.unlink()
+        archives = self.archives()
+        for archive in archives[:max(len(archives) - self.backup_count, 0)]:
+            archive.unlink(missing_ok=True)
+
+
+def _chunks(data: bytes) -> Iterable[bytes]:
+    """Split ``data`` into writes of at most `MAX_WRITE_BYTES`, each ending at a newline."""
+    while len(data) > MAX_WRITE_BYTES:
+        cut = data.rfind(b"\n", 0, MAX_WRITE_BYTES) + 1 or data.find(b"\n") + 1 or len(data)
+        yield data[:cut]
+        data = data[cut:]
+    if data:
+        yield data
+
+
+class _file_lock:
+    """Exclusive advisory lock on ``path`` between processes (a no-op without fcntl)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.fd: int | None = None
+
+    def __enter__(self) -> None:
+        if fcntl is not None:
+            self.fd = os.open(self.path, os.O_WRONLY | os.O_CREAT, 0o644)
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+
+    def __exit__(self, *exc_info) -> None:
+        if self.fd is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+
+
+class _Flusher:
+    """One daemon thread flushing the buffers of every live writer once they are ``flush_interval`` old."""
+
+    def __init__(self):
+        self._writers: "weakref.WeakSet[SpanWriter]" = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add(self, writer: SpanWriter) -> None:
+        with self._lock:
+            self._writers.add(writer)
+
+    def wake(self) -> None:
+        """Called when a writer starts buffering: (re)compute the next deadline, starting the thread if needed."""
+        self._wakeup.set()
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="span-writer-flush", daemon=True)
+                self._thread.start()
+                # Forked multiprocessing children leave through os._exit, skipping atexit
+                from multiprocessing import util
+
+                util.Finalize(self, self.flush_all, exitpriority=0)
+
+    def discard(self, writer: SpanWriter) -> None:
+        with self._lock:
+            self._writers.discard(writer)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                writers = list(self._writers)
+            now = time.monotonic()
+            deadlines = []
+            for writer in writers:
+                if writer._is_stale(now):
+                    self.flush(writer)
+                elif writer._buffer:
+                    deadlines.append(writer._first_buffered_at + writer.flush_interval)
+            # Sleep until the oldest buffer is due, or until a writer starts a new one
+            self._wakeup.wait(max(min(deadlines) - now, 0.001) if deadlines else None)
+            self._wakeup.clear()
+
+    def flush_all(self) -> None:
+        with self._lock:
+            writers = list(self._writers)
+        for writer in writers:
+            self.flush(writer)
+
+    @staticmethod
+    def flush(writer: SpanWriter) -> None:
+        try:
+            writer.flush()
+        except OSError as e:
+            from loguru import logger
+
+            logger.error(f"Failed to flush spans to {writer.path}: {e}")
+
+    def after_fork(self) -> None:
+        # The child must not write its parent's buffered spans again, and has no flush thread
+        # until its first write
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        for writer in list(self._writers):
+            writer._lock = threading.RLock()
+            writer._buffer, writer._buffered = [], 0
+
+
+_flusher = _Flusher()
+atexit.register(_flusher.flush_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_flusher.after_fork)
+
+_writers: dict[Path, SpanWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def span_writer(path: str | Path, **options: Any) -> SpanWriter:
+    """
+    The process-wide `SpanWriter` of ``path``, created with ``options`` on first use.
+
+    Every emitter of a stream shares its buffer and file descriptor; ``options`` given after the
+    writer exists are ignored.
+    """
+    key = Path(path).expanduser().absolute()
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = SpanWriter(key, **options)
+        return writer
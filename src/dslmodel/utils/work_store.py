@@ -0,0 +1,567 @@
+"""
+Transactional SQLite store for swarm coordination: agents, work items, claims and events.
+
+Replaces the JSON documents the coordination CLIs used to read and rewrite whole on every
+operation (``work_items.json``, ``agents.json``, ``work_queue.json``, ``work_claims.json``, ...).
+Each operation touches only the rows it changes, through indexed lookups, and concurrent agents
+in separate processes coordinate through SQLite's own locking (WAL mode, so readers never wait
+for writers) instead of lock files.
+
+`WorkStore.claim_next` hands the highest-priority, oldest pending item to an agent in a single
+``BEGIN IMMEDIATE`` transaction, so two agents can never claim the same item.
+
+Work items and agents are plain dicts. Known fields are stored in indexed columns, anything
+else (``story_points``, ``trace_id``, ...) in a JSON ``data`` column and merged back on read.
+
+`import_json` migrates the JSON files of the older CLIs; `open_work_store` does so
+automatically the first time a store is created next to them::
+
+    python -m dslmodel.utils.work_store ~/s2s/agent_coordination coordination.db
+"""
+import json
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from loguru import logger
+
+PRIORITY_RANK = {"low": 0, "medium": 1, "high": 2, "critical": 3}
+
+WORK_COLUMNS = (
+    "id", "type", "title", "priority", "team", "status", "progress", "agent_id",
+    "created_at", "updated_at", "completed_at",
+)
+AGENT_COLUMNS = ("id", "name", "team", "status", "created_at", "work_completed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS agents (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    team TEXT,
+    status TEXT NOT NULL DEFAULT 'idle',
+    created_at TEXT,
+    work_completed INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS agents_status ON agents (status, team);
+
+CREATE TABLE IF NOT EXISTS work_items (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    type TEXT,
+    title TEXT,
+    priority TEXT,
+    priority_rank INTEGER NOT NULL DEFAULT 1,
+    team TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    progress INTEGER NOT NULL DEFAULT 0,
+    agent_id TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    completed_at TEXT,
+    data TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS work_items_queue ON work_items (status, priority_rank DESC, seq);
+CREATE INDEX IF NOT EXISTS work_items_team ON work_items (team, status);
+CREATE INDEX IF NOT EXISTS work_items_agent ON work_items (agent_id);
+
+CREATE TABLE IF NOT EXISTS claims (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    work_id TEXT NOT NULL,
+    agent_id TEXT,
+    claimed_at TEXT NOT NULL,
+    released_at TEXT,
+    outcome TEXT
+);
+CREATE INDEX IF NOT EXISTS claims_work ON claims (work_id, released_at);
+CREATE INDEX IF NOT EXISTS claims_agent ON claims (agent_id);
+
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    event TEXT NOT NULL,
+    data TEXT NOT NULL DEFAULT '{}'
+);
+
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def _now() -> str:
+    return datetime.now().isoformat()
+
+
+def _split(record: dict[str, Any], columns: tuple[str, ...]) -> tuple[dict[str, Any], dict[str, Any]]:
+    known = {key: value for key, value in record.items() if key in columns}
+    extra = {key: value for key, value in record.items() if key not in columns}
+    return known, extra
+
+
+def _to_dict(row: sqlite3.Row | None, columns: tuple[str, ...]) -> dict[str, Any] | None:
+    if row is None:
+        return None
+    record = json.loads(row["data"])
+    record.update({column: row[column] for column in columns})
+    return record
+
+
+class WorkStore:
+    """
+    SQLite-backed coordination store; safe to share between threads and processes.
+
+    :param path: Database file, created with its directory if missing.
+    :param timeout: Seconds a writer waits for another process's transaction to finish.
+    """
+
+    def __init__(self, path: str | Path, timeout: float = 30.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.RLock()
+        self._depth = 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run the block as one write transaction; nested blocks join the outer one.
+
+        ``BEGIN IMMEDIATE`` takes the write lock up front, so a read-then-update inside the
+        block cannot race another writer.
+        """
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self._conn
+                finally:
+                    self._depth -= 1
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._depth = 1
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            else:
+                self._conn.execute("COMMIT")
+            finally:
+                self._depth = 0
+
+    def _query(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def next_id(self, name: str = "work") -> int:
+        """Atomically increment and return counter ``name`` (starting at 1)."""
+        with self.transaction() as conn:
+            conn.execute("INSERT OR IGNORE INTO counters (name, value) VALUES (?, 0)", (name,))
+            conn.execute("UPDATE counters SET value = value + 1 WHERE name = ?", (name,))
+            return conn.execute("SELECT value FROM counters WHERE name = ?", (name,)).fetchone()[0]
+
+    def peek_id(self, name: str = "work") -> int:
+        """The value `next_id` will return next, without incrementing."""
+        row = self._query("SELECT value FROM counters WHERE name = ?", (name,))
+        return (row[0][0] if row else 0) + 1
+
+    def set_counter(self, name: str, value: int) -> None:
+        """Raise counter ``name`` to at least ``value``."""
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT INTO counters (name, value) VALUES (?, ?)"
+                " ON CONFLICT(name) DO UPDATE SET value = MAX(value, excluded.value)",
+                (name, value),
+            )
+
+    # Agents
+
+    def put_agent(self, agent: dict[str, Any]) -> str:
+        """Insert or replace an agent; ``agent["id"]`` is required."""
+        known, extra = _split(agent, AGENT_COLUMNS)
+        known.setdefault("status", "idle")
+        known.setdefault("work_completed", 0)
+        known.setdefault("created_at", _now())
+        columns = [*known, "data"]
+        with self.transaction() as conn:
+            conn.execute(
+                f"INSERT OR REPLACE INTO agents ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                (*known.values(), json.dumps(extra, default=str)),
+            )
+        return agent["id"]
+
+    def add_agent(self, name: str, team: str | None = None, agent_id: str | None = None, **extra: Any) -> str:
+        agent_id = agent_id or f"agent_{time.time_ns()}"
+        return self.put_agent({"id": agent_id, "name": name, "team": team or "default", **extra})
+
+    def get_agent(self, agent_id: str) -> dict[str, Any] | None:
+        rows = self._query("SELECT * FROM agents WHERE id = ?", (agent_id,))
+        return _to_dict(rows[0] if rows else None, AGENT_COLUMNS)
+
+    def list_agents(self, status: str | None = None, team: str | None = None) -> list[dict[str, Any]]:
+        where, params = self._filters(status=status, team=team)
+        rows = self._query(f"SELECT * FROM agents{where} ORDER BY created_at, id", params)
+        return [_to_dict(row, AGENT_COLUMNS) for row in rows]
+
+    def update_agent(self, agent_id: str, **fields: Any) -> bool:
+        return self._update("agents", AGENT_COLUMNS, agent_id, fields)
+
+    # Work items
+
+    def put_work(self, item: dict[str, Any]) -> str:
+        """Insert or update a work item by ``item["id"]``, keeping its queue position if it exists."""
+        known, extra = _split(item, WORK_COLUMNS)
+        known.setdefault("status", "pending")
+        known.setdefault("created_at", _now())
+        known.setdefault("updated_at", known["created_at"])
+        known["priority_rank"] = PRIORITY_RANK.get(known.get("priority"), 1)
+        known["data"] = json.dumps(extra, default=str)
+        columns = list(known)
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column != "id")
+        with self.transaction() as conn:
+            conn.execute(
+                f"INSERT INTO work_items ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+                f" ON CONFLICT(id) DO UPDATE SET {updates}",
+                tuple(known.values()),
+            )
+        return item["id"]
+
+    def add_work(
+        self,
+        title: str,
+        type: str = "task",
+        priority: str = "medium",
+        team: str | None = None,
+        work_id: str | None = None,
+        **extra: Any,
+    ) -> str:
+        work_id = work_id or f"work_{time.time_ns()}"
+        return self.put_work({"id": work_id, "title": title, "type": type, "priority": priority, "team": team, **extra})
+
+    def get_work(self, work_id: str) -> dict[str, Any] | None:
+        rows = self._query("SELECT * FROM work_items WHERE id = ?", (work_id,))
+        return _to_dict(rows[0] if rows else None, WORK_COLUMNS)
+
+    def list_work(
+        self,
+        status: str | None = None,
+        team: str | None = None,
+        agent_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Work items in insertion order, optionally filtered (``limit`` keeps the newest)."""
+        where, params = self._filters(status=status, team=team, agent_id=agent_id)
+        if limit is None:
+            rows = self._query(f"SELECT * FROM work_items{where} ORDER BY seq", params)
+        else:
+            rows = self._query(f"SELECT * FROM work_items{where} ORDER BY seq DESC LIMIT ?", (*params, limit))[::-1]
+        return [_to_dict(row, WORK_COLUMNS) for row in rows]
+
+    def update_work(self, work_id: str, **fields: Any) -> bool:
+        """Update fields of a work item (``updated_at`` is set automatically); False if it does not exist."""
+        fields.setdefault("updated_at", _now())
+        return self._update("work_items", WORK_COLUMNS, work_id, fields)
+
+    def claim_next(self, agent_id: str, team: str | None = None, status: str = "in_progress") -> dict[str, Any] | None:
+        """
+        Atomically assign the highest-priority, oldest pending work item (of ``team``) to ``agent_id``.
+
+        The item is set to ``status``, a claim is recorded and the agent, if registered, is marked
+        working. Returns the claimed item, or None if nothing is pending.
+        """
+        where, params = self._filters(status="pending", team=team)
+        with self.transaction() as conn:
+            row = conn.execute(
+                f"SELECT id FROM work_items{where} ORDER BY priority_rank DESC, seq LIMIT 1", params
+            ).fetchone()
+            if row is None:
+                return None
+            self._assign(conn, row["id"], agent_id, status)
+            return self.get_work(row["id"])
+
+    def claim(self, work_id: str, agent_id: str, status: str = "in_progress") -> bool:
+        """Assign a specific pending work item to ``agent_id``; False if it is not pending."""
+        with self.transaction() as conn:
+            row = conn.execute("SELECT status FROM work_items WHERE id = ?", (work_id,)).fetchone()
+            if row is None or row["status"] != "pending":
+                return False
+            self._assign(conn, work_id, agent_id, status)
+            return True
+
+    def _assign(self, conn: sqlite3.Connection, work_id: str, agent_id: str, status: str) -> None:
+        now = _now()
+        conn.execute(
+            "UPDATE work_items SET status = ?, agent_id = ?, updated_at = ? WHERE id = ?",
+            (status, agent_id, now, work_id),
+        )
+        conn.execute("INSERT INTO claims (work_id, agent_id, claimed_at) VALUES (?, ?, ?)", (work_id, agent_id, now))
+        conn.execute("UPDATE agents SET status = 'working' WHERE id = ?", (agent_id,))
+
+    def complete(self, work_id: str, status: str = "completed", **fields: Any) -> bool:
+        """
+        Finish a work item: set ``status``, progress 100 and ``completed_at`` (plus ``fields``),
+        close its open claim, and return its agent to idle with one more completed item.
+        """
+        now = _now()
+        with self.transaction() as conn:
+            item = self.get_work(work_id)
+            if item is None:
+                return False
+            self.update_work(
+                work_id, **{"status": status, "progress": 100, "completed_at": now, "updated_at": now, **fields}
+            )
+            self._release(conn, item, status, now)
+            if item.get("agent_id"):
+                conn.execute(
+                    "UPDATE agents SET status = 'idle', work_completed = work_completed + 1 WHERE id = ?",
+                    (item["agent_id"],),
+                )
+        return True
+
+    def release(self, work_id: str) -> bool:
+        """Return a claimed work item to the queue and its agent to idle."""
+        now = _now()
+        with self.transaction() as conn:
+            item = self.get_work(work_id)
+            if item is None:
+                return False
+            self.update_work(work_id, status="pending", agent_id=None, updated_at=now)
+            self._release(conn, item, "released", now)
+            if item.get("agent_id"):
+                conn.execute("UPDATE agents SET status = 'idle' WHERE id = ?", (item["agent_id"],))
+        return True
+
+    @staticmethod
+    def _release(conn: sqlite3.Connection, item: dict[str, Any], outcome: str, now: str) -> None:
+        conn.execute(
+            "UPDATE claims SET released_at = ?, outcome = ? WHERE work_id = ? AND released_at IS NULL",
+            (now, outcome, item["id"]),
+        )
+
+    def purge(self, status: str = "completed") -> list[dict[str, Any]]:
+        """Delete and return the work items with ``status`` (their claims are kept)."""
+        with self.transaction() as conn:
+            items = self.list_work(status=status)
+            conn.execute("DELETE FROM work_items WHERE status = ?", (status,))
+        return items
+
+    def claims(self, work_id: str | None = None, agent_id: str | None = None) -> list[dict[str, Any]]:
+        where, params = self._filters(work_id=work_id, agent_id=agent_id)
+        return [dict(row) for row in self._query(f"SELECT * FROM claims{where} ORDER BY id", params)]
+
+    # Statistics and events
+
+    def work_counts(self, team: str | None = None) -> dict[str, int]:
+        """Number of work items by status."""
+        where, params = self._filters(team=team)
+        rows = self._query(f"SELECT status, COUNT(*) FROM work_items{where} GROUP BY status", params)
+        return {row[0]: row[1] for row in rows}
+
+    def average(self, field: str, status: str | None = None, team: str | None = None, default: float | None = None
+                ) -> float | None:
+        """Mean of a numeric work-item field (column or extra field); items without it count as ``default``."""
+        return self._aggregate("AVG", field, status, team, default)
+
+    def total(self, field: str, status: str | None = None, team: str | None = None) -> float:
+        """Sum of a numeric work-item field (column or extra field)."""
+        return self._aggregate("TOTAL", field, status, team, 0)
+
+    def _aggregate(self, function: str, field: str, status: str | None, team: str | None, default: Any) -> Any:
+        where, params = self._filters(status=status, team=team)
+        value = field if field in WORK_COLUMNS else "json_extract(data, ?)"
+        field_params = () if field in WORK_COLUMNS else (f"$.{field}",)
+        return self._query(
+            f"SELECT {function}(COALESCE({value}, ?)) FROM work_items{where}", (*field_params, default, *params)
+        )[0][0]
+
+    def agent_counts(self) -> dict[str, int]:
+        """Number of agents by status."""
+        return {row[0]: row[1] for row in self._query("SELECT status, COUNT(*) FROM agents GROUP BY status")}
+
+    def log_event(self, event: str, data: dict[str, Any] | None = None, keep: int | None = None,
+                  timestamp: str | None = None) -> None:
+        """Append an event; with ``keep`` only the newest ``keep`` events are retained."""
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "INSERT INTO events (timestamp, event, data) VALUES (?, ?, ?)",
+                (timestamp or _now(), event, json.dumps(data or {}, default=str)),
+            )
+            if keep is not None:
+                conn.execute("DELETE FROM events WHERE id <= ?", (cursor.lastrowid - keep,))
+
+    def events(self, last: int | None = None) -> list[dict[str, Any]]:
+        """Events oldest first; ``last`` keeps only the newest ones."""
+        if last is None:
+            rows = self._query("SELECT * FROM events ORDER BY id")
+        else:
+            rows = self._query("SELECT * FROM events ORDER BY id DESC LIMIT ?", (last,))[::-1]
+        return [{"timestamp": row["timestamp"], "event": row["event"], "data": json.loads(row["data"])} for row in rows]
+
+    def is_empty(self) -> bool:
+        return not any(
+            self._query(f"SELECT 1 FROM {table} LIMIT 1") for table in ("agents", "work_items", "events")
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # Helpers
+
+    @staticmethod
+    def _filters(**filters: Any) -> tuple[str, tuple]:
+        active = {column: value for column, value in filters.items() if value is not None}
+        if not active:
+            return "", ()
+        return " WHERE " + " AND ".join(f"{column} = ?" for column in active), tuple(active.values())
+
+    def _update(self, table: str, columns: tuple[str, ...], record_id: str, fields: dict[str, Any]) -> bool:
+        known, extra = _split(fields, columns)
+        known.pop("id", None)
+        if table == "work_items" and "priority" in known:
+            known["priority_rank"] = PRIORITY_RANK.get(known["priority"], 1)
+        with self.transaction() as conn:
+            row = conn.execute(f"SELECT data FROM {table} WHERE id = ?", (record_id,)).fetchone()
+            if row is None:
+                return False
+            if extra:
+                known["data"] = json.dumps({**json.loads(row["data"]), **extra}, default=str)
+            if known:
+                assignments = ", ".join(f"{column} = ?" for column in known)
+                conn.execute(f"UPDATE {table} SET {assignments} WHERE id = ?", (*known.values(), record_id))
+        return True
+
+
+# Migration from the JSON files of the older coordination CLIs
+
+
+def _read(path: Path) -> Any:
+    if path.suffix == ".jsonl":
+        return [json.loads(line) for line in path.read_text().splitlines() if line.strip()]
+    return json.loads(path.read_text())
+
+
+def _import_work_items(store: WorkStore, data: dict[str, Any]) -> int:
+    """``work_items.json`` of ``dsl coord``: ``{"items": {id: item}, "next_id": n}``."""
+    for item in data.get("items", {}).values():
+        store.put_work(item)
+    store.set_counter("work", data.get("next_id", 1) - 1)
+    return len(data.get("items", {}))
+
+
+def _import_agents(store: WorkStore, data: dict[str, Any] | list[dict[str, Any]]) -> int:
+    """``agents.json`` of ``dsl swarm`` (``{id: agent}``) or ``agent_status.json`` (list of agents)."""
+    agents = [{"id": agent_id, **agent} for agent_id, agent in data.items()] if isinstance(data, dict) else data
+    count = 0
+    for agent in agents:
+        agent = dict(agent)
+        agent.setdefault("id", agent.pop("agent_id", None))
+        if agent.get("created") and not agent.get("created_at"):
+            agent["created_at"] = agent.pop("created")
+        if agent["id"]:
+            store.put_agent(agent)
+            count += 1
+    return count
+
+
+def _import_work_queue(store: WorkStore, data: list[dict[str, Any]]) -> int:
+    """``work_queue.json`` of ``dsl swarm``."""
+    renames = {"description": "title", "created": "created_at", "assigned_to": "agent_id", "completed": "completed_at"}
+    for item in data:
+        store.put_work({renames.get(key, key): value for key, value in item.items()})
+    return len(data)
+
+
+def _import_claims(store: WorkStore, data: list[dict[str, Any]]) -> int:
+    """``work_claims.json`` / ``work_claims_fast.jsonl`` of ``coordination_cli_v2``."""
+    renames = {"work_item_id": "id", "work_type": "type", "description": "title", "claimed_at": "created_at"}
+    with store.transaction() as conn:
+        for claim in data:
+            item = {renames.get(key, key): value for key, value in claim.items()}
+            if item.get("completed_at"):
+                item.setdefault("status", "completed")
+            store.put_work(item)
+            conn.execute(
+                "INSERT INTO claims (work_id, agent_id, claimed_at, released_at, outcome) VALUES (?, ?, ?, ?, ?)",
+                (item["id"], item.get("agent_id"), item.get("created_at") or _now(), item.get("completed_at"),
+                 item.get("status", "completed") if item.get("completed_at") else None),
+            )
+    return len(data)
+
+
+def _import_events(event: str | None):
+    def handler(store: WorkStore, data: list[dict[str, Any]]) -> int:
+        for entry in data:
+            if event is None:
+                store.log_event(entry.get("event", "event"), entry.get("data"), timestamp=entry.get("timestamp"))
+            else:
+                store.log_event(event, entry, timestamp=entry.get("completed_at"))
+        return len(data)
+
+    return handler
+
+
+IMPORTERS = {
+    "work_items.json": _import_work_items,
+    "agents.json": _import_agents,
+    "agent_status.json": _import_agents,
+    "work_queue.json": _import_work_queue,
+    "work_claims.json": _import_claims,
+    "work_claims_fast.jsonl": _import_claims,
+    "telemetry.json": _import_events(None),
+    "coordination_log.json": _import_events("work_completed"),
+}
+
+
+def legacy_files(directory: str | Path) -> list[Path]:
+    """The JSON coordination files in ``directory`` that `import_json` understands."""
+    directory = Path(directory)
+    return [directory / name for name in IMPORTERS if (directory / name).is_file()]
+
+
+def import_json(store: WorkStore, directory: str | Path) -> dict[str, int]:
+    """
+    Import the JSON coordination files in ``directory`` into ``store``.
+
+    Agents and work items are upserted by id, so importing twice does not duplicate them
+    (claims and events are appended). Files that cannot be parsed are logged and skipped; all
+    other files are imported in one transaction, so a failing import leaves the store unchanged.
+
+    :return: Number of records imported per file name.
+    """
+    imported = {}
+    with store.transaction():
+        for path in legacy_files(directory):
+            try:
+                data = _read(path)
+            except (OSError, ValueError) as e:
+                logger.error(f"Skipping {path}: {e}")
+                continue
+            imported[path.name] = IMPORTERS[path.name](store, data)
+    return imported
+
+
+def open_work_store(path: str | Path, legacy_dir: str | Path | None = None) -> WorkStore:
+    """Open the store at ``path``; a new store first imports any JSON files in ``legacy_dir``."""
+    store = WorkStore(path)
+    if legacy_dir is not None and store.is_empty() and legacy_files(legacy_dir):
+        imported = import_json(store, legacy_dir)
+        logger.info(f"Imported coordination data from {legacy_dir} into {path}: {imported}")
+    return store
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m dslmodel.utils.work_store SOURCE_DIR DATABASE")
+    print(json.dumps(import_json(WorkStore(sys.argv[2]), sys.argv[1]), indent=2))
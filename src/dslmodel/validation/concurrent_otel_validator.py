@@ -20,6 +20,8 @@ from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 
+from dslmodel.utils.span_writer import span_writer
+
 # Try to import OpenTelemetry components
 try:
     from opentelemetry import trace
@@ -372,6 +374,7 @@ class ConcurrentOTELValidator:
             
             # Emit test spans
             spans_file = self.coordination_dir / "telemetry_spans.jsonl"
+            writer = span_writer(spans_file)
             emitted_spans = []
             
             for span_def in scenario.spans_to_emit:
@@ -384,12 +387,14 @@ class ConcurrentOTELValidator:
                 }
                 
                 # Write to coordination file
-                with open(spans_file, 'a') as f:
-                    f.write(json.dumps(span) + '\n')
+                writer.write(span)
                 
                 emitted_spans.append(span)
                 await asyncio.sleep(0.1)  # Small delay between spans
             
+            # Agents read the stream back from disk
+            writer.flush()
+            
             # Wait for agents to process
             await asyncio.sleep(2)
             
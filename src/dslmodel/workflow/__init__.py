@@ -1,6 +1,8 @@
 from .workflow_executor import (
+    configure_logging,
     execute_workflow,
     initialize_context,
+    resume_workflow,
     schedule_workflow,
     update_context,
 )
@@ -0,0 +1,153 @@
+"""
+End-to-end overhead of `execute_workflow` on synthetic workflows; run it with ``dsl bench workflow``.
+
+A generated workflow has ``jobs`` jobs in layers of ``width`` (each job depends on one job of
+the previous layer), ``actions`` trivial code actions per job, a ``conditions`` fraction of
+them guarded by a condition, and a context with ``context_size`` row dicts that no action
+touches. Action bodies do almost nothing, so the time per action is executor overhead.
+
+For each scenario `bench` reports the best of ``repeat`` runs: wall time, microseconds per
+action, actions per second, and peak traced memory (measured in a separate run, since
+tracemalloc slows execution). `regressions` compares results against a saved baseline.
+Profiles run the jobs one after another in the main thread, since profilers only see the
+calling thread; the pyinstrument profiler needs the optional pyinstrument package.
+"""
+import cProfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from dslmodel.workflow.plan import WorkflowPlan, plan_workflow
+from dslmodel.workflow.workflow_executor import execute_job, execute_workflow
+from dslmodel.workflow.workflow_models import Action, Condition, Job, Workflow
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    jobs: int = 10
+    width: int = 1
+    actions: int = 20
+    conditions: float = 0.0
+    context_size: int = 100
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in [
+        Scenario("baseline"),
+        Scenario("wide", jobs=32, width=8),
+        Scenario("deep", jobs=50, actions=10),
+        Scenario("conditional", conditions=1.0),
+        Scenario("big-context", context_size=100_000),
+        Scenario("many-actions", jobs=2, actions=500),
+    ]
+}
+
+
+def sample_workflow(scenario: Scenario) -> Workflow:
+    jobs = []
+    for j in range(scenario.jobs):
+        layer = j // scenario.width
+        parent = (layer - 1) * scenario.width + j % scenario.width
+        steps = []
+        for a in range(scenario.actions):
+            guarded = a < round(scenario.actions * scenario.conditions)
+            steps.append(Action(
+                name=f"action-{j}-{a}",
+                code=f"out_{j} = {a}",
+                cond=Condition(expr=f"limit > {a}") if guarded else None,
+            ))
+        jobs.append(Job(name=f"job-{j}", depends_on=[f"job-{parent}"] if layer else None, steps=steps))
+    return Workflow(name=scenario.name, jobs=jobs)
+
+
+def sample_context(scenario: Scenario) -> dict:
+    return {
+        "rows": [{"id": i, "name": f"row-{i}", "score": i * 0.5} for i in range(scenario.context_size)],
+        "limit": scenario.actions,
+    }
+
+
+def run_once(scenario: Scenario, plan: WorkflowPlan) -> float:
+    context = sample_context(scenario)
+    start = time.perf_counter()
+    result = execute_workflow(plan, context)
+    elapsed = time.perf_counter() - start
+    assert result[f"out_{scenario.jobs - 1}"] == scenario.actions - 1
+    return elapsed
+
+
+def peak_memory(scenario: Scenario, plan: WorkflowPlan) -> float:
+    """Peak traced allocation in MiB during one run, excluding the input context."""
+    context = sample_context(scenario)
+    tracemalloc.start()
+    try:
+        execute_workflow(plan, context)
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def run_inline(plan: WorkflowPlan, context: dict) -> dict:
+    """Run the plan's jobs one after another in the calling thread, which is all a profiler sees."""
+    for job in plan.jobs:
+        context = execute_job(job, context).to_dict()
+    return context
+
+
+def profile(scenario: Scenario, profiler: str, directory: Path) -> Path:
+    """
+    Profile one inline run of ``scenario`` and return the written file.
+
+    :raises ImportError: If ``profiler`` is pyinstrument and it is not installed.
+    """
+    plan = plan_workflow(sample_workflow(scenario))
+    context = sample_context(scenario)
+    if profiler == "pyinstrument":
+        from pyinstrument import Profiler
+
+        output = directory / f"{scenario.name}.html"
+        with Profiler() as instrument:
+            run_inline(plan, context)
+        directory.mkdir(parents=True, exist_ok=True)
+        output.write_text(instrument.output_html())
+    else:
+        output = directory / f"{scenario.name}.prof"
+        with cProfile.Profile() as cprofile:
+            run_inline(plan, context)
+        directory.mkdir(parents=True, exist_ok=True)
+        cprofile.dump_stats(output)
+    return output
+
+
+def bench(scenario: Scenario, repeat: int = 3) -> dict:
+    plan = plan_workflow(sample_workflow(scenario))
+    run_once(scenario, plan)  # warm the compile cache and thread pools
+    elapsed = min(run_once(scenario, plan) for _ in range(repeat))
+    actions = scenario.jobs * scenario.actions
+    return {
+        "scenario": asdict(scenario),
+        "ms": elapsed * 1e3,
+        "us_per_action": elapsed / actions * 1e6,
+        "actions_per_s": actions / elapsed,
+        "peak_mib": peak_memory(scenario, plan),
+    }
+
+
+def regressions(results: dict[str, dict], baseline: dict[str, dict], tolerance: float = 0.2) -> list[str]:
+    """Scenarios whose time per action grew by more than ``tolerance`` over ``baseline``."""
+    messages = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        change = result["us_per_action"] / before["us_per_action"] - 1
+        if change > tolerance:
+            messages.append(
+                f"{name}: {before['us_per_action']:.1f} -> {result['us_per_action']:.1f} us/action (+{change:.0%})"
+            )
+    return messages
@@ -0,0 +1,168 @@
+"""
+Durable checkpoints for workflow runs.
+
+A `WorkflowCheckpoint` is a directory holding one run's progress::
+
+    run.json          workflow name, status and the initial context (written once)
+    jobs/<job>.json   per-job status, number of completed actions and the job's changes
+
+Job files are rewritten atomically (temporary file, fsync, rename) after every action, and
+only contain what the job changed, so checkpoint cost does not grow with the size of the
+context. Jobs running in parallel write separate files.
+
+``execute_workflow(..., checkpoint_dir=...)`` starts a checkpointed run and `resume_workflow`
+continues one: finished jobs are skipped and their changes restored, and unfinished jobs
+continue after their last completed action. An action marked ``idempotent: false`` that was
+interrupted mid-run is not re-run silently; resuming raises `CheckpointError` unless
+``rerun_interrupted=True``.
+
+Only JSON values are checkpointed. A job whose changes hold anything else (e.g. a datetime or a
+set inside a list) is recorded as not resumable, without its changes, and runs again from its
+first action on resume; initial context entries holding such values are left out of ``run.json``.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+from loguru import logger
+
+from dslmodel.workflow.context import PLAIN_TYPES
+
+CHECKPOINT_VERSION = 1
+
+
+class CheckpointError(RuntimeError):
+    """Raised when a checkpoint cannot be used to resume a workflow."""
+
+
+def atomic_write(path: Path, data: bytes, fsync: bool = True) -> None:
+    """Replace ``path`` with ``data`` so readers see either the old or the new content."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "wb") as file:
+        file.write(data)
+        if fsync:
+            file.flush()
+            os.fsync(file.fileno())
+    os.replace(tmp, path)
+
+
+def non_json_paths(data: dict[str, Any]) -> list[str]:
+    """Paths (``key``, ``key[0]``, ``key.field``) of values in ``data`` that do not round-trip through JSON."""
+    return [path for key, value in data.items() for path in _walk(value, str(key))]
+
+
+def _walk(value: Any, path: str):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(key, str):
+                yield from _walk(item, f"{path}.{key}")
+            else:
+                yield f"{path}.{key!r}"
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _walk(item, f"{path}[{index}]")
+    elif not isinstance(value, (str, int, float, bool, type(None))):
+        yield path
+
+
+def _dumps(data: Any) -> bytes:
+    return json.dumps(data).encode()
+
+
+class WorkflowCheckpoint:
+    """
+    Checkpoint directory of one workflow run.
+
+    Holds only a path, so it can be passed to process-pool jobs.
+
+    :param path: Directory for the checkpoint files; created on `begin`.
+    :param fsync: Flush every write to disk (disable for speed on throwaway runs).
+    """
+
+    def __init__(self, path: str | os.PathLike, fsync: bool = True):
+        self.path = Path(path)
+        self.fsync = fsync
+
+    @property
+    def run_file(self) -> Path:
+        return self.path / "run.json"
+
+    def job_file(self, name: str) -> Path:
+        return self.path / "jobs" / f"{quote(name, safe='')}.json"
+
+    def exists(self) -> bool:
+        return self.run_file.exists()
+
+    def begin(self, workflow_name: str, context: dict[str, Any]) -> None:
+        """Start a new run, discarding any earlier progress in this directory."""
+        jobs = self.path / "jobs"
+        jobs.mkdir(parents=True, exist_ok=True)
+        for file in jobs.glob("*.json"):
+            file.unlink()
+        plain = {key: value for key, value in context.items() if isinstance(value, PLAIN_TYPES)}
+        unserializable = non_json_paths(plain)
+        if unserializable:
+            logger.warning(f"Not checkpointing context values that are not JSON: {', '.join(unserializable)}")
+            plain = {key: value for key, value in plain.items() if not any(_walk(value, key))}
+        self._write_run({"version": CHECKPOINT_VERSION, "workflow": workflow_name, "status": "running", "context": plain})
+
+    def load_run(self) -> dict[str, Any]:
+        """
+        Return the run record (``workflow``, ``status``, ``context``).
+
+        :raises CheckpointError: If there is no checkpoint or it was written by another version.
+        """
+        if not self.exists():
+            raise CheckpointError(f"No workflow checkpoint in {self.path}")
+        run = json.loads(self.run_file.read_bytes())
+        if run.get("version") != CHECKPOINT_VERSION:
+            raise CheckpointError(f"Unsupported checkpoint version {run.get('version')} in {self.path}")
+        return run
+
+    def complete(self) -> None:
+        run = self.load_run()
+        run["status"] = "completed"
+        self._write_run(run)
+
+    def _write_run(self, run: dict[str, Any]) -> None:
+        atomic_write(self.run_file, _dumps(run), self.fsync)
+
+    def load_job(self, name: str) -> dict[str, Any] | None:
+        """Return the saved state of job ``name``: ``status``, ``actions``, ``delta``, ``running`` and ``resumable``."""
+        file = self.job_file(name)
+        return json.loads(file.read_bytes()) if file.exists() else None
+
+    def save_job(
+        self,
+        name: str,
+        status: str,
+        actions: int = 0,
+        delta: dict[str, Any] | None = None,
+        running: str | None = None,
+    ) -> None:
+        """
+        Record job progress.
+
+        :param status: "running", "succeeded" or "failed".
+        :param actions: Number of leading actions that completed.
+        :param delta: The job's changes to its input context so far.
+        :param running: Name of a non-idempotent action that has started but not finished.
+
+        If ``delta`` holds values that are not JSON, the job is saved as not resumable, without its changes.
+        """
+        delta = delta or {}
+        state = {"status": status, "actions": actions, "delta": delta, "running": running, "resumable": True}
+        unserializable = non_json_paths(delta)
+        if unserializable:
+            logger.warning(
+                f"Job {name} changed values that cannot be checkpointed ({', '.join(unserializable)}); "
+                "it will run again from the start on resume"
+            )
+            state.update(delta={}, resumable=False)
+        atomic_write(self.job_file(name), _dumps(state), self.fsync)
+
+    def reset_job(self, name: str) -> None:
+        self.job_file(name).unlink(missing_ok=True)
@@ -0,0 +1,213 @@
+"""
+Compilation of workflow conditions and action code.
+
+Condition expressions and ``Action.code`` blocks are compiled to code objects once and kept in
+a process-wide LRU cache keyed by a hash of their source, so repeated executions (loop
+iterations, scheduled re-runs) skip parsing. Code without Jinja markup is compiled as is;
+templated code is rendered against the context when it runs and the rendered source is looked
+up in the same cache. Templates that reference no variables are rendered once, up front.
+
+`compile_workflow` (``Workflow.compile``) compiles every condition and code block before a
+workflow runs and reports all failures at once.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from types import CodeType
+from typing import TYPE_CHECKING, Any
+
+from jinja2 import TemplateSyntaxError, meta
+
+from dslmodel.template import render
+from dslmodel.template.cache import CacheInfo, template_cache
+from dslmodel.workflow.context import code_names
+
+if TYPE_CHECKING:
+    from dslmodel.workflow.workflow_models import Workflow
+
+DEFAULT_CODE_CACHE_SIZE = 4096
+JINJA_MARKERS = ("{{", "{%", "{#")
+FILENAMES = {"eval": "<condition>", "exec": "<action>"}
+
+
+@dataclass(frozen=True)
+class CompiledSource:
+    code: CodeType
+    # Global names the code may touch, or None if it reaches its scope dynamically
+    names: frozenset[str] | None
+
+
+class CodeCache:
+    """Thread-safe LRU cache of compiled condition and code sources with hit/miss counters."""
+
+    def __init__(self, maxsize: int = DEFAULT_CODE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._compiled: OrderedDict[tuple[str, str], CompiledSource] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, source: str, mode: str = "exec") -> CompiledSource:
+        """
+        Return the compiled ``source`` (``mode`` is "eval" for conditions, "exec" for code).
+
+        :raises SyntaxError: If the source does not compile; failures are not cached.
+        """
+        key = (mode, hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest())
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is not None:
+                self._compiled.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        code = compile(source, FILENAMES[mode], mode)
+        names = code_names(code)
+        compiled = CompiledSource(code, None if names is None else frozenset(names))
+        if self.maxsize <= 0:
+            return compiled
+
+        with self._lock:
+            self._compiled[key] = compiled
+            self._compiled.move_to_end(key)
+            while len(self._compiled) > self.maxsize:
+                self._compiled.popitem(last=False)
+        return compiled
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum number of cached sources, evicting the oldest entries if needed."""
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._compiled) > max(maxsize, 0):
+                self._compiled.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all compiled sources and reset the counters."""
+        with self._lock:
+            self._compiled.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._compiled))
+
+
+code_cache = CodeCache()
+
+
+def code_cache_info() -> CacheInfo:
+    """Return hit/miss statistics for the process-wide code cache."""
+    return code_cache.info()
+
+
+def clear_code_cache() -> None:
+    """Clear the process-wide code cache."""
+    code_cache.clear()
+
+
+def compile_source(source: str, mode: str = "exec") -> CompiledSource:
+    """Compile ``source`` through the process-wide code cache."""
+    return code_cache.get(source, mode)
+
+
+def is_templated(source: str) -> bool:
+    return any(marker in source for marker in JINJA_MARKERS)
+
+
+@lru_cache(maxsize=DEFAULT_CODE_CACHE_SIZE)
+def render_static(source: str) -> str | None:
+    """
+    Render a template that references no variables (and no globals such as ``fake``) once;
+    return None for templates that depend on the context.
+
+    :raises TemplateSyntaxError: If ``source`` is not a valid template.
+    """
+    environment = template_cache.get_environment()
+    if meta.find_undeclared_variables(environment.parse(source)):
+        return None
+    return template_cache.get_template(source).render()
+
+
+def resolve_code(source: str, context: Mapping[str, Any], mode: str = "exec") -> tuple[CompiledSource, str]:
+    """
+    Return the compiled code for ``source`` in ``context`` and the source that was compiled,
+    rendering templated sources first.
+    """
+    if is_templated(source):
+        static = render_static(source)
+        source = static if static is not None else render(source, **context)
+    return compile_source(source, mode), source
+
+
+@dataclass
+class CompileIssue:
+    """A condition or code block that failed to compile."""
+
+    job: str
+    action: str
+    field: str  # "cond", "code", "loop.over" or "loop.reduce"
+    error: str
+    lineno: int | None = None
+
+    def __str__(self) -> str:
+        line = f" (line {self.lineno})" if self.lineno else ""
+        return f"{self.job}/{self.action} {self.field}{line}: {self.error}"
+
+
+class WorkflowCompileError(ValueError):
+    """Raised by `compile_workflow` when any condition or code block fails to compile."""
+
+    def __init__(self, workflow_name: str, issues: list[CompileIssue]):
+        self.workflow_name = workflow_name
+        self.issues = issues
+        report = "\n".join(f"  - {issue}" for issue in issues)
+        super().__init__(f"Workflow '{workflow_name}' has {len(issues)} source(s) that failed to compile:\n{report}")
+
+
+def _check(source: str, mode: str) -> tuple[str, int | None] | None:
+    """Compile ``source`` into the cache; return ``(error, lineno)`` on failure."""
+    try:
+        if is_templated(source):
+            source = render_static(source)
+            if source is None:
+                # Rendered per run; only the template syntax can be checked up front
+                return None
+        compile_source(source, mode)
+    except TemplateSyntaxError as e:
+        return f"TemplateSyntaxError: {e.message}", e.lineno
+    except SyntaxError as e:
+        return f"{type(e).__name__}: {e.msg}", e.lineno
+    return None
+
+
+def compile_workflow(workflow: "Workflow", raise_errors: bool = True) -> list[CompileIssue]:
+    """
+    Compile every condition and code block of ``workflow`` into the code cache.
+
+    :param raise_errors: Raise `WorkflowCompileError` listing every failure instead of returning them.
+    :return: The sources that failed to compile.
+    """
+    issues = []
+    for job in workflow.jobs:
+        for action in job.steps:
+            loop = action.loop
+            sources = [
+                ("cond", action.cond.expr if action.cond else None, "eval"),
+                ("code", action.code, "exec"),
+                ("loop.over", loop.over if loop else None, "eval"),
+                ("loop.reduce", loop.reduce if loop else None, "eval"),
+            ]
+            for field, source, mode in sources:
+                if not source:
+                    continue
+                failure = _check(source, mode)
+                if failure is not None:
+                    issues.append(CompileIssue(job.name, action.name, field, *failure))
+    if issues and raise_errors:
+        raise WorkflowCompileError(workflow.name, issues)
+    return issues
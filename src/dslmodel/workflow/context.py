@@ -0,0 +1,175 @@
+"""
+Layered, copy-on-write workflow context.
+
+A `WorkflowContext` is a `ChainMap` of scopes: the context a job (or a direct
+``execute_action`` call) receives is wrapped as a *shared* bottom layer that is never written,
+and each job and action works in overlays stacked on top of it. Creating a scope is O(1)
+whatever the size of the values in context, so large DataFrame-derived lists are no longer deep
+copied per action and per condition.
+
+Values are copied lazily instead: before code runs, `WorkflowContext.own` deep-copies the
+mutable shared values the code references by name into the top overlay, so in-place mutation
+(``rows.append(...)``) never leaks into the caller's context or into concurrently running jobs.
+
+Writes are tracked, and only newly written values are checked for ``{{`` and rendered; a value
+is rendered once, when it is written, rather than on every update.
+"""
+import copy
+from collections import ChainMap
+from collections.abc import Iterable, Mapping
+from types import CodeType
+from typing import Any
+
+from loguru import logger
+
+from dslmodel.template import render
+
+# Values kept when a context is created or updated; anything else (modules, functions, ...) is dropped
+PLAIN_TYPES = (int, float, str, bool, list, dict, type(None))
+# Values that can be shared between scopes without copying
+IMMUTABLE_TYPES = (int, float, complex, str, bytes, bool, frozenset, type(None))
+# Builtins that reach the scope dynamically, so the names a code object uses cannot be known up front
+DYNAMIC_SCOPE_NAMES = frozenset({"globals", "locals", "vars", "eval", "exec"})
+
+_MISSING = object()
+
+
+def has_template(value: Any) -> bool:
+    """Return True if ``value`` is, or contains, a string with a ``{{`` placeholder."""
+    if isinstance(value, str):
+        return "{{" in value
+    if isinstance(value, dict):
+        return any(has_template(key) or has_template(item) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return any(has_template(item) for item in value)
+    return False
+
+
+def code_names(code: CodeType) -> set[str] | None:
+    """
+    Global names ``code`` (and any nested function or comprehension) may read or write.
+
+    Returns None when the code can reach its scope dynamically (``globals()``, ``eval``, ...).
+    """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            nested = code_names(const)
+            if nested is None:
+                return None
+            names |= nested
+    return None if names & DYNAMIC_SCOPE_NAMES else names
+
+
+class WorkflowContext(ChainMap):
+    """
+    Chained workflow scopes with copy-on-write semantics.
+
+    ``maps[-shared:]`` are shared layers owned by the caller and never written; the layers above
+    them belong to this context and its descendants. Writes go to ``maps[0]`` and are recorded in
+    ``dirty`` until `render_dirty` renders them.
+    """
+
+    def __init__(self, *maps: Mapping[str, Any], shared: int = 0):
+        super().__init__(*maps)
+        self.shared = shared
+        self.dirty: dict[str, None] = {}
+
+    @classmethod
+    def wrap(cls, data: Mapping[str, Any] | None) -> "WorkflowContext":
+        """
+        Return ``data`` as a context without copying its values.
+
+        A plain mapping becomes the shared bottom layer, keeping only plain-data values (see
+        `PLAIN_TYPES`); its templated values are rendered once, into a new top layer.
+        """
+        if isinstance(data, cls):
+            return data
+        base = {
+            key: value
+            for key, value in (data or {}).items()
+            if key != "__builtins__" and isinstance(value, PLAIN_TYPES)
+        }
+        context = cls({}, base, shared=1)
+        context.dirty.update(dict.fromkeys(key for key, value in base.items() if has_template(value)))
+        context.render_dirty()
+        return context
+
+    @classmethod
+    def view(cls, data: Mapping[str, Any]) -> "WorkflowContext":
+        """Read-only scope over ``data`` (no filtering or rendering), e.g. for evaluating a condition."""
+        if isinstance(data, cls):
+            return data.new_child()
+        return cls({}, data, shared=1)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.maps[0][key] = value
+        self.dirty[key] = None
+
+    def new_child(self, m: dict[str, Any] | None = None) -> "WorkflowContext":
+        """A new overlay on top of this context; writes to it do not affect this context."""
+        return self.__class__({} if m is None else m, *self.maps, shared=self.shared)
+
+    def copy(self) -> "WorkflowContext":
+        """Copy of the top layer; lower layers are shared."""
+        return self.__class__(self.maps[0].copy(), *self.maps[1:], shared=self.shared)
+
+    __copy__ = copy
+
+    @property
+    def owned_layers(self) -> list[dict[str, Any]]:
+        return self.maps[: len(self.maps) - self.shared]
+
+    def own(self, names: Iterable[str] | None = None) -> None:
+        """
+        Copy the mutable values of ``names`` (all names if None) that live in shared layers into
+        the top layer, so code can mutate them in place without affecting the shared layers.
+        """
+        owned = self.owned_layers
+        for name in self if names is None else names:
+            if any(name in layer for layer in owned):
+                continue
+            value = self.get(name, _MISSING)
+            if value is not _MISSING and not isinstance(value, IMMUTABLE_TYPES):
+                self.maps[0][name] = copy.deepcopy(value)
+
+    def absorb(self, scope: Mapping[str, Any]) -> None:
+        """Write the names ``scope`` (e.g. the globals of executed code) added or rebound."""
+        for key, value in scope.items():
+            if key != "__builtins__" and self.get(key, _MISSING) is not value:
+                self[key] = value
+
+    def render_dirty(self) -> None:
+        """Render the templated values written since the last call and convert them to native types."""
+        for key in self.dirty:
+            value = self[key]
+            if not has_template(value):
+                continue
+            rendered = render(value if isinstance(value, str) else str(value), **self)
+            try:
+                rendered = eval(rendered)
+            except Exception as e:
+                logger.error(f"Error converting rendered value to native Python type: {e}")
+            self.maps[0][key] = rendered
+        self.dirty.clear()
+
+    def compact(self) -> "WorkflowContext":
+        """Merge the owned layers into one so lookups stay O(1) as scopes are stacked."""
+        owned = len(self.maps) - self.shared
+        if owned > 1:
+            merged: dict[str, Any] = {}
+            for layer in reversed(self.maps[:owned]):
+                merged.update(layer)
+            self.maps[:owned] = [merged]
+        return self
+
+    def changes(self) -> dict[str, Any]:
+        """The plain-data values written in the owned layers, i.e. this context's changes to the shared ones."""
+        merged: dict[str, Any] = {}
+        for layer in reversed(self.owned_layers):
+            merged.update(layer)
+        return {key: value for key, value in merged.items() if isinstance(value, PLAIN_TYPES)}
+
+    def to_dict(self) -> dict[str, Any]:
+        """Flatten into a plain dict (values are not copied)."""
+        return dict(self)
@@ -0,0 +1,280 @@
+"""
+Dependency-graph execution of workflow jobs.
+
+`DAGScheduler` starts every job as soon as the jobs in its ``depends_on`` have finished, so
+independent jobs run concurrently. Each job receives the workflow context plus the changes made
+by its (transitive) dependencies; the changes of all jobs are merged in topological order, which
+makes the final context independent of completion order.
+
+Jobs run on a thread pool by default. ``Job.runner`` selects the backend through
+`RUNNER_BACKENDS`, e.g. ``runner: process`` runs a CPU-bound job in a process pool (its actions
+and context must then be picklable).
+
+``Job.max_retries`` and ``Job.retry_delay_seconds`` retry a failing job; jobs that declare
+``max_retries`` treat any failing action as a job failure. ``Job.sla_seconds`` is checked while
+the job runs and a miss is logged as soon as the deadline passes. A job that still fails
+contributes no changes; its dependents run anyway, as they did under sequential execution.
+
+With a `WorkflowCheckpoint`, jobs recorded as succeeded are skipped (their changes are restored)
+and each finished job is recorded.
+"""
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from collections.abc import Mapping
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+
+from dslmodel.workflow.checkpoint import WorkflowCheckpoint
+from dslmodel.workflow.context import PLAIN_TYPES, WorkflowContext
+from dslmodel.workflow.workflow_models import Job, Workflow
+
+# Job.runner values mapped to executor backends; unlisted runners ("local", "python", ...) use threads
+RUNNER_BACKENDS: dict[str, str] = {
+    "thread": "thread",
+    "process": "process",
+}
+
+_MISSING = object()
+
+
+@dataclass
+class JobResult:
+    """Outcome of one job in a `DAGScheduler` run."""
+
+    name: str
+    status: str = "pending"  # pending | running | succeeded | failed
+    attempts: int = 0
+    delta: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    started_at: float | None = None
+    duration_s: float = 0.0
+    sla_missed: bool = False
+
+
+def context_delta(before: Mapping[str, Any], after: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Plain-data keys that a job added or changed.
+
+    Only plain data crosses job boundaries, which also keeps deltas picklable for process-pool jobs.
+    Values the job never wrote are still the caller's objects, so identity is checked first. For a
+    `WorkflowContext` only the layers the job wrote are compared, not the shared ones below them.
+    """
+    delta = {}
+    items = after.changes().items() if isinstance(after, WorkflowContext) else after.items()
+    for key, value in items:
+        previous = before.get(key, _MISSING)
+        if previous is not value and isinstance(value, PLAIN_TYPES) and previous != value:
+            delta[key] = value
+    return delta
+
+
+def run_job(
+    job: Job, context: dict[str, Any], checkpoint: WorkflowCheckpoint | None = None, rerun_interrupted: bool = False
+) -> tuple[dict[str, Any], int, str | None]:
+    """
+    Run ``job`` with retries in the calling worker and return ``(delta, attempts, error)``.
+
+    A retry starts the job over, discarding its checkpointed progress.
+    Module-level so it can be sent to a process pool.
+    """
+    from dslmodel.workflow.workflow_executor import execute_job
+
+    strict = job.max_retries is not None
+    attempts = 0
+    while True:
+        attempts += 1
+        if attempts > 1 and checkpoint is not None:
+            checkpoint.reset_job(job.name)
+        try:
+            output = execute_job(
+                job, context, raise_errors=strict, checkpoint=checkpoint, rerun_interrupted=rerun_interrupted
+            )
+            return context_delta(context, output), attempts, None
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if attempts > (job.max_retries or 0):
+                return {}, attempts, error
+            delay = job.retry_delay_seconds or 0
+            logger.warning(f"Job {job.name} attempt {attempts} failed ({error}); retrying in {delay}s")
+            time.sleep(delay)
+
+
+class DAGScheduler:
+    """
+    Runs a workflow's jobs in dependency order with bounded concurrency.
+
+    :param workflow: The workflow whose jobs to run. Jobs are topologically sorted in place.
+    :param max_workers: Maximum concurrently running jobs per backend (default: one per job, up to 32).
+    :param checkpoint: Saves each job's progress; jobs it records as succeeded are not run again.
+    :param rerun_interrupted: Allow re-running interrupted non-idempotent actions when resuming.
+    """
+
+    def __init__(
+        self,
+        workflow: Workflow,
+        max_workers: int | None = None,
+        checkpoint: WorkflowCheckpoint | None = None,
+        rerun_interrupted: bool = False,
+    ):
+        workflow.topological_sort()
+        self.workflow = workflow
+        self.jobs = {job.name: job for job in workflow.jobs}
+        self.order = [job.name for job in workflow.jobs]
+        self.position = {name: index for index, name in enumerate(self.order)}
+        self.max_workers = max_workers or max(1, min(32, len(self.order)))
+        self.dependents: dict[str, list[str]] = {name: [] for name in self.order}
+        self.ancestors: dict[str, set[str]] = {}
+        for name in self.order:
+            dependencies = self.jobs[name].depends_on or []
+            self.ancestors[name] = set(dependencies).union(*(self.ancestors[dep] for dep in dependencies))
+            for dependency in dependencies:
+                self.dependents[dependency].append(name)
+        self.results: dict[str, JobResult] = {name: JobResult(name) for name in self.order}
+        self.checkpoint = checkpoint
+        self.rerun_interrupted = rerun_interrupted
+
+    def restore(self) -> set[str]:
+        """
+        Load checkpointed job states; return the jobs that already succeeded.
+
+        Jobs whose changes could not be checkpointed are reset to run again from the start.
+
+        :raises CheckpointError: If an unfinished job was interrupted in a non-idempotent action,
+            or rerunning a job would repeat a completed non-idempotent action.
+        """
+        from dslmodel.workflow.workflow_executor import check_interrupted, check_rerun
+
+        finished = set()
+        for name in self.order:
+            state = self.checkpoint.load_job(name)
+            if state is None:
+                continue
+            check_interrupted(name, state, self.rerun_interrupted)
+            if not state.get("resumable", True):
+                check_rerun(self.jobs[name], state, self.rerun_interrupted)
+                self.checkpoint.reset_job(name)
+            elif state["status"] == "succeeded":
+                result = self.results[name]
+                result.status, result.delta = "succeeded", state["delta"]
+                finished.add(name)
+        if finished:
+            logger.info(f"Skipping {len(finished)} job(s) completed in the checkpoint: {', '.join(sorted(finished))}")
+        return finished
+
+    def backend(self, job: Job) -> str:
+        return RUNNER_BACKENDS.get(job.runner, "thread")
+
+    def job_context(self, name: str, base: WorkflowContext) -> WorkflowContext:
+        """
+        The base context plus the changes of every ancestor of ``name``, applied in topological order.
+
+        The ancestors' changes are merged into one layer over the shared ``base``, so building a
+        job's context costs the size of those changes, not of the whole context.
+        """
+        changes: dict[str, Any] = {}
+        for ancestor in sorted(self.ancestors[name], key=self.position.__getitem__):
+            changes.update(self.results[ancestor].delta)
+        layers = [changes, *base.maps] if changes else base.maps
+        return WorkflowContext({}, *layers, shared=len(layers))
+
+    def merged_context(self, base: Mapping[str, Any]) -> dict[str, Any]:
+        context = dict(base)
+        for name in self.order:
+            context.update(self.results[name].delta)
+        return context
+
+    def _executor(self, executors: dict[str, Executor], backend: str) -> Executor:
+        if backend not in executors:
+            if backend == "process":
+                executors[backend] = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            else:
+                executors[backend] = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix=f"workflow-{self.workflow.name}"
+                )
+        return executors[backend]
+
+    def _check_slas(self, running: dict[Future, str]) -> float | None:
+        """Log SLA misses of running jobs; return seconds until the next SLA deadline, if any."""
+        now = time.monotonic()
+        next_deadline = None
+        for name in running.values():
+            job, result = self.jobs[name], self.results[name]
+            if job.sla_seconds is None or result.sla_missed:
+                continue
+            remaining = result.started_at + job.sla_seconds - now
+            if remaining <= 0:
+                result.sla_missed = True
+                logger.warning(f"Job {name} missed its SLA of {job.sla_seconds}s")
+            elif next_deadline is None or remaining < next_deadline:
+                next_deadline = remaining
+        return next_deadline
+
+    def run(self, context: dict[str, Any]) -> dict[str, Any]:
+        """Run all jobs and return ``context`` merged with every job's changes."""
+        # Filtered and rendered once; every job's context is layered over it
+        context = WorkflowContext.wrap(context)
+        finished = self.restore() if self.checkpoint is not None else set()
+        waiting = {
+            name: len([dep for dep in self.jobs[name].depends_on or [] if dep not in finished])
+            for name in self.order
+        }
+        ready = [name for name in self.order if waiting[name] == 0 and name not in finished]
+        running: dict[Future, str] = {}
+        executors: dict[str, Executor] = {}
+
+        try:
+            while ready or running:
+                for name in ready:
+                    job, result = self.jobs[name], self.results[name]
+                    logger.info(f"Starting execution of job: {name}")
+                    result.status, result.started_at = "running", time.monotonic()
+                    backend = self.backend(job)
+                    # Thread jobs run in a copy of the caller's context variables (the workflow's event tags)
+                    call = (run_job,) if backend == "process" else (copy_context().run, run_job)
+                    future = self._executor(executors, backend).submit(
+                        *call, job, self.job_context(name, context), self.checkpoint, self.rerun_interrupted
+                    )
+                    running[future] = name
+                ready = []
+
+                done, _ = wait(running, timeout=self._check_slas(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    self._finish(name, future)
+                    for dependent in self.dependents[name]:
+                        waiting[dependent] -= 1
+                        if waiting[dependent] == 0:
+                            ready.append(dependent)
+                # Keep starts in topological order when several jobs become ready together
+                ready.sort(key=self.position.__getitem__)
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        return self.merged_context(context)
+
+    def _finish(self, name: str, future: Future) -> None:
+        job, result = self.jobs[name], self.results[name]
+        result.duration_s = time.monotonic() - result.started_at
+        try:
+            result.delta, result.attempts, result.error = future.result()
+        except Exception as e:  # e.g. the job could not be pickled for a process pool
+            result.attempts, result.error = max(result.attempts, 1), f"{type(e).__name__}: {e}"
+        if job.sla_seconds is not None and result.duration_s > job.sla_seconds and not result.sla_missed:
+            result.sla_missed = True
+            logger.warning(f"Job {name} missed its SLA of {job.sla_seconds}s")
+
+        if result.error is None:
+            result.status = "succeeded"
+            logger.info(f"Finished execution of job: {name}")
+            if self.checkpoint is not None:
+                self.checkpoint.save_job(name, "succeeded", len(job.steps), result.delta)
+        else:
+            result.status = "failed"
+            logger.error(f"Error executing job {name}: {result.error}")
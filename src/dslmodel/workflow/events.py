@@ -0,0 +1,204 @@
+"""
+Structured execution events for workflows.
+
+The executor emits a `WorkflowEvent` at workflow, job and action start and end (with
+durations and status) and for every condition outcome. Events go to the sinks subscribed to
+`workflow_events`; with no sinks, emitting is a single attribute check, and nothing is ever
+formatted unless a sink asks for it. Built-in sinks:
+
+- `EventBuffer`: bounded in-memory ring buffer (``execute_workflow(verbose=True)`` uses one per run).
+- `StepMetrics`: per-step count, error count, total and max duration; the process-wide
+  `step_metrics` instance is subscribed by default.
+- `LoguruSink`: forwards events to loguru at a chosen level.
+
+Events carry the run id, workflow and job of the code that emitted them (tracked with context
+variables, so they follow jobs and actions onto worker threads). Jobs on a process pool emit
+their events in the worker process, where they are not collected.
+"""
+import contextvars
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+
+from loguru import logger
+
+current_run: contextvars.ContextVar[str | None] = contextvars.ContextVar("workflow_run", default=None)
+current_workflow: contextvars.ContextVar[str | None] = contextvars.ContextVar("workflow_name", default=None)
+current_job: contextvars.ContextVar[str | None] = contextvars.ContextVar("workflow_job", default=None)
+
+
+@dataclass(slots=True)
+class WorkflowEvent:
+    """One execution event; ``kind`` is e.g. ``job_start``, ``action_end`` or ``condition``."""
+
+    kind: str
+    run_id: str | None = None
+    workflow: str | None = None
+    job: str | None = None
+    action: str | None = None
+    status: str | None = None  # ok | error | skipped, or true | false for conditions
+    duration_s: float | None = None
+    data: dict[str, Any] | None = None
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def step(self) -> str:
+        return "/".join(part for part in (self.workflow, self.job, self.action) if part)
+
+    def __str__(self) -> str:
+        parts = [self.kind, self.step]
+        if self.status:
+            parts.append(self.status)
+        if self.duration_s is not None:
+            parts.append(f"{self.duration_s * 1000:.1f}ms")
+        if self.data:
+            parts.append(" ".join(f"{key}={value!r}" for key, value in self.data.items()))
+        return " ".join(parts)
+
+
+Sink = Callable[[WorkflowEvent], None]
+
+
+class WorkflowEvents:
+    """Fan-out of workflow events to subscribed sinks."""
+
+    def __init__(self):
+        self._sinks: tuple[Sink, ...] = ()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._sinks)
+
+    def subscribe(self, sink: Sink) -> Sink:
+        with self._lock:
+            self._sinks = (*self._sinks, sink)
+        return sink
+
+    def unsubscribe(self, sink: Sink) -> None:
+        with self._lock:
+            self._sinks = tuple(existing for existing in self._sinks if existing is not sink)
+
+    @contextmanager
+    def subscribed(self, sink: Sink) -> Iterator[Sink]:
+        self.subscribe(sink)
+        try:
+            yield sink
+        finally:
+            self.unsubscribe(sink)
+
+    def emit(self, kind: str, **fields: Any) -> None:
+        sinks = self._sinks
+        if not sinks:
+            return
+        fields.setdefault("job", current_job.get())
+        event = WorkflowEvent(kind, current_run.get(), current_workflow.get(), **fields)
+        for sink in sinks:
+            try:
+                sink(event)
+            except Exception as e:
+                logger.warning(f"Workflow event sink {sink!r} failed: {e}")
+
+
+workflow_events = WorkflowEvents()
+
+
+@contextmanager
+def workflow_run(workflow_name: str) -> Iterator[str]:
+    """Tag events emitted inside the block with a new run id and ``workflow_name``."""
+    run_id = uuid.uuid4().hex[:12]
+    run_token, name_token = current_run.set(run_id), current_workflow.set(workflow_name)
+    try:
+        yield run_id
+    finally:
+        current_run.reset(run_token)
+        current_workflow.reset(name_token)
+
+
+@contextmanager
+def job_scope(job_name: str) -> Iterator[None]:
+    token = current_job.set(job_name)
+    try:
+        yield
+    finally:
+        current_job.reset(token)
+
+
+class EventBuffer:
+    """
+    Ring buffer keeping the last ``maxlen`` events, optionally only those of one run.
+
+    :param maxlen: Maximum number of events kept (None for unbounded).
+    :param run_id: Keep only events of this run.
+    """
+
+    def __init__(self, maxlen: int | None = 10_000, run_id: str | None = None):
+        self.events: deque[WorkflowEvent] = deque(maxlen=maxlen)
+        self.run_id = run_id
+
+    def __call__(self, event: WorkflowEvent) -> None:
+        if self.run_id is None or event.run_id == self.run_id:
+            self.events.append(event)
+
+    def messages(self) -> list[str]:
+        """The buffered events formatted as text lines."""
+        return [str(event) for event in self.events]
+
+
+class StepMetrics:
+    """Per-step execution counts, errors and durations, keyed by ``workflow/job[/action]``."""
+
+    def __init__(self):
+        self.counts: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.total_s: Counter[str] = Counter()
+        self.max_s: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: WorkflowEvent) -> None:
+        if event.duration_s is None or not event.kind.endswith("_end"):
+            return
+        step = event.step
+        with self._lock:
+            self.counts[step] += 1
+            self.total_s[step] += event.duration_s
+            self.max_s[step] = max(self.max_s.get(step, 0.0), event.duration_s)
+            if event.status == "error":
+                self.errors[step] += 1
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {
+                step: {
+                    "count": count,
+                    "errors": self.errors[step],
+                    "total_s": self.total_s[step],
+                    "mean_s": self.total_s[step] / count,
+                    "max_s": self.max_s[step],
+                }
+                for step, count in self.counts.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts.clear()
+            self.errors.clear()
+            self.total_s.clear()
+            self.max_s.clear()
+
+
+class LoguruSink:
+    """Forward events to loguru at ``level``; the event is only formatted if the level is enabled."""
+
+    def __init__(self, level: str = "DEBUG"):
+        self.level = level
+
+    def __call__(self, event: WorkflowEvent) -> None:
+        logger.opt(depth=2).log(self.level, "{}", event)
+
+
+step_metrics = workflow_events.subscribe(StepMetrics())
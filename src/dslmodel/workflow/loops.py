@@ -0,0 +1,132 @@
+"""
+Data-parallel execution of looping actions (``Action.loop``).
+
+`execute_loop` evaluates ``loop.over`` once, splits the items into chunks and runs the action
+body (its code, shell command or callable) for every item, sequentially or on a thread or
+process pool. Each iteration runs in its own copy-on-write scope over the job's context, so
+iterations cannot see or clobber each other's writes; the value of ``loop.collect`` (default:
+the loop variable) after each iteration is gathered in input order and stored under
+``loop.into``, optionally combined by ``loop.reduce`` first.
+
+Process-pool iterations receive only the context names the body's code references (or all
+plain values for shell and callable bodies), so the body and those values must be picklable.
+"""
+import math
+import multiprocessing
+import os
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from loguru import logger
+
+from dslmodel.workflow.compiler import compile_source
+from dslmodel.workflow.context import PLAIN_TYPES, WorkflowContext
+from dslmodel.workflow.workflow_models import Action
+
+LOOP_BACKENDS = ("sequential", "thread", "process")
+# Chunks per worker when loop.chunk_size is not set; smooths out uneven item costs
+CHUNKS_PER_WORKER = 4
+
+
+def evaluate_expression(expr: str, context: Mapping[str, Any], **extra: Any) -> Any:
+    """Evaluate a loop expression against ``context`` (read-only) and ``extra`` names."""
+    scope = WorkflowContext.view(context)
+    if extra:
+        scope = scope.new_child(extra)
+    return eval(compile_source(expr, "eval").code, {}, scope)
+
+
+def iteration_scope(context: WorkflowContext, var: str, item: Any) -> WorkflowContext:
+    """A scope binding ``var`` to ``item`` in which all of ``context`` (and the item) is copy-on-write."""
+    return WorkflowContext({}, {var: item}, *context.maps, shared=len(context.maps) + 1)
+
+
+def run_chunk(
+    body: Action, context: Mapping[str, Any], var: str, collect: str, items: list, raise_errors: bool = False
+) -> list:
+    """
+    Run ``body`` once per item and return the collected results.
+
+    Module-level so it can be sent to a process pool.
+    """
+    from dslmodel.workflow.workflow_executor import execute_action
+
+    if not isinstance(context, WorkflowContext):
+        context = WorkflowContext.view(context)
+    results = []
+    for item in items:
+        output = execute_action(body, iteration_scope(context, var, item), raise_errors=raise_errors)
+        results.append(output.get(collect))
+    return results
+
+
+def chunked(items: list, size: int) -> list[list]:
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def _chunk_size(loop, items: int, workers: int) -> int:
+    if loop.chunk_size:
+        return loop.chunk_size
+    return max(1, math.ceil(items / (workers * CHUNKS_PER_WORKER)))
+
+
+def _process_context(body: Action, context: WorkflowContext) -> dict[str, Any]:
+    """The part of ``context`` a process-pool iteration needs, as a plain dict."""
+    names = compile_source(body.code).names if body.code and not (body.shell or body.callable) else None
+    if names is None:
+        return {key: value for key, value in context.items() if isinstance(value, PLAIN_TYPES)}
+    return {name: context[name] for name in names if name in context}
+
+
+def _workers(loop) -> int:
+    if loop.max_workers:
+        return loop.max_workers
+    # The executors' own defaults
+    cpus = os.cpu_count() or 1
+    return cpus if loop.backend == "process" else min(32, cpus + 4)
+
+
+def _executor(backend: str, max_workers: int) -> Executor:
+    if backend == "process":
+        return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="workflow-loop")
+
+
+def execute_loop(action: Action, context: Mapping[str, Any], raise_errors: bool = False) -> WorkflowContext:
+    """
+    Run a looping action and return the context updated with its results.
+
+    :raises ValueError: If ``loop.backend`` is not one of `LOOP_BACKENDS`.
+    """
+    from dslmodel.workflow.workflow_executor import update_context
+
+    loop = action.loop
+    if loop.backend not in LOOP_BACKENDS:
+        raise ValueError(f"Unknown loop backend '{loop.backend}'. Supported backends are {', '.join(LOOP_BACKENDS)}.")
+
+    context = WorkflowContext.wrap(context)
+    items = list(evaluate_expression(loop.over, context))
+    body = action.model_copy(update={"loop": None, "cond": None})
+    collect = loop.collect or loop.var
+    logger.info(f"Looping action '{action.name}' over {len(items)} item(s) ({loop.backend})")
+
+    if loop.backend == "sequential" or len(items) <= 1:
+        results = run_chunk(body, context, loop.var, collect, items, raise_errors)
+    else:
+        workers = _workers(loop)
+        with _executor(loop.backend, workers) as executor:
+            shared = _process_context(body, context) if loop.backend == "process" else context
+            chunks = chunked(items, _chunk_size(loop, len(items), workers))
+            futures = [
+                executor.submit(run_chunk, body, shared, loop.var, collect, chunk, raise_errors)
+                for chunk in chunks
+            ]
+            results = [result for future in futures for result in future.result()]
+
+    if not loop.into:
+        return context
+    value = results
+    if loop.reduce:
+        value = evaluate_expression(loop.reduce, context, results=results)
+    return update_context(context, {loop.into: value})
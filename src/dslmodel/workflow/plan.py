@@ -0,0 +1,152 @@
+"""
+Import resolution and immutable execution plans for workflows.
+
+`plan_workflow` resolves a workflow's ``imports`` once into a `WorkflowPlan`: the flattened,
+topologically sorted jobs of the workflow and everything it imports, the merged context, and
+the compile report of its conditions and code. Executing or scheduling a plan reuses all of
+that across runs; a plan notices when an imported file changes (`WorkflowPlan.is_stale`) and
+`execute_workflow` re-plans before running it.
+
+Imported files are parsed through a process-wide `ImportCache` keyed by path and modification
+time, import cycles raise `ImportCycleError`, and a file imported more than once (e.g. through
+two parents) contributes its jobs once. Relative import paths are resolved against the
+importing file's directory, falling back to the working directory.
+"""
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from loguru import logger
+
+from dslmodel.workflow.compiler import CompileIssue, compile_workflow
+from dslmodel.workflow.workflow_models import Job, Workflow
+
+
+class ImportCycleError(ValueError):
+    """Raised when workflow imports form a cycle."""
+
+    def __init__(self, chain: list[Path]):
+        self.chain = chain
+        super().__init__("Workflow import cycle: " + " -> ".join(str(path) for path in chain))
+
+
+class ImportCache:
+    """Thread-safe cache of parsed workflow files, invalidated when a file's mtime or size changes."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._workflows: dict[Path, tuple[tuple[int, int], Workflow]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def signature(path: Path) -> tuple[int, int]:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self, path: Path) -> Workflow:
+        """Return the workflow in ``path``, parsing it only if it changed since it was last loaded."""
+        signature = self.signature(path)
+        with self._lock:
+            cached = self._workflows.get(path)
+            if cached is not None and cached[0] == signature:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        workflow = Workflow.from_yaml(file_path=path)
+        with self._lock:
+            self._workflows[path] = (signature, workflow)
+        return workflow
+
+    def clear(self) -> None:
+        with self._lock:
+            self._workflows.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+import_cache = ImportCache()
+
+
+def resolve_import(import_path: str, importer: Path | None) -> Path:
+    path = Path(os.path.expanduser(import_path))
+    if not path.is_absolute() and importer is not None and (importer.parent / path).exists():
+        path = importer.parent / path
+    return path.resolve()
+
+
+@dataclass(frozen=True)
+class WorkflowPlan:
+    """Flattened, validated and topologically sorted form of a workflow; shared across runs."""
+
+    workflow: Workflow
+    jobs: tuple[Job, ...]
+    context: Mapping[str, Any]
+    # (path, (mtime_ns, size)) of every imported file
+    sources: tuple[tuple[Path, tuple[int, int]], ...] = ()
+    issues: tuple[CompileIssue, ...] = field(default=())
+
+    @property
+    def name(self) -> str:
+        return self.workflow.name
+
+    def is_stale(self) -> bool:
+        """True if an imported file changed or disappeared since the plan was built."""
+        for path, signature in self.sources:
+            try:
+                if ImportCache.signature(path) != signature:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def to_workflow(self) -> Workflow:
+        """A fresh, import-free `Workflow` for one run (jobs are shared, not copied)."""
+        return self.workflow.model_copy(update={"jobs": list(self.jobs), "context": dict(self.context), "imports": []})
+
+
+def plan_workflow(workflow: Workflow, cache: ImportCache | None = None) -> WorkflowPlan:
+    """
+    Resolve ``workflow``'s imports, sort its jobs and compile its sources into a `WorkflowPlan`.
+
+    Imported jobs follow the importing workflow's jobs in depth-first import order, and
+    imported contexts are applied over the workflow's context in the same order.
+
+    :raises ImportCycleError: If the imports form a cycle.
+    :raises ValueError: If the job dependencies form a cycle.
+    """
+    cache = cache or import_cache
+    jobs = list(workflow.jobs)
+    context = dict(workflow.context or {})
+    sources: dict[Path, tuple[int, int]] = {}
+
+    def visit(imports: list[str] | None, importer: Path | None, stack: list[Path]) -> None:
+        for import_path in imports or []:
+            path = resolve_import(import_path, importer)
+            if path in stack:
+                raise ImportCycleError(stack[stack.index(path):] + [path])
+            if path in sources:
+                continue
+            imported = cache.load(path)
+            sources[path] = ImportCache.signature(path)
+            jobs.extend(imported.jobs)
+            context.update(imported.context or {})
+            visit(imported.imports, path, stack + [path])
+
+    visit(workflow.imports, None, [])
+
+    flattened = workflow.model_copy(update={"jobs": jobs, "context": context, "imports": []})
+    flattened.topological_sort()
+    issues = compile_workflow(flattened, raise_errors=False)
+    if sources:
+        logger.debug(f"Resolved {len(sources)} import(s) for workflow {workflow.name}")
+    return WorkflowPlan(
+        workflow=workflow,
+        jobs=tuple(flattened.jobs),
+        context=MappingProxyType(context),
+        sources=tuple(sources.items()),
+        issues=tuple(issues),
+    )
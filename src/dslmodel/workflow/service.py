@@ -0,0 +1,306 @@
+"""
+Long-running scheduler service for a directory of workflows.
+
+`WorkflowService` loads every workflow file in a directory and registers all their
+``schedules`` on one shared APScheduler `AsyncIOScheduler`. Triggers only dispatch: runs
+execute on one bounded thread pool owned by the service, so hundreds of scheduled workflows
+share a fixed number of workers instead of each starting its own scheduler.
+
+- **Hot reload**: the directory is rescanned every ``reload_interval`` seconds. Files whose
+  modification time or size changed (or whose imports changed) are re-planned and their
+  triggers replaced; deleted files are unscheduled. A file that fails to load keeps its previous
+  version scheduled.
+- **Concurrency**: a workflow's ``max_concurrent_runs`` bounds its queued plus running runs;
+  triggers beyond it are recorded as ``skipped``.
+- **Misfires**: a run starting more than ``misfire_grace_seconds`` (per workflow, or the
+  service default) late is recorded as ``missed``; with ``coalesce`` overdue runs collapse into one.
+- **Introspection**: `WorkflowService.history` lists recent runs and
+  `WorkflowService.status` reports queue depth, running runs and next fire times.
+
+Run it with ``python -m dslmodel.workflow.service <directory>``.
+"""
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from os import PathLike
+from pathlib import Path
+from typing import Any
+
+import pytz
+from apscheduler.events import EVENT_JOB_MISSED, JobExecutionEvent
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from loguru import logger
+
+from dslmodel.workflow.plan import ImportCache, WorkflowPlan, import_cache, plan_workflow
+from dslmodel.workflow.workflow_executor import build_trigger, execute_workflow
+
+RELOAD_JOB_ID = "workflow-service:reload"
+
+
+@dataclass
+class RunRecord:
+    """One triggered run of a workflow; ``status`` is queued, running, succeeded, failed, skipped or missed."""
+
+    workflow: str
+    trigger: str
+    status: str = "queued"
+    queued_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+
+    @property
+    def duration_s(self) -> float | None:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+@dataclass
+class ScheduledWorkflow:
+    """A loaded workflow file and the scheduler jobs registered for it."""
+
+    path: Path
+    plan: WorkflowPlan
+    job_ids: list[str]
+
+    @property
+    def name(self) -> str:
+        return self.plan.name
+
+
+class WorkflowService:
+    """
+    Schedules every workflow in ``directory`` on one scheduler and one bounded worker pool.
+
+    :param directory: Directory scanned for workflow files.
+    :param pattern: Glob selecting the workflow files.
+    :param max_workers: Workflow runs executing at once across all workflows.
+    :param misfire_grace_seconds: Default lateness after which a scheduled run is dropped.
+    :param reload_interval: Seconds between directory rescans while running (None disables).
+    :param history_size: Number of runs kept in `history`.
+    """
+
+    def __init__(
+        self,
+        directory: str | PathLike,
+        pattern: str = "*.yaml",
+        max_workers: int = 8,
+        misfire_grace_seconds: int = 60,
+        reload_interval: float | None = 5.0,
+        history_size: int = 1000,
+        cache: ImportCache | None = None,
+    ):
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.misfire_grace_seconds = misfire_grace_seconds
+        self.reload_interval = reload_interval
+        self.cache = cache or import_cache
+        self.scheduler = AsyncIOScheduler(timezone=pytz.UTC)
+        self.scheduler.add_listener(self._on_missed, EVENT_JOB_MISSED)
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="workflow-service")
+        self.workflows: dict[str, ScheduledWorkflow] = {}
+        self._history: deque[RunRecord] = deque(maxlen=history_size)
+        self._active: Counter[str] = Counter()  # queued + running runs per workflow
+        self._queued = 0
+        self._running = 0
+        self._lock = threading.Lock()
+
+    # Loading
+
+    def reload(self) -> dict[str, list[str]]:
+        """
+        Rescan the directory and update the schedule for added, changed and removed files.
+
+        :return: Workflow names by change: ``added``, ``updated`` and ``removed``.
+        """
+        changes: dict[str, list[str]] = {"added": [], "updated": [], "removed": []}
+        seen: set[str] = set()
+        for path in sorted(self.directory.glob(self.pattern)):
+            path = path.resolve()
+            try:
+                workflow = self.cache.load(path)
+                current = self.workflows.get(workflow.name)
+                if current is not None and current.path != path:
+                    logger.error(f"Workflow '{workflow.name}' in {path} is already loaded from {current.path}; ignoring")
+                    continue
+                seen.add(workflow.name)
+                if current is not None and current.plan.workflow is workflow and not current.plan.is_stale():
+                    continue
+                plan = plan_workflow(workflow, self.cache)
+                if plan.issues:
+                    logger.error(f"Workflow '{plan.name}' in {path} has compile errors; its failing steps will error")
+            except Exception as e:
+                logger.error(f"Failed to load workflow {path}: {e}")
+                seen.update(entry.name for entry in self.workflows.values() if entry.path == path)
+                continue
+            self._unschedule(plan.name)
+            self.workflows[plan.name] = ScheduledWorkflow(path, plan, self._schedule(plan))
+            changes["updated" if current is not None else "added"].append(plan.name)
+
+        for name in set(self.workflows) - seen:
+            self._unschedule(name)
+            del self.workflows[name]
+            changes["removed"].append(name)
+
+        if any(changes.values()):
+            logger.info(f"Reloaded workflows from {self.directory}: {changes}")
+        return changes
+
+    def _schedule(self, plan: WorkflowPlan) -> list[str]:
+        workflow = plan.workflow
+        grace = workflow.misfire_grace_seconds
+        job_ids = []
+        for index, schedule in enumerate(workflow.schedules):
+            try:
+                trigger = build_trigger(schedule)
+            except (TypeError, ValueError) as e:
+                logger.error(f"Invalid schedule {index} of workflow '{workflow.name}': {e}")
+                continue
+            job = self.scheduler.add_job(
+                self._dispatch,
+                trigger,
+                args=[workflow.name, f"schedule:{index}"],
+                id=f"{workflow.name}:{index}",
+                name=workflow.name,
+                coalesce=workflow.coalesce,
+                misfire_grace_time=grace if grace is not None else self.misfire_grace_seconds,
+                max_instances=1,
+                replace_existing=True,
+            )
+            job_ids.append(job.id)
+        return job_ids
+
+    def _unschedule(self, name: str) -> None:
+        entry = self.workflows.get(name)
+        for job_id in entry.job_ids if entry else ():
+            if self.scheduler.get_job(job_id) is not None:
+                self.scheduler.remove_job(job_id)
+
+    # Running
+
+    # Scheduler jobs are coroutines, so dispatching and reloading happen on the event loop thread
+
+    async def _dispatch(self, name: str, trigger: str) -> None:
+        self.run_now(name, trigger)
+
+    async def _reload(self) -> None:
+        self.reload()
+
+    def run_now(self, name: str, trigger: str = "manual") -> Future | None:
+        """
+        Queue a run of workflow ``name`` on the worker pool.
+
+        :return: The run's future, or None if the workflow is unknown or at its concurrency limit.
+        """
+        entry = self.workflows.get(name)
+        if entry is None:
+            logger.error(f"Unknown workflow '{name}'")
+            return None
+        record = RunRecord(name, trigger)
+        with self._lock:
+            if self._active[name] >= entry.plan.workflow.max_concurrent_runs:
+                record.status = "skipped"
+                self._history.append(record)
+                logger.warning(f"Skipping run of workflow '{name}': {self._active[name]} run(s) already active")
+                return None
+            self._active[name] += 1
+            self._queued += 1
+            self._history.append(record)
+        return self.pool.submit(self._run, entry.plan, record)
+
+    def _run(self, plan: WorkflowPlan, record: RunRecord) -> dict[str, Any] | None:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            record.status, record.started_at = "running", time.time()
+        try:
+            context = execute_workflow(plan)
+            record.status = "succeeded"
+            return context
+        except BaseException as e:  # a step raising e.g. KeyboardInterrupt fails its run, not the service
+            record.status, record.error = "failed", f"{type(e).__name__}: {e}"
+            logger.error(f"Workflow '{plan.name}' failed: {record.error}")
+            return None
+        finally:
+            record.finished_at = time.time()
+            with self._lock:
+                self._running -= 1
+                self._active[plan.name] -= 1
+
+    def _on_missed(self, event: JobExecutionEvent) -> None:
+        job = self.scheduler.get_job(event.job_id)
+        name = job.name if job is not None else event.job_id.rpartition(":")[0]
+        with self._lock:
+            self._history.append(RunRecord(name, f"schedule:{event.job_id.rpartition(':')[2]}", status="missed"))
+        logger.warning(f"Workflow '{name}' missed its run scheduled for {event.scheduled_run_time}")
+
+    # Introspection
+
+    @property
+    def queue_depth(self) -> int:
+        """Runs waiting for a free worker."""
+        return self._queued
+
+    def history(self, workflow: str | None = None) -> list[RunRecord]:
+        """Recent runs, oldest first, optionally of one workflow."""
+        with self._lock:
+            return [record for record in self._history if workflow is None or record.workflow == workflow]
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            active = dict(self._active)
+            queued, running = self._queued, self._running
+        workflows = {}
+        for name, entry in list(self.workflows.items()):
+            jobs = [self.scheduler.get_job(job_id) for job_id in entry.job_ids]
+            next_runs = [job.next_run_time for job in jobs if job is not None and getattr(job, "next_run_time", None)]
+            workflows[name] = {
+                "path": str(entry.path),
+                "active": active.get(name, 0),
+                "next_run_time": min(next_runs) if next_runs else None,
+            }
+        return {"queued": queued, "running": running, "workflows": workflows}
+
+    # Lifecycle
+
+    def start(self) -> None:
+        """Load the directory and start scheduling; must be called from a running event loop."""
+        self.reload()
+        if self.reload_interval:
+            self.scheduler.add_job(
+                self._reload, "interval", seconds=self.reload_interval, id=RELOAD_JOB_ID, replace_existing=True
+            )
+        self.scheduler.start()
+        logger.info(f"Workflow service started with {len(self.workflows)} workflow(s) from {self.directory}")
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop scheduling; with ``wait`` queued and running runs finish first."""
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        self.pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    async def serve(self, stop: asyncio.Event | None = None) -> None:
+        """Run until ``stop`` is set (forever without one), then shut down."""
+        self.start()
+        try:
+            await (stop or asyncio.Event()).wait()
+        finally:
+            await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
+
+    def run_forever(self) -> None:
+        try:
+            asyncio.run(self.serve())
+        except (KeyboardInterrupt, SystemExit):
+            logger.info("Workflow service stopped")
+
+
+if __name__ == "__main__":
+    from dslmodel.workflow.workflow_executor import configure_logging
+
+    configure_logging("INFO")
+    WorkflowService(sys.argv[1] if len(sys.argv) > 1 else ".").run_forever()
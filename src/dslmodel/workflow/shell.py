@@ -0,0 +1,130 @@
+"""
+Streaming shell execution for workflow ``Action.shell`` steps.
+
+`run_shell` runs a command as an asyncio subprocess and streams its stdout and stderr line by
+line to the log as they are produced, keeping at most ``max_lines`` trailing lines of each in
+memory (all lines when None). A command that exceeds ``timeout`` is killed, as is a command
+whose task is cancelled; the command runs in its own process group on POSIX so the whole
+pipeline goes with it.
+
+`run_shell_sync` is the blocking entry point used by the executor; it also works when called
+from a thread that already runs an event loop.
+"""
+import asyncio
+import os
+import signal
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from loguru import logger
+
+# Largest chunk read as one "line"; longer lines are logged in pieces
+STREAM_LIMIT = 1024 * 1024
+
+
+@dataclass
+class ShellResult:
+    """Outcome of a `run_shell` call; ``stdout``/``stderr`` hold the retained trailing lines."""
+
+    command: str
+    returncode: int | None
+    stdout: str = ""
+    stderr: str = ""
+    timed_out: bool = False
+    duration_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+
+async def _pump(stream: asyncio.StreamReader, lines: deque, label: str) -> None:
+    """Read ``stream`` to EOF, logging each line and keeping the trailing ones in ``lines``."""
+    while True:
+        try:
+            chunk = await stream.readuntil(b"\n")
+        except asyncio.IncompleteReadError as e:
+            chunk = e.partial
+        except asyncio.LimitOverrunError as e:
+            chunk = await stream.read(e.consumed)
+        if not chunk:
+            return
+        line = chunk.decode(errors="replace").rstrip("\r\n")
+        lines.append(line)
+        logger.info(f"[{label}] {line}")
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is not None:
+        return
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+async def run_shell(
+    command: str,
+    env: dict[str, str] | None = None,
+    timeout: float | None = None,
+    max_lines: int | None = None,
+    label: str = "shell",
+) -> ShellResult:
+    """
+    Run ``command`` through the shell, streaming its output to the log.
+
+    :param env: Environment for the command (replaces the inherited environment, as with ``Popen``).
+    :param timeout: Seconds after which the command is killed and the result marked ``timed_out``.
+    :param max_lines: Trailing lines of each stream to keep in the result (None keeps all).
+    :param label: Prefix for logged lines, e.g. the action name.
+    """
+    start = time.monotonic()
+    process = await asyncio.create_subprocess_shell(
+        command,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env,
+        limit=STREAM_LIMIT,
+        start_new_session=os.name == "posix",
+    )
+    stdout, stderr = deque(maxlen=max_lines), deque(maxlen=max_lines)
+    pumps = asyncio.gather(
+        _pump(process.stdout, stdout, label),
+        _pump(process.stderr, stderr, f"{label} stderr"),
+    )
+    timed_out = False
+    try:
+        await asyncio.wait_for(asyncio.shield(pumps), timeout)
+        await process.wait()
+    except asyncio.TimeoutError:
+        timed_out = True
+        _kill(process)
+        await process.wait()
+        await pumps
+    except asyncio.CancelledError:
+        _kill(process)
+        pumps.cancel()
+        raise
+    return ShellResult(
+        command,
+        process.returncode,
+        "\n".join(stdout).strip(),
+        "\n".join(stderr).strip(),
+        timed_out,
+        time.monotonic() - start,
+    )
+
+
+def run_shell_sync(command: str, **kwargs) -> ShellResult:
+    """Blocking `run_shell`; runs in a helper thread if this thread already has a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_shell(command, **kwargs))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run_shell(command, **kwargs)).result()
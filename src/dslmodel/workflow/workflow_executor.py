@@ -1,228 +1,480 @@
-import copy
 import sys
+import time
+from collections.abc import Mapping
 from datetime import datetime
-from subprocess import Popen, PIPE
+from os import PathLike
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from subprocess import CalledProcessError, TimeoutExpired
 from typing import Any
 
 import pytz
 from apscheduler.schedulers.base import BaseScheduler
+from apscheduler.triggers.base import BaseTrigger
 from apscheduler.triggers.cron import CronTrigger as APSchedulerCronTrigger
 from apscheduler.triggers.date import DateTrigger as APSchedulerDateTrigger
 from loguru import logger
 
-from dslmodel.template import render
+from dslmodel.workflow.checkpoint import CheckpointError, WorkflowCheckpoint
+from dslmodel.workflow.compiler import WorkflowCompileError, compile_source, resolve_code
+from dslmodel.workflow.context import PLAIN_TYPES, WorkflowContext
+from dslmodel.workflow.dag_scheduler import context_delta
+from dslmodel.workflow.events import EventBuffer, LoguruSink, job_scope, workflow_events, workflow_run
+from dslmodel.workflow.loops import execute_loop
+from dslmodel.workflow.plan import WorkflowPlan, plan_workflow
+from dslmodel.workflow.shell import run_shell_sync
 from dslmodel.workflow.workflow_models import Job, Action, Workflow, CronSchedule, DateSchedule
 
-# Configure logger with timestamp and log level
-logger.remove()  # Remove default handler
-logger.add(
-    sys.stderr,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level="DEBUG",
-)
-logger.add(
-    "workflow_executor.log",
-    format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
-    level="DEBUG",
-    rotation="1 MB",
+LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
 )
+FILE_LOG_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}"
 
 
-# Custom log handler to collect log messages
-class LogCollector:
-    def __init__(self):
-        self.messages = []
+def configure_logging(
+    level: str = "INFO",
+    log_file: str | PathLike | None = None,
+    rotation: str = "1 MB",
+    events: bool = False,
+) -> list[int]:
+    """
+    Replaces loguru's handlers with a stderr handler (and optionally a rotating file) at ``level``.
 
-    def write(self, message):
-        if message.strip():  # Avoid empty messages
-            self.messages.append(message.strip())
+    Importing the executor leaves logging alone; applications call this once at startup. Messages
+    below ``level`` are dropped before they are formatted. With ``events`` every workflow event
+    (see `dslmodel.workflow.events`) is also logged at DEBUG level.
 
-    def flush(self):
-        pass  # Required for file-like objects
+    :return: The ids of the added loguru handlers.
+    """
+    logger.remove()
+    handler_ids = [logger.add(sys.stderr, format=LOG_FORMAT, level=level)]
+    if log_file is not None:
+        handler_ids.append(logger.add(log_file, format=FILE_LOG_FORMAT, level=level, rotation=rotation))
+    if events and not any(isinstance(sink, LoguruSink) for sink in workflow_events._sinks):
+        workflow_events.subscribe(LoguruSink("DEBUG"))
+    return handler_ids
 
 
 def initialize_context(init_ctx: dict[str, Any] | None = None) -> dict[str, Any]:
-    """Initializes the workflow context."""
-    logger.debug(f"Initializing context with: {init_ctx}")
-    return copy.deepcopy(init_ctx) if init_ctx else {}
-
-
-def update_context(context: dict[str, Any], updates: dict[str, Any]) -> dict[str, Any]:
-    """Updates the workflow context with new values."""
-    new_context = {
-        k: v for k, v in context.items() if isinstance(v, (int, float, str, bool, list, dict))
-    }
+    """Initializes the workflow context. Values are not copied: jobs and actions copy them on write."""
+    logger.debug("Initializing context with keys: {}", list(init_ctx or {}))
+    return dict(init_ctx) if init_ctx else {}
 
-    new_context = copy.deepcopy(new_context)
 
-    new_context.update(updates)
+def update_context(context: Mapping[str, Any], updates: Mapping[str, Any]) -> WorkflowContext:
+    """
+    Returns a new context layer with ``updates`` applied; ``context`` itself is not modified.
 
-    if "__builtins__" in new_context:
-        del new_context["__builtins__"]  # Remove builtins from context
-
-    rendered_context = {}
-    for arg, value in new_context.items():
-        if "{{" in str(value):
-            rendered_context[arg] = render(value, **new_context)
-            try:
-                rendered_context[arg] = eval(rendered_context[arg])
-            except Exception as e:
-                logger.error(f"Error converting rendered value to native Python type: {e}")
-        else:
-            rendered_context[arg] = value
-    return rendered_context
+    Only plain-data updates are kept, and only the updated values are rendered.
+    """
+    new_context = WorkflowContext.wrap(context).new_child()
+    for key, value in updates.items():
+        if key != "__builtins__" and isinstance(value, PLAIN_TYPES):
+            new_context[key] = value
+    new_context.render_dirty()
+    return new_context.compact()
 
 
-def evaluate_condition(condition: str, context: dict[str, Any]) -> bool:
+def evaluate_condition(condition: str, context: Mapping[str, Any]) -> bool:
     """Evaluates a condition within the current context."""
-    logger.debug(f"Evaluating condition: '{condition}' with context: {context}")
     try:
-        safe_context = copy.deepcopy(context)
-        result = eval(condition, {}, safe_context)
-        logger.debug(f"Condition result: {result}")
+        compiled = compile_source(condition, "eval")
+        scope = WorkflowContext.view(context)
+        scope.own(compiled.names)
+        result = eval(compiled.code, {}, scope)
+        logger.debug("Condition {!r} evaluated to {}", condition, result)
         return result
     except Exception as e:
         logger.error(f"Error evaluating condition '{condition}': {e}")
         return False
 
 
-def execute_job(job: Job, context: dict[str, Any]) -> dict[str, Any]:
-    """Executes all actions within a job."""
-    logger.info(f"Executing job: {job.name}")
-    job_context = update_context(context, {})  # Isolate context for the job
+def execute_job(
+    job: Job,
+    context: Mapping[str, Any],
+    raise_errors: bool = False,
+    checkpoint: WorkflowCheckpoint | None = None,
+    rerun_interrupted: bool = False,
+) -> WorkflowContext:
+    """
+    Executes all actions within a job. With ``raise_errors`` the first failing action aborts the job.
+
+    With a ``checkpoint`` the job's progress is saved after every action (or parallel group) and
+    a job with saved progress continues after its last completed action.
+
+    :raises CheckpointError: If a non-idempotent action was interrupted and ``rerun_interrupted`` is not set.
+    """
+    with job_scope(job.name):
+        workflow_events.emit("job_start")
+        started, status = time.perf_counter(), "error"
+        try:
+            job_context = _execute_job(job, context, raise_errors, checkpoint, rerun_interrupted)
+            status = "ok"
+            return job_context
+        finally:
+            workflow_events.emit("job_end", status=status, duration_s=time.perf_counter() - started)
+
+
+def _execute_job(
+    job: Job,
+    context: Mapping[str, Any],
+    raise_errors: bool,
+    checkpoint: WorkflowCheckpoint | None,
+    rerun_interrupted: bool,
+) -> WorkflowContext:
+    logger.info("Executing job: {}", job.name)
+    job_context = WorkflowContext.wrap(context)  # Isolate context for the job
+    completed = 0
+
+    state = checkpoint.load_job(job.name) if checkpoint is not None else None
+    if state:
+        check_interrupted(job.name, state, rerun_interrupted)
+        if not state.get("resumable", True):
+            check_rerun(job, state, rerun_interrupted)
+            state = None
+    if state:
+        completed = state["actions"]
+        job_context = job_context.new_child(state["delta"]).compact()
+        logger.info(f"Resuming job {job.name} after {completed} completed action(s)")
+
+    end = 0
+    for group in action_groups(job.steps):
+        start, end = end, end + len(group)
+        if end <= completed:
+            continue
+        if checkpoint is not None:
+            unsafe = [action.name for action in group if not action.idempotent]
+            if unsafe:
+                checkpoint.save_job(job.name, "running", start, job_context.changes(), running=unsafe[0])
+
+        if len(group) > 1:
+            job_context = execute_parallel(group, job_context, raise_errors=raise_errors)
+        else:
+            action = group[0]
+            try:
+                job_context = execute_action(action, job_context, raise_errors=raise_errors)  # Execute each action
+            except Exception as e:
+                logger.error(f"Error executing action {action.name}: {e!s}")
+                if raise_errors:
+                    raise
+
+        if checkpoint is not None:
+            checkpoint.save_job(job.name, "running", end, job_context.changes())
 
-    for action in job.steps:
-        logger.info(f"Executing action: {action.name}")
+    logger.debug("Job {} completed", job.name)
+    return job_context
+
+
+def check_interrupted(job_name: str, state: dict[str, Any], rerun_interrupted: bool = False) -> None:
+    """Refuse to resume a job whose non-idempotent action was interrupted, unless explicitly allowed."""
+    if state.get("running") and not rerun_interrupted:
+        raise CheckpointError(
+            f"Action '{state['running']}' of job '{job_name}' was interrupted and is not idempotent; "
+            "resume with rerun_interrupted=True to run it again"
+        )
+
+
+def check_rerun(job: Job, state: dict[str, Any], rerun_interrupted: bool = False) -> None:
+    """
+    A job whose changes could not be checkpointed runs again from the start; refuse if that would
+    repeat a completed non-idempotent action, unless explicitly allowed.
+    """
+    done = [action.name for action in job.steps[: state["actions"]] if not action.idempotent]
+    if done and not rerun_interrupted:
+        raise CheckpointError(
+            f"Job '{job.name}' must run again because its changes could not be checkpointed, which would "
+            f"repeat the non-idempotent action '{done[0]}'; resume with rerun_interrupted=True to allow it"
+        )
+    logger.warning(f"Job {job.name} could not be checkpointed; running it again from the start")
+
+
+def action_groups(actions: list[Action]) -> list[list[Action]]:
+    """Split ``actions`` into runs of adjacent ``parallel`` actions and single sequential ones."""
+    groups: list[list[Action]] = []
+    for action in actions:
+        if action.parallel and groups and groups[-1][-1].parallel:
+            groups[-1].append(action)
+        else:
+            groups.append([action])
+    return groups
+
+
+def execute_parallel(actions: list[Action], context: Mapping[str, Any], raise_errors: bool = False) -> WorkflowContext:
+    """
+    Executes ``actions`` concurrently against the same context and merges their changes in
+    declaration order, so the result matches sequential execution of independent actions.
+    """
+    context = WorkflowContext.wrap(context)
+    logger.debug("Executing {} actions in parallel: {}", len(actions), [action.name for action in actions])
+    with ThreadPoolExecutor(max_workers=len(actions), thread_name_prefix="workflow-action") as executor:
+        # Each action runs in a copy of the caller's context variables so its events keep the job's tags
+        futures = [
+            executor.submit(copy_context().run, execute_action, action, context, raise_errors) for action in actions
+        ]
+
+    updates: dict[str, Any] = {}
+    for action, future in zip(actions, futures):
         try:
-            job_context = execute_action(action, job_context)  # Execute each action
-            logger.info(f"Finished executing action: {action.name}")
+            updates.update(context_delta(context, future.result()))
         except Exception as e:
             logger.error(f"Error executing action {action.name}: {e!s}")
+            if raise_errors:
+                raise
+    return update_context(context, updates)
+
+
+def execute_action(action: Action, context: Mapping[str, Any], raise_errors: bool = False) -> WorkflowContext:
+    """
+    Executes a single action, updating the context accordingly.
+    Errors are logged, and re-raised when ``raise_errors`` is set (a failing shell command raises
+    CalledProcessError, one that exceeds ``timeout_seconds`` raises TimeoutExpired).
+
+    Emits ``action_start``/``action_end`` events (status ``ok``, ``error`` or ``skipped``) and a
+    ``condition`` event with the outcome of the action's condition.
+    """
+    workflow_events.emit("action_start", action=action.name)
+    started, status = time.perf_counter(), "error"
+    try:
+        context, status = _execute_action(action, WorkflowContext.wrap(context), raise_errors)
+        return context
+    finally:
+        workflow_events.emit("action_end", action=action.name, status=status, duration_s=time.perf_counter() - started)
 
-    logger.debug(f"Job {job.name} completed. Updated context: {job_context}")
-    return job_context
 
+def _execute_action(action: Action, context: WorkflowContext, raise_errors: bool) -> tuple[WorkflowContext, str]:
+    logger.debug("Executing action: {}", action.name)
+    status = "ok"
 
-def execute_action(action: Action, context: dict[str, Any]) -> dict[str, Any]:
-    """Executes a single action, updating the context accordingly."""
-    logger.info(f"Executing action: {action.name}")
+    if action.cond:
+        met = evaluate_condition(action.cond.expr, context)
+        workflow_events.emit("condition", action=action.name, status="true" if met else "false",
+                             data={"expr": action.cond.expr})
+        if not met:
+            logger.debug("Condition for action '{}' not met, skipping", action.name)
+            return context, "skipped"
 
-    if action.cond and not evaluate_condition(action.cond.expr, context):
-        logger.info(f"Condition for action '{action.name}' not met, skipping.")
-        return context
+    if action.loop:
+        return execute_loop(action, context, raise_errors=raise_errors), status
 
-    action_context = update_context(context, {})
+    action_context = context.new_child()
 
     if action.code:
-        logger.debug(f"Executing code for action '{action.name}'")
-        rendered_code = render(action.code, **action_context)
-        logger.debug(f"Rendered code: {rendered_code}")
         try:
-            exec(rendered_code, action_context, action_context)
-            logger.info(f"Code execution for action '{action.name}' completed successfully")
+            compiled, rendered_code = resolve_code(action.code, action_context)
+            if rendered_code is not action.code:
+                logger.debug("Rendered code for action '{}': {}", action.name, rendered_code)
+            # Copy only the shared values this code can touch; everything else is passed by reference
+            action_context.own(compiled.names)
+            scope = action_context.to_dict()
+            exec(compiled.code, scope)
+            action_context.absorb(scope)
         except Exception as e:
+            status = "error"
             logger.error(f"Error executing code for action '{action.name}': {e!s}")
-        context = update_context(context, action_context)
+            if raise_errors:
+                raise
 
     if action.shell:
-        logger.debug(f"Executing shell command for action '{action.name}': {action.shell}")
+        logger.debug("Executing shell command for action '{}': {}", action.name, action.shell)
+        result = None
         try:
-            process = Popen(action.shell, shell=True, stdout=PIPE, stderr=PIPE, env=action.env or None)
-            stdout, stderr = process.communicate()
-
-            if process.returncode == 0:
-                logger.info(f"Shell command executed successfully. Output:\n{stdout.decode().strip()}")
+            result = run_shell_sync(
+                action.shell,
+                env=action.env or None,
+                timeout=action.timeout_seconds,
+                max_lines=action.output_lines,
+                label=action.name,
+            )
+            if result.timed_out:
+                status = "error"
+                logger.error(f"Shell command timed out after {action.timeout_seconds}s and was killed")
+            elif result.returncode == 0:
+                logger.debug("Shell command executed successfully in {:.2f}s", result.duration_s)
             else:
-                logger.error(f"Shell command failed with error:\n{stderr.decode().strip()}")
+                status = "error"
+                logger.error(f"Shell command failed with exit code {result.returncode}")
 
             # Optionally, capture the output in the context if needed
-            action_context["shell_output"] = stdout.decode().strip()
-            action_context["shell_error"] = stderr.decode().strip() if stderr else None
+            action_context["shell_output"] = result.stdout
+            action_context["shell_error"] = result.stderr or None
 
         except Exception as e:
+            status = "error"
             logger.error(f"Error executing shell command for action '{action.name}': {e!s}")
-        context = update_context(context, action_context)
+            if raise_errors:
+                raise
+        if raise_errors and result is not None and not result.ok:
+            if result.timed_out:
+                raise TimeoutExpired(action.shell, action.timeout_seconds, result.stdout, result.stderr)
+            raise CalledProcessError(result.returncode, action.shell, result.stdout, result.stderr)
 
     # Execute a callable function if provided
     if action.callable:
-        logger.debug(f"Executing callable for action '{action.name}'")
         try:
             result = action.callable()
-            logger.debug(f"Callable result for action '{action.name}': {result}")
+            logger.debug("Callable result for action '{}': {}", action.name, result)
             if isinstance(result, dict):
                 action_context.update(result)  # Update context if the callable returns a dict
         except Exception as e:
+            status = "error"
             logger.error(f"Error executing callable for action '{action.name}': {e!s}")
-        context = update_context(context, action_context)
-
-    logger.debug(f"Action '{action.name}' completed. Updated context: {context}")
-    return context
-
-
-def execute_workflow(workflow: Workflow, init_ctx: dict[str, Any] | None = None, verbose: bool = False) -> dict[
-    str, Any]:
-    """Executes all jobs defined in a workflow."""
-    logger.info(f"Executing workflow: {workflow.name}")
+            if raise_errors:
+                raise
+
+    # Promote the action's writes (and the values it took ownership of) into a new context layer
+    context = update_context(context, action_context.maps[0])
+    logger.debug("Action '{}' completed. Updated keys: {}", action.name, list(action_context.maps[0]))
+    return context, status
+
+
+def as_plan(workflow: Workflow | WorkflowPlan) -> WorkflowPlan:
+    """Return the plan for ``workflow``, rebuilding a plan whose imported files changed."""
+    if isinstance(workflow, WorkflowPlan):
+        return plan_workflow(workflow.workflow) if workflow.is_stale() else workflow
+    return plan_workflow(workflow)
+
+
+def execute_workflow(
+    workflow: Workflow | WorkflowPlan,
+    init_ctx: dict[str, Any] | None = None,
+    verbose: bool = False,
+    max_workers: int | None = None,
+    checkpoint_dir: str | PathLike | None = None,
+) -> dict[str, Any]:
+    """
+    Executes all jobs defined in a workflow.
+
+    Jobs run as a dependency graph (see `dslmodel.workflow.dag_scheduler`): independent jobs run
+    concurrently, each job sees the outputs of the jobs it depends on, and the returned context
+    merges every job's changes in topological order.
+
+    With ``checkpoint_dir`` progress is saved after every action so an interrupted run can be
+    continued with `resume_workflow` (see `dslmodel.workflow.checkpoint`).
+
+    Imports are resolved into a `WorkflowPlan` (see `dslmodel.workflow.plan`); pass the plan
+    itself to skip that work on repeated runs.
+    """
+    plan = as_plan(workflow)
+    logger.info("Executing workflow: {}", plan.name)
     global_context = initialize_context(init_ctx)
-    
-    # Merge workflow's context into global context
-    if workflow.context:
-        if hasattr(workflow.context, "model_dump"):
-            global_context.update(workflow.context.model_dump())
-        else:
-            global_context.update(workflow.context)
-
-    workflow.process_imports()
-    workflow.topological_sort()
-
-    log_collector = LogCollector()
-    logger.add(log_collector, level="DEBUG")
 
-    for job in workflow.jobs:
-        logger.info(f"Starting execution of job: {job.name}")
+    # Merge the workflow's (and its imports') context into global context
+    global_context.update(plan.context)
+
+    checkpoint = None
+    if checkpoint_dir is not None:
+        checkpoint = WorkflowCheckpoint(checkpoint_dir)
+        checkpoint.begin(plan.name, global_context)
+
+    return _run_workflow(plan, global_context, verbose, max_workers, checkpoint)
+
+
+def resume_workflow(
+    workflow: Workflow | WorkflowPlan,
+    checkpoint_dir: str | PathLike,
+    verbose: bool = False,
+    max_workers: int | None = None,
+    rerun_interrupted: bool = False,
+) -> dict[str, Any]:
+    """
+    Continues a run started with ``execute_workflow(..., checkpoint_dir=...)``.
+
+    The initial context is restored from the checkpoint, finished jobs are skipped and their
+    changes reapplied, and unfinished jobs continue after their last completed action.
+
+    :raises CheckpointError: If the checkpoint is missing, belongs to another workflow, or a
+        non-idempotent action was interrupted and ``rerun_interrupted`` is not set.
+    """
+    plan = as_plan(workflow)
+    checkpoint = WorkflowCheckpoint(checkpoint_dir)
+    run = checkpoint.load_run()
+    if run["workflow"] != plan.name:
+        raise CheckpointError(f"Checkpoint in {checkpoint_dir} belongs to workflow '{run['workflow']}', not '{plan.name}'")
+    logger.info(f"Resuming workflow: {plan.name} from {checkpoint_dir}")
+    return _run_workflow(plan, run["context"], verbose, max_workers, checkpoint, rerun_interrupted)
+
+
+def _run_workflow(
+    plan: WorkflowPlan,
+    global_context: dict[str, Any],
+    verbose: bool,
+    max_workers: int | None,
+    checkpoint: WorkflowCheckpoint | None = None,
+    rerun_interrupted: bool = False,
+) -> dict[str, Any]:
+    from dslmodel.workflow.dag_scheduler import DAGScheduler
+
+    # Sources that failed to compile when the plan was built are reported again when their action runs
+    if plan.issues:
+        logger.error(str(WorkflowCompileError(plan.name, list(plan.issues))))
+
+    with workflow_run(plan.name) as run_id:
+        # verbose runs keep their own events in memory instead of capturing every log message
+        buffer = workflow_events.subscribe(EventBuffer(run_id=run_id)) if verbose else None
+        workflow_events.emit("workflow_start")
+        started, status = time.perf_counter(), "error"
         try:
-            global_context = execute_job(job, global_context)
-            logger.info(f"Finished execution of job: {job.name}")
-        except Exception as e:
-            logger.error(f"Error executing job {job.name}: {e!s}")
+            scheduler = DAGScheduler(
+                plan.to_workflow(), max_workers=max_workers, checkpoint=checkpoint, rerun_interrupted=rerun_interrupted
+            )
+            global_context = scheduler.run(global_context)
+            status = "ok"
+        finally:
+            workflow_events.emit("workflow_end", status=status, duration_s=time.perf_counter() - started)
+            if buffer is not None:
+                workflow_events.unsubscribe(buffer)
+
+    if checkpoint is not None:
+        checkpoint.complete()
 
     if "__builtins__" in global_context:
         del global_context["__builtins__"]
 
-    logger.info(f"Workflow '{workflow.name}' completed. Final context: {global_context}")
+    logger.info("Workflow '{}' completed. Final context keys: {}", plan.name, list(global_context))
 
     if verbose:
-        global_context['log_messages'] = log_collector.messages
+        global_context['log_messages'] = buffer.messages()
 
     return global_context
 
 
-def schedule_workflow(workflow: Workflow, scheduler: BaseScheduler):
-    """Schedules a workflow using the provided scheduler."""
+def build_trigger(schedule: CronSchedule | DateSchedule) -> BaseTrigger:
+    """The APScheduler trigger for a workflow schedule (times are UTC; ``run_date: now`` fires immediately)."""
+    if isinstance(schedule, CronSchedule):
+        return APSchedulerCronTrigger.from_crontab(schedule.cron, timezone=pytz.UTC)
+    if isinstance(schedule, DateSchedule):
+        run_date = schedule.run_date if schedule.run_date != "now" else datetime.now(pytz.UTC)
+        return APSchedulerDateTrigger(run_date=run_date, timezone=pytz.UTC)
+    raise TypeError(f"Unknown trigger type: {type(schedule)}")
+
+
+def schedule_workflow(workflow: Workflow | WorkflowPlan, scheduler: BaseScheduler | None = None):
+    """
+    Schedules a workflow using the provided scheduler (a new background scheduler by default).
+
+    The workflow is planned once here (imports resolved, jobs sorted, conditions and code
+    compiled), and every triggered run reuses the plan until an imported file changes.
+    To run many workflows on one shared scheduler, see `dslmodel.workflow.service.WorkflowService`.
+
+    :raises WorkflowCompileError: If any condition or code block fails to compile.
+    :raises ImportCycleError: If the workflow's imports form a cycle.
+    """
+    plan = as_plan(workflow)
+    workflow = plan.workflow
     logger.info(f"Scheduling workflow: {workflow.name}")
-    for trigger in workflow.schedules:
-        if isinstance(trigger, CronSchedule):
-            logger.debug(f"Adding cron job for trigger: {trigger.cron}")
-            job = scheduler.add_job(
-                execute_workflow,
-                APSchedulerCronTrigger.from_crontab(trigger.cron, timezone=pytz.UTC),
-                args=[workflow],
-                timezone=pytz.UTC,
-            )
-            logger.debug(f"Job added: {job!s}")
-        elif isinstance(trigger, DateSchedule):
-            logger.debug(f"Adding date job for trigger: {trigger.run_date}")
-            run_date = trigger.run_date if trigger.run_date != "now" else datetime.now(pytz.UTC)
-            job = scheduler.add_job(
-                execute_workflow,
-                APSchedulerDateTrigger(run_date=run_date, timezone=pytz.UTC),
-                args=[workflow],
-                timezone=pytz.UTC,
-            )
-            logger.debug(f"Job added: {job!s}")
-        else:
-            logger.error(f"Unknown trigger type: {type(trigger)}")
-            
+    if plan.issues:
+        raise WorkflowCompileError(workflow.name, list(plan.issues))
+    scheduler = scheduler or default_scheduler()
+    for schedule in workflow.schedules:
+        try:
+            trigger = build_trigger(schedule)
+        except TypeError as e:
+            logger.error(str(e))
+            continue
+        job = scheduler.add_job(execute_workflow, trigger, args=[plan])
+        logger.debug(f"Job added: {job!s}")
+
     scheduler.start()
 
     logger.info(f"Workflow '{workflow.name}' scheduled successfully")
@@ -232,12 +484,13 @@ def schedule_workflow(workflow: Workflow, scheduler: BaseScheduler):
 
 def default_scheduler():
     """Returns a default scheduler."""
-    return BackgroundScheduler()
+    from apscheduler.schedulers.background import BackgroundScheduler
 
+    return BackgroundScheduler(timezone=pytz.UTC)
 
-if __name__ == "__main__":
-    from apscheduler.schedulers.background import BackgroundScheduler
 
+if __name__ == "__main__":
+    configure_logging("DEBUG", log_file="workflow_executor.log")
     workflow = Workflow.from_yaml("path/to/your/workflow.yaml")
     scheduler = default_scheduler()
     
@@ -245,6 +498,6 @@ if __name__ == "__main__":
 
     try:
         while True:
-            pass
+            time.sleep(1)
     except (KeyboardInterrupt, SystemExit):
         scheduler.shutdown()
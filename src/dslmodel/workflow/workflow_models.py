@@ -41,6 +41,36 @@ class Condition(DSLModel):
     expr: str = Field(..., description="A Python expression as a string to evaluate the condition.")
 
 
+class Loop(DSLModel):
+    """
+    Runs an action once per item of an iterable in the context, optionally in parallel.
+
+    Each iteration sees the context plus the loop variable and runs in its own scope; only the
+    collected per-item results are written back, as a list (or the ``reduce`` value) under ``into``.
+    """
+
+    over: str = Field(..., description="A Python expression evaluating to the iterable to loop over.")
+    var: str = Field("item", description="Name the current item is bound to in each iteration.")
+    collect: str | None = Field(
+        None,
+        description="Variable whose value after each iteration is collected as its result (default: the loop variable).",
+    )
+    into: str | None = Field(
+        None, description="Context variable receiving the collected results in input order."
+    )
+    reduce: str | None = Field(
+        None,
+        description="A Python expression combining the collected list, bound as `results`, into the value stored in `into`.",
+    )
+    backend: str = Field(
+        "sequential", description="Where iterations run: 'sequential', 'thread' or 'process'."
+    )
+    max_workers: int | None = Field(None, description="Maximum pool workers for the thread and process backends.")
+    chunk_size: int | None = Field(
+        None, description="Items per pool task (default: enough to give each worker about four chunks)."
+    )
+
+
 class Action(DSLModel):
     """
     Describes an individual unit of work or operation to be performed as part of a job in the workflow.
@@ -67,6 +97,23 @@ class Action(DSLModel):
         None, description="A callable function that is executed when the action runs."
     )
     shell: str | None = Field(None, description="Shell command to be executed directly.")
+    timeout_seconds: float | None = Field(
+        None, description="Maximum run time of the shell command; it is killed when exceeded."
+    )
+    output_lines: int | None = Field(
+        None, description="Keep only the last N lines of shell output in context (default: all)."
+    )
+    idempotent: bool = Field(
+        True,
+        description="Safe to run again when a checkpointed workflow is resumed after being interrupted during this action.",
+    )
+    parallel: bool = Field(
+        False,
+        description="Run concurrently with adjacent actions that are also marked parallel; they must not use each other's outputs.",
+    )
+    loop: Loop | None = Field(
+        None, description="Repeat the action over the items of an iterable in the context."
+    )
 
 
 
@@ -148,17 +195,31 @@ class Workflow(DSLModel):
     env: dict[str, str] | None = Field(
         {}, description="Global environments variables for the workflow."
     )
+    max_concurrent_runs: int = Field(
+        1, description="Maximum runs of this workflow queued or running at once in a scheduler service; further triggers are skipped."
+    )
+    misfire_grace_seconds: int | None = Field(
+        None, description="How late a scheduled run may still start; later runs are dropped as missed (default: the service's setting)."
+    )
+    coalesce: bool = Field(
+        True, description="Run once instead of once per missed trigger when several runs are overdue."
+    )
 
     def process_imports(self) -> None:
-        """Process imported workflows and integrate them into the current workflow."""
-        for import_path in self.imports:
-            imported_workflow = Workflow.from_yaml(import_path)
-            # Integrate jobs from the imported workflow
-            self.jobs.extend(imported_workflow.jobs)
-            # Integrate or merge contexts if necessary
-            self.context.update(imported_workflow.context)
-            # Recursively process imports
-            imported_workflow.process_imports()
+        """
+        Merge the jobs and context of imported workflows into this workflow and clear ``imports``,
+        so calling it again is a no-op. See `dslmodel.workflow.plan` for how imports are resolved.
+        """
+        plan = self.plan()
+        self.jobs = list(plan.jobs)
+        self.context = dict(plan.context)
+        self.imports = []
+
+    def plan(self):
+        """Resolve imports, sort jobs and compile sources into a reusable `WorkflowPlan`."""
+        from dslmodel.workflow.plan import plan_workflow
+
+        return plan_workflow(self)
 
     def topological_sort(self):
         from collections import deque
@@ -199,6 +260,16 @@ class Workflow(DSLModel):
 
         self.jobs = sorted_jobs
 
+    def compile(self, raise_errors: bool = True) -> list:
+        """
+        Compile every condition and code block into the process-wide code cache.
+
+        Returns the sources that failed to compile, or raises `WorkflowCompileError` listing them.
+        """
+        from dslmodel.workflow.compiler import compile_workflow
+
+        return compile_workflow(self, raise_errors=raise_errors)
+
     def run(self):
         """Run the workflow."""
         from dslmodel.workflow.workflow_executor import schedule_workflow
@@ -206,4 +277,4 @@ class Workflow(DSLModel):
         if not self.schedules:
             self.schedules = [DateSchedule(run_date="now")]
 
-        schedule_workflow(self)
+        return schedule_workflow(self)
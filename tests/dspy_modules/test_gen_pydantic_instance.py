@@ -0,0 +1,135 @@
+import gc
+import threading
+import weakref
+
+import dspy
+import pytest
+from dspy.utils.dummies import DummyLM
+from pydantic import Field
+
+from dslmodel import DSLModel
+from dslmodel.dspy_modules import gen_pydantic_instance
+from dslmodel.dspy_modules.gen_pydantic_instance import (
+    GenPydanticInstance,
+    clear_generation_contexts,
+    get_generation_context,
+)
+
+
+class Address(DSLModel):
+    street: str = Field(..., description="Street name")
+
+
+class Person(DSLModel):
+    name: str = Field(..., description="Full name")
+    address: Address
+
+
+def test_generation_context_is_built_once_per_model(monkeypatch):
+    """Test that source collection runs once per model class, not once per instance."""
+    clear_generation_contexts()
+    calls = []
+    original = gen_pydantic_instance.collect_all_sources_as_string
+    monkeypatch.setattr(
+        gen_pydantic_instance,
+        "collect_all_sources_as_string",
+        lambda model: calls.append(model) or original(model),
+    )
+
+    first = GenPydanticInstance(Person)
+    second = GenPydanticInstance(Person)
+
+    assert calls == [Person]
+    assert first.context is second.context
+    assert first.generate is second.generate
+    assert "class Address" in first.model_sources
+    assert "address" in first.context.json_schema["properties"]
+
+
+def test_generation_context_is_shared_across_threads():
+    """Test that concurrent callers share a single context."""
+    clear_generation_contexts()
+    contexts = []
+    threads = [threading.Thread(target=lambda: contexts.append(get_generation_context(Address))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(context) for context in contexts}) == 1
+
+
+def test_generation_context_follows_class_object():
+    """Test that a redefined class gets a new context and the old one can be collected."""
+
+    def define():
+        class Temp(DSLModel):
+            value: int
+
+        return Temp
+
+    old_cls = define()
+    old_context = get_generation_context(old_cls)
+    new_cls = define()
+    assert get_generation_context(new_cls) is not old_context
+
+    old_ref = weakref.ref(old_cls)
+    del old_cls, old_context
+    gc.collect()
+    assert old_ref() is None
+
+
+class Contact(DSLModel):
+    name: str
+    age: int
+    email: str
+
+
+def _run_with_answers(answers, **kwargs):
+    lm = DummyLM(answers)
+    module = GenPydanticInstance(Contact, **kwargs)
+    with dspy.context(lm=lm):
+        return module, module("Ada, 36, ada@example.com")
+
+
+def test_local_repair_avoids_llm_correction():
+    """Test that mechanical errors are repaired without a second LM call."""
+    module, contact = _run_with_answers(
+        [{"root_model_kwargs_dict": "```python\n{'Contact': {'name': 'Ada', 'age': '36', 'email': 'ada@example.com'}}\n```"}]
+    )
+    assert contact == Contact(name="Ada", age=36, email="ada@example.com")
+    assert module.metrics.snapshot()["generate"]["attempts"] == 1
+    assert set(module.metrics.snapshot()) == {"generate", "local"}
+
+
+def test_targeted_patch_merges_only_failing_fields():
+    """Test that only the failing field is sent to the LM and merged into the output."""
+    module, contact = _run_with_answers(
+        [
+            {"root_model_kwargs_dict": "{'name': 'Ada', 'age': 'thirty-six'}"},
+            {"field_patch_dict": "{'age': 36, 'email': 'ada@example.com', 'name': 'Eve'}"},
+        ]
+    )
+    assert contact == Contact(name="Ada", age=36, email="ada@example.com")
+    assert module.metrics.snapshot()["patch"] == {"attempts": 1, "successes": 1, "tokens": 0}
+
+
+def test_repair_is_bounded():
+    """Test that a model that never validates stops after the configured attempts."""
+    bad = {"root_model_kwargs_dict": "{'name': 'Ada'}"}
+    answers = [
+        bad,
+        {"field_patch_dict": "{}"},
+        {"field_patch_dict": "{}"},
+        {"reasoning": "", "what_went_wrong": "", "how_to_fix": "", **bad},
+        {"reasoning": "", "suggested_changes": "[]"},
+    ]
+    module = GenPydanticInstance(Contact, max_patch_attempts=2, max_corrections=1)
+    with dspy.context(lm=DummyLM(answers)), pytest.raises(ValueError, match="Model generation failed"):
+        module("Ada")
+    assert {stage: counts["attempts"] for stage, counts in module.metrics.snapshot().items()} == {
+        "generate": 1,
+        "local": 4,
+        "patch": 2,
+        "correct": 1,
+        "diagnose": 1,
+    }
@@ -0,0 +1,110 @@
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict
+
+from dslmodel.dspy_modules.output_repair import (
+    RepairMetrics,
+    apply_patch,
+    error_deltas,
+    parse_output,
+    repair_locally,
+)
+
+
+class Color(str, Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Address(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    street: str
+    zip_code: str
+
+
+class Person(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    name: str
+    age: int
+    nickname: str | None
+    tags: list[str]
+    favourite: Color
+    address: Address
+
+
+GOOD = {
+    "name": "Ada",
+    "age": 36,
+    "nickname": None,
+    "tags": ["math"],
+    "favourite": "red",
+    "address": {"street": "Main", "zip_code": "02139"},
+}
+
+
+def test_parse_output_formats():
+    """Test that Python literals, JSON, YAML and fenced output all parse."""
+    assert parse_output("{'a': True, 'b': None}") == {"a": True, "b": None}
+    assert parse_output('{"a": true, "b": null}') == {"a": True, "b": None}
+    assert parse_output("a: 1\nb: [x, y]") == {"a": 1, "b": ["x", "y"]}
+    assert parse_output("```python\nkwargs_dict: dict = {'a': 1}\n```") == {"a": 1}
+
+
+def test_repair_locally_fixes_mechanical_errors():
+    """Test that local repairs fix coercions, extras, enums and nullable fields without an LM."""
+    broken = {
+        "Person": {
+            "name": "Ada",
+            "age": "1,000",
+            "tags": "math",
+            "favourite": "RED",
+            "address": "{'street': 'Main', 'zip_code': 2139, 'country': 'US'}",
+        }
+    }
+    instance, data, error = repair_locally(Person, broken)
+    assert error is None
+    assert instance.age == 1000
+    assert instance.tags == ["math"]
+    assert instance.favourite is Color.RED
+    assert instance.nickname is None
+    assert instance.address == Address(street="Main", zip_code="2139")
+    assert "Person" in broken  # input left untouched
+
+
+def test_repair_locally_reports_unfixable_errors():
+    """Test that errors needing real content are returned with the partially repaired data."""
+    instance, data, error = repair_locally(Person, {**GOOD, "age": "unknown", "tags": 5})
+    assert instance is None
+    assert data["tags"] == ["5"]
+    assert [tuple(item["loc"]) for item in error.errors()] == [("age",)]
+
+
+def test_error_deltas_and_patch_merge():
+    """Test that deltas carry only failing paths and patches only touch those paths."""
+    data = {**GOOD, "address": {"street": "Main"}, "age": "old"}
+    _, data, error = repair_locally(Person, data)
+    deltas = error_deltas(Person.model_json_schema(), data, error)
+    assert [delta["path"] for delta in deltas] == ["age", "address.zip_code"]
+    assert deltas[0]["schema"] == {"title": "Age", "type": "integer"}
+    assert deltas[1]["current_value"] == "<missing>"
+
+    merged, applied = apply_patch(
+        data, {"age": 36, "address.zip_code": "02139", "name": "Eve"}, [d["path"] for d in deltas]
+    )
+    assert applied == ["age", "address.zip_code"]
+    assert Person.model_validate(merged) == Person.model_validate(GOOD)
+    assert data["age"] == "old"
+
+
+def test_repair_metrics_snapshot():
+    """Test that metrics aggregate attempts, successes and tokens per stage."""
+    metrics = RepairMetrics()
+    metrics.record("patch", False, 40)
+    metrics.record("patch", True, 30)
+    metrics.record("local", True)
+    assert metrics.snapshot() == {
+        "local": {"attempts": 1, "successes": 1, "tokens": 0},
+        "patch": {"attempts": 2, "successes": 1, "tokens": 70},
+    }
@@ -15,3 +15,14 @@ def test_render_template_default():
 
     # The field_with_template should be rendered
     assert result["field_with_template"] == 10
+
+
+class PlainModel(BaseModel, JinjaDSLMixin):
+    field_without_template: str = Field(default="plain")
+
+
+# Test case 2: Only templated defaults are recorded, and plain defaults are left to pydantic
+def test_templated_default_fields():
+    assert MyModel.templated_default_fields() == ("field_with_template",)
+    assert PlainModel.templated_default_fields() == ()
+    assert PlainModel.render_defaults({}) == {}
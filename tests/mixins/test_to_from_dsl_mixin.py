@@ -81,3 +81,37 @@ def test_format_permutations(save_format, load_format):
 
     # Ensure round-trip consistency across formats
     assert model == loaded_model
+
+
+# Test streaming round-trips through JSONL, multi-document YAML and JSON arrays
+@pytest.mark.parametrize("suffix", [".jsonl", ".yaml", ".json"])
+def test_write_many_iter_from_file(tmp_path, suffix):
+    models = [generate_random_model() for _ in range(50)]
+    file_path = tmp_path / f"models{suffix}"
+
+    # A generator proves write_many consumes its input lazily
+    assert MyModel.write_many((model for model in models), file_path) == 50
+    assert list(MyModel.iter_from_file(file_path)) == models
+
+
+# Test streaming readers from strings, skipping blank lines and empty documents
+def test_iter_from_strings():
+    assert list(MyModel.iter_from_jsonl('{"name": "a", "value": 1}\n\n{"name": "b", "value": 2}\n')) == [
+        MyModel(name="a", value=1),
+        MyModel(name="b", value=2),
+    ]
+    assert list(MyModel.iter_from_yaml_documents("---\nname: a\nvalue: 1\n---\n---\nname: b\nvalue: 2\n")) == [
+        MyModel(name="a", value=1),
+        MyModel(name="b", value=2),
+    ]
+    assert list(MyModel.iter_from_json_array('{"models": [{"name": "a", "value": 1}]}', prefix="models.item")) == [
+        MyModel(name="a", value=1)
+    ]
+
+
+# Test that invalid records fail with the offending line number
+def test_iter_from_jsonl_reports_line():
+    records = MyModel.iter_from_jsonl('{"name": "a", "value": 1}\n{"name": \n')
+    assert next(records) == MyModel(name="a", value=1)
+    with pytest.raises(ValueError, match="line 2"):
+        next(records)
@@ -0,0 +1,56 @@
+import pytest
+from pydantic import BaseModel
+
+from dslmodel.mixins import to_from_mixin
+from dslmodel.mixins.to_from_mixin import ToFromMixin
+
+
+class MyModel(BaseModel, ToFromMixin):
+    name: str
+    value: int
+
+
+MODELS = [MyModel(name=f"name-{i}", value=i) for i in range(200)]
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+# Test async streaming round-trips, with chunk boundaries falling inside records
+@pytest.mark.asyncio
+@pytest.mark.parametrize("suffix", [".jsonl", ".yaml", ".json"])
+async def test_write_many_iter_from_file(tmp_path, monkeypatch, suffix):
+    monkeypatch.setattr(to_from_mixin, "CHUNK_SIZE", 64)
+    file_path = tmp_path / f"models{suffix}"
+
+    async def models():
+        for model in MODELS:
+            yield model
+
+    assert await MyModel.write_many(models(), file_path) == len(MODELS)
+    assert await collect(MyModel.iter_from_file(file_path)) == MODELS
+
+
+# Test that the async YAML splitter matches PyYAML's multi-document parsing
+@pytest.mark.asyncio
+async def test_iter_from_yaml_documents_markers():
+    content = "name: a\nvalue: 1\n...\n--- \nname: b\nvalue: 2\n---\n"
+    assert await collect(MyModel.iter_from_yaml_documents(content)) == [
+        MyModel(name="a", value=1),
+        MyModel(name="b", value=2),
+    ]
+
+
+# Test that Unicode line separators inside JSON strings do not split records
+@pytest.mark.asyncio
+@pytest.mark.parametrize("chunk_size", [8, 1 << 20])
+async def test_iter_from_jsonl_keeps_unicode_separators(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(to_from_mixin, "CHUNK_SIZE", chunk_size)
+    models = [MyModel(name="a\u2028b\x85c\x0cd", value=1), MyModel(name="e", value=2)]
+    file_path = tmp_path / "models.jsonl"
+
+    await MyModel.write_many(models, file_path)
+
+    assert await collect(MyModel.iter_from_jsonl(file_path=file_path)) == models
+    assert await collect(MyModel.iter_from_jsonl(file_path.read_text())) == models
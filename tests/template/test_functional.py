@@ -31,3 +31,28 @@ def test_render_native_inflection_extension():
     template_str = "{{ 'person' | pluralize }}"
     result = render_native(template_str)
     assert result == "people"  # Plural of "person" is "people"
+
+
+def test_render_reuses_compiled_template():
+    """Test that repeated renders of the same source hit the template cache."""
+    from dslmodel.template import clear_template_cache, render, template_cache_info
+
+    clear_template_cache()
+    assert render("Hello {{ name }}", name="a") == "Hello a"
+    assert render("Hello {{ name }}", name="b") == "Hello b"
+    info = template_cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_template_cache_eviction():
+    """Test that the template cache evicts the least recently used entry."""
+    from dslmodel.template import TemplateCache
+
+    cache = TemplateCache(maxsize=2)
+    first = cache.get_template("{{ 1 }}")
+    cache.get_template("{{ 2 }}")
+    cache.get_template("{{ 3 }}")
+    assert cache.info().currsize == 2
+    assert cache.get_template("{{ 1 }}") is not first
+    assert cache.get_environment("native") is cache.get_environment("native")
@@ -0,0 +1,65 @@
+"""Startup-time regression tests for the ``dsl`` CLI.
+
+Sub-apps are registered lazily, so ``dsl --help`` and a single sub-app must not pay for
+importing every command module (OTEL, dspy, rich tables, ...).
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+
+from dslmodel.cli import SUBAPPS
+
+HELP_WALL_CLOCK_BUDGET_S = 3.0
+SUBCOMMAND_WALL_CLOCK_BUDGET_S = 5.0
+HELP_MODULE_BUDGET = 500
+SUBCOMMAND_MODULE_BUDGET = 700
+
+_HARNESS = """
+import sys
+from dslmodel.cli import app
+try:
+    app(sys.argv[1:])
+except SystemExit:
+    pass
+sys.stderr.write(f"\\nmodules={len(sys.modules)} dspy={'dspy' in sys.modules}\\n")
+"""
+
+
+def _run_cli(*args: str) -> tuple[float, int, bool, str]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", _HARNESS, *args], capture_output=True, text=True, env=env, check=True
+    )
+    elapsed = time.perf_counter() - start
+    stats = result.stderr.strip().splitlines()[-1]
+    modules, dspy_loaded = (part.split("=")[1] for part in stats.split())
+    return elapsed, int(modules), dspy_loaded == "True", result.stdout
+
+
+def test_help_startup_budget():
+    """Test that `dsl --help` lists every sub-app without importing them."""
+    elapsed, modules, dspy_loaded, output = _run_cli("--help")
+    assert "swarm" in output and "forge-dx" in output
+    assert not dspy_loaded
+    assert modules < HELP_MODULE_BUDGET, f"dsl --help imported {modules} modules"
+    assert elapsed < HELP_WALL_CLOCK_BUDGET_S, f"dsl --help took {elapsed:.2f}s"
+
+
+def test_subcommand_startup_budget():
+    """Test that invoking one sub-app imports only that sub-app."""
+    elapsed, modules, _, output = _run_cli("swarm", "--help")
+    assert "status" in output
+    assert modules < SUBCOMMAND_MODULE_BUDGET, f"dsl swarm --help imported {modules} modules"
+    assert elapsed < SUBCOMMAND_WALL_CLOCK_BUDGET_S, f"dsl swarm --help took {elapsed:.2f}s"
+
+
+def test_registry_points_at_existing_modules():
+    """Test that every registered sub-app names a unique command and an existing module."""
+    names = [spec.name for spec in SUBAPPS]
+    assert len(names) == len(set(names))
+    missing = [spec.module for spec in SUBAPPS if importlib.util.find_spec(spec.module) is None]
+    assert not missing, f"registered sub-app modules not found: {missing}"
@@ -0,0 +1,138 @@
+"""Tests for running swarm agent commands in-process, on warm workers and as subprocesses."""
+
+import asyncio
+import sys
+import textwrap
+import time
+
+import pytest
+
+from dslmodel.agents.swarm import CommandExecutor, NextCommand, command_executor
+from dslmodel.agents.swarm.command_executor import release_command_executor
+
+CLI = textwrap.dedent("""
+    import os
+    import sys
+    import time
+
+    import typer
+
+    app = typer.Typer()
+    work = typer.Typer()
+    app.add_typer(work, name="work")
+
+
+    @work.command()
+    def claim(title: str):
+        print(f"claimed {title} in {os.getpid()}")
+
+
+    @work.command()
+    def fail():
+        print("bad input", file=sys.stderr)
+        raise typer.Exit(2)
+
+
+    @work.command()
+    def slow(seconds: float):
+        time.sleep(seconds)
+""")
+
+
+@pytest.fixture
+def cli(tmp_path):
+    path = tmp_path / "cli.py"
+    path.write_text(CLI)
+    return [sys.executable, str(path)]
+
+
+def test_pool_reuses_warm_workers(cli):
+    with CommandExecutor(cli, pool_size=1) as executor:
+        first = executor.run(NextCommand(path=["work", "claim"], args=["a"]))
+        second = executor.run(NextCommand(path=["work", "claim"], args=["b"]))
+        failed = executor.run(NextCommand(path=["work", "fail"]))
+
+        assert (first.mode, first.returncode) == ("pool", 0)
+        assert first.stdout.startswith("claimed a in ")
+        assert first.stdout.split()[-1] == second.stdout.split()[-1]  # same process
+        assert (failed.returncode, failed.stderr) == (2, "bad input\n")
+        assert executor.snapshot()["work claim"]["count"] == 2
+        assert executor.snapshot()["work fail"]["failures"] == 1
+
+
+def test_timeout_replaces_worker(cli):
+    with CommandExecutor(cli, pool_size=1, timeout=0.5) as executor:
+        slow = executor.run(NextCommand(path=["work", "slow"], args=["5"]))
+        after = executor.run(NextCommand(path=["work", "claim"], args=["c"]))
+
+    assert slow.timed_out and not slow.ok
+    assert after.ok and after.stdout.startswith("claimed c")
+
+
+def test_cancelled_command_does_not_leak_its_reply(cli):
+    with CommandExecutor(cli, pool_size=1) as executor:
+        executor.run(NextCommand(path=["work", "claim"], args=["warm-up"]))
+        slow = executor.submit(NextCommand(path=["work", "slow"], args=["0.5"]))
+        time.sleep(0.2)
+        slow.cancel()
+        after = executor.run(NextCommand(path=["work", "claim"], args=["e"]))
+
+    assert after.ok and after.stdout.startswith("claimed e")
+
+
+def test_run_many_runs_concurrently_in_order(cli):
+    commands = [NextCommand(path=["work", "slow"], args=["0.5"]) for _ in range(4)]
+    commands.append(NextCommand(path=["work", "claim"], args=["last"]))
+
+    with CommandExecutor(cli, pool_size=4, max_concurrency=4) as executor:
+        executor.run(NextCommand(path=["work", "claim"], args=["warm-up"]))
+        results = executor.run_many(commands)
+
+    assert all(result.ok for result in results)
+    assert results[-1].stdout.startswith("claimed last")
+    # Four half-second commands at once, not one after another
+    assert sum(result.duration_s for result in results[:4]) < 4 * 0.5 * 2
+
+
+def test_inprocess_commands(cli):
+    namespace = {}
+    exec(CLI, namespace)
+
+    with CommandExecutor(cli, app=namespace["app"], inprocess_commands=["work claim"]) as executor:
+        inprocess = asyncio.run(executor.arun(NextCommand(path=["work", "claim"], args=["d"])))
+        pooled = executor.run(NextCommand(path=["work", "fail"]))
+
+    assert inprocess.mode == "inprocess"
+    assert inprocess.stdout.startswith("claimed d")
+    assert (pooled.mode, pooled.returncode) == ("pool", 2)
+
+
+def test_falls_back_to_subprocess(tmp_path):
+    not_a_cli = tmp_path / "plain.py"
+    not_a_cli.write_text("import sys\nprint(' '.join(sys.argv[1:]))\n")
+
+    with CommandExecutor([sys.executable, str(not_a_cli)]) as executor:
+        result = executor.run(NextCommand(path=["work", "list"], args=["--all"]))
+
+    assert (result.mode, result.stdout) == ("subprocess", "work list --all\n")
+
+
+def test_fq_name_becomes_command_path():
+    with CommandExecutor(["echo"]) as executor:
+        result = executor.run(NextCommand(fq_name="swarmsh.ping.pong", args=["--ping-id", "1"]))
+
+    assert result.stdout == "swarmsh ping pong --ping-id 1\n"
+    assert "swarmsh.ping.pong" in executor.snapshot()
+
+
+def test_shared_executor_closes_with_last_reference(cli):
+    first = command_executor(cli)
+    second = command_executor(cli)
+    assert first is second
+
+    release_command_executor(first)
+    assert first.run(NextCommand(path=["work", "claim"], args=["f"])).ok
+    release_command_executor(second)
+    third = command_executor(cli)
+    assert third is not first
+    release_command_executor(third)
@@ -0,0 +1,56 @@
+"""Import-time budget for ``import dslmodel``.
+
+Workers import dslmodel in short-lived processes, so the package must not pull in
+dspy, pandas or the template stack, nor configure an LM, until they are used.
+"""
+
+import os
+import subprocess
+import sys
+
+# Cumulative microseconds reported by ``python -X importtime`` for the ``dslmodel`` package itself
+# (measured at 0.3-0.5 ms; the rest is headroom for slow CI machines)
+IMPORT_TIME_BUDGET_US = 10_000
+
+HEAVY_MODULES = ("dspy", "pandas", "jinja2", "litellm")
+
+
+def _run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def _cumulative_import_time(stderr: str, module: str) -> int:
+    """Return the cumulative import time in microseconds for ``module`` from ``-X importtime`` output."""
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if name.strip() == module and cumulative_us.strip().isdigit():
+            return int(cumulative_us)
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+def test_import_time_budget():
+    """Test that importing dslmodel stays within the import-time budget."""
+    result = _run_python("import dslmodel", "-X", "importtime")
+    cumulative_us = _cumulative_import_time(result.stderr, "dslmodel")
+    assert cumulative_us < IMPORT_TIME_BUDGET_US, f"import dslmodel took {cumulative_us}us"
+
+
+def test_import_does_not_load_heavy_modules():
+    """Test that importing dslmodel does not import dspy, pandas or jinja2."""
+    result = _run_python(
+        "import sys, dslmodel; print(','.join(m for m in %r if m in sys.modules))" % (HEAVY_MODULES,)
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_attribute_resolution():
+    """Test that public names resolve on first access without configuring an LM."""
+    result = _run_python(
+        "import dspy, dslmodel; dslmodel.DSLModel; dslmodel.render; print(dspy.settings.lm is None)"
+    )
+    assert result.stdout.strip().splitlines()[-1] == "True"
@@ -0,0 +1,44 @@
+import pytest
+from pydantic import Field, ValidationError
+
+from dslmodel import DSLModel
+
+
+class Record(DSLModel):
+    name: str
+    age: int = 0
+
+
+class TemplatedRecord(DSLModel):
+    name: str = Field(default="{{ 'user-' ~ (2 + 3) }}")
+    age: int = 0
+
+
+def test_templated_defaults_precomputed_per_class():
+    """Test that templated defaults are recorded at subclass creation, per class."""
+    assert Record.__dict__["__templated_defaults__"] == ()
+    assert TemplatedRecord.__dict__["__templated_defaults__"] == ("name",)
+
+
+def test_templated_defaults_rendered_on_every_path():
+    """Test that templated defaults render for direct construction, model_validate and bulk_validate."""
+    assert TemplatedRecord().name == "user-5"
+    assert TemplatedRecord(name="given").name == "given"
+    assert TemplatedRecord.model_validate({"age": 1}).name == "user-5"
+    assert [record.name for record in TemplatedRecord.bulk_validate([{}, {"name": "given"}])] == ["user-5", "given"]
+
+
+def test_bulk_validate_matches_per_instance_construction():
+    """Test that bulk validation accepts any iterable and matches one-by-one construction."""
+    rows = [{"name": f"n{i}", "age": i} for i in range(100)]
+    records = Record.bulk_validate(row for row in rows)
+    assert records == [Record(**row) for row in rows]
+    assert Record.list_adapter() is Record.list_adapter()
+
+
+def test_from_records_json_and_errors():
+    """Test that from_records validates JSON arrays and reports failing record indices."""
+    assert Record.from_records(b'[{"name": "a", "age": 1}]') == [Record(name="a", age=1)]
+    with pytest.raises(ValidationError) as excinfo:
+        Record.from_records([{"name": "a"}, {"name": "b", "age": "x"}])
+    assert excinfo.value.errors()[0]["loc"] == (1, "age")
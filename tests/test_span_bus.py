@@ -0,0 +1,176 @@
+"""Tests for routing spans to many agents from one span stream."""
+
+import asyncio
+import json
+import time
+
+from dslmodel.agents.swarm import NextCommand, SpanBus, SpanRouter
+from dslmodel.agents.swarm.span_router import KeywordMatcher
+
+
+def test_keyword_matcher_finds_overlapping_keywords():
+    matcher = KeywordMatcher(["he", "she", "hers", "his", "x"])
+
+    assert matcher.find("ushers") == [0, 1, 2]
+    assert matcher.find("this") == [3]
+    assert matcher.find("") == []
+
+
+class RecordingAgent:
+    """Duck-typed agent: routing only needs TRIGGER_MAP, LISTEN_FILTER and the handlers."""
+
+    LISTEN_FILTER = None
+
+    def __init__(self):
+        self.seen = []
+        self.commands = []
+
+    async def arun_cli(self, cmd):
+        self.commands.append(cmd.args)
+        return "", ""
+
+
+class VoteAgent(RecordingAgent):
+    TRIGGER_MAP = {"vote": "on_vote", "motion": "on_motion", "missing": "not_defined"}
+    LISTEN_FILTER = "swarmsh.roberts."
+
+    def on_vote(self, span):
+        self.seen.append(("vote", span.name))
+        return NextCommand(path=["roberts", "tally"], args=[span.span_id])
+
+    def on_motion(self, span):
+        self.seen.append(("motion", span.name))
+
+
+class PingAgent(RecordingAgent):
+    TRIGGER_MAP = {"ping": "on_ping"}
+
+    def on_ping(self, span):
+        self.seen.append(("ping", span.name))
+
+
+class EverythingAgent(RecordingAgent):
+    TRIGGER_MAP = {}
+
+    def forward(self, span):
+        self.seen.append(("forward", span.name))
+
+
+def test_router_matches_forward_semantics():
+    vote, ping, everything = VoteAgent(), PingAgent(), EverythingAgent()
+    router = SpanRouter([vote, ping, everything], opaque=[2])
+
+    # First TRIGGER_MAP key wins, keys are matched against the lower-cased name
+    assert router.route("swarmsh.roberts.Motion.VOTE") == ((0, "on_vote"), (2, None))
+    assert router.route("swarmsh.roberts.motion") == ((0, "on_motion"), (2, None))
+    # LISTEN_FILTER is a prefix check on the original name
+    assert router.route("other.vote.ping") == ((1, "on_ping"), (2, None))
+    # Keys whose handler does not exist are ignored
+    assert router.route("swarmsh.roberts.missing") == ((2, None),)
+
+
+def span_line(name: str) -> str:
+    return json.dumps({"name": name, "trace_id": "t", "span_id": f"s{time.time_ns()}", "timestamp": time.time()}) + "\n"
+
+
+async def run_bus(bus, path, lines, until):
+    stop = asyncio.Event()
+    task = asyncio.create_task(bus.run(stop))
+    await asyncio.sleep(0.2)
+    with path.open("a") as f:
+        f.writelines(lines)
+    for _ in range(100):
+        if until():
+            break
+        await asyncio.sleep(0.05)
+    stop.set()
+    await asyncio.wait_for(task, 5)
+
+
+def test_bus_fans_out_and_resumes(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    offset_file = tmp_path / "bus.offset"
+    vote, ping, everything = VoteAgent(), PingAgent(), EverythingAgent()
+    bus = SpanBus(path, [vote, ping, everything], queue_size=2, offset_file=offset_file)
+
+    lines = [span_line("swarmsh.roberts.vote"), span_line("swarmsh.ping"), span_line("swarmsh.roberts.motion")] * 5
+    asyncio.run(run_bus(bus, path, lines, lambda: len(everything.seen) == 15))
+
+    assert vote.seen == [("vote", "swarmsh.roberts.vote"), ("motion", "swarmsh.roberts.motion")] * 5
+    assert len(vote.commands) == 5
+    assert ping.seen == [("ping", "swarmsh.ping")] * 5
+    assert bus.snapshot()["VoteAgent"]["handled"] == 10
+    assert bus.snapshot()["VoteAgent"]["max_queued"] <= 2
+
+    # A new bus on the same offset file only sees spans written after the last handled one
+    with path.open("a") as f:
+        f.write(span_line("swarmsh.ping"))
+    ping = PingAgent()
+    asyncio.run(run_bus(SpanBus(path, [ping], offset_file=offset_file), path, [], lambda: ping.seen))
+    assert ping.seen == [("ping", "swarmsh.ping")]
+
+
+def test_bus_survives_handler_errors(tmp_path):
+    class BrokenAgent(RecordingAgent):
+        TRIGGER_MAP = {"ping": "on_ping"}
+
+        def on_ping(self, span):
+            raise RuntimeError("boom")
+
+    path = tmp_path / "spans.jsonl"
+    broken, ping = BrokenAgent(), PingAgent()
+    bus = SpanBus(path, [broken, ping])
+
+    asyncio.run(run_bus(bus, path, [span_line("ping")] * 3, lambda: len(ping.seen) == 3))
+
+    assert bus.snapshot()["BrokenAgent"]["errors"] == 3
+    assert len(ping.seen) == 3
+
+
+
+def test_bus_commits_handled_batches_while_busy(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    offset_file = tmp_path / "bus.offset"
+    releases = [asyncio.Event(), asyncio.Event()]
+
+    class BlockingAgent(RecordingAgent):
+        TRIGGER_MAP = {"block": "on_block"}
+
+        def on_block(self, span):
+            return NextCommand(path=["hold"])
+
+        async def arun_cli(self, cmd):
+            self.commands.append(cmd)
+            await releases[len(self.commands) - 1].wait()
+            return "", ""
+
+    agent = BlockingAgent()
+    bus = SpanBus(path, [agent], offset_file=offset_file)
+
+    async def wait_for(condition):
+        while not condition():
+            await asyncio.sleep(0.02)
+
+    async def scenario():
+        stop = asyncio.Event()
+        task = asyncio.create_task(bus.run(stop))
+        await asyncio.sleep(0.2)
+        with path.open("a") as f:
+            f.write(span_line("block"))
+        await wait_for(lambda: len(agent.commands) == 1)
+        first_batch_end = path.stat().st_size
+        with path.open("a") as f:
+            f.write(span_line("block"))
+        await wait_for(lambda: bus.stats[0].received == 2)
+
+        # The second span is still pending, but the first batch is done and its position saved
+        releases[0].set()
+        await wait_for(lambda: len(agent.commands) == 2)
+        assert json.loads(offset_file.read_text())["offset"] == first_batch_end
+
+        releases[1].set()
+        stop.set()
+        await asyncio.wait_for(task, 5)
+
+    asyncio.run(scenario())
+    assert json.loads(offset_file.read_text())["offset"] == path.stat().st_size
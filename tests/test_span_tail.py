@@ -0,0 +1,139 @@
+"""Tests for batched, event-driven span tailing."""
+
+import asyncio
+import json
+import os
+import threading
+import time
+
+from dslmodel.agents.swarm import SpanTail
+from dslmodel.agents.swarm.span_tail import decode_spans
+
+
+def span_line(name: str, **attributes) -> str:
+    return json.dumps({
+        "name": name,
+        "trace_id": "trace",
+        "span_id": f"span_{time.time_ns()}",
+        "timestamp": time.time(),
+        "attributes": attributes,
+    }) + "\n"
+
+
+def append(path, text: str) -> None:
+    with path.open("a") as f:
+        f.write(text)
+
+
+def test_decode_spans_skips_invalid_lines():
+    lines = [span_line("a").strip().encode(), b"not json", b'{"name": "missing fields"}', b"",
+             span_line("b").strip().encode()]
+
+    assert [span.name for span in decode_spans(lines)] == ["a", "b"]
+
+
+def test_read_batch_returns_complete_lines_only(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    append(path, span_line("old"))
+
+    with SpanTail(path) as tail:
+        assert tail.read_batch() == []
+
+        line = span_line("new")
+        append(path, span_line("first") + line[:10])
+        assert [span.name for span in tail.read_batch()] == ["first"]
+
+        append(path, line[10:])
+        assert [span.name for span in tail.read_batch()] == ["new"]
+
+
+def test_from_start_reads_existing_spans(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    append(path, span_line("a") + span_line("b"))
+
+    with SpanTail(path, from_start=True, chunk_size=16) as tail:
+        assert [span.name for span in tail.read_batch()] == ["a", "b"]
+
+
+def test_batches_are_capped(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    append(path, "".join(span_line(f"s{i}") for i in range(100)))
+    line_size = path.stat().st_size // 100
+
+    with SpanTail(path, from_start=True, chunk_size=64, max_batch_bytes=10 * line_size) as tail:
+        first = tail.read_batch()
+        assert 10 <= len(first) <= 11
+        tail.commit()
+
+        stop = threading.Event()
+        names = [span.name for span in first]
+        for batch in tail.follow(stop):
+            assert len(batch) <= 11
+            names += [span.name for span in batch]
+            if len(names) == 100:
+                stop.set()
+
+    assert names == [f"s{i}" for i in range(100)]
+
+
+def test_commit_resumes_after_last_batch(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    offset_file = tmp_path / "spans.offset"
+
+    with SpanTail(path, offset_file=offset_file) as tail:
+        append(path, span_line("handled"))
+        assert len(tail.read_batch()) == 1
+        tail.commit()
+
+    append(path, span_line("written while down"))
+
+    with SpanTail(path, offset_file=offset_file) as tail:
+        assert [span.name for span in tail.read_batch()] == ["written while down"]
+
+
+def test_follows_rotation_and_truncation(tmp_path):
+    path = tmp_path / "spans.jsonl"
+
+    with SpanTail(path) as tail:
+        append(path, span_line("before rotation"))
+        os.rename(path, tmp_path / "spans.jsonl.1")
+        append(path, span_line("after rotation"))
+        assert [span.name for span in tail.read_batch()] == ["before rotation", "after rotation"]
+
+        path.write_text("")
+        assert tail.read_batch() == []
+        append(path, span_line("after truncation"))
+        assert [span.name for span in tail.read_batch()] == ["after truncation"]
+
+
+def test_follow_wakes_on_write(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    stop = threading.Event()
+
+    with SpanTail(path, poll_interval=5.0) as tail:
+        writer = threading.Timer(0.1, append, (path, span_line("a") + span_line("b")))
+        writer.start()
+        start = time.perf_counter()
+        batch = next(tail.follow(stop))
+        elapsed = time.perf_counter() - start
+
+    assert [span.name for span in batch] == ["a", "b"]
+    assert elapsed < 4.0
+
+
+def test_afollow_wakes_on_write(tmp_path):
+    path = tmp_path / "spans.jsonl"
+
+    async def first_batch(tail):
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.1, append, path, span_line("a"))
+        async for batch in tail.afollow():
+            return batch
+
+    with SpanTail(path, poll_interval=5.0) as tail:
+        start = time.perf_counter()
+        batch = asyncio.run(first_batch(tail))
+        elapsed = time.perf_counter() - start
+
+    assert [span.name for span in batch] == ["a"]
+    assert elapsed < 4.0
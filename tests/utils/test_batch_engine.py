@@ -0,0 +1,121 @@
+import asyncio
+import itertools
+import threading
+import time
+from typing import ClassVar
+
+from dslmodel import DSLModel
+from dslmodel.utils.batch_engine import BatchEngine, RateLimiter, is_transient_error
+
+
+class EchoModel(DSLModel):
+    prompt: str
+
+    @classmethod
+    def from_prompt(cls, prompt: str) -> "EchoModel":
+        return cls(prompt=prompt)
+
+
+class FlakyModel(DSLModel):
+    prompt: str
+    failures: ClassVar[dict[str, int]] = {}
+
+    @classmethod
+    def from_prompt(cls, prompt: str) -> "FlakyModel":
+        cls.failures[prompt] = cls.failures.get(prompt, 0) + 1
+        if cls.failures[prompt] < 3:
+            raise TimeoutError("transient")
+        return cls(prompt=prompt)
+
+
+class BrokenModel(DSLModel):
+    @classmethod
+    def from_prompt(cls, prompt: str) -> "BrokenModel":
+        raise ValueError("permanent")
+
+
+def test_stream_preserves_index_over_unbounded_jobs():
+    """Test that jobs are pulled lazily and results keep their input index."""
+    engine = BatchEngine(max_concurrency=4)
+    jobs = ((EchoModel, f"job {i}") for i in itertools.count())
+
+    async def take(n):
+        results = []
+        async for result in engine.stream(jobs):
+            results.append(result)
+            if len(results) == n:
+                break
+        return results
+
+    results = asyncio.run(take(20))
+    assert len(results) == 20
+    assert all(result.ok and result.instance.prompt == f"job {result.index}" for result in results)
+    assert all(result.latency_s >= 0 for result in results)
+
+
+class SlowModel(DSLModel):
+    prompt: str
+
+    @classmethod
+    def from_prompt(cls, prompt: str) -> "SlowModel":
+        if prompt != "fast":
+            time.sleep(0.5)
+        return cls(prompt=prompt)
+
+
+def test_closing_stream_does_not_wait_for_running_calls():
+    """Test that leaving a stream early does not block the event loop on in-flight jobs."""
+    engine = BatchEngine(max_concurrency=4)
+    jobs = [(SlowModel, "fast")] + [(SlowModel, f"slow {i}") for i in range(3)]
+
+    async def first():
+        stream = engine.stream(jobs)
+        result = await anext(stream)
+        start = time.perf_counter()
+        await stream.aclose()
+        return result, time.perf_counter() - start
+
+    result, closing_s = asyncio.run(first())
+    assert result.instance.prompt == "fast"
+    assert closing_s < 0.25
+
+
+def test_run_retries_transient_errors_only():
+    """Test that transient errors are retried with backoff and permanent ones are not."""
+    engine = BatchEngine(max_retries=3, backoff_base=0.001)
+    flaky, broken = engine.run([(FlakyModel, "a"), (BrokenModel, "b")])
+
+    assert flaky.ok and flaky.attempts == 3
+    assert not broken.ok and broken.attempts == 1
+    assert isinstance(broken.error, ValueError)
+
+
+def test_concurrency_limit_is_respected():
+    """Test that no more than max_concurrency jobs run at the same time."""
+    active, peak, lock = 0, 0, threading.Lock()
+
+    class SlowModel(DSLModel):
+        prompt: str
+
+        @classmethod
+        def from_prompt(cls, prompt: str) -> "SlowModel":
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            threading.Event().wait(0.01)
+            with lock:
+                active -= 1
+            return cls(prompt=prompt)
+
+    results = BatchEngine(max_concurrency=2).run((SlowModel, str(i)) for i in range(8))
+    assert [result.index for result in results] == list(range(8))
+    assert peak <= 2
+
+
+def test_rate_limiter_and_transient_classification():
+    limiter = RateLimiter(per_minute=60_000)
+    assert limiter.acquire() == 0.0
+    assert is_transient_error(TimeoutError())
+    assert is_transient_error(type("RateLimitError", (Exception,), {})())
+    assert not is_transient_error(ValueError())
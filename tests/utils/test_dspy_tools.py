@@ -289,3 +289,27 @@ def test_presets(
     )
 
     assert lm == lm_instance
+
+
+def test_direct_generators_load_the_default_lm(monkeypatch):
+    """
+    Test that dspy entry points which bypass the mixins (gen_int, ...) configure the default LM on first use.
+    """
+    from dspy.utils import DummyLM
+    from dslmodel.generators.gen_python_primitive import gen_int
+
+    calls = []
+
+    def fake_init_text(**kwargs):
+        calls.append(kwargs)
+        dspy.settings.configure(lm=DummyLM([{"reasoning": "six times seven", "output": "42"}] * 2))
+
+    monkeypatch.setattr("dslmodel.utils.dspy_tools.init_text", fake_init_text)
+    previous = dspy.settings.lm
+    dspy.settings.configure(lm=None)
+    try:
+        assert gen_int("six times seven") == 42
+        assert gen_int("six times seven") == 42
+    finally:
+        dspy.settings.configure(lm=previous)
+    assert len(calls) == 1
@@ -0,0 +1,79 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from pydantic import Field
+
+from dslmodel import DSLModel
+from dslmodel.utils.response_cache import (
+    ResponseCache,
+    disable_response_cache,
+    enable_response_cache,
+)
+
+
+class Config(DSLModel):
+    app_name: str = Field(..., description="Application name")
+    version: str = Field(..., description="Application version")
+
+
+@pytest.fixture
+def fake_generation(monkeypatch):
+    """Replace the LM and the generation module so from_prompt runs offline."""
+    calls = []
+
+    def fake_gen_instance(model, prompt, verbose=False):
+        calls.append(prompt)
+        return model(app_name=prompt, version="1.0")
+
+    lm = SimpleNamespace(model="fake/lm", kwargs={"temperature": 0.0})
+    monkeypatch.setattr("dslmodel.utils.dspy_tools.ensure_lm", lambda: lm)
+    monkeypatch.setattr("dslmodel.dspy_modules.gen_pydantic_instance.gen_instance", fake_gen_instance)
+    return calls
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = enable_response_cache(tmp_path / "cache.sqlite3")
+    yield cache
+    disable_response_cache()
+
+
+def test_from_prompt_hits_cache(fake_generation, cache):
+    first = Config.from_prompt("awesome")
+    second = Config.from_prompt("awesome")
+
+    assert fake_generation == ["awesome"]
+    assert second == first
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_from_prompt_bypasses_cache(fake_generation, cache):
+    Config.from_prompt("awesome")
+    Config.from_prompt("awesome", use_cache=False)
+    assert fake_generation == ["awesome", "awesome"]
+
+
+def test_cache_key_depends_on_lm_and_prompt():
+    lm = SimpleNamespace(model="a", kwargs={"temperature": 0.0})
+    hotter = SimpleNamespace(model="a", kwargs={"temperature": 1.0})
+    key = ResponseCache.make_key(Config, "prompt", lm)
+    assert key == ResponseCache.make_key(Config, "prompt", lm)
+    assert key != ResponseCache.make_key(Config, "other", lm)
+    assert key != ResponseCache.make_key(Config, "prompt", hotter)
+
+
+def test_cache_ttl_and_size_eviction(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=60, max_entries=2)
+    for name in ("a", "b", "c"):
+        cache.set(name, Config(app_name=name, version="1"))
+    assert cache.stats().entries == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == {"app_name": "c", "version": "1"}
+
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get("c") is None
+    cache.close()
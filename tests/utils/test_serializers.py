@@ -0,0 +1,113 @@
+import json
+from datetime import datetime
+from enum import Enum
+from typing import ClassVar
+
+import pytest
+import yaml
+
+from dslmodel import DSLModel
+from dslmodel.utils.serializers import (
+    Serializer,
+    _serializers,
+    available_serializers,
+    detect_serializer,
+    get_serializer,
+    register_serializer,
+)
+
+
+class Level(str, Enum):
+    LOW = "low"
+    HIGH = "high"
+
+
+class Item(DSLModel):
+    name: str
+    level: Level = Level.LOW
+    created_at: datetime = datetime(2024, 1, 2, 3, 4, 5)
+    tags: list[str] = []
+
+
+class BinaryItem(Item):
+    default_file_format: ClassVar[str] = "msgpack"
+
+
+ITEM = Item(name="widget", level=Level.HIGH, tags=["a", "b"])
+
+
+@pytest.mark.parametrize("file_format", available_serializers())
+def test_round_trip_with_detection(tmp_path, file_format):
+    """Test that every available format round-trips and is detected without an extension."""
+    path = ITEM.save(str(tmp_path / f"item.{file_format}"), file_format=file_format)
+    assert Item.load(path) == ITEM
+
+    anonymous = tmp_path / "item.bin"
+    anonymous.write_bytes(ITEM.to_bytes(file_format))
+    assert Item.load(str(anonymous)) == ITEM
+    assert Item.from_bytes(ITEM.to_bytes(file_format)) == ITEM
+
+
+def test_yaml_output_matches_pure_python_dumper():
+    """Test that the C YAML dumper matches yaml.dump and writes enums as values."""
+    data = ITEM.model_dump(exclude={"level"})
+    assert get_serializer("yaml").dumps(data).decode() == yaml.dump(data, default_flow_style=False, width=1000)
+    assert "level: high" in ITEM.to_yaml()
+
+
+def test_detection_of_text_formats():
+    """Test detection of JSON, TOML and YAML payloads."""
+    assert detect_serializer(b'  {"name": "x"}').name == "json"
+    assert detect_serializer(b"# comment\nname = 'x'\n").name == "toml"
+    assert detect_serializer(b"name: x\n").name == "yaml"
+
+
+def test_per_class_default_format(tmp_path):
+    """Test that a model class can choose its default save format."""
+    pytest.importorskip("msgpack")
+    path = BinaryItem(name="widget").save(str(tmp_path / "item.data"))
+    assert Item.load(path) == Item(name="widget")
+    assert (tmp_path / "item.data").read_bytes()[:1] != b"n"
+
+
+def test_unknown_and_unavailable_formats(monkeypatch):
+    """Test errors for unknown formats and formats whose dependency is missing."""
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        get_serializer("xml")
+    monkeypatch.setattr(get_serializer("toml"), "requires", "not_a_real_module")
+    with pytest.raises(ImportError, match="not_a_real_module"):
+        get_serializer("toml")
+
+
+def test_register_custom_serializer(monkeypatch):
+    """Test that custom serializers can be registered and selected by name."""
+
+    class UpperJSON(Serializer):
+        name = "upper-json"
+        extensions = (".ujson",)
+        dump_mode = "json"
+
+        def dumps(self, data):
+            return json.dumps(data).upper().encode()
+
+        def loads(self, payload):
+            return json.loads(payload.decode().lower())
+
+    monkeypatch.setattr("dslmodel.utils.serializers._serializers", dict(_serializers))
+    register_serializer(UpperJSON())
+    with pytest.raises(ValueError, match="already registered"):
+        register_serializer(UpperJSON())
+    assert Item.from_bytes(Item(name="w").to_bytes("upper-json"), format="upper-json") == Item(name="w")
+
+
+def test_incomplete_serializer_cannot_be_created():
+    """Test that a serializer missing dumps/loads fails when created, not on first use."""
+
+    class DumpOnly(Serializer):
+        name = "dump-only"
+
+        def dumps(self, data):
+            return b""
+
+    with pytest.raises(TypeError):
+        DumpOnly()
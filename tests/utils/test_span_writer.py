@@ -0,0 +1,96 @@
+import gzip
+import json
+import multiprocessing
+import time
+
+import pytest
+
+from dslmodel.utils.span_writer import SpanWriter, span_writer
+
+
+def read_spans(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_buffers_until_size_or_flush(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    with SpanWriter(path, buffer_bytes=100, flush_interval=60) as writer:
+        writer.write({"name": "a"})
+        assert not path.exists() or path.read_text() == ""
+
+        writer.write_many({"name": "x" * 20} for _ in range(5))
+        assert len(read_spans(path)) == 6
+
+        writer.write('{"name": "encoded"}')
+        writer.flush()
+        assert read_spans(path)[-1] == {"name": "encoded"}
+
+
+def test_background_thread_flushes_old_buffers(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    with SpanWriter(path, flush_interval=0.05) as writer:
+        writer.write({"name": "a"})
+        for _ in range(100):
+            if path.exists() and path.read_text():
+                break
+            time.sleep(0.01)
+
+        assert read_spans(path) == [{"name": "a"}]
+
+
+def test_fsync_always_writes_every_span(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    with SpanWriter(path, fsync="always", flush_interval=60) as writer:
+        writer.write({"name": "a"})
+        assert read_spans(path) == [{"name": "a"}]
+
+
+def test_invalid_fsync_policy(tmp_path):
+    with pytest.raises(ValueError):
+        SpanWriter(tmp_path / "spans.jsonl", fsync="sometimes")
+
+
+def test_rotation_compresses_and_prunes_archives(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    with SpanWriter(path, buffer_bytes=0, max_bytes=50, backup_count=2) as writer:
+        for i in range(6):
+            writer.write({"name": "s", "i": i, "pad": "x" * 20})
+            time.sleep(0.001)  # distinct archive timestamps
+
+        archives = writer.archives()
+        assert writer.rotations == 5
+        assert [archive.suffix for archive in archives] == [".gz", ".jsonl"]
+        # Newest spans: archives in order, then the live file
+        with gzip.open(archives[0], "rt") as f:
+            spans = [json.loads(line) for line in f]
+        spans += read_spans(archives[1]) + read_spans(path)
+        assert [span["i"] for span in spans] == [3, 4, 5]
+
+
+def append_spans(path, worker):
+    writer = span_writer(path, buffer_bytes=4096)
+    for i in range(200):
+        writer.write({"worker": worker, "i": i, "pad": "x" * 100})
+
+
+def test_processes_append_whole_lines(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    processes = [multiprocessing.Process(target=append_spans, args=(path, worker)) for worker in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+
+    spans = read_spans(path)
+    assert len(spans) == 800
+    for worker in range(4):
+        assert [span["i"] for span in spans if span["worker"] == worker] == list(range(200))
+
+
+def test_span_writer_is_shared_per_path(tmp_path):
+    first = span_writer(tmp_path / "spans.jsonl", buffer_bytes=1)
+    second = span_writer(str(tmp_path / "spans.jsonl"))
+
+    assert first is second
+    assert second.buffer_bytes == 1
+    assert span_writer(tmp_path / "other.jsonl") is not first
@@ -0,0 +1,179 @@
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dslmodel.utils.work_store import WorkStore, import_json, open_work_store
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = WorkStore(tmp_path / "work.db")
+    yield store
+    store.close()
+
+
+def test_claim_next_takes_highest_priority_then_oldest(store):
+    store.add_work("low", priority="low", work_id="w1")
+    store.add_work("first high", priority="high", work_id="w2")
+    store.add_work("second high", priority="high", work_id="w3")
+
+    assert store.claim_next("agent-1")["id"] == "w2"
+    assert store.claim_next("agent-1")["id"] == "w3"
+    assert store.claim_next("agent-1")["id"] == "w1"
+    assert store.claim_next("agent-1") is None
+
+
+def test_claim_next_filters_by_team(store):
+    store.add_work("a", team="alpha", work_id="w1")
+    store.add_work("b", team="beta", work_id="w2")
+
+    item = store.claim_next("agent-1", team="beta")
+
+    assert item["id"] == "w2"
+    assert item["agent_id"] == "agent-1"
+    assert item["status"] == "in_progress"
+
+
+def test_concurrent_claims_hand_out_each_item_once(tmp_path):
+    path = tmp_path / "work.db"
+    seed = WorkStore(path)
+    for i in range(50):
+        seed.add_work(f"item {i}", work_id=f"w{i}")
+
+    def worker(n):
+        store = WorkStore(path)
+        claimed = []
+        while (item := store.claim_next(f"agent-{n}")) is not None:
+            claimed.append(item["id"])
+        store.close()
+        return claimed
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(worker, range(4)))
+
+    claimed = [work_id for result in results for work_id in result]
+    assert sorted(claimed) == sorted(f"w{i}" for i in range(50))
+    assert seed.work_counts() == {"in_progress": 50}
+    seed.close()
+
+
+def test_complete_and_release_update_agent_and_claims(store):
+    store.add_agent("worker", agent_id="agent-1")
+    store.add_work("task", work_id="w1")
+    store.claim("w1", "agent-1")
+    assert store.get_agent("agent-1")["status"] == "working"
+
+    store.release("w1")
+    assert store.get_work("w1")["status"] == "pending"
+    assert store.get_agent("agent-1")["status"] == "idle"
+
+    store.claim("w1", "agent-1")
+    assert store.complete("w1", score=8)
+
+    item = store.get_work("w1")
+    assert (item["status"], item["progress"], item["score"]) == ("completed", 100, 8)
+    assert store.get_agent("agent-1")["work_completed"] == 1
+    assert [claim["outcome"] for claim in store.claims("w1")] == ["released", "completed"]
+    assert not store.claim("w1", "agent-1")
+    assert not store.complete("missing")
+
+
+def test_complete_fields_override_defaults(store):
+    store.add_work("task", work_id="w1")
+
+    assert store.complete("w1", progress=90, completed_at="2024-01-01T00:00:00")
+
+    item = store.get_work("w1")
+    assert (item["status"], item["progress"], item["completed_at"]) == ("completed", 90, "2024-01-01T00:00:00")
+
+
+def test_extra_fields_round_trip_and_aggregate(store):
+    store.add_work("a", work_id="w1", velocity_points=3, tags=["x"])
+    store.add_work("b", work_id="w2", velocity_points=5)
+    store.add_work("c", work_id="w3")
+
+    assert store.get_work("w1")["tags"] == ["x"]
+    store.update_work("w3", velocity_points=1)
+    assert store.total("velocity_points") == 9
+    assert store.average("score", default=5) == 5
+
+
+def test_transaction_rolls_back_on_error(store):
+    with pytest.raises(RuntimeError):
+        with store.transaction():
+            store.add_work("doomed", work_id="w1")
+            raise RuntimeError
+
+    assert store.get_work("w1") is None
+
+
+def test_events_keep_only_newest(store):
+    for i in range(5):
+        store.log_event("tick", {"i": i}, keep=3)
+
+    assert [event["data"]["i"] for event in store.events()] == [2, 3, 4]
+    assert [event["data"]["i"] for event in store.events(last=1)] == [4]
+
+
+def test_import_json_reads_legacy_files(tmp_path, store):
+    legacy = tmp_path / "legacy"
+    legacy.mkdir()
+    (legacy / "work_items.json").write_text(json.dumps({
+        "items": {"WORK-1": {"id": "WORK-1", "title": "Fix", "status": "pending", "priority": "high"}},
+        "next_id": 2,
+    }))
+    (legacy / "agents.json").write_text(json.dumps({"agent-1": {"name": "a", "status": "idle", "created": "t"}}))
+    (legacy / "work_claims_fast.jsonl").write_text(
+        json.dumps({"work_item_id": "work_1", "agent_id": "agent-1", "work_type": "bug",
+                    "description": "Crash", "status": "active"}) + "\n"
+    )
+    (legacy / "telemetry.json").write_text("not json")
+
+    imported = import_json(store, legacy)
+
+    assert imported == {"work_items.json": 1, "agents.json": 1, "work_claims_fast.jsonl": 1}
+    assert store.get_work("WORK-1")["priority"] == "high"
+    assert store.get_work("work_1")["type"] == "bug"
+    assert store.get_agent("agent-1")["created_at"] == "t"
+    assert store.next_id() == 2
+
+
+def test_import_claims_without_status(tmp_path, store):
+    legacy = tmp_path / "legacy"
+    legacy.mkdir()
+    (legacy / "work_claims.json").write_text(json.dumps([
+        {"work_item_id": "w1", "agent_id": "agent-1", "description": "Done", "completed_at": "t"},
+        {"work_item_id": "w2", "agent_id": "agent-1", "description": "Open", "status": "active"},
+    ]))
+
+    assert import_json(store, legacy) == {"work_claims.json": 2}
+    assert store.get_work("w1")["status"] == "completed"
+    assert [claim["outcome"] for claim in store.claims()] == ["completed", None]
+
+
+def test_failed_import_leaves_store_empty(tmp_path, store):
+    legacy = tmp_path / "legacy"
+    legacy.mkdir()
+    (legacy / "work_items.json").write_text(json.dumps({"items": {"w1": {"id": "w1", "title": "a"}}}))
+    (legacy / "work_claims.json").write_text(json.dumps([{"agent_id": "agent-1"}]))  # no work_item_id
+
+    with pytest.raises(sqlite3.IntegrityError):
+        import_json(store, legacy)
+    assert store.is_empty()
+
+
+def test_open_work_store_imports_only_into_a_new_store(tmp_path):
+    legacy = tmp_path / "legacy"
+    legacy.mkdir()
+    (legacy / "work_queue.json").write_text(json.dumps([{"id": "w1", "description": "Task", "status": "pending"}]))
+
+    store = open_work_store(tmp_path / "work.db", legacy_dir=legacy)
+    assert store.get_work("w1")["title"] == "Task"
+    store.complete("w1")
+    store.close()
+
+    store = open_work_store(tmp_path / "work.db", legacy_dir=legacy)
+    assert store.get_work("w1")["status"] == "completed"
+    store.close()
@@ -0,0 +1,99 @@
+import time
+
+from dslmodel.workflow import execute_workflow
+from dslmodel.workflow.dag_scheduler import DAGScheduler
+from dslmodel.workflow.workflow_models import Action, Job, Workflow
+
+
+def sleep_job(name, seconds=0.3, depends_on=None, code="", **kwargs):
+    return Job(
+        name=name,
+        depends_on=depends_on,
+        steps=[Action(name=f"{name}-step", code=f"import time\ntime.sleep({seconds})\n{code}")],
+        **kwargs,
+    )
+
+
+def test_independent_jobs_run_concurrently():
+    """Test that a fan-out of independent jobs takes about as long as one job."""
+    workflow = Workflow(
+        name="fanout",
+        jobs=[sleep_job("prepare", 0.05, code="base = 1")]
+        + [sleep_job(f"branch{i}", 0.3, depends_on=["prepare"], code=f"out{i} = base + {i}") for i in range(4)]
+        + [sleep_job("report", 0.0, depends_on=[f"branch{i}" for i in range(4)], code="total = out0 + out1 + out2 + out3")],
+    )
+    start = time.perf_counter()
+    context = execute_workflow(workflow)
+    assert time.perf_counter() - start < 0.9
+    assert context["total"] == 10
+
+
+def test_context_follows_dependencies_and_merges_in_topological_order():
+    """Test that jobs only see their dependencies and the final merge is deterministic."""
+    workflow = Workflow(
+        name="merge",
+        jobs=[
+            sleep_job("slow", 0.2, code="value = 'slow'"),
+            sleep_job("fast", 0.0, code="seen_slow = 'value' in dir()\nvalue = 'fast'"),
+            sleep_job("after", 0.0, depends_on=["slow"], code="from_slow = value"),
+        ],
+    )
+    scheduler = DAGScheduler(workflow)
+    context = scheduler.run({})
+    assert context["from_slow"] == "slow"
+    assert context["seen_slow"] is False
+    # "fast" comes after "slow" in topological order, so its value wins regardless of timing
+    assert context["value"] == "fast"
+    assert all(result.status == "succeeded" for result in scheduler.results.values())
+
+
+def test_retries_and_sla(tmp_path):
+    """Test that max_retries re-runs a failing job and sla_seconds misses are reported."""
+    marker = tmp_path / "attempted"
+    flaky_code = (
+        "import os\n"
+        f"if not os.path.exists({str(marker)!r}):\n"
+        f"    open({str(marker)!r}, 'w').close()\n"
+        "    raise RuntimeError('first attempt fails')\n"
+        "recovered = True"
+    )
+    workflow = Workflow(
+        name="retries",
+        jobs=[
+            Job(name="flaky", max_retries=2, retry_delay_seconds=0, steps=[Action(name="flaky", code=flaky_code)]),
+            Job(name="broken", max_retries=1, steps=[Action(name="broken", code="raise ValueError('always')")]),
+            sleep_job("late", 0.1, sla_seconds=0),
+        ],
+    )
+    scheduler = DAGScheduler(workflow)
+    context = scheduler.run({})
+    results = scheduler.results
+    assert context["recovered"] is True
+    assert (results["flaky"].status, results["flaky"].attempts) == ("succeeded", 2)
+    assert (results["broken"].status, results["broken"].attempts) == ("failed", 2)
+    assert "always" in results["broken"].error
+    assert results["late"].sla_missed and not results["flaky"].sla_missed
+
+
+
+def test_context_is_rendered_once_and_shared_by_jobs(monkeypatch):
+    """Test that the initial context is rendered once per run, not once per job."""
+    from dslmodel.workflow import context as context_module
+
+    renders = []
+    real_render = context_module.render
+    monkeypatch.setattr(context_module, "render", lambda *args, **kwargs: renders.append(args) or real_render(*args, **kwargs))
+
+    rows = [{"id": i} for i in range(100)]
+    workflow = Workflow(
+        name="shared",
+        jobs=[Job(name=f"job{i}", steps=[Action(name="count", code=f"seen{i} = len(rows)")]) for i in range(5)],
+    )
+    scheduler = DAGScheduler(workflow)
+    result = scheduler.run({"rows": rows, "greeting": "'{{ rows | length }} rows'"})
+
+    assert len(renders) == 1
+    assert result["greeting"] == "100 rows"
+    assert [result[f"seen{i}"] for i in range(5)] == [100] * 5
+    # Jobs see the rendered context but only report their own writes
+    assert [job.delta for job in scheduler.results.values()] == [{f"seen{i}": 100} for i in range(5)]
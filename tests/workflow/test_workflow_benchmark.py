@@ -0,0 +1,32 @@
+import json
+
+from typer.testing import CliRunner
+
+from dslmodel.cli import app
+
+runner = CliRunner()
+TINY = ["bench", "workflow", "--jobs", "4", "--width", "2", "--actions", "3", "--conditions", "0.5", "--repeat", "1"]
+
+
+def test_bench_workflow_saves_and_checks_baseline(tmp_path):
+    results = tmp_path / "results.json"
+    result = runner.invoke(app, [*TINY, "--save", str(results)])
+    assert result.exit_code == 0, result.output
+    custom = json.loads(results.read_text())["custom"]
+    assert custom["scenario"]["jobs"] == 4
+    assert custom["us_per_action"] > 0 and custom["peak_mib"] > 0
+
+    result = runner.invoke(app, [*TINY, "--baseline", str(results), "--tolerance", "100"])
+    assert result.exit_code == 0, result.output
+
+    custom["us_per_action"] /= 1000
+    results.write_text(json.dumps({"custom": custom}))
+    result = runner.invoke(app, [*TINY, "--baseline", str(results)])
+    assert result.exit_code == 1
+    assert "REGRESSION custom" in result.output
+
+
+def test_bench_workflow_writes_cprofile(tmp_path):
+    result = runner.invoke(app, [*TINY, "--profile", "cprofile", "--profile-dir", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "custom.prof").stat().st_size > 0
@@ -0,0 +1,86 @@
+import pytest
+
+from dslmodel.workflow import execute_workflow, resume_workflow
+from dslmodel.workflow.checkpoint import CheckpointError, WorkflowCheckpoint
+from dslmodel.workflow.workflow_models import Action, Job, Workflow
+
+
+def make_workflow(prepare_code: str, crash: bool, idempotent: bool = True) -> Workflow:
+    return Workflow(name="etl", jobs=[
+        Job(name="prepare", steps=[Action(name="load", code=prepare_code)]),
+        Job(name="process", depends_on=["prepare"], steps=[
+            Action(name="total", code="total = sum(rows)"),
+            Action(name="publish", code="raise KeyboardInterrupt" if crash else "published = True",
+                   idempotent=idempotent),
+            Action(name="double", code="double = total * 2"),
+        ]),
+    ], context={"scale": 1})
+
+
+def test_resume_skips_completed_work(tmp_path):
+    with pytest.raises(KeyboardInterrupt):
+        execute_workflow(make_workflow("rows = list(range(5))", crash=True), checkpoint_dir=tmp_path)
+
+    checkpoint = WorkflowCheckpoint(tmp_path)
+    assert checkpoint.load_run()["status"] == "running"
+    assert checkpoint.load_job("prepare")["status"] == "succeeded"
+    assert checkpoint.load_job("process")["actions"] == 1
+    assert checkpoint.load_job("process")["delta"]["total"] == 10
+
+    # Completed jobs and actions must not run again
+    resumed = make_workflow("raise RuntimeError('ran twice')", crash=False)
+    resumed.jobs[1].steps[0].code = "raise RuntimeError('ran twice')"
+    context = resume_workflow(resumed, tmp_path)
+
+    assert context["rows"] == [0, 1, 2, 3, 4]
+    assert (context["total"], context["published"], context["double"]) == (10, True, 20)
+    assert context["scale"] == 1
+    assert checkpoint.load_run()["status"] == "completed"
+
+
+def test_interrupted_non_idempotent_action_is_not_rerun_silently(tmp_path):
+    with pytest.raises(KeyboardInterrupt):
+        execute_workflow(make_workflow("rows = [1]", crash=True, idempotent=False), checkpoint_dir=tmp_path)
+
+    workflow = make_workflow("rows = [1]", crash=False, idempotent=False)
+    with pytest.raises(CheckpointError, match="publish"):
+        resume_workflow(workflow, tmp_path)
+
+    context = resume_workflow(workflow, tmp_path, rerun_interrupted=True)
+    assert context["published"] is True
+
+
+def test_resume_rejects_other_workflow(tmp_path):
+    execute_workflow(make_workflow("rows = [1]", crash=False), checkpoint_dir=tmp_path)
+    other = Workflow(name="other", jobs=[Job(name="job", steps=[Action(name="a", code="pass")])])
+
+    with pytest.raises(CheckpointError, match="belongs to workflow 'etl'"):
+        resume_workflow(other, tmp_path)
+
+
+def test_job_with_non_json_changes_runs_again_on_resume(tmp_path):
+    prepare = "rows = list(range(5)); tags = [{'a', 'b'}]"
+    with pytest.raises(KeyboardInterrupt):
+        execute_workflow(make_workflow(prepare, crash=True), checkpoint_dir=tmp_path)
+
+    state = WorkflowCheckpoint(tmp_path).load_job("prepare")
+    assert (state["status"], state["resumable"], state["delta"]) == ("succeeded", False, {})
+
+    context = resume_workflow(make_workflow(prepare, crash=False), tmp_path)
+    assert context["tags"] == [{"a", "b"}]
+    assert (context["total"], context["published"], context["double"]) == (10, True, 20)
+
+
+def test_rerun_of_non_json_job_does_not_repeat_non_idempotent_actions(tmp_path):
+    workflow = make_workflow("rows = [1]", crash=True)
+    workflow.jobs[0].steps[0].idempotent = False
+    workflow.jobs[0].steps.append(Action(name="stamp", code="stamps = {'at': {1, 2}}"))
+    with pytest.raises(KeyboardInterrupt):
+        execute_workflow(workflow, checkpoint_dir=tmp_path)
+
+    workflow.jobs[1].steps[1].code = "published = True"
+    with pytest.raises(CheckpointError, match="'load'"):
+        resume_workflow(workflow, tmp_path)
+
+    context = resume_workflow(workflow, tmp_path, rerun_interrupted=True)
+    assert context["stamps"] == {"at": {1, 2}}
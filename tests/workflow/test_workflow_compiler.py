@@ -0,0 +1,58 @@
+import pytest
+
+from dslmodel.workflow.compiler import (
+    WorkflowCompileError,
+    clear_code_cache,
+    code_cache_info,
+    compile_source,
+    resolve_code,
+)
+from dslmodel.workflow.workflow_executor import execute_job
+from dslmodel.workflow.workflow_models import Action, Condition, Job, Workflow
+
+
+def test_sources_are_compiled_once():
+    clear_code_cache()
+    job = Job(name="loop", steps=[
+        Action(name=f"step-{i}", code="counter += 1", cond=Condition(expr="counter < 100"))
+        for i in range(10)
+    ])
+
+    context = execute_job(job, {"counter": 0})
+
+    assert context["counter"] == 10
+    info = code_cache_info()
+    assert info.misses == 2
+    assert info.hits == 18
+
+
+def test_static_templates_render_once_and_dynamic_ones_per_context():
+    compiled, source = resolve_code("limit = {{ 5 * 20 }}", {})
+    assert source == "limit = 100"
+
+    _, first = resolve_code("name = '{{ user }}'", {"user": "ann"})
+    _, second = resolve_code("name = '{{ user }}'", {"user": "bob"})
+    assert (first, second) == ("name = 'ann'", "name = 'bob'")
+    assert compile_source(first).names == {"name"}
+
+
+def test_compile_reports_every_failure():
+    workflow = Workflow(name="broken", jobs=[
+        Job(name="job", steps=[
+            Action(name="ok", code="x = 1", cond=Condition(expr="x > 0")),
+            Action(name="bad_code", code="x = = 1"),
+            Action(name="bad_cond", code="x = 2", cond=Condition(expr="x >")),
+            Action(name="bad_template", code="x = {{ value }"),
+            Action(name="dynamic", code="x = {{ value }}"),
+        ])
+    ])
+
+    issues = workflow.compile(raise_errors=False)
+    assert [(issue.action, issue.field) for issue in issues] == [
+        ("bad_code", "code"), ("bad_cond", "cond"), ("bad_template", "code"),
+    ]
+    assert issues[0].lineno == 1
+
+    with pytest.raises(WorkflowCompileError, match="3 source") as error:
+        workflow.compile()
+    assert error.value.issues == issues
@@ -0,0 +1,59 @@
+from dslmodel.workflow.context import WorkflowContext, code_names
+from dslmodel.workflow.workflow_executor import evaluate_condition, execute_action, execute_job, update_context
+from dslmodel.workflow.workflow_models import Action, Job
+
+
+def test_update_context_shares_unchanged_values():
+    rows = [{"id": i} for i in range(1000)]
+    context = {"rows": rows, "skip": object()}
+
+    new_context = update_context(context, {"count": "{{ rows | length }}"})
+
+    assert new_context["rows"] is rows
+    assert new_context["count"] == 1000
+    assert "skip" not in new_context
+    assert "count" not in context
+
+
+def test_only_written_values_are_rendered():
+    context = WorkflowContext.wrap({"name": "Alice", "greeting": "Hi {{ name }}"})
+    assert context["greeting"] == "Hi Alice"
+
+    context = update_context(context, {"name": "Bob"})
+    assert context["greeting"] == "Hi Alice"
+    assert context.dirty == {}
+
+
+def test_in_place_mutation_does_not_leak():
+    context = {"messages": ["a"], "untouched": [1, 2]}
+    job = Job(name="job", steps=[
+        Action(name="append", code="messages.append('b')"),
+        Action(name="append_again", code="messages.append('c')"),
+    ])
+
+    new_context = execute_job(job, context)
+
+    assert new_context["messages"] == ["a", "b", "c"]
+    assert context["messages"] == ["a"]
+    assert new_context["untouched"] is context["untouched"]
+
+
+def test_condition_cannot_mutate_context():
+    context = {"items": [1, 2, 3]}
+    assert evaluate_condition("items.pop() == 3", context)
+    assert context["items"] == [1, 2, 3]
+
+
+def test_scopes_stay_compact():
+    context = {"counter": 0}
+    action = Action(name="increment", code="counter += 1")
+    for _ in range(50):
+        context = execute_action(action, context)
+
+    assert context["counter"] == 50
+    assert len(context.maps) == 2
+
+
+def test_code_names_detects_dynamic_scope_access():
+    assert code_names(compile("total = sum(x for x in rows)", "<test>", "exec")) >= {"total", "rows"}
+    assert code_names(compile("globals()['rows'].clear()", "<test>", "exec")) is None
@@ -0,0 +1,82 @@
+import sys
+
+from loguru import logger
+
+from dslmodel.workflow import configure_logging, execute_workflow
+from dslmodel.workflow.events import EventBuffer, StepMetrics, workflow_events
+from dslmodel.workflow.workflow_models import Action, Condition, Job, Workflow
+
+
+def make_workflow() -> Workflow:
+    return Workflow(name="etl", jobs=[
+        Job(name="prepare", steps=[
+            Action(name="load", code="rows = [1, 2, 3]"),
+            Action(name="skip", code="skipped = True", cond=Condition(expr="len(rows) > 10")),
+        ]),
+        Job(name="process", depends_on=["prepare"], steps=[
+            Action(name="total", code="total = sum(rows)", parallel=True),
+            Action(name="broken", code="1 / 0", parallel=True),
+        ]),
+    ])
+
+
+def test_events_cover_jobs_actions_and_conditions():
+    buffer, metrics = EventBuffer(), StepMetrics()
+    with workflow_events.subscribed(buffer), workflow_events.subscribed(metrics):
+        context = execute_workflow(make_workflow())
+
+    assert context["total"] == 6
+    events = list(buffer.events)
+    assert {event.run_id for event in events} == {events[0].run_id}
+    assert (events[0].kind, events[-1].kind) == ("workflow_start", "workflow_end")
+
+    ends = {(event.job, event.action): event.status for event in events if event.kind.endswith("_end")}
+    assert ends[("prepare", "load")] == "ok"
+    assert ends[("prepare", "skip")] == "skipped"
+    # Parallel actions run on worker threads but keep their job's tags
+    assert ends[("process", "total")] == "ok"
+    assert ends[("process", "broken")] == "error"
+    assert ends[("process", None)] == "ok"
+
+    [condition] = [event for event in events if event.kind == "condition"]
+    assert (condition.action, condition.status, condition.data) == ("skip", "false", {"expr": "len(rows) > 10"})
+
+    snapshot = metrics.snapshot()
+    assert snapshot["etl/process/broken"]["errors"] == 1
+    assert snapshot["etl/prepare"]["count"] == 1
+    assert snapshot["etl"]["max_s"] >= snapshot["etl/prepare"]["max_s"]
+
+
+def test_verbose_run_returns_only_its_own_events():
+    context = execute_workflow(make_workflow(), verbose=True)
+    other = execute_workflow(Workflow(name="other", jobs=[Job(name="job", steps=[Action(name="a", code="a = 1")])]),
+                             verbose=True)
+
+    assert "action_end etl/prepare/load ok" in "\n".join(context["log_messages"])
+    assert not any("etl" in message for message in other["log_messages"])
+
+
+def test_configure_logging_gates_by_level(tmp_path):
+    log_file = tmp_path / "workflow.log"
+    configure_logging("INFO", log_file=log_file)
+    try:
+        execute_workflow(make_workflow())
+        logger.complete()
+    finally:
+        logger.remove()
+        logger.add(sys.stderr)  # loguru's default handler
+
+    text = log_file.read_text()
+    assert "Executing workflow: etl" in text
+    assert "Error executing code for action 'broken'" in text
+    assert "DEBUG" not in text
+
+
+def test_emit_without_sinks_is_a_no_op():
+    sinks = workflow_events._sinks
+    workflow_events._sinks = ()
+    try:
+        assert not workflow_events.enabled
+        execute_workflow(make_workflow())
+    finally:
+        workflow_events._sinks = sinks
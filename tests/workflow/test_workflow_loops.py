@@ -0,0 +1,55 @@
+import pytest
+
+from dslmodel.workflow.workflow_executor import execute_action, execute_workflow
+from dslmodel.workflow.workflow_models import Action, Job, Loop, Workflow
+
+
+@pytest.mark.parametrize("backend", ["sequential", "thread"])
+def test_loop_collects_results_in_order(backend):
+    action = Action(
+        name="square",
+        code="square = n * n\nn = None",
+        loop=Loop(over="numbers", var="n", collect="square", into="squares", backend=backend, chunk_size=3),
+    )
+    context = {"numbers": list(range(10))}
+
+    new_context = execute_action(action, context)
+
+    assert new_context["squares"] == [n * n for n in range(10)]
+    assert "square" not in new_context and "n" not in new_context
+
+
+def test_loop_reduce_and_item_isolation():
+    rows = [{"amount": 150}, {"amount": 90}, {"amount": 200}]
+    action = Action(
+        name="tax",
+        code="row['amount'] = row['amount'] * 2",
+        loop=Loop(over="[r for r in rows if r['amount'] > 100]", var="row", into="total",
+                  reduce="sum(r['amount'] for r in results)", backend="thread"),
+    )
+
+    new_context = execute_action(action, {"rows": rows})
+
+    assert new_context["total"] == 700
+    assert rows == [{"amount": 150}, {"amount": 90}, {"amount": 200}]
+
+
+def test_loop_in_workflow_with_process_backend():
+    workflow = Workflow(name="fan_out", jobs=[
+        Job(name="job", steps=[
+            Action(name="setup", code="words = ['a', 'bb', 'ccc']"),
+            Action(
+                name="measure",
+                code="size = len(word) * factor",
+                loop=Loop(over="words", var="word", collect="size", into="sizes", backend="process", max_workers=2),
+            ),
+        ])
+    ], context={"factor": 10})
+
+    assert execute_workflow(workflow)["sizes"] == [10, 20, 30]
+
+
+def test_unknown_backend_raises():
+    action = Action(name="bad", code="pass", loop=Loop(over="[1]", backend="gpu"))
+    with pytest.raises(ValueError, match="Unknown loop backend"):
+        execute_action(action, {}, raise_errors=True)
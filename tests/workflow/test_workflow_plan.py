@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from dslmodel.workflow.plan import ImportCache, ImportCycleError, plan_workflow
+from dslmodel.workflow.workflow_executor import execute_workflow
+from dslmodel.workflow.workflow_models import Action, Job, Workflow
+
+
+def write_workflow(path, name, code, imports=(), depends_on=None, context=None):
+    Workflow(
+        name=name,
+        imports=list(imports),
+        context=context or {},
+        jobs=[Job(name=name, depends_on=depends_on, steps=[Action(name=f"{name}-step", code=code)])],
+    ).to_yaml(str(path))
+    return path
+
+
+@pytest.fixture
+def imported_files(tmp_path):
+    write_workflow(tmp_path / "base.yaml", "base", "rows = [1, 2, 3]", context={"source": "base"})
+    write_workflow(tmp_path / "stats.yaml", "stats", "total = sum(rows)", imports=["base.yaml"], depends_on=["base"])
+    write_workflow(tmp_path / "report.yaml", "report", "report = f'{source}: {total}'",
+                   imports=["stats.yaml", "base.yaml"], depends_on=["stats"])
+    return tmp_path
+
+
+def test_plan_flattens_imports_once(imported_files):
+    cache = ImportCache()
+    root = Workflow(name="root", imports=[str(imported_files / "report.yaml")], jobs=[
+        Job(name="final", depends_on=["report"], steps=[Action(name="done", code="done = report.upper()")]),
+    ])
+
+    plan = plan_workflow(root, cache)
+
+    assert [job.name for job in plan.jobs] == ["base", "stats", "report", "final"]
+    assert len(plan.sources) == 3
+    assert plan.context == {"source": "base"}
+    assert root.imports and len(root.jobs) == 1
+
+    plan_workflow(root, cache)
+    assert (cache.misses, cache.hits) == (3, 3)
+
+    assert execute_workflow(plan)["done"] == "BASE: 6"
+    assert execute_workflow(plan)["done"] == "BASE: 6"
+
+
+def test_process_imports_is_idempotent(imported_files):
+    root = Workflow(name="root", imports=[str(imported_files / "stats.yaml")], jobs=[])
+    root.process_imports()
+    root.process_imports()
+
+    assert [job.name for job in root.jobs] == ["base", "stats"]
+
+
+def test_import_cycle_is_reported(tmp_path):
+    write_workflow(tmp_path / "a.yaml", "a", "a = 1", imports=["b.yaml"])
+    write_workflow(tmp_path / "b.yaml", "b", "b = 1", imports=["a.yaml"])
+    root = Workflow(name="root", imports=[str(tmp_path / "a.yaml")], jobs=[])
+
+    with pytest.raises(ImportCycleError, match=r"a\.yaml -> .*b\.yaml -> .*a\.yaml"):
+        plan_workflow(root, ImportCache())
+
+
+def test_changed_import_makes_plan_stale(imported_files):
+    root = Workflow(name="root", imports=[str(imported_files / "base.yaml")], jobs=[])
+    plan = plan_workflow(root)
+    assert not plan.is_stale()
+
+    path = write_workflow(imported_files / "base.yaml", "base", "rows = [10, 20]")
+    os.utime(path, ns=(0, 0))
+
+    assert plan.is_stale()
+    assert execute_workflow(plan)["rows"] == [10, 20]
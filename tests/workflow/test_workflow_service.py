@@ -0,0 +1,91 @@
+import asyncio
+import os
+
+import pytest
+
+from dslmodel.workflow.plan import ImportCache
+from dslmodel.workflow.service import WorkflowService
+from dslmodel.workflow.workflow_models import Action, CronSchedule, DateSchedule, Job, Workflow
+
+
+def write_workflow(path, name, code="done = True", schedules=None, **fields):
+    Workflow(
+        name=name,
+        schedules=schedules if schedules is not None else [CronSchedule(cron="0 * * * *")],
+        jobs=[Job(name="job", steps=[Action(name="step", code=code)])],
+        **fields,
+    ).to_yaml(str(path))
+    return path
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = WorkflowService(tmp_path, max_workers=2, reload_interval=None, cache=ImportCache())
+    yield service
+    service.shutdown()
+
+
+def test_reload_tracks_added_changed_and_removed_files(tmp_path, service):
+    write_workflow(tmp_path / "hourly.yaml", "hourly")
+    daily = write_workflow(tmp_path / "daily.yaml", "daily", schedules=[CronSchedule(cron="0 0 * * *")])
+
+    assert service.reload() == {"added": ["daily", "hourly"], "updated": [], "removed": []}
+    assert service.reload() == {"added": [], "updated": [], "removed": []}
+    assert sorted(job.id for job in service.scheduler.get_jobs()) == ["daily:0", "hourly:0"]
+
+    write_workflow(daily, "daily", schedules=[CronSchedule(cron="0 0 * * *"), CronSchedule(cron="0 12 * * *")])
+    os.utime(daily, ns=(0, 0))
+    (tmp_path / "hourly.yaml").unlink()
+
+    assert service.reload() == {"added": [], "updated": ["daily"], "removed": ["hourly"]}
+    assert sorted(job.id for job in service.scheduler.get_jobs()) == ["daily:0", "daily:1"]
+
+
+def test_broken_file_keeps_previous_version(tmp_path, service):
+    path = write_workflow(tmp_path / "report.yaml", "report")
+    service.reload()
+
+    path.write_text("name: [unclosed")
+    os.utime(path, ns=(0, 0))
+
+    assert service.reload() == {"added": [], "updated": [], "removed": []}
+    assert "report" in service.workflows
+
+
+def test_concurrency_limit_skips_extra_runs(tmp_path, service):
+    write_workflow(tmp_path / "slow.yaml", "slow", code="import time; time.sleep(0.3)")
+    service.reload()
+
+    first = service.run_now("slow")
+    assert service.run_now("slow") is None
+    first.result(timeout=10)
+
+    assert [record.status for record in service.history("slow")] == ["succeeded", "skipped"]
+    assert service.history("slow")[0].duration_s >= 0.3
+    assert service.status()["workflows"]["slow"]["active"] == 0
+
+
+def test_service_runs_scheduled_workflows(tmp_path):
+    write_workflow(tmp_path / "now.yaml", "now", schedules=[DateSchedule(run_date="now")])
+    write_workflow(tmp_path / "failing.yaml", "failing", schedules=[DateSchedule(run_date="now")],
+                   code="raise KeyboardInterrupt")
+    write_workflow(tmp_path / "late.yaml", "late", schedules=[DateSchedule(run_date="2020-01-01 00:00:00")],
+                   misfire_grace_seconds=1)
+    service = WorkflowService(tmp_path, reload_interval=0.1, cache=ImportCache())
+
+    async def main():
+        stop = asyncio.Event()
+        task = asyncio.create_task(service.serve(stop))
+        for _ in range(100):
+            await asyncio.sleep(0.05)
+            history = service.history()
+            if len(history) == 3 and all(record.status in ("succeeded", "failed", "missed") for record in history):
+                break
+        stop.set()
+        await task
+
+    asyncio.run(main())
+
+    statuses = {record.workflow: record.status for record in service.history()}
+    assert statuses == {"now": "succeeded", "failing": "failed", "late": "missed"}
+    assert service.queue_depth == 0
@@ -0,0 +1,62 @@
+import asyncio
+import time
+from subprocess import CalledProcessError, TimeoutExpired
+
+import pytest
+
+from dslmodel.workflow.shell import run_shell, run_shell_sync
+from dslmodel.workflow.workflow_executor import action_groups, execute_action, execute_job
+from dslmodel.workflow.workflow_models import Action, Job
+
+
+def test_shell_output_keeps_trailing_lines():
+    action = Action(name="count", shell="for i in 1 2 3 4; do echo line $i; done; echo oops >&2", output_lines=2)
+
+    context = execute_action(action, {})
+
+    assert context["shell_output"] == "line 3\nline 4"
+    assert context["shell_error"] == "oops"
+
+
+def test_shell_timeout_kills_command():
+    action = Action(name="hang", shell="sleep 5; echo done", timeout_seconds=0.3)
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutExpired):
+        execute_action(action, {}, raise_errors=True)
+    assert time.monotonic() - start < 3
+
+    assert execute_action(action, {})["shell_output"] == ""
+
+
+def test_shell_failure_raises_called_process_error():
+    with pytest.raises(CalledProcessError):
+        execute_action(Action(name="fail", shell="exit 3"), {}, raise_errors=True)
+
+
+def test_parallel_actions_run_concurrently():
+    steps = [
+        Action(name="a", shell="sleep 0.5; echo a", parallel=True),
+        Action(name="b", code="b = 1", parallel=True),
+        Action(name="c", shell="sleep 0.5; echo c", parallel=True),
+        Action(name="after", code="seen = shell_output + str(b)"),
+    ]
+    assert [len(group) for group in action_groups(steps)] == [3, 1]
+
+    start = time.monotonic()
+    context = execute_job(Job(name="build", steps=steps), {})
+
+    assert time.monotonic() - start < 0.95
+    assert context["seen"] == "c1"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_command_is_killed():
+    task = asyncio.create_task(run_shell("sleep 5"))
+    await asyncio.sleep(0.2)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # Also usable from inside a running event loop
+    assert run_shell_sync("echo hi").stdout == "hi"